@@ -30,13 +30,19 @@ def main() -> int:
         # Setup logging
         Logger.setup(level="INFO")
         Logger.info(t.APP_STARTING)
+
+        from wifi_connector.core.config import Config
+
+        config = Config.load()
+        # The logger starts before the config exists; switch the file format now
+        Logger.set_json_format(config.json_logs)
         
         # Configure dark theme BEFORE importing GUI modules (critical)
         from wifi_connector.utils.theme import setup_dark_theme
         try:
             setup_dark_theme()
         except Exception as e:
-            Logger.critical(f"No se pudo configurar el tema oscuro: {e}")
+            Logger.critical(t.APP_ERROR_THEME, error=e)
             print("Error crítico: No se puede iniciar la aplicación sin tema oscuro.")
             print(f"Detalles: {e}")
             return 1
@@ -45,7 +51,7 @@ def main() -> int:
         from wifi_connector.gui.main_window import MainWindow
         
         # Create and run the main window
-        app = MainWindow()
+        app = MainWindow(config=config)
         app.run()
         
         Logger.info(t.APP_CLOSED)
@@ -59,12 +65,16 @@ def main() -> int:
         
     except Exception as e:
         # Handle any unexpected errors during GUI initialization
-        Logger.error(t.APP_ERROR_START.format(error=e), exc_info=True)
+        Logger.error(t.APP_ERROR_START, error=e, exc_info=True)
         print(t.APP_ERROR_MESSAGE)
         print(t.APP_ERROR_DETAILS.format(error=e))
         print(f"\n{t.APP_ERROR_CHECK_LOGS}")
         return 1
 
+    finally:
+        # Flush records still waiting in the logging queue before exiting
+        Logger.shutdown()
+
 
 if __name__ == "__main__":
     sys.exit(main())
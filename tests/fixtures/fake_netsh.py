@@ -0,0 +1,73 @@
+"""Sustituto de netsh para los tests de NetshSession.
+
+Sin argumentos se comporta como el modo interactivo: escribe el prompt
+"netsh>" sin salto de línea, lee un comando por línea y responde. Las
+palabras desconocidas producen el mensaje de "comando no encontrado" que
+incluye la propia palabra, igual que netsh. Con argumentos ejecuta un único
+comando y termina, como una invocación normal de netsh.
+
+Comandos especiales para provocar fallos: "crash" termina el proceso y
+"hang" (también "hang show ...", que pasa por consulta) deja de responder.
+"""
+
+import os
+import sys
+import time
+
+
+RESPONSES = {
+    "wlan show interfaces": (
+        "\n"
+        "There is 1 interface on the system:\n"
+        "\n"
+        "    Name                   : Wi-Fi\n"
+        "    State                  : connected\n"
+        "    SSID                   : gencat_ENS_EDU\n"
+        "\n"
+    ),
+    "wlan show profiles": (
+        "\n"
+        "User profiles\n"
+        "-------------\n"
+        "    All User Profile     : gencat_ENS_EDU\n"
+        "\n"
+    ),
+}
+
+
+def respond(line: str) -> int:
+    """Escribe la respuesta a un comando y devuelve su código de retorno."""
+    if line == "crash":
+        sys.stdout.flush()
+        os._exit(3)
+    if line.split()[0] == "hang":
+        sys.stdout.flush()
+        time.sleep(3600)
+    if line in RESPONSES:
+        sys.stdout.write(RESPONSES[line])
+        return 0
+    sys.stdout.write(f"The following command was not found: {line}.\n")
+    return 1
+
+
+def main() -> int:
+    if len(sys.argv) > 1:
+        code = respond(" ".join(sys.argv[1:]))
+        sys.stdout.flush()
+        return code
+
+    while True:
+        sys.stdout.write("netsh>")
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            return 0
+        line = line.strip()
+        if line in ("exit", "bye", "quit"):
+            return 0
+        if line:
+            respond(line)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,7 @@ def build_encrypted_vault_bytes(
     n: int = 2**15,
     r: int = 8,
     p: int = 1,
+    public_metadata: Dict[str, Any] | None = None,
 ) -> bytes:
     """Construye un vault VLTB cifrado desde un payload JSON.
 
@@ -30,13 +31,21 @@ def build_encrypted_vault_bytes(
         n: Parámetro N de Scrypt (default: 32768)
         r: Parámetro r de Scrypt (default: 8)
         p: Parámetro p de Scrypt (default: 1)
+        public_metadata: Metadatos públicos; si se indican se genera un vault v2
 
     Returns:
         Bytes del vault cifrado en formato VLTB
     """
     plaintext = json.dumps(payload).encode("utf-8")
     return build_encrypted_vault_bytes_from_plaintext(
-        plaintext, password, salt=salt, nonce=nonce, n=n, r=r, p=p
+        plaintext,
+        password,
+        salt=salt,
+        nonce=nonce,
+        n=n,
+        r=r,
+        p=p,
+        public_metadata=public_metadata,
     )
 
 
@@ -49,6 +58,7 @@ def build_encrypted_vault_bytes_from_plaintext(
     n: int = 2**15,
     r: int = 8,
     p: int = 1,
+    public_metadata: Dict[str, Any] | None = None,
 ) -> bytes:
     """Construye un vault VLTB cifrado desde plaintext.
 
@@ -60,6 +70,7 @@ def build_encrypted_vault_bytes_from_plaintext(
         n: Parámetro N de Scrypt (default: 32768)
         r: Parámetro r de Scrypt (default: 8)
         p: Parámetro p de Scrypt (default: 1)
+        public_metadata: Metadatos públicos; si se indican se genera un vault v2
 
     Returns:
         Bytes del vault cifrado en formato VLTB
@@ -76,7 +87,7 @@ def build_encrypted_vault_bytes_from_plaintext(
     # Construir header VLTB
     header = vm.VLTB_HEADER_STRUCT.pack(
         vm.MAGIC,  # magic: b"VLTB"
-        1,  # version: 1
+        vm.VLTB_VERSION_1 if public_metadata is None else vm.VLTB_VERSION_2,
         vm.KDF_SCRYPT,  # kdf_type: 1
         vm.AEAD_AESGCM,  # aead_type: 1
         0,  # reserved: 0
@@ -88,6 +99,15 @@ def build_encrypted_vault_bytes_from_plaintext(
         ct_len,  # ciphertext_len
     )
 
+    # Sección de metadatos públicos (solo v2), autenticada como parte del AAD
+    public_section = b""
+    if public_metadata is not None:
+        metadata_bytes = json.dumps(public_metadata).encode("utf-8")
+        public_section = (
+            vm.VLTB_METADATA_LEN_STRUCT.pack(len(metadata_bytes)) + metadata_bytes
+        )
+    aad = header + public_section
+
     # Derivar clave con Scrypt
     kdf = Scrypt(
         salt=salt,
@@ -98,24 +118,36 @@ def build_encrypted_vault_bytes_from_plaintext(
     )
     key = kdf.derive(password.encode("utf-8"))
 
-    # Cifrar con AES-GCM usando header como AAD
-    ciphertext = AESGCM(key).encrypt(nonce, plaintext, header)
+    # Cifrar con AES-GCM usando header (+ metadatos públicos) como AAD
+    ciphertext = AESGCM(key).encrypt(nonce, plaintext, aad)
 
-    # Construir blob final: header + salt + nonce + ciphertext
-    return header + salt + nonce + ciphertext
+    # Construir blob final: header [+ metadatos] + salt + nonce + ciphertext
+    return aad + salt + nonce + ciphertext
 
 
-def write_vault_file(tmp_path, payload: Dict[str, Any], password: str) -> Any:
+def write_vault_file(
+    tmp_path,
+    payload: Dict[str, Any],
+    password: str,
+    name: str = "vault.bin",
+    public_metadata: Dict[str, Any] | None = None,
+) -> Any:
     """Escribe un vault.bin en formato VLTB y retorna el path.
 
     Args:
         tmp_path: Path del directorio temporal
         payload: Diccionario con estructura {metadata: {}, centers: []}
         password: Contraseña para cifrar
+        name: Nombre del archivo (default: vault.bin)
+        public_metadata: Metadatos públicos; si se indican se genera un vault v2
 
     Returns:
-        Path del archivo vault.bin creado
+        Path del archivo vault creado
     """
-    vault_path = tmp_path / "vault.bin"
-    vault_path.write_bytes(build_encrypted_vault_bytes(payload, password))
+    vault_path = tmp_path / name
+    vault_path.write_bytes(
+        build_encrypted_vault_bytes(
+            payload, password, public_metadata=public_metadata
+        )
+    )
     return vault_path
@@ -83,3 +83,46 @@ class TestConfigValidation:
             debug_mode=False
         )
         assert config.pause_duration == 0.5
+
+
+class TestConfigLoad:
+    """Tests para Config.load()."""
+
+    def test_load_returns_default_when_missing(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "wifi_connector.utils.paths.get_config_path",
+            lambda: tmp_path / "config.json",
+        )
+
+        assert Config.load() == Config.default()
+
+    def test_load_reads_vault_mirror_dir(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(
+            json.dumps({"vault_mirror_dir": "\\\\server\\vaults"}), encoding="utf-8"
+        )
+        monkeypatch.setattr(
+            "wifi_connector.utils.paths.get_config_path", lambda: config_file
+        )
+
+        assert Config.load().vault_mirror_dir == "\\\\server\\vaults"
+
+    def test_load_falls_back_on_invalid_file(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"unknown": 1}), encoding="utf-8")
+        monkeypatch.setattr(
+            "wifi_connector.utils.paths.get_config_path", lambda: config_file
+        )
+
+        assert Config.load() == Config.default()
+
+
+class TestSpeculativeUnlockConfig:
+    """Tests para la configuración del desbloqueo especulativo."""
+
+    def test_disabled_by_default(self):
+        assert Config.default().speculative_unlock is False
+
+    def test_negative_delay_raises(self):
+        with pytest.raises(ValueError):
+            Config(speculative_unlock_delay_ms=-1)
@@ -0,0 +1,249 @@
+"""
+Tests unitarios para el módulo connection_attempt.
+"""
+
+import asyncio
+import concurrent.futures
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from wifi_connector.core.connection_attempt import (
+    ConnectionAttempt,
+    ConnectionController,
+    ConnectionState,
+)
+from wifi_connector.core.exceptions import ConnectionCancelledError
+from wifi_connector.core.profile_connector import ProfileConnector
+from wifi_connector.network import process_runner
+from wifi_connector.network.event_loop import BackgroundLoop
+from wifi_connector.utils import translations as t
+
+
+SLEEP_60 = [sys.executable, "-c", "import time; time.sleep(60)"]
+
+
+def _recording_attempt(connector):
+    """Crea un intento que guarda la secuencia de estados por la que pasa."""
+    states = []
+    attempt = ConnectionAttempt(
+        connector, on_state_change=lambda state, message: states.append(state)
+    )
+    return attempt, states
+
+
+class TestConnectionAttempt(unittest.TestCase):
+    """Tests de la máquina de estados de un intento."""
+
+    def setUp(self):
+        self.connector = ProfileConnector("gencat_ENS_EDU")
+
+    def test_successful_attempt_walks_through_states(self):
+        attempt, states = _recording_attempt(self.connector)
+
+        with patch.object(
+            self.connector, "_run_connection_steps", return_value=(True, "ok")
+        ), patch.object(
+            self.connector,
+            "verify_connection_async",
+            AsyncMock(return_value=(True, "verificat")),
+        ):
+            success, message = asyncio.run(attempt.run())
+
+        self.assertTrue(success)
+        self.assertEqual(message, t.PROFILE_SUCCESS_COMPLETE)
+        self.assertIsNotNone(attempt.trace_id)
+        self.assertEqual(
+            states,
+            [
+                ConnectionState.PREPARING,
+                ConnectionState.VERIFYING,
+                ConnectionState.CONNECTED,
+            ],
+        )
+
+    def test_failed_step_ends_in_failed(self):
+        attempt, states = _recording_attempt(self.connector)
+
+        with patch.object(
+            self.connector, "_run_connection_steps", return_value=(False, "error")
+        ):
+            success, message = asyncio.run(attempt.run())
+
+        self.assertFalse(success)
+        self.assertEqual(message, "error")
+        self.assertEqual(attempt.error_class, "steps")
+        self.assertEqual(states, [ConnectionState.PREPARING, ConnectionState.FAILED])
+
+    def test_cancel_before_run_skips_steps(self):
+        attempt, states = _recording_attempt(self.connector)
+        attempt.cancel()
+
+        with patch.object(self.connector, "_run_connection_steps") as steps:
+            success, message = asyncio.run(attempt.run())
+
+        steps.assert_not_called()
+        self.assertFalse(success)
+        self.assertEqual(message, t.PROFILE_CANCELLED)
+        self.assertEqual(states, [ConnectionState.CANCELLED])
+
+    def test_invalid_transition_raises(self):
+        attempt = ConnectionAttempt(self.connector)
+
+        with self.assertRaises(RuntimeError):
+            attempt._transition(ConnectionState.CONNECTED)
+
+    def test_terminal_states(self):
+        self.assertTrue(ConnectionState.CANCELLED.is_terminal)
+        self.assertFalse(ConnectionState.VERIFYING.is_terminal)
+
+
+class TestConnectionController(unittest.TestCase):
+    """Tests de cancelación y reemplazo con procesos reales."""
+
+    def setUp(self):
+        self.loop = BackgroundLoop(name="test-connection-loop")
+        self.controller = ConnectionController(self.loop)
+
+    def tearDown(self):
+        self.loop.stop()
+
+    def _hanging_connector(self, started: threading.Event) -> ProfileConnector:
+        """Conector cuyo primer paso lanza un comando que no termina nunca."""
+        connector = ProfileConnector("gencat_ENS_EDU")
+
+        def steps(progress_callback=None):
+            started.set()
+            connector._run_command(SLEEP_60)
+            return True, "no s'hauria d'arribar aquí"
+
+        connector._run_connection_steps = steps
+        return connector
+
+    def test_cancel_during_steps_kills_running_command(self):
+        started = threading.Event()
+        attempt, states = _recording_attempt(self._hanging_connector(started))
+
+        with patch(
+            "wifi_connector.network.process_runner._kill_tree",
+            wraps=process_runner._kill_tree,
+        ) as kill:
+            future = self.controller.start(attempt)
+            self.assertTrue(started.wait(5))
+            time.sleep(0.2)
+
+            start = time.monotonic()
+            self.controller.cancel()
+            with self.assertRaises(concurrent.futures.CancelledError):
+                future.result(timeout=5)
+
+        self.assertLess(time.monotonic() - start, 3)
+        kill.assert_called_once()
+        self.assertEqual(attempt.state, ConnectionState.CANCELLED)
+        self.assertEqual(states[-1], ConnectionState.CANCELLED)
+
+    def test_new_attempt_preempts_running_one(self):
+        started = threading.Event()
+        first = ConnectionAttempt(self._hanging_connector(started))
+        first_future = self.controller.start(first)
+        self.assertTrue(started.wait(5))
+
+        second_connector = ProfileConnector("gencat_ENS_EDU")
+        first_state_when_second_started = []
+
+        def second_steps(progress_callback=None):
+            first_state_when_second_started.append(first.state)
+            return True, "ok"
+
+        second_connector._run_connection_steps = second_steps
+        second_connector.verify_connection_async = AsyncMock(
+            return_value=(True, "verificat")
+        )
+        second = ConnectionAttempt(second_connector)
+
+        second_future = self.controller.start(second)
+
+        self.assertEqual(second_future.result(timeout=5), (True, t.PROFILE_SUCCESS_COMPLETE))
+        with self.assertRaises(concurrent.futures.CancelledError):
+            first_future.result(timeout=5)
+        self.assertEqual(first_state_when_second_started, [ConnectionState.CANCELLED])
+        self.assertTrue(self.controller.is_current(second))
+
+    def test_cancel_during_async_verify(self):
+        connector = ProfileConnector("gencat_ENS_EDU")
+        verifying = threading.Event()
+
+        async def slow_verify():
+            verifying.set()
+            await asyncio.sleep(60)
+
+        connector._run_connection_steps = MagicMock(return_value=(True, "ok"))
+        connector.verify_connection_async = slow_verify
+        attempt = ConnectionAttempt(connector)
+
+        future = self.controller.start(attempt)
+        self.assertTrue(verifying.wait(5))
+        self.controller.cancel()
+
+        with self.assertRaises(concurrent.futures.CancelledError):
+            future.result(timeout=5)
+        self.assertEqual(attempt.state, ConnectionState.CANCELLED)
+
+
+class TestProfileConnectorCancellation(unittest.TestCase):
+    """Tests de los puntos de cancelación del conector síncrono."""
+
+    def setUp(self):
+        self.connector = ProfileConnector("gencat_ENS_EDU")
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_cancel_interrupts_verify_sleep(self, mock_run):
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout=b"SSID: gencat_ENS_EDU\nState: authenticating", stderr=b""
+        )
+        threading.Timer(0.2, self.connector.cancel).start()
+
+        start = time.monotonic()
+        with self.assertRaises(ConnectionCancelledError):
+            self.connector._verify_connection(max_attempts=3, wait_seconds=30)
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_cancelled_connector_runs_no_more_commands(self, mock_run):
+        self.connector.cancel()
+
+        with self.assertRaises(ConnectionCancelledError):
+            self.connector._run_command(["netsh", "wlan", "show", "interfaces"])
+
+        mock_run.assert_not_called()
+
+    @patch.object(ProfileConnector, "_verify_connection")
+    @patch.object(ProfileConnector, "_connect_to_network")
+    @patch.object(ProfileConnector, "_install_wifi_profile")
+    def test_cancel_between_steps_stops_connection(
+        self, mock_install, mock_connect, mock_verify
+    ):
+        def install_then_cancel():
+            self.connector.cancel()
+            return True, "instal·lat"
+
+        mock_install.side_effect = install_then_cancel
+        self.connector.profile_state = None
+
+        with patch.object(
+            self.connector, "_are_eap_credentials_current", return_value=True
+        ):
+            success, message = self.connector.connect_via_profile()
+
+        self.assertFalse(success)
+        self.assertEqual(message, t.PROFILE_CANCELLED)
+        mock_connect.assert_not_called()
+        mock_verify.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Tests unitarios para el módulo connection_history.
+"""
+
+import io
+import json
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from wifi_connector.core.connection_attempt import ConnectionState
+from wifi_connector.data.connection_history import (
+    AttemptRecord,
+    ConnectionHistory,
+    main,
+    summarize,
+)
+
+
+class TestConnectionHistory(unittest.TestCase):
+    """Tests de escritura por lotes y consultas."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp.name) / "history.sqlite3"
+        self.history = ConnectionHistory(self.db_path, flush_interval=0.05)
+
+    def tearDown(self):
+        self.history.close()
+        self.tmp.cleanup()
+
+    def _rows(self):
+        connection = sqlite3.connect(self.db_path)
+        try:
+            return connection.execute(
+                "SELECT center_code, outcome, total_ms, steps, error_class, "
+                "app_version, vault_version FROM attempts ORDER BY id"
+            ).fetchall()
+        finally:
+            connection.close()
+
+    def test_record_is_written_off_the_calling_thread(self):
+        writer_threads = []
+        original = ConnectionHistory._write_batch
+
+        def spy(history, connection, batch):
+            writer_threads.append(threading.current_thread().name)
+            return original(history, connection, batch)
+
+        with patch.object(ConnectionHistory, "_write_batch", spy):
+            self.history.record(
+                AttemptRecord(
+                    "08001234",
+                    "failed",
+                    1500.0,
+                    steps={"step.install": 300.0},
+                    error_class="step.configure_eap",
+                    app_version="1.0.0",
+                    vault_version="7",
+                )
+            )
+            self.assertTrue(self.history.flush())
+
+        self.assertEqual(writer_threads, ["history-writer"])
+        (row,) = self._rows()
+        self.assertEqual(row[:3], ("08001234", "failed", 1500.0))
+        self.assertEqual(json.loads(row[3]), {"step.install": 300.0})
+        self.assertEqual(row[4:], ("step.configure_eap", "1.0.0", "7"))
+
+    def test_records_are_batched_in_one_transaction(self):
+        history = ConnectionHistory(self.db_path, batch_size=50, flush_interval=0.3)
+        batches = []
+        original = ConnectionHistory._write_batch
+
+        def spy(self_, connection, batch):
+            batches.append(len(batch))
+            return original(self_, connection, batch)
+
+        with patch.object(ConnectionHistory, "_write_batch", spy):
+            for _ in range(10):
+                history.record(AttemptRecord("08001234", "connected", 800.0))
+            history.close()
+
+        self.assertEqual(batches, [10])
+        self.assertEqual(len(self._rows()), 10)
+
+    def test_summary_percentiles_and_success_rate(self):
+        for ms in range(1, 101):
+            self.history.record(
+                AttemptRecord("08001234", "connected" if ms <= 90 else "failed", ms)
+            )
+        self.history.record(AttemptRecord("08001234", "cancelled", 99999))
+        self.history.flush()
+
+        summary = self.history.summary()
+
+        self.assertEqual(summary.count, 100)
+        self.assertAlmostEqual(summary.success_rate, 0.9)
+        self.assertEqual((summary.p50, summary.p95, summary.p99), (50, 95, 99))
+
+    def test_summary_filters_by_center_and_time(self):
+        now = time.time()
+        self.history.record(AttemptRecord("A", "connected", 100, started_at=now - 10))
+        self.history.record(AttemptRecord("B", "connected", 900, started_at=now - 10))
+        self.history.record(AttemptRecord("A", "failed", 500, started_at=now - 9000))
+        self.history.flush()
+
+        summary = self.history.summary(since=now - 60, center_code="A")
+
+        self.assertEqual(summary.count, 1)
+        self.assertEqual(summary.p50, 100)
+
+    def test_summary_by_window(self):
+        start = time.time() - 3 * 3600
+        for hour, ms in ((0, 100), (0, 300), (2, 900)):
+            self.history.record(
+                AttemptRecord("A", "connected", ms, started_at=start + hour * 3600 + 1)
+            )
+        self.history.flush()
+
+        windows = self.history.summary_by_window(3600, since=start)
+
+        self.assertEqual([w.count for w in windows], [2, 1])
+        self.assertEqual(windows[1].window_start, start + 2 * 3600)
+        self.assertEqual(windows[1].p50, 900)
+
+    def test_queries_on_missing_database_are_empty(self):
+        self.assertEqual(self.history.summary().count, 0)
+        self.assertFalse(self.db_path.exists())
+
+    def test_record_after_close_is_ignored(self):
+        self.history.close()
+        self.history.record(AttemptRecord("A", "connected", 100))
+
+        self.assertFalse(self.db_path.exists())
+
+    def test_cli_prints_summary(self):
+        self.history.record(AttemptRecord("A", "connected", 1200))
+        self.history.flush()
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            code = main(["--db", str(self.db_path), "--days", "1"])
+
+        self.assertEqual(code, 0)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("100.0%", lines[1])
+        self.assertIn("1200", lines[1])
+
+
+class TestAttemptRecord(unittest.TestCase):
+    """Tests de la conversión desde un intento terminado."""
+
+    def test_from_attempt(self):
+        attempt = MagicMock(
+            state=ConnectionState.FAILED, duration=2.5, error_class="verify"
+        )
+        attempt.step_durations.return_value = {"step.connect": 0.25}
+
+        record = AttemptRecord.from_attempt(attempt, "08001234", "1.0.0", "7")
+
+        self.assertEqual(record.outcome, "failed")
+        self.assertEqual(record.total_ms, 2500)
+        self.assertEqual(record.steps, {"step.connect": 250})
+        self.assertEqual(record.error_class, "verify")
+
+    def test_summarize_empty(self):
+        summary = summarize([])
+
+        self.assertEqual((summary.count, summary.success_rate, summary.p99), (0, 0.0, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
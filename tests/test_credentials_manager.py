@@ -15,6 +15,8 @@ from wifi_connector.data.credentials_manager import (
     CenterCredentials,
     CredentialsManager,
 )
+from wifi_connector.data.index_cache import IndexCache
+from wifi_connector.data.vault_manager import VaultManager
 from tests.fixtures.vault_helpers import write_vault_file
 
 
@@ -206,3 +208,187 @@ class TestCredentialsManagerVaultErrors:
 
             with pytest.raises(CredentialsFileError):
                 manager.load_credentials("secret")
+
+
+class TestCredentialsManagerMultipleVaults:
+    @staticmethod
+    def _entry(code, name, user="user", pwd="pass"):
+        return {"Codi": code, "Centre": name, "Usuari": user, "Contrasenya": pwd}
+
+    def test_accepts_sequence_of_paths(self, tmp_path):
+        paths = [str(tmp_path / "a.bin"), str(tmp_path / "b.bin")]
+        manager = CredentialsManager(vault_path=paths)
+
+        assert manager.vault_paths == paths
+        assert manager.vault_path == paths[0]
+
+    def test_merges_centers_from_all_vaults(self, tmp_path, password):
+        first = write_vault_file(
+            tmp_path,
+            {"metadata": {"generated_at": "2026-01-01"},
+             "centers": [self._entry("08000001", "Centre A")]},
+            password,
+            name="a.bin",
+        )
+        second = write_vault_file(
+            tmp_path,
+            {"metadata": {"generated_at": "2026-02-01"},
+             "centers": [self._entry("17000001", "Centre B")]},
+            password,
+            name="b.bin",
+        )
+
+        manager = CredentialsManager(vault_path=[str(first), str(second)])
+        assert manager.load_credentials(password) is True
+
+        codes = [c.center_code for c in manager.get_all_centers()]
+        assert codes == ["08000001", "17000001"]
+        assert manager.get_center_by_code("17000001").center_name == "Centre B"
+        assert manager.vault_metadata == {"generated_at": "2026-02-01"}
+        assert set(manager.vaults_metadata) == {str(first), str(second)}
+
+    def test_duplicate_code_prefers_newest_generated_at(self, tmp_path, password):
+        older = write_vault_file(
+            tmp_path,
+            {"metadata": {"generated_at": "2026-01-01T00:00:00"},
+             "centers": [self._entry("08000001", "Antic", pwd="old")]},
+            password,
+            name="older.bin",
+        )
+        newer = write_vault_file(
+            tmp_path,
+            {"metadata": {"generated_at": "2026-03-01T00:00:00"},
+             "centers": [self._entry("08000001", "Nou", pwd="new")]},
+            password,
+            name="newer.bin",
+        )
+
+        manager = CredentialsManager(vault_path=[str(older), str(newer)])
+        manager.load_credentials(password)
+
+        assert len(manager.centers) == 1
+        assert manager.get_center_by_code("08000001").password == "new"
+
+    def test_duplicate_code_tie_prefers_first_path(self, tmp_path, password):
+        first = write_vault_file(
+            tmp_path,
+            {"metadata": {}, "centers": [self._entry("08000001", "Primer")]},
+            password,
+            name="first.bin",
+        )
+        second = write_vault_file(
+            tmp_path,
+            {"metadata": {}, "centers": [self._entry("08000001", "Segon")]},
+            password,
+            name="second.bin",
+        )
+
+        manager = CredentialsManager(vault_path=[str(first), str(second)])
+        manager.load_credentials(password)
+
+        assert manager.get_center_by_code("08000001").center_name == "Primer"
+
+    def test_wrong_password_in_any_vault_raises(self, tmp_path, password):
+        centers = [self._entry("08000001", "Centre")]
+        good = write_vault_file(
+            tmp_path, {"metadata": {}, "centers": centers}, password, name="good.bin"
+        )
+        bad = write_vault_file(
+            tmp_path, {"metadata": {}, "centers": centers}, "other", name="bad.bin"
+        )
+
+        manager = CredentialsManager(vault_path=[str(good), str(bad)])
+
+        with pytest.raises(VaultDecryptionError):
+            manager.load_credentials(password)
+
+    def test_peek_metadata_returns_newest_public_metadata(self, tmp_path, password):
+        centers = [self._entry("08000001", "Centre")]
+        first = write_vault_file(
+            tmp_path,
+            {"metadata": {}, "centers": centers},
+            password,
+            name="a.bin",
+            public_metadata={"version": "1", "generated_at": "2026-01-01"},
+        )
+        second = write_vault_file(
+            tmp_path,
+            {"metadata": {}, "centers": centers},
+            password,
+            name="b.bin",
+            public_metadata={"version": "2", "generated_at": "2026-02-01"},
+        )
+
+        manager = CredentialsManager(vault_path=[str(first), str(second)])
+
+        assert manager.peek_metadata()["version"] == "2"
+
+
+class TestCredentialsManagerIndexCache:
+    def test_second_load_uses_snapshot(self, tmp_path, vault_file, password):
+        cache = IndexCache(tmp_path / "cache")
+        CredentialsManager(str(vault_file), index_cache=cache).load_credentials(
+            password
+        )
+
+        manager = CredentialsManager(str(vault_file), index_cache=cache)
+        with patch.object(VaultManager, "decrypt") as mock_decrypt:
+            assert manager.load_credentials(password) is True
+
+        mock_decrypt.assert_not_called()
+        assert len(manager.centers) == 3
+        assert manager.get_center_by_code("08023456").password == "pass456"
+        assert manager.vault_metadata["source"] == "tests"
+
+    def test_wrong_password_is_rejected_with_snapshot(
+        self, tmp_path, vault_file, password
+    ):
+        cache = IndexCache(tmp_path / "cache")
+        CredentialsManager(str(vault_file), index_cache=cache).load_credentials(
+            password
+        )
+
+        manager = CredentialsManager(str(vault_file), index_cache=cache)
+        with pytest.raises(VaultDecryptionError):
+            manager.load_credentials("wrong")
+
+    def test_vault_change_invalidates_snapshot(
+        self, tmp_path, vault_payload, password
+    ):
+        cache = IndexCache(tmp_path / "cache")
+        vault_file = write_vault_file(tmp_path, vault_payload, password)
+        CredentialsManager(str(vault_file), index_cache=cache).load_credentials(
+            password
+        )
+
+        vault_payload["centers"] = vault_payload["centers"][:1]
+        write_vault_file(tmp_path, vault_payload, password)
+        manager = CredentialsManager(str(vault_file), index_cache=cache)
+        manager.load_credentials(password)
+
+        assert len(manager.centers) == 1
+
+
+class TestCredentialsManagerUnlocked:
+    def test_load_with_pre_unlocked_vaults_skips_kdf(self, vault_file, password):
+        manager = CredentialsManager(str(vault_file))
+        unlocked = manager.unlock_vaults(password)
+
+        with patch.object(VaultManager, "_derive_key") as mock_derive:
+            assert manager.load_credentials(password, unlocked=unlocked) is True
+
+        mock_derive.assert_not_called()
+        assert len(manager.centers) == 3
+
+    def test_state_key_is_derived_from_the_vault_keys(self, tmp_path, vault_file, password):
+        cache = IndexCache(tmp_path / "cache")
+        first = CredentialsManager(str(vault_file), index_cache=cache)
+        assert first.state_key is None
+        first.load_credentials(password)
+
+        second = CredentialsManager(str(vault_file), index_cache=cache)
+        second.load_credentials(password)  # desde el snapshot
+
+        assert len(first.state_key) == 32
+        assert second.state_key == first.state_key
+        assert first.state_key not in vault_file.read_bytes()
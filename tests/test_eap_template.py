@@ -0,0 +1,65 @@
+"""Tests for EapCredentialsTemplate."""
+
+from pathlib import Path
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from wifi_connector.core.eap_template import (
+    MSCHAPV2_NAMESPACE,
+    EapCredentialsTemplate,
+    load_eap_template,
+)
+
+
+TEMPLATE_PATH = Path(__file__).parent.parent / "xml" / "credentials_template.xml"
+NAMESPACES = {"MsChapV2": MSCHAPV2_NAMESPACE}
+
+
+@pytest.fixture
+def template():
+    return EapCredentialsTemplate(TEMPLATE_PATH.read_text(encoding="utf-8"))
+
+
+def _credentials(xml_text):
+    root = ET.fromstring(xml_text.encode("utf-8"))
+    return (
+        root.find(".//MsChapV2:Username", NAMESPACES).text,
+        root.find(".//MsChapV2:Password", NAMESPACES).text,
+    )
+
+
+def test_render_replaces_username_and_password(template):
+    assert _credentials(template.render("W0801", "pass123")) == ("W0801", "pass123")
+
+
+def test_render_escapes_xml_special_characters(template):
+    password = "a<b>&c$d'\""
+
+    assert _credentials(template.render("user&co", password)) == ("user&co", password)
+
+
+def test_render_keeps_rest_of_template(template):
+    rendered = template.render("user", "pass")
+
+    assert "<eapCommon:Type>25</eapCommon:Type>" in rendered
+    assert "default_password" not in rendered
+
+
+def test_template_without_credentials_elements_is_rejected():
+    with pytest.raises(ValueError):
+        EapCredentialsTemplate("<Root />")
+
+
+def test_invalid_xml_is_rejected():
+    with pytest.raises(ET.ParseError):
+        EapCredentialsTemplate("<Root>")
+
+
+def test_load_eap_template_is_cached():
+    load_eap_template.cache_clear()
+
+    first = load_eap_template(str(TEMPLATE_PATH))
+    second = load_eap_template(str(TEMPLATE_PATH))
+
+    assert first is second
@@ -0,0 +1,89 @@
+"""
+Tests unitarios para el módulo event_loop.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+import unittest
+
+from wifi_connector.network.event_loop import BackgroundLoop
+
+
+class TestBackgroundLoop(unittest.TestCase):
+    """Tests del bucle asyncio en hilo de fondo."""
+
+    def setUp(self):
+        self.loop = BackgroundLoop(name="test-loop")
+
+    def tearDown(self):
+        self.loop.stop()
+
+    def test_submit_runs_coroutine_off_the_calling_thread(self):
+        async def where():
+            return threading.current_thread().name
+
+        result = self.loop.submit(where()).result(timeout=5)
+
+        self.assertEqual(result, "test-loop")
+        self.assertTrue(self.loop.is_running)
+
+    def test_tasks_run_concurrently(self):
+        async def nap():
+            await asyncio.sleep(0.3)
+            return True
+
+        start = time.monotonic()
+        futures = [self.loop.submit(nap()) for _ in range(5)]
+        results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(results, [True] * 5)
+        self.assertLess(time.monotonic() - start, 1.2)
+
+    def test_future_cancel_cancels_task(self):
+        cancelled = threading.Event()
+        started = threading.Event()
+
+        async def forever():
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        future = self.loop.submit(forever())
+        self.assertTrue(started.wait(5))
+        future.cancel()
+
+        self.assertTrue(cancelled.wait(5))
+
+    def test_stop_cancels_pending_tasks(self):
+        started = threading.Event()
+
+        async def forever():
+            started.set()
+            await asyncio.sleep(3600)
+
+        future = self.loop.submit(forever())
+        self.assertTrue(started.wait(5))
+
+        self.loop.stop()
+
+        self.assertFalse(self.loop.is_running)
+        with self.assertRaises(concurrent.futures.CancelledError):
+            future.result(timeout=5)
+
+    def test_restarts_after_stop(self):
+        async def answer():
+            return 42
+
+        self.loop.submit(answer()).result(timeout=5)
+        self.loop.stop()
+
+        self.assertEqual(self.loop.submit(answer()).result(timeout=5), 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,8 @@
 """Unit tests for GUI components."""
 
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, AsyncMock, MagicMock, call
 import threading
 
 from wifi_connector.gui.main_window import MainWindow
@@ -58,6 +59,7 @@ def mock_ctk_modules():
         patch(
             "wifi_connector.gui.main_window.ctk.set_default_color_theme"
         ) as mock_theme,
+        patch("wifi_connector.gui.main_window.ConnectionHistory"),
     ):
         # Configure mock window
         mock_window = MagicMock()
@@ -368,6 +370,25 @@ class TestConnectionActions:
             state="disabled", text="Connectant..."
         )
 
+    @patch("wifi_connector.gui.main_window.CredentialsManager")
+    def test_on_connect_profile_clicked_during_connection_preempts(
+        self, mock_creds_manager_class, mock_ctk_modules, mock_credentials_manager
+    ):
+        """Test that a new Connect click replaces the running attempt."""
+        mock_creds_manager_class.return_value = mock_credentials_manager
+
+        main_window = MainWindow()
+        main_window.selected_center = (
+            mock_credentials_manager.get_all_centers.return_value[0]
+        )
+        main_window.is_connecting = True
+
+        with patch.object(main_window.connection_controller, "start") as start:
+            main_window._on_connect_profile_clicked()
+
+        start.assert_called_once()
+        assert main_window.is_connecting
+
     @patch("wifi_connector.gui.main_window.NetworkManager")
     @patch("wifi_connector.gui.main_window.CredentialsManager")
     def test_on_disconnect_clicked_calls_disconnect(
@@ -380,15 +401,17 @@ class TestConnectionActions:
         """Test that disconnect is called when Disconnect button is clicked."""
         mock_creds_manager_class.return_value = mock_credentials_manager
         mock_network_manager = MagicMock()
-        mock_network_manager.disconnect.return_value = True
+        mock_network_manager.disconnect_async = AsyncMock(return_value=True)
         mock_network_manager_class.return_value = mock_network_manager
 
         main_window = MainWindow()
         main_window.status_label = MagicMock()
 
-        main_window._on_disconnect_clicked()
+        with patch.object(main_window.network_loop, "submit") as submit:
+            main_window._on_disconnect_clicked()
+        asyncio.run(submit.call_args[0][0])
 
-        mock_network_manager.disconnect.assert_called_once()
+        mock_network_manager.disconnect_async.assert_awaited_once()
 
     @patch("wifi_connector.gui.main_window.CredentialsManager")
     def test_on_disconnect_clicked_during_connection_shows_error(
@@ -481,3 +504,21 @@ class TestDarkThemeIntegration:
         assert mock_ctk_modules["frame"].called
         assert mock_ctk_modules["button"].called
         assert mock_ctk_modules["label"].called
+
+
+class TestConnectedStatus:
+    """Tests for the status message shown after a successful connection."""
+
+    def test_includes_link_details_when_known(self):
+        """Test that signal, channel and rate from the interface are shown."""
+        from wifi_connector.network.netsh_output import WlanInterface
+
+        status = MainWindow._connected_status(
+            WlanInterface(state="connected", channel=36, receive_rate=866.7, signal=92)
+        )
+
+        assert status == "Connectat correctament via perfil! (senyal 92% · canal 36 · 866.7 Mbps)"
+
+    def test_plain_message_without_interface(self):
+        """Test that the plain message is used when nothing was parsed."""
+        assert MainWindow._connected_status(None) == "Connectat correctament via perfil!"
@@ -0,0 +1,23 @@
+"""Tests for file hashing."""
+
+import hashlib
+from unittest.mock import patch
+
+from wifi_connector.utils.hashing import file_sha256
+
+
+def test_file_sha256(tmp_path):
+    path = tmp_path / "profile.xml"
+    path.write_bytes(b"<xml/>")
+
+    assert file_sha256(path) == hashlib.sha256(b"<xml/>").hexdigest()
+    assert file_sha256(str(path)) == file_sha256(path)
+
+
+def test_file_sha256_spans_chunks(tmp_path):
+    data = bytes(range(256)) * 10
+    path = tmp_path / "vault.bin"
+    path.write_bytes(data)
+
+    with patch("wifi_connector.utils.hashing.CHUNK_SIZE", 100):
+        assert file_sha256(path) == hashlib.sha256(data).hexdigest()
@@ -0,0 +1,75 @@
+"""Tests for IndexCache."""
+
+import pytest
+
+from wifi_connector.data.index_cache import (
+    CACHE_SUFFIX,
+    CachedIndex,
+    IndexCache,
+)
+
+
+HASHES = ["a" * 64]
+KEYS = [b"k" * 32]
+
+
+@pytest.fixture
+def snapshot():
+    return CachedIndex(
+        metadata={"version": "1.0"},
+        vaults_metadata=[{"version": "1.0"}],
+        rows=[["08012345", "Institut Example", "W08012345", "pass123"]],
+    )
+
+
+def test_roundtrip(tmp_path, snapshot):
+    cache = IndexCache(tmp_path)
+    cache.save(HASHES, KEYS, snapshot)
+
+    assert cache.load(HASHES, KEYS) == snapshot
+
+
+def test_snapshot_is_encrypted(tmp_path, snapshot):
+    IndexCache(tmp_path).save(HASHES, KEYS, snapshot)
+
+    (cache_file,) = tmp_path.glob(f"*{CACHE_SUFFIX}")
+    assert b"pass123" not in cache_file.read_bytes()
+
+
+def test_wrong_key_misses(tmp_path, snapshot):
+    cache = IndexCache(tmp_path)
+    cache.save(HASHES, KEYS, snapshot)
+
+    assert cache.load(HASHES, [b"x" * 32]) is None
+
+
+def test_changed_vault_hash_misses(tmp_path, snapshot):
+    cache = IndexCache(tmp_path)
+    cache.save(HASHES, KEYS, snapshot)
+
+    assert cache.load(["b" * 64], KEYS) is None
+
+
+def test_corrupted_file_misses(tmp_path, snapshot):
+    cache = IndexCache(tmp_path)
+    cache.save(HASHES, KEYS, snapshot)
+    (cache_file,) = tmp_path.glob(f"*{CACHE_SUFFIX}")
+    data = bytearray(cache_file.read_bytes())
+    data[-1] ^= 0xFF
+    cache_file.write_bytes(bytes(data))
+
+    assert cache.load(HASHES, KEYS) is None
+
+
+def test_save_replaces_stale_snapshots(tmp_path, snapshot):
+    cache = IndexCache(tmp_path)
+    cache.save(HASHES, KEYS, snapshot)
+    cache.save(["b" * 64], KEYS, snapshot)
+
+    assert len(list(tmp_path.glob(f"*{CACHE_SUFFIX}"))) == 1
+    assert cache.load(HASHES, KEYS) is None
+    assert cache.load(["b" * 64], KEYS) == snapshot
+
+
+def test_missing_cache_dir_misses(tmp_path):
+    assert IndexCache(tmp_path / "missing").load(HASHES, KEYS) is None
@@ -0,0 +1,264 @@
+"""
+Tests unitarios para el módulo log_analysis.
+"""
+
+import gzip
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from wifi_connector.utils import translations as t
+from wifi_connector.utils.log_analysis import (
+    DayStats,
+    FileCursor,
+    analyze,
+    main,
+    parse_log,
+)
+
+
+def _line(message: str, level: str = "INFO") -> str:
+    """Línea con el formato de Logger."""
+    return f"2025-03-14 09:15:02 - WifiConnector - {level} - {message}\n"
+
+
+def _summary(ms: float, **steps: float) -> str:
+    breakdown = ", ".join(
+        t.TIMING_SUMMARY_ITEM.format(name=name.replace("_", "."), ms=value, count=1)
+        for name, value in steps.items()
+    )
+    return _line(t.TIMING_LOG_SUMMARY.format(trace_id="ab12", duration_ms=ms, breakdown=breakdown))
+
+
+CONNECTED = [
+    _line(t.PROFILE_LOG_STARTING),
+    _line(f"✓ {t.PROFILE_SUCCESS_COMPLETE}"),
+    _summary(2000, step_install=400, step_connect=1000),
+]
+
+AUTH_FAILED = [
+    _line(t.PROFILE_LOG_STARTING),
+    _line(t.PROFILE_ERROR_AUTH, "ERROR"),
+    _line(t.PROFILE_LOG_VERIFY_ERROR.format(message=t.PROFILE_ERROR_AUTH), "ERROR"),
+    _summary(6000, step_install=600),
+]
+
+VERIFY_TIMEOUT = [
+    _line(t.PROFILE_LOG_STARTING),
+    _line(t.PROFILE_WARNING_NOT_VISIBLE.format(ssid="gencat_ENS_EDU"), "WARNING"),
+    _line(t.PROFILE_ERROR_NO_VERIFY.format(ssid="gencat_ENS_EDU", attempts=10), "WARNING"),
+    _line(t.PROFILE_LOG_VERIFY_ERROR.format(message="..."), "ERROR"),
+]
+
+UNVERIFIED = [
+    _line(t.PROFILE_LOG_STARTING),
+    _line(t.PROFILE_WARNING_PERMISSIONS_VERIFY, "WARNING"),
+    _line(t.PROFILE_LOG_VERIFY_FAILED.format(message="..."), "WARNING"),
+    _line(t.PROFILE_LOG_VERIFY_PROBABLY_OK),
+]
+
+
+class TestFileCursor(unittest.TestCase):
+    """Tests del reconocimiento de intentos en los mensajes."""
+
+    def _consume(self, lines):
+        cursor = FileCursor()
+        for line in lines:
+            cursor.consume(line.split(" - ", 3)[3].rstrip("\n"))
+        return cursor
+
+    def test_outcomes_and_reasons(self):
+        cursor = self._consume(CONNECTED + AUTH_FAILED + VERIFY_TIMEOUT + UNVERIFIED)
+
+        stats = cursor.stats
+        self.assertEqual((stats.connected, stats.failed, stats.cancelled), (2, 2, 0))
+        # El motivo más prioritario gana: la red no visible explica la verificación agotada
+        self.assertEqual(stats.reasons, {"auth": 1, "not_found": 1, "permissions": 1})
+        self.assertIsNone(cursor.open_attempt)
+
+    def test_step_timings_come_from_the_summary(self):
+        stats = self._consume(CONNECTED + AUTH_FAILED).stats
+
+        self.assertEqual(stats.timings["step.install"], [2, 1000.0])
+        self.assertEqual(stats.timings["attempt"], [2, 8000.0])
+        self.assertEqual(stats.mean_timings()["step.connect"], 1000.0)
+
+    def test_attempt_without_outcome_is_interrupted(self):
+        cursor = self._consume([_line(t.PROFILE_LOG_STARTING)] + CONNECTED)
+
+        self.assertEqual(cursor.stats.reasons, {"interrupted": 1})
+        self.assertEqual(cursor.stats.connected, 1)
+
+    def test_cancelled_does_not_count_for_success_rate(self):
+        cursor = self._consume(
+            CONNECTED + [_line(t.PROFILE_LOG_STARTING), _line(t.PROFILE_LOG_CANCELLED)]
+        )
+
+        self.assertEqual(cursor.stats.cancelled, 1)
+        self.assertEqual(cursor.stats.success_rate, 1.0)
+
+
+class TestParseLog(unittest.TestCase):
+    """Tests de la lectura incremental de un log."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "14-03-2025.log"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_partial_line_is_left_for_next_run(self):
+        self.path.write_text("".join(CONNECTED[:2]) + CONNECTED[2][:20], encoding="utf-8")
+
+        state = parse_log(str(self.path))
+
+        self.assertEqual(state["offset"], len("".join(CONNECTED[:2]).encode("utf-8")))
+        self.assertNotIn("attempt", state["stats"]["timings"])
+
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(CONNECTED[2][20:])
+        state = parse_log(str(self.path), state)
+
+        self.assertEqual(state["stats"]["timings"]["attempt"], [1, 2000.0])
+
+    def test_attempt_open_across_runs(self):
+        self.path.write_text("".join(AUTH_FAILED[:2]), encoding="utf-8")
+        state = parse_log(str(self.path))
+        self.assertEqual(state["open_attempt"], "auth")
+
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(AUTH_FAILED[2:]))
+        state = parse_log(str(self.path), json.loads(json.dumps(state)))
+
+        self.assertEqual(state["stats"]["reasons"], {"auth": 1})
+
+    def test_truncated_file_is_reparsed(self):
+        self.path.write_text("".join(CONNECTED * 3), encoding="utf-8")
+        state = parse_log(str(self.path))
+
+        self.path.write_text("".join(AUTH_FAILED), encoding="utf-8")
+        state = parse_log(str(self.path), state)
+
+        self.assertEqual((state["stats"]["connected"], state["stats"]["failed"]), (0, 1))
+
+    def test_json_lines_are_parsed_by_message(self):
+        lines = [json.dumps({"event": "X", "message": line.split(" - ", 3)[3].rstrip("\n")}) + "\n" for line in AUTH_FAILED]
+        self.path.write_text(CONNECTED[0] + "".join(lines), encoding="utf-8")
+
+        state = parse_log(str(self.path))
+
+        self.assertEqual(state["stats"]["reasons"], {"interrupted": 1, "auth": 1})
+
+
+class TestAnalyze(unittest.TestCase):
+    """Tests del análisis de un árbol de logs con cursor."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "logs"
+        self.cursor = Path(self.tmp.name) / "cursor.json"
+        self._write("aula1-pc03/14-03-2025.log", CONNECTED + AUTH_FAILED)
+        self._write("aula1-pc03/15-03-2025.log", CONNECTED)
+        self._write("sala-profes/14-03-2025.log", VERIFY_TIMEOUT)
+        self._write("sala-profes/notes.log", CONNECTED)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, relative, lines, mode="w"):
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, mode, encoding="utf-8") as f:
+            f.write("".join(lines))
+
+    def test_aggregates_per_machine_and_day_with_process_pool(self):
+        results = analyze(self.root, self.cursor, workers=2)
+
+        self.assertEqual(
+            sorted(results),
+            [
+                ("aula1-pc03", "2025-03-14"),
+                ("aula1-pc03", "2025-03-15"),
+                ("sala-profes", "2025-03-14"),
+            ],
+        )
+        day = results[("aula1-pc03", "2025-03-14")]
+        self.assertEqual((day.attempts, day.success_rate), (2, 0.5))
+        self.assertEqual(results[("sala-profes", "2025-03-14")].reasons, {"not_found": 1})
+
+    def test_rerun_only_reads_new_lines(self):
+        analyze(self.root, self.cursor, workers=1)
+        self._write("aula1-pc03/15-03-2025.log", AUTH_FAILED, mode="a")
+
+        state = json.loads(self.cursor.read_text(encoding="utf-8"))
+        offset = state["files"]["aula1-pc03/15-03-2025.log"]["offset"]
+        results = analyze(self.root, self.cursor, workers=1)
+
+        day = results[("aula1-pc03", "2025-03-15")]
+        self.assertEqual((day.connected, day.failed), (1, 1))
+        self.assertEqual(results[("aula1-pc03", "2025-03-14")].attempts, 2)
+        state = json.loads(self.cursor.read_text(encoding="utf-8"))
+        self.assertGreater(state["files"]["aula1-pc03/15-03-2025.log"]["offset"], offset)
+
+    def test_rotated_segments_are_counted_once(self):
+        analyze(self.root, self.cursor, workers=1)
+        # Rotación: el log del día pasa a un fragmento comprimido y se empieza de nuevo
+        day_log = self.root / "aula1-pc03/15-03-2025.log"
+        with gzip.open(day_log.with_name("15-03-2025.1.log.gz"), "wt", encoding="utf-8") as f:
+            f.write(day_log.read_text(encoding="utf-8") + "".join(AUTH_FAILED))
+        self._write("aula1-pc03/15-03-2025.log", CONNECTED * 2)
+
+        results = analyze(self.root, self.cursor, workers=1)
+
+        day = results[("aula1-pc03", "2025-03-15")]
+        self.assertEqual((day.connected, day.failed), (3, 1))
+        self.assertEqual(analyze(self.root, self.cursor, workers=1), results)
+
+    def test_invalid_cursor_starts_over(self):
+        self.cursor.write_text("{no json", encoding="utf-8")
+
+        results = analyze(self.root, self.cursor, workers=1)
+
+        self.assertEqual(results[("aula1-pc03", "2025-03-15")].connected, 1)
+
+    def test_cli_prints_rows_and_json(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            code = main([str(self.root), "--cursor", str(self.cursor), "--workers", "1"])
+
+        self.assertEqual(code, 0)
+        text = output.getvalue()
+        self.assertIn("50.0%", text)
+        self.assertIn("auth=1", text)
+        self.assertIn("step.install 500 ms", text)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main([str(self.root), "--cursor", str(self.cursor), "--json"])
+
+        report = json.loads(output.getvalue())
+        self.assertEqual(report["aula1-pc03"]["total"]["attempts"], 3)
+        self.assertEqual(report["sala-profes"]["days"]["2025-03-14"]["failed"], 1)
+
+
+class TestDayStats(unittest.TestCase):
+    """Tests de la acumulación de agregados."""
+
+    def test_merge_and_round_trip(self):
+        stats = DayStats(connected=1, reasons={"auth": 1})
+        stats.add_timing("step.install", 300)
+        other = DayStats.from_dict(json.loads(json.dumps(stats.__dict__)))
+
+        stats.merge(other)
+
+        self.assertEqual(stats.connected, 2)
+        self.assertEqual(stats.reasons, {"auth": 2})
+        self.assertEqual(stats.timings["step.install"], [2, 600.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Tests unitarios para el módulo log_json.
+"""
+
+import ast
+import json
+import logging
+import sys
+import unittest
+from pathlib import Path
+
+from wifi_connector.utils import translations as t
+from wifi_connector.utils.log_json import JsonFormatter, event_id
+
+
+ROOT = Path(__file__).parent.parent
+LOGGER_METHODS = {"debug", "info", "warning", "error", "critical"}
+
+
+def _record(msg, args=None, exc_info=None, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("wifi_connector", logging.ERROR, __file__, 1, msg, args, exc_info)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestEventId(unittest.TestCase):
+    """Tests del identificador de evento."""
+
+    def test_translation_constant_gives_its_name(self):
+        self.assertEqual(event_id(t.PROFILE_LOG_STARTING), "PROFILE_LOG_STARTING")
+        self.assertEqual(event_id(t.TIMING_LOG_SUMMARY), "TIMING_LOG_SUMMARY")
+
+    def test_free_text_has_no_event(self):
+        self.assertIsNone(event_id("✓ Connectat"))
+
+    def test_translation_texts_are_unique(self):
+        """Dos constantes con el mismo texto darían el mismo evento."""
+        names_by_text = {}
+        for name, value in vars(t).items():
+            if name.isupper() and isinstance(value, str):
+                names_by_text.setdefault(value, []).append(name)
+
+        shared = [names for names in names_by_text.values() if len(names) > 1]
+
+        self.assertEqual(shared, [])
+
+
+class TestJsonFormatter(unittest.TestCase):
+    """Tests del formato JSON de un registro."""
+
+    def test_plain_message_is_looked_up_by_text(self):
+        payload = json.loads(JsonFormatter().format(_record(t.PROFILE_LOG_CANCELLED)))
+
+        self.assertEqual(payload["event"], "PROFILE_LOG_CANCELLED")
+        self.assertEqual(payload["message"], t.PROFILE_LOG_CANCELLED)
+        self.assertEqual(payload["level"], "ERROR")
+        self.assertIn("T", payload["ts"])
+
+    def test_fields_that_are_not_json_are_converted_to_text(self):
+        record = _record(
+            "ruta {path}",
+            event_template=t.PROFILE_LOG_RETURNCODE,
+            event_fields={"path": object.__new__(type("Ruta", (), {"__str__": lambda s: "C:/x"}))},
+            event_context={"step": "install"},
+        )
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(payload["event"], "PROFILE_LOG_RETURNCODE")
+        self.assertEqual(payload["fields"], {"path": "C:/x"})
+        self.assertEqual(payload["step"], "install")
+
+    def test_exception_is_included(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _record("error", exc_info=sys.exc_info())
+
+        line = JsonFormatter().format(record)
+
+        self.assertNotIn("\n", line)
+        self.assertIn("ValueError: boom", json.loads(line)["exc"])
+
+
+class TestLoggerCalls(unittest.TestCase):
+    """Las llamadas a Logger pasan la plantilla y sus campos por separado."""
+
+    def _untemplated_calls(self, path: Path):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if not (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr in LOGGER_METHODS
+                and isinstance(node.func.value, ast.Name)
+                and node.func.value.id == "Logger"
+                and node.args
+            ):
+                continue
+            message = node.args[0]
+            preformatted = (
+                isinstance(message, ast.Call)
+                and isinstance(message.func, ast.Attribute)
+                and message.func.attr == "format"
+                and isinstance(message.func.value, ast.Attribute)
+                and isinstance(message.func.value.value, ast.Name)
+                and message.func.value.value.id == "t"
+            )
+            stringified = (
+                isinstance(message, ast.Call)
+                and isinstance(message.func, ast.Name)
+                and message.func.id == "str"
+            )
+            if preformatted or stringified or isinstance(message, ast.JoinedStr):
+                yield f"{path.relative_to(ROOT)}:{node.lineno}"
+
+    def test_no_call_loses_the_translation_template(self):
+        """Logger.x(t.X.format(...)), un f-string o str(e) pierden el evento."""
+        paths = [ROOT / "main.py", *sorted((ROOT / "wifi_connector").rglob("*.py"))]
+
+        offenders = [call for path in paths for call in self._untemplated_calls(path)]
+
+        self.assertEqual(offenders, [], "Usa Logger.x(t.X, **campos)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+Tests unitarios para el módulo log_rotation.
+"""
+
+import gzip
+import logging
+import os
+import tempfile
+import time
+import unittest
+from datetime import date
+from pathlib import Path
+
+from wifi_connector.utils.log_rotation import (
+    LogMaintenance,
+    RetentionPolicy,
+    RotatingDailyFileHandler,
+    next_segment_path,
+)
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("wifi_connector", logging.INFO, __file__, 1, message, None, None)
+
+
+class TestRotatingDailyFileHandler(unittest.TestCase):
+    """Tests de la rotación por tamaño y por día."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        self.path = self.folder / "14-03-2025.log"
+        self.maintenance = LogMaintenance(self.folder)
+        self.handlers = []
+
+    def tearDown(self):
+        for handler in self.handlers:
+            handler.close()
+        self.maintenance.stop()
+        self.tmp.cleanup()
+
+    def _handler(self, **kwargs):
+        handler = RotatingDailyFileHandler(
+            self.path, maintenance=self.maintenance, clock=lambda: date(2025, 3, 14), **kwargs
+        )
+        self.handlers.append(handler)
+        return handler
+
+    def test_rollover_keeps_current_path_and_compresses_segments(self):
+        self.maintenance.start(active=self.path)
+        handler = self._handler(max_bytes=200)
+
+        for i in range(20):
+            handler.emit(_record(f"Missatge {i:02d} " + "x" * 40))
+        self.maintenance.stop()
+
+        names = sorted(os.listdir(self.folder))
+        self.assertIn("14-03-2025.log", names)
+        self.assertIn("14-03-2025.1.log.gz", names)
+        self.assertFalse([n for n in names if n.endswith(".1.log") or n.endswith(".part")])
+        self.assertLess(self.path.stat().st_size, 200)
+
+        lines = []
+        for name in sorted(n for n in names if n.endswith(".gz")):
+            with gzip.open(self.folder / name, "rt", encoding="utf-8") as f:
+                lines.extend(f.read().splitlines())
+        lines.extend(self.path.read_text(encoding="utf-8").splitlines())
+        self.assertEqual(sorted(lines), sorted(f"Missatge {i:02d} " + "x" * 40 for i in range(20)))
+
+    def test_segments_are_never_renumbered(self):
+        (self.folder / "14-03-2025.1.log.gz").write_bytes(b"")
+        (self.folder / "14-03-2025.7.log.gz").write_bytes(b"")
+        (self.folder / "15-03-2025.9.log.gz").write_bytes(b"")
+
+        self.assertEqual(next_segment_path(self.path).name, "14-03-2025.8.log")
+
+    def test_oversized_record_does_not_rotate_empty_file(self):
+        handler = self._handler(max_bytes=10)
+
+        handler.emit(_record("x" * 50))
+
+        self.assertEqual(sorted(os.listdir(self.folder)), ["14-03-2025.log"])
+
+    def test_day_change_switches_to_new_daily_file(self):
+        today = [date(2025, 3, 14)]
+        handler = RotatingDailyFileHandler(
+            self.path, maintenance=self.maintenance, clock=lambda: today[0]
+        )
+        self.handlers.append(handler)
+
+        handler.emit(_record("divendres"))
+        today[0] = date(2025, 3, 15)
+        handler.emit(_record("dissabte"))
+
+        self.assertEqual(handler.path.name, "15-03-2025.log")
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "divendres\n")
+        self.assertEqual(handler.path.read_text(encoding="utf-8"), "dissabte\n")
+
+
+class TestRetention(unittest.TestCase):
+    """Tests de la política de retención."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        now = time.time()
+        self.files = []
+        for age_days, name in enumerate(
+            ["05-03-2025.log", "04-03-2025.1.log.gz", "04-03-2025.log", "03-03-2025.log"]
+        ):
+            path = self.folder / name
+            path.write_bytes(b"x" * 100)
+            mtime = now - age_days * 86400
+            os.utime(path, (mtime, mtime))
+            self.files.append(path)
+        # Ni el cursor de análisis ni otros archivos cuentan
+        (self.folder / "notes.txt").write_bytes(b"x" * 10000)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_by_count_removes_oldest_first(self):
+        expired = RetentionPolicy(max_files=2).expired(self.folder, None, time.time())
+
+        self.assertEqual(expired, [self.files[3], self.files[2]])
+
+    def test_by_total_size(self):
+        policy = RetentionPolicy(max_total_bytes=250)
+
+        self.assertEqual(len(policy.expired(self.folder, None, time.time())), 2)
+
+    def test_by_age(self):
+        policy = RetentionPolicy(max_age_days=1.5)
+
+        expired = policy.expired(self.folder, None, time.time())
+
+        self.assertEqual(expired, [self.files[3], self.files[2]])
+
+    def test_active_file_is_never_removed(self):
+        active = self.files[3]
+        maintenance = LogMaintenance(self.folder, RetentionPolicy(max_files=1))
+        maintenance.active = active
+
+        removed = maintenance.apply_retention()
+
+        self.assertTrue(active.exists())
+        self.assertEqual(sorted(removed), sorted(self.files[:3]))
+
+    def test_start_compresses_leftover_segments(self):
+        leftover = self.folder / "05-03-2025.1.log"
+        leftover.write_text("línia\n", encoding="utf-8")
+        maintenance = LogMaintenance(self.folder)
+
+        maintenance.start(active=self.files[0])
+        maintenance.stop()
+
+        self.assertFalse(leftover.exists())
+        with gzip.open(self.folder / "05-03-2025.1.log.gz", "rt", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "línia\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,7 +33,7 @@ class TestLoggerSetup:
         """Test that setup() adds console handler."""
         Logger.setup()
         
-        handlers = Logger._logger.handlers
+        handlers = Logger._handlers
         assert len(handlers) >= 1
         assert any(isinstance(h, logging.StreamHandler) for h in handlers)
     
@@ -42,7 +42,7 @@ class TestLoggerSetup:
         log_file = tmp_path / "test.log"
         Logger.setup(log_file=str(log_file))
         
-        handlers = Logger._logger.handlers
+        handlers = Logger._handlers
         file_handlers = [h for h in handlers if isinstance(h, logging.FileHandler)]
         assert len(file_handlers) == 1
     
@@ -50,7 +50,7 @@ class TestLoggerSetup:
         """Test that setup() configures formatter with timestamp format."""
         Logger.setup()
         
-        handler = Logger._logger.handlers[0]
+        handler = Logger._handlers[0]
         formatter = handler.formatter
         assert formatter is not None
         assert '%(asctime)s' in formatter._fmt
@@ -204,7 +204,7 @@ class TestLoggerFormatting:
         """Test that log formatter includes timestamp."""
         Logger.setup()
         
-        handler = Logger._logger.handlers[0]
+        handler = Logger._handlers[0]
         formatter = handler.formatter
         
         assert formatter.datefmt == '%Y-%m-%d %H:%M:%S'
@@ -213,7 +213,7 @@ class TestLoggerFormatting:
         """Test that log formatter includes logger name."""
         Logger.setup()
         
-        handler = Logger._logger.handlers[0]
+        handler = Logger._handlers[0]
         formatter = handler.formatter
         
         assert '%(name)s' in formatter._fmt
@@ -223,8 +223,208 @@ class TestLoggerFormatting:
         """Test that log formatter includes level and message."""
         Logger.setup()
         
-        handler = Logger._logger.handlers[0]
+        handler = Logger._handlers[0]
         formatter = handler.formatter
         
         assert '%(levelname)s' in formatter._fmt
         assert '%(message)s' in formatter._fmt
+
+
+class TestLoggerQueue:
+    """Tests for the queue-based writer thread."""
+
+    def setup_method(self):
+        """Reset logger state before each test."""
+        Logger._logger = None
+        Logger._is_setup = False
+
+    def teardown_method(self):
+        """Stop the writer thread and release the log file."""
+        Logger.shutdown()
+        for handler in Logger._handlers:
+            handler.close()
+        Logger._handlers = []
+
+    def test_records_are_written_off_the_calling_thread(self, tmp_path):
+        """Test that handlers emit on the listener thread, not the caller."""
+        import threading
+
+        Logger.setup(log_file=str(tmp_path / "test.log"))
+        file_handler = Logger._handlers[-1]
+        threads = []
+        original_emit = file_handler.emit
+
+        def spy(record):
+            threads.append(threading.current_thread())
+            original_emit(record)
+
+        with patch.object(file_handler, "emit", side_effect=spy):
+            Logger.info("Test queued message")
+            Logger.shutdown()
+
+        assert threads and threading.main_thread() not in threads
+
+    def test_shutdown_flushes_pending_records(self, tmp_path):
+        """Test that shutdown() writes every queued record to the file."""
+        log_file = tmp_path / "test.log"
+        Logger.setup(log_file=str(log_file))
+
+        for i in range(200):
+            Logger.info(f"Message {i}")
+        Logger.shutdown()
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 200
+        assert lines[-1].endswith("Message 199")
+
+    def test_messages_after_shutdown_are_written_directly(self, tmp_path):
+        """Test that logging after shutdown() still reaches the file."""
+        log_file = tmp_path / "test.log"
+        Logger.setup(log_file=str(log_file))
+        Logger.shutdown()
+
+        Logger.warning("Late message")
+
+        assert "Late message" in log_file.read_text(encoding="utf-8")
+
+    def test_no_console_handler_without_console(self, tmp_path, monkeypatch):
+        """Test that the console handler is dropped when stderr is devnull."""
+        import os
+
+        with open(os.devnull, "w") as devnull:
+            monkeypatch.setattr("sys.stderr", devnull)
+            Logger.setup(log_file=str(tmp_path / "test.log"))
+
+        assert [type(h) for h in Logger._handlers] == [logging.FileHandler]
+
+
+class TestLoggerLazyFormatting:
+    """Tests for the template-plus-fields form and is_enabled()."""
+
+    def setup_method(self):
+        """Reset logger state before each test."""
+        Logger._logger = None
+        Logger._is_setup = False
+
+    def test_fields_are_formatted_when_level_is_enabled(self):
+        """Test that a template with fields is formatted before logging."""
+        Logger.setup(level="DEBUG")
+
+        with patch.object(Logger._logger, 'debug') as mock_debug:
+            Logger.debug("Filtrant per '{query}'", query="escola")
+            mock_debug.assert_called_once_with("Filtrant per 'escola'")
+
+    def test_field_named_message_is_allowed(self):
+        """Test that a template field may be called 'message'."""
+        Logger.setup(level="DEBUG")
+
+        with patch.object(Logger._logger, 'debug') as mock_debug:
+            Logger.debug("[{type}] {message}", type="info", message="Llest")
+            mock_debug.assert_called_once_with("[info] Llest")
+
+    def test_disabled_level_skips_formatting(self):
+        """Test that a disabled level neither formats nor logs."""
+        Logger.setup(level="INFO")
+        template = Mock()
+
+        with patch.object(Logger._logger, 'debug') as mock_debug:
+            Logger.debug(template, query="escola")
+
+        template.format.assert_not_called()
+        mock_debug.assert_not_called()
+
+    def test_error_fields_keep_exc_info(self):
+        """Test that error() accepts fields together with exc_info."""
+        Logger.setup()
+
+        with patch.object(Logger._logger, 'error') as mock_error:
+            Logger.error("Error: {error}", exc_info=True, error="boom")
+            mock_error.assert_called_once_with("Error: boom", exc_info=True)
+
+    def test_is_enabled_follows_configured_level(self):
+        """Test that is_enabled() reflects the configured level."""
+        Logger.setup(level="INFO")
+
+        assert Logger.is_enabled(Logger.INFO) is True
+        assert Logger.is_enabled(Logger.DEBUG) is False
+
+    def test_is_enabled_auto_setups_if_not_setup(self):
+        """Test that is_enabled() sets up the logger on first use."""
+        assert Logger._is_setup is False
+
+        Logger.is_enabled(Logger.DEBUG)
+
+        assert Logger._is_setup is True
+
+
+class TestLoggerJsonFormat:
+    """Tests for the JSON Lines file format."""
+
+    def setup_method(self):
+        """Reset logger state before each test."""
+        Logger._logger = None
+        Logger._is_setup = False
+
+    def teardown_method(self):
+        """Stop the writer thread, release the log file and go back to text."""
+        Logger.shutdown()
+        for handler in Logger._handlers:
+            handler.close()
+        Logger._handlers = []
+        Logger._file_handler = None
+        Logger._json_format = False
+        if Logger._logger is not None:
+            Logger._logger.handlers.clear()
+        Logger._is_setup = False
+
+    def _records(self, log_file):
+        import json
+
+        Logger.shutdown()
+        return [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+
+    def test_records_carry_event_fields_context_and_thread(self, tmp_path):
+        """Test that each line has the event ID, template fields and context."""
+        from wifi_connector.utils import translations as t
+
+        log_file = tmp_path / "test.log"
+        Logger.setup(level="DEBUG", log_file=str(log_file), json_format=True)
+
+        with Logger.context(center="08001234", trace_id="ab12"):
+            Logger.debug(t.PROCESS_LOG_FINISHED, program="netsh", duration_ms=12.5, returncode=0)
+        Logger.info(t.PROFILE_LOG_STARTING)
+
+        first, second = self._records(log_file)
+        assert first["event"] == "PROCESS_LOG_FINISHED"
+        assert first["fields"] == {"program": "netsh", "duration_ms": 12.5, "returncode": 0}
+        assert (first["center"], first["trace_id"]) == ("08001234", "ab12")
+        assert first["thread"] == "MainThread"
+        assert first["level"] == "DEBUG"
+        assert first["message"] == "netsh finalitzat en 12 ms (codi 0)"
+        assert second["event"] == "PROFILE_LOG_STARTING"
+        assert "fields" not in second and "center" not in second
+
+    def test_set_json_format_switches_the_file_format(self, tmp_path):
+        """Test that the format can be switched after setup()."""
+        log_file = tmp_path / "test.log"
+        Logger.setup(log_file=str(log_file))
+
+        Logger.info("Text line")
+        Logger.set_json_format(True)
+        Logger.info("JSON line")
+        Logger.shutdown()
+
+        text, json_line = log_file.read_text(encoding="utf-8").splitlines()
+        assert text.endswith(" - INFO - Text line")
+        assert json_line.startswith("{") and '"message": "JSON line"' in json_line
+
+    def test_no_extra_when_text_format_or_level_disabled(self, tmp_path):
+        """Test that records get no extra dicts unless they will be written as JSON."""
+        from wifi_connector.utils.logger import _NO_EXTRA
+
+        Logger.setup(level="INFO", log_file=str(tmp_path / "test.log"))
+        assert Logger._extra(Logger.INFO, "x", {}) is _NO_EXTRA
+
+        Logger.set_json_format(True)
+        assert Logger._extra(Logger.DEBUG, "x", {"a": 1}) is _NO_EXTRA
+        assert Logger._extra(Logger.INFO, "x", {"a": 1})["extra"]["event_fields"] == {"a": 1}
@@ -0,0 +1,177 @@
+"""
+Tests unitarios para el módulo metrics.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from wifi_connector.core.config import Config
+from wifi_connector.network.netsh_output import WlanInterface
+from wifi_connector.utils import metrics
+from wifi_connector.utils.metrics import (
+    AppMetrics,
+    Counter,
+    Histogram,
+    TextfileExporter,
+)
+
+
+class TestMetricTypes(unittest.TestCase):
+    """Tests del formato de texto de Prometheus."""
+
+    def test_counter_renders_labelled_samples(self):
+        counter = Counter("attempts_total", "Attempts.", ("outcome",))
+        counter.inc(outcome="connected")
+        counter.inc(outcome="connected")
+        counter.inc(outcome="failed")
+
+        lines = counter.render()
+
+        self.assertEqual(lines[0], "# HELP attempts_total Attempts.")
+        self.assertEqual(lines[1], "# TYPE attempts_total counter")
+        self.assertIn('attempts_total{outcome="connected"} 2', lines)
+        self.assertIn('attempts_total{outcome="failed"} 1', lines)
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+        for value in (0.05, 0.5, 0.7, 3):
+            histogram.observe(value)
+
+        lines = histogram.render()
+
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', lines)
+        self.assertIn('latency_seconds_bucket{le="1"} 3', lines)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 4', lines)
+        self.assertIn("latency_seconds_sum 4.25", lines)
+        self.assertIn("latency_seconds_count 4", lines)
+
+    def test_label_values_are_escaped(self):
+        counter = Counter("c_total", "C.", ("step",))
+        counter.inc(step='a"b\\c')
+
+        self.assertIn('c_total{step="a\\"b\\\\c"} 1', counter.render())
+
+    def test_concurrent_updates_are_not_lost(self):
+        counter = Counter("c_total", "C.")
+
+        def work():
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(counter.value(), 8000)
+
+
+class TestAppMetrics(unittest.TestCase):
+    """Tests de las métricas de la aplicación."""
+
+    def test_attempt_finished_updates_counters_and_steps(self):
+        app_metrics = AppMetrics()
+
+        app_metrics.attempt_finished(
+            "connected", 3.0, {"step.install": 0.4, "verify.attempt": 1.2}
+        )
+        app_metrics.attempt_finished("failed", 9.0, {"step.install": 0.5})
+
+        self.assertEqual(app_metrics.attempts.value(outcome="connected"), 1)
+        self.assertEqual(app_metrics.attempts.value(outcome="failed"), 1)
+        self.assertEqual(app_metrics.step_duration.count(step="step.install"), 2)
+        self.assertEqual(len(app_metrics.last_success.render()[2:]), 1)
+
+    def test_failed_attempt_does_not_set_last_success(self):
+        app_metrics = AppMetrics()
+
+        app_metrics.attempt_finished("failed", 1.0, {})
+
+        self.assertEqual(app_metrics.last_success.render()[2:], [])
+
+    def test_interface_observed_sets_signal_and_link_rates(self):
+        app_metrics = AppMetrics()
+
+        app_metrics.interface_observed(
+            WlanInterface(signal=78, receive_rate=144.4, transmit_rate=None)
+        )
+
+        text = app_metrics.render()
+        self.assertIn("wifi_connector_signal_percent 78", text)
+        self.assertIn('wifi_connector_link_rate_mbps{direction="receive"} 144.4', text)
+        self.assertNotIn('direction="transmit"', text)
+
+
+class TestTextfileExporter(unittest.TestCase):
+    """Tests de la escritura del archivo .prom."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "wifi_connector.prom"
+
+    def tearDown(self):
+        metrics.disable()
+        self.tmp.cleanup()
+
+    def test_write_is_atomic_and_leaves_no_temp_files(self):
+        app_metrics = AppMetrics()
+        app_metrics.attempts.inc(outcome="connected")
+        exporter = TextfileExporter(app_metrics, self.path)
+
+        with patch("wifi_connector.utils.metrics.os.replace", wraps=os.replace) as rep:
+            self.assertTrue(exporter.write())
+
+        rep.assert_called_once()
+        self.assertEqual(os.listdir(self.tmp.name), [self.path.name])
+        content = self.path.read_text(encoding="utf-8")
+        self.assertIn('wifi_connector_connect_attempts_total{outcome="connected"} 1', content)
+        self.assertTrue(content.endswith("\n"))
+
+    def test_failed_write_keeps_previous_file(self):
+        exporter = TextfileExporter(AppMetrics(), self.path)
+        exporter.write()
+        before = self.path.read_text(encoding="utf-8")
+
+        with patch(
+            "wifi_connector.utils.metrics.os.replace", side_effect=OSError("disc ple")
+        ):
+            self.assertFalse(exporter.write())
+
+        self.assertEqual(self.path.read_text(encoding="utf-8"), before)
+        self.assertEqual(os.listdir(self.tmp.name), [self.path.name])
+
+    def test_enable_writes_periodically_and_disable_flushes(self):
+        app_metrics = metrics.enable(self.path, interval=0.05)
+        self.assertIs(metrics.active(), app_metrics)
+
+        deadline = time.monotonic() + 5
+        while not self.path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(self.path.exists())
+
+        app_metrics.search_duration.observe(0.002)
+        metrics.disable()
+
+        self.assertIsNone(metrics.active())
+        self.assertIn(
+            "wifi_connector_search_duration_seconds_count 1",
+            self.path.read_text(encoding="utf-8"),
+        )
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(metrics.active())
+        self.assertIsNone(Config().metrics_textfile)
+
+    def test_config_rejects_non_positive_interval(self):
+        with self.assertRaises(ValueError):
+            Config(metrics_interval=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
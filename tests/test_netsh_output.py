@@ -0,0 +1,121 @@
+"""
+Tests unitarios para el módulo netsh_output.
+
+Las salidas de ejemplo están en tests/fixtures/netsh_outputs.json, por idioma
+de Windows (ca/es/en/fr), junto con los resultados que se deben reconocer.
+"""
+
+import json
+import os
+import unittest
+from dataclasses import asdict
+
+from wifi_connector.network.netsh_output import (
+    NetshOutcome,
+    WlanInterface,
+    classify,
+    find_interface,
+    normalize,
+    parse_interfaces,
+)
+
+
+CORPUS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fixtures", "netsh_outputs.json"
+)
+
+
+def _load_corpus(section="samples"):
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        return json.load(f)[section]
+
+
+class TestClassifyCorpus(unittest.TestCase):
+    """Tests del clasificador contra el corpus de salidas reales."""
+
+    def test_every_sample_gives_its_outcomes(self):
+        for sample in _load_corpus():
+            text = sample.get("stdout", "") or sample.get("stderr", "")
+            with self.subTest(lang=sample["lang"], command=sample["command"], text=text):
+                output = classify(sample.get("stdout", ""), sample.get("stderr", ""))
+                self.assertEqual(
+                    sorted(outcome.value for outcome in output.outcomes),
+                    sorted(sample["outcomes"]),
+                )
+
+    def test_corpus_covers_every_language_and_outcome(self):
+        corpus = _load_corpus()
+        for lang in ("ca", "es", "en", "fr"):
+            for outcome in ("success", "not_found", "not_available", "permission", "already_exists"):
+                with self.subTest(lang=lang, outcome=outcome):
+                    self.assertTrue(
+                        any(s["lang"] == lang and outcome in s["outcomes"] for s in corpus)
+                    )
+
+
+class TestNormalize(unittest.TestCase):
+    """Tests de la forma normalizada."""
+
+    def test_removes_accents_case_and_extra_spaces(self):
+        self.assertEqual(
+            normalize("  La xarxa   NO està\r\ndisponible "), "la xarxa no esta disponible"
+        )
+
+    def test_drops_characters_without_ascii_form(self):
+        self.assertEqual(normalize("ning£n perfil «x»"), "ningn perfil x")
+
+
+class TestNetshOutput(unittest.TestCase):
+    """Tests del resultado clasificado."""
+
+    def test_stdout_and_stderr_are_classified_together(self):
+        output = classify("Perfil eliminat.", "Access is denied.")
+
+        self.assertTrue(output.has(NetshOutcome.PERMISSION))
+        self.assertTrue(output.has(NetshOutcome.SUCCESS, NetshOutcome.PERMISSION))
+        self.assertFalse(output.has(NetshOutcome.SUCCESS))
+        self.assertEqual(output.text, "perfil eliminat. access is denied.")
+
+    def test_error_5_is_not_error_50(self):
+        self.assertTrue(classify("Error 5: acceso denegado").has(NetshOutcome.PERMISSION))
+        self.assertFalse(classify("error 50: not supported").has(NetshOutcome.PERMISSION))
+
+
+class TestParseInterfaces(unittest.TestCase):
+    """Tests del análisis de "netsh wlan show interfaces"."""
+
+    def test_every_sample_gives_its_interfaces(self):
+        for sample in _load_corpus("interfaces"):
+            with self.subTest(lang=sample["lang"], mojibake=sample.get("mojibake", False)):
+                interfaces = parse_interfaces(sample["stdout"])
+                self.assertEqual([asdict(i) for i in interfaces], sample["expected"])
+
+    def test_output_without_names_splits_on_repeated_fields(self):
+        interfaces = parse_interfaces("State: disconnected\nState: connected\nSSID: x")
+
+        self.assertEqual([i.state for i in interfaces], ["disconnected", "connected"])
+        self.assertEqual(interfaces[1].ssid, "x")
+
+    def test_empty_output(self):
+        self.assertEqual(parse_interfaces(""), [])
+
+
+class TestFindInterface(unittest.TestCase):
+    """Tests de la elección del adaptador de la red."""
+
+    def test_matches_ssid_or_profile_ignoring_case(self):
+        other = WlanInterface(name="Wi-Fi", state="connected", ssid="Casa")
+        ours = WlanInterface(name="Wi-Fi 2", state="connecting", profile="gencat_ENS_EDU")
+
+        self.assertIs(find_interface([other, ours], "GENCAT_ens_edu"), ours)
+        self.assertIsNone(find_interface([other], "gencat_ENS_EDU"))
+
+    def test_prefers_the_connected_adapter(self):
+        associating = WlanInterface(name="Wi-Fi", state="authenticating", ssid="gencat_ENS_EDU")
+        connected = WlanInterface(name="Wi-Fi 2", state="connected", ssid="gencat_ENS_EDU")
+
+        self.assertIs(find_interface([associating, connected], "gencat_ENS_EDU"), connected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,306 @@
+"""
+Tests unitarios para el módulo netsh_session.
+
+Se ejecutan contra tests/fixtures/fake_netsh.py, un intérprete que imita el
+modo interactivo de netsh, de modo que funcionan también fuera de Windows.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from wifi_connector.core.exceptions import ConnectionCancelledError, NetshSessionError
+from wifi_connector.core.profile_connector import ProfileConnector
+from wifi_connector.network.manager import NetworkManager
+from wifi_connector.network.netsh_session import MAX_TIMEOUTS, NetshSession, is_query
+
+
+FAKE_NETSH = [
+    sys.executable,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "fake_netsh.py"),
+]
+
+
+class TestNetshSession(unittest.TestCase):
+    """Tests de la sesión interactiva contra el intérprete sustituto."""
+
+    def setUp(self):
+        self.session = NetshSession(command=FAKE_NETSH, timeout=5)
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_returns_framed_output_without_prompt(self):
+        output = self.session.run(["wlan", "show", "interfaces"]).decode()
+
+        self.assertIn("State                  : connected", output)
+        self.assertNotIn("netsh>", output)
+        self.assertNotIn("wc_end_", output)
+
+    def test_reuses_single_process(self):
+        self.session.run(["wlan", "show", "interfaces"])
+        pid = self.session._process.pid
+
+        output = self.session.run(["wlan", "show", "profiles"]).decode()
+
+        self.assertIn("All User Profile     : gencat_ENS_EDU", output)
+        self.assertEqual(self.session._process.pid, pid)
+
+    def test_error_output_is_not_mistaken_for_sentinel(self):
+        output = self.session.run(["wlan", "show", "nothing"]).decode()
+
+        self.assertIn("not found: wlan show nothing", output)
+
+    def test_restarts_after_process_dies(self):
+        self.session.run(["wlan", "show", "interfaces"])
+        old_process = self.session._process
+        old_process.kill()
+        old_process.wait()
+
+        output = self.session.run(["wlan", "show", "interfaces"]).decode()
+
+        self.assertIn("connected", output)
+        self.assertNotEqual(self.session._process.pid, old_process.pid)
+
+    def test_command_that_keeps_crashing_raises(self):
+        with self.assertRaises(NetshSessionError):
+            self.session.run(["crash"])
+
+        output = self.session.run(["wlan", "show", "interfaces"]).decode()
+        self.assertIn("connected", output)
+
+    def test_timeout_kills_and_restarts_session(self):
+        self.session.run(["wlan", "show", "interfaces"])
+        hung_process = self.session._process
+
+        with self.assertRaises(NetshSessionError):
+            self.session.run(["hang"], timeout=0.5)
+
+        self.assertIsNotNone(hung_process.poll())
+        self.assertTrue(self.session.is_available)
+        output = self.session.run(["wlan", "show", "interfaces"]).decode()
+        self.assertIn("gencat_ENS_EDU", output)
+        self.assertIsNot(self.session._process, hung_process)
+
+    def test_repeated_timeouts_disable_session(self):
+        for _ in range(MAX_TIMEOUTS):
+            with self.assertRaises(NetshSessionError):
+                self.session.run(["hang"], timeout=0.3)
+
+        self.assertFalse(self.session.is_available)
+        with patch("wifi_connector.network.netsh_session.subprocess.Popen") as popen:
+            with self.assertRaises(NetshSessionError):
+                self.session.run(["wlan", "show", "interfaces"])
+            popen.assert_not_called()
+
+    def test_answer_between_timeouts_keeps_session(self):
+        for _ in range(MAX_TIMEOUTS):
+            with self.assertRaises(NetshSessionError):
+                self.session.run(["hang"], timeout=0.3)
+            self.session.run(["wlan", "show", "interfaces"])
+
+        self.assertTrue(self.session.is_available)
+
+    def test_cancel_event_interrupts_wait(self):
+        self.session.run(["wlan", "show", "interfaces"])
+        cancel_event = threading.Event()
+        threading.Timer(0.2, cancel_event.set).start()
+
+        start = time.monotonic()
+        with self.assertRaises(ConnectionCancelledError):
+            self.session.run(["hang"], cancel_event=cancel_event)
+
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertTrue(self.session.is_available)
+        output = self.session.run(["wlan", "show", "interfaces"]).decode()
+        self.assertIn("connected", output)
+
+    def test_concurrent_callers_get_their_own_output(self):
+        results = {}
+
+        def query(name, args):
+            results[name] = self.session.run(args).decode()
+
+        threads = [
+            threading.Thread(
+                target=query, args=(i, ["wlan", "show", "interfaces" if i % 2 else "profiles"])
+            )
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        for i, output in results.items():
+            expected = "State" if i % 2 else "All User Profile"
+            self.assertIn(expected, output)
+        self.assertEqual(len(results), 8)
+
+    def test_close_stops_process(self):
+        self.session.run(["wlan", "show", "interfaces"])
+        process = self.session._process
+
+        self.session.close()
+
+        self.assertFalse(self.session.is_alive)
+        self.assertIsNotNone(process.poll())
+
+    def test_missing_executable_marks_session_unavailable(self):
+        session = NetshSession(command=["/nonexistent/netsh"])
+
+        with self.assertRaises(NetshSessionError):
+            session.run(["wlan", "show", "interfaces"])
+        with patch("wifi_connector.network.netsh_session.subprocess.Popen") as popen:
+            with self.assertRaises(NetshSessionError):
+                session.run(["wlan", "show", "interfaces"])
+            popen.assert_not_called()
+
+
+class TestIsQuery(unittest.TestCase):
+    """Tests para la detección de comandos de solo lectura."""
+
+    def test_show_commands_are_queries(self):
+        self.assertTrue(is_query(["wlan", "show", "interfaces"]))
+        self.assertTrue(is_query(["wlan", "SHOW", "profiles"]))
+
+    def test_other_commands_are_not_queries(self):
+        self.assertFalse(is_query(["wlan", "connect", "name=x"]))
+        self.assertFalse(is_query(["wlan", "add", "profile", "filename=x"]))
+        self.assertFalse(is_query(["wlan"]))
+
+
+class TestSessionIntegration(unittest.TestCase):
+    """Tests del uso de la sesión desde ProfileConnector y NetworkManager."""
+
+    def setUp(self):
+        self.session = MagicMock(timeout=10.0, is_available=True)
+        self.session.run.return_value = b"    State : connected\r\n"
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_profile_connector_routes_queries_to_session(self, mock_run):
+        connector = ProfileConnector(netsh_session=self.session)
+
+        result = connector._run_command(["netsh", "wlan", "show", "interfaces"])
+
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("connected", result.stdout)
+        self.session.run.assert_called_once_with(
+            ["wlan", "show", "interfaces"],
+            timeout=10.0,
+            cancel_event=connector.cancel_event,
+        )
+        mock_run.assert_not_called()
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_profile_connector_session_wait_honours_call_timeout(self, mock_run):
+        connector = ProfileConnector(netsh_session=self.session)
+
+        connector._run_command(["netsh", "wlan", "show", "interfaces"], timeout=2.0)
+
+        self.assertEqual(self.session.run.call_args.kwargs["timeout"], 2.0)
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_profile_connector_skips_disabled_session(self, mock_run):
+        self.session.is_available = False
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"ok", stderr=b"")
+        connector = ProfileConnector(netsh_session=self.session)
+
+        connector._run_command(["netsh", "wlan", "show", "interfaces"])
+
+        self.session.run.assert_not_called()
+        mock_run.assert_called_once()
+
+    def test_profile_connector_cancel_interrupts_session_query(self):
+        session = NetshSession(command=FAKE_NETSH, timeout=30)
+        connector = ProfileConnector(netsh_session=session)
+        threading.Timer(0.3, connector.cancel).start()
+        try:
+            start = time.monotonic()
+            with self.assertRaises(ConnectionCancelledError):
+                connector._run_command(["netsh", "hang", "show"])
+            self.assertLess(time.monotonic() - start, 5)
+        finally:
+            session.close()
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_profile_connector_spawns_mutating_commands(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"ok", stderr=b"")
+        connector = ProfileConnector(netsh_session=self.session)
+
+        connector._run_command(["netsh", "wlan", "connect", "name=gencat_ENS_EDU"])
+
+        self.session.run.assert_not_called()
+        mock_run.assert_called_once()
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_profile_connector_falls_back_when_session_fails(self, mock_run):
+        self.session.run.side_effect = NetshSessionError("sense netsh")
+        mock_run.return_value = MagicMock(returncode=1, stdout=b"", stderr=b"error")
+        connector = ProfileConnector(netsh_session=self.session)
+
+        result = connector._run_command(["netsh", "wlan", "show", "interfaces"])
+
+        self.assertEqual(result.returncode, 1)
+        mock_run.assert_called_once()
+
+    @patch("wifi_connector.network.manager.run_process")
+    def test_network_manager_routes_queries_to_session(self, mock_run):
+        self.session.run.return_value = b"SSID 1 : gencat_ENS_EDU\r\n"
+        manager = NetworkManager(netsh_session=self.session)
+
+        networks = manager.get_available_networks()
+
+        self.assertEqual(networks, ["gencat_ENS_EDU"])
+        mock_run.assert_not_called()
+
+
+class TestNetshSessionBenchmark(unittest.TestCase):
+    """
+    Compara la latencia por comando de la sesión con la de un proceso por comando.
+
+    Lanzar un proceso cuesta decenas de milisegundos y una consulta por la
+    sesión, menos de uno; el margen (SLACK) es amplio para que una máquina
+    de CI cargada no dé falsos fallos.
+    """
+
+    ROUNDS = 10
+    SLACK = 2.0
+
+    def test_session_is_faster_than_spawning(self):
+        args = ["wlan", "show", "interfaces"]
+
+        def timed(call):
+            samples = []
+            for _ in range(self.ROUNDS):
+                start = time.perf_counter()
+                call()
+                samples.append(time.perf_counter() - start)
+            return statistics.median(samples)
+
+        spawn_median = timed(
+            lambda: subprocess.run(FAKE_NETSH + args, capture_output=True, check=False)
+        )
+
+        session = NetshSession(command=FAKE_NETSH)
+        try:
+            session.run(args)  # El arranque se paga una sola vez
+            session_median = timed(lambda: session.run(args))
+        finally:
+            session.close()
+
+        self.assertLess(
+            session_median,
+            spawn_median * self.SLACK,
+            f"mediana de {self.ROUNDS}: proceso {spawn_median * 1000:.1f} ms, "
+            f"sesión {session_median * 1000:.1f} ms",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
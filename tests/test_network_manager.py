@@ -1,7 +1,8 @@
 """Unit tests for NetworkManager class."""
 
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 import subprocess
 from wifi_connector.network.manager import NetworkManager
 
@@ -58,7 +59,7 @@ Just garbage data
 class TestGetAvailableNetworks:
     """Tests for get_available_networks() method."""
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_returns_list_of_networks_from_valid_output(
         self,
         mock_run,
@@ -78,7 +79,7 @@ class TestGetAvailableNetworks:
         assert "OtherNetwork" in networks
         assert "TestNetwork" in networks
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_returns_empty_list_when_no_networks_found(
         self,
         mock_run,
@@ -95,7 +96,7 @@ class TestGetAvailableNetworks:
         
         assert networks == []
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_returns_empty_list_for_malformed_output(
         self,
         mock_run,
@@ -112,7 +113,7 @@ class TestGetAvailableNetworks:
         
         assert networks == []
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_returns_empty_list_on_subprocess_error(
         self,
         mock_run,
@@ -129,7 +130,7 @@ class TestGetAvailableNetworks:
         
         assert networks == []
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_calls_netsh_with_correct_arguments(
         self,
         mock_run,
@@ -148,7 +149,7 @@ class TestGetAvailableNetworks:
         call_args = mock_run.call_args[0][0]
         assert call_args == ["netsh", "wlan", "show", "networks"]
     
-    @patch('wifi_connector.network.manager.subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_uses_cp850_encoding(
         self,
         mock_run,
@@ -170,7 +171,7 @@ class TestGetAvailableNetworks:
 class TestIsNetworkAvailable:
     """Tests for is_network_available() method."""
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_returns_true_when_network_is_available(
         self,
         mock_run,
@@ -187,7 +188,7 @@ class TestIsNetworkAvailable:
         
         assert result is True
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_returns_false_when_network_is_not_available(
         self,
         mock_run,
@@ -204,7 +205,7 @@ class TestIsNetworkAvailable:
         
         assert result is False
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_returns_false_when_no_networks_available(
         self,
         mock_run,
@@ -225,7 +226,7 @@ class TestIsNetworkAvailable:
 class TestDisconnect:
     """Tests for disconnect() method."""
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_returns_true_on_successful_disconnect(
         self,
         mock_run,
@@ -241,7 +242,7 @@ class TestDisconnect:
         
         assert result is True
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_calls_netsh_disconnect_command(
         self,
         mock_run,
@@ -259,7 +260,7 @@ class TestDisconnect:
         call_args = mock_run.call_args[0][0]
         assert call_args == ["netsh", "wlan", "disconnect"]
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_returns_false_on_subprocess_error(
         self,
         mock_run,
@@ -280,7 +281,7 @@ class TestDisconnect:
 class TestExecuteNetshCommand:
     """Tests for _execute_netsh_command() private method."""
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_executes_command_with_netsh_prefix(
         self,
         mock_run,
@@ -298,7 +299,7 @@ class TestExecuteNetshCommand:
         assert call_args[0] == "netsh"
         assert call_args[1:] == ["wlan", "show", "networks"]
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_returns_stdout_on_success(
         self,
         mock_run,
@@ -315,7 +316,7 @@ class TestExecuteNetshCommand:
         
         assert result == expected_output
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_raises_exception_on_command_failure(
         self,
         mock_run,
@@ -331,13 +332,13 @@ class TestExecuteNetshCommand:
         with pytest.raises(subprocess.CalledProcessError):
             network_manager._execute_netsh_command(["test"])
     
-    @patch('subprocess.run')
+    @patch('wifi_connector.network.manager.run_process')
     def test_uses_check_true_flag(
         self,
         mock_run,
         network_manager
     ):
-        """Test that check=True is used in subprocess.run."""
+        """Test that check=True is passed to run_process."""
         mock_run.return_value = MagicMock(
             stdout="Success",
             returncode=0
@@ -349,6 +350,87 @@ class TestExecuteNetshCommand:
         assert call_kwargs.get('check') is True
 
 
+class TestAsyncOperations:
+    """Tests for the asyncio variants of scan and disconnect."""
+
+    @patch('wifi_connector.network.manager.run_process_async', new_callable=AsyncMock)
+    def test_scan_returns_networks(
+        self,
+        mock_run,
+        network_manager,
+        mock_netsh_output_valid
+    ):
+        """Test that the async scan parses the netsh output."""
+        mock_run.return_value = MagicMock(
+            stdout=mock_netsh_output_valid,
+            returncode=0
+        )
+
+        networks = asyncio.run(network_manager.get_available_networks_async())
+
+        assert networks == ["gencat_ENS_EDU", "OtherNetwork", "TestNetwork"]
+        assert mock_run.call_args[0][0] == ["netsh", "wlan", "show", "networks"]
+
+    @patch('wifi_connector.network.manager.run_process_async', new_callable=AsyncMock)
+    def test_scan_returns_empty_list_on_error(self, mock_run, network_manager):
+        """Test that a failed async scan returns an empty list."""
+        mock_run.side_effect = subprocess.CalledProcessError(
+            returncode=1,
+            cmd="netsh",
+            output="Error"
+        )
+
+        assert asyncio.run(network_manager.get_available_networks_async()) == []
+
+    @patch('wifi_connector.network.manager.run_process_async', new_callable=AsyncMock)
+    def test_disconnect_success(self, mock_run, network_manager):
+        """Test that the async disconnect returns True on success."""
+        mock_run.return_value = MagicMock(stdout="", returncode=0)
+
+        assert asyncio.run(network_manager.disconnect_async()) is True
+        assert mock_run.call_args[0][0] == ["netsh", "wlan", "disconnect"]
+
+    @patch('wifi_connector.network.manager.run_process_async', new_callable=AsyncMock)
+    def test_disconnect_failure(self, mock_run, network_manager):
+        """Test that the async disconnect returns False on failure."""
+        mock_run.side_effect = subprocess.CalledProcessError(
+            returncode=1,
+            cmd="netsh",
+            output="Error"
+        )
+
+        assert asyncio.run(network_manager.disconnect_async()) is False
+
+    def test_scan_and_disconnect_run_concurrently(self, network_manager):
+        """Test that several async operations overlap on one loop."""
+
+        async def slow_netsh(command, **kwargs):
+            await asyncio.sleep(0.2)
+            return MagicMock(stdout="SSID 1 : gencat_ENS_EDU", returncode=0)
+
+        async def run_all():
+            return await asyncio.gather(
+                network_manager.get_available_networks_async(),
+                network_manager.get_available_networks_async(),
+                network_manager.disconnect_async(),
+            )
+
+        with patch(
+            'wifi_connector.network.manager.run_process_async',
+            side_effect=slow_netsh
+        ):
+            loop = asyncio.new_event_loop()
+            try:
+                start = loop.time()
+                results = loop.run_until_complete(run_all())
+                elapsed = loop.time() - start
+            finally:
+                loop.close()
+
+        assert results == [["gencat_ENS_EDU"], ["gencat_ENS_EDU"], True]
+        assert elapsed < 0.5
+
+
 class TestParseNetworkList:
     """Tests for _parse_network_list() private method."""
     
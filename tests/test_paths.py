@@ -1,6 +1,7 @@
 """Tests for path utilities."""
 
 import sys
+from datetime import date
 from pathlib import Path
 
 from wifi_connector.utils import paths
@@ -22,3 +23,35 @@ def test_get_paths_frozen_mode(monkeypatch, tmp_path):
 
     assert paths.get_vault_path() == exe_path.parent / "vault"
     assert paths.get_favorites_path() == exe_path.parent / "vault" / "fav.json"
+
+
+def test_get_vault_files_default_first(monkeypatch, tmp_path):
+    exe_path = tmp_path / "app.exe"
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    monkeypatch.setattr(sys, "executable", str(exe_path))
+    vault_dir = tmp_path / "vault"
+    vault_dir.mkdir()
+    for name in ("b.bin", "vault.bin", "a.bin", "fav.json"):
+        (vault_dir / name).write_bytes(b"")
+
+    assert [p.name for p in paths.get_vault_files()] == [
+        "vault.bin",
+        "a.bin",
+        "b.bin",
+    ]
+
+
+def test_get_vault_files_missing_folder(monkeypatch, tmp_path):
+    exe_path = tmp_path / "app.exe"
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    monkeypatch.setattr(sys, "executable", str(exe_path))
+
+    assert paths.get_vault_files() == [tmp_path / "vault" / "vault.bin"]
+
+
+def test_get_current_log_path(monkeypatch, tmp_path):
+    exe_path = tmp_path / "app.exe"
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    monkeypatch.setattr(sys, "executable", str(exe_path))
+
+    assert paths.get_current_log_path(date(2025, 3, 4)) == tmp_path / "Logs" / "04-03-2025.log"
@@ -0,0 +1,247 @@
+"""
+Tests unitarios para el módulo process_runner.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from unittest.mock import patch
+
+from wifi_connector.core.exceptions import CommandTimeoutError
+from wifi_connector.core.profile_connector import ProfileConnector
+from wifi_connector.network import process_runner
+from wifi_connector.network.process_runner import (
+    CommandWatchdog,
+    LatencyStats,
+    run_process,
+    run_process_async,
+)
+
+
+def _python(code):
+    return [sys.executable, "-c", textwrap.dedent(code)]
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # Un zombi ya no se ejecuta aunque todavía tenga PID
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split(")")[-1].split()[0] != "Z"
+    except OSError:
+        return True
+
+
+class TestRunProcess(unittest.TestCase):
+    """Tests de ejecución con plazo."""
+
+    def test_captures_output_and_returncode(self):
+        result = run_process(
+            _python("import sys; print('hola'); sys.exit(3)"), timeout=10
+        )
+
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(result.stdout.strip(), b"hola")
+
+    def test_decodes_with_encoding(self):
+        result = run_process(_python("print('hola')"), timeout=10, encoding="cp850")
+
+        self.assertEqual(result.stdout.strip(), "hola")
+
+    def test_check_raises_called_process_error(self):
+        with self.assertRaises(subprocess.CalledProcessError):
+            run_process(_python("import sys; sys.exit(1)"), timeout=10, check=True)
+
+    def test_timeout_raises_promptly(self):
+        start = time.monotonic()
+
+        with self.assertRaises(CommandTimeoutError):
+            run_process(_python("import time; time.sleep(60)"), timeout=0.5)
+
+        self.assertLess(time.monotonic() - start, 5)
+
+    @unittest.skipIf(os.name == "nt", "usa /proc y grupos de procesos POSIX")
+    def test_timeout_kills_whole_process_tree(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pid_file = os.path.join(tmp, "child.pid")
+            parent = _python(
+                f"""
+                import subprocess, sys, time
+                child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+                with open({pid_file!r}, "w") as f:
+                    f.write(str(child.pid))
+                time.sleep(60)
+                """
+            )
+
+            with self.assertRaises(CommandTimeoutError):
+                run_process(parent, timeout=1.5)
+
+            with open(pid_file) as f:
+                child_pid = int(f.read())
+
+        deadline = time.monotonic() + 5
+        while _pid_alive(child_pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(_pid_alive(child_pid))
+
+    def test_records_latency(self):
+        with patch(
+            "wifi_connector.network.process_runner.latency_stats", LatencyStats()
+        ) as stats:
+            run_process(_python("pass"), timeout=10)
+
+        program = os.path.splitext(os.path.basename(sys.executable))[0]
+        self.assertEqual(stats.summary()[program]["count"], 1)
+
+
+class TestRunProcessAsync(unittest.TestCase):
+    """Tests de la variante asyncio."""
+
+    def test_captures_output_and_returncode(self):
+        result = asyncio.run(
+            run_process_async(
+                _python("import sys; print('hola'); sys.exit(2)"), timeout=10
+            )
+        )
+
+        self.assertEqual(result.returncode, 2)
+        self.assertEqual(result.stdout.strip(), b"hola")
+
+    def test_decodes_with_encoding(self):
+        result = asyncio.run(
+            run_process_async(_python("print('hola')"), timeout=10, encoding="cp850")
+        )
+
+        self.assertEqual(result.stdout.strip(), "hola")
+
+    def test_check_raises_called_process_error(self):
+        with self.assertRaises(subprocess.CalledProcessError):
+            asyncio.run(
+                run_process_async(
+                    _python("import sys; sys.exit(1)"), timeout=10, check=True
+                )
+            )
+
+    def test_timeout_raises(self):
+        with self.assertRaises(CommandTimeoutError):
+            asyncio.run(
+                run_process_async(_python("import time; time.sleep(60)"), timeout=0.5)
+            )
+
+    @unittest.skipIf(os.name == "nt", "usa /proc y grupos de procesos POSIX")
+    def test_cancellation_kills_process(self):
+        async def cancel_soon():
+            task = asyncio.ensure_future(
+                run_process_async(
+                    _python("import time; time.sleep(60)"),
+                    timeout=60,
+                )
+            )
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        start = time.monotonic()
+        with patch(
+            "wifi_connector.network.process_runner._kill_tree",
+            wraps=process_runner._kill_tree,
+        ) as kill:
+            asyncio.run(cancel_soon())
+
+        kill.assert_called_once()
+        self.assertLess(time.monotonic() - start, 5)
+
+
+class TestCommandWatchdog(unittest.TestCase):
+    """Tests del vigilante de comandos estancados."""
+
+    def test_reports_stalled_command_once_per_threshold(self):
+        watchdog = CommandWatchdog(stall_after=0.1, interval=60)
+        watch_id = watchdog.register(["netsh", "wlan", "show", "networks"], pid=1)
+
+        self.assertEqual(watchdog.check(), [])
+        time.sleep(0.15)
+        self.assertEqual(watchdog.check(), ["netsh wlan show networks"])
+        self.assertEqual(watchdog.check(), [])
+
+        watchdog.unregister(watch_id)
+        time.sleep(0.1)
+        self.assertEqual(watchdog.check(), [])
+
+    def test_background_thread_logs_warning(self):
+        watchdog = CommandWatchdog(stall_after=0.05, interval=0.02)
+
+        with patch("wifi_connector.network.process_runner.Logger") as logger:
+            watch_id = watchdog.register(["WLANSetEAPUserData"], pid=1)
+            time.sleep(0.2)
+            watchdog.unregister(watch_id)
+
+        logger.warning.assert_called()
+
+
+class TestLatencyStats(unittest.TestCase):
+    """Tests de las estadísticas de latencia."""
+
+    def test_summary_percentiles(self):
+        stats = LatencyStats()
+        for ms in range(1, 101):
+            stats.record("netsh", ms / 1000)
+
+        summary = stats.summary()["netsh"]
+
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["p50"], 0.050)
+        self.assertAlmostEqual(summary["p95"], 0.095)
+        self.assertAlmostEqual(summary["max"], 0.100)
+
+    def test_keeps_only_the_latest_samples(self):
+        """Los percentiles usan la ventana; el total y el máximo, todo."""
+        stats = LatencyStats(max_samples=10)
+        stats.record("netsh", 5.0)
+        for _ in range(20):
+            stats.record("netsh", 0.01)
+
+        summary = stats.summary()["netsh"]
+
+        self.assertEqual(len(stats._samples["netsh"]), 10)
+        self.assertEqual(summary["count"], 21)
+        self.assertAlmostEqual(summary["p95"], 0.01)
+        self.assertAlmostEqual(summary["max"], 5.0)
+
+    def test_log_summary_writes_one_line_per_program(self):
+        stats = LatencyStats()
+        stats.record("netsh", 0.01)
+        stats.record("WLANSetEAPUserData", 0.5)
+
+        with patch("wifi_connector.network.process_runner.Logger") as logger:
+            stats.log_summary()
+
+        self.assertEqual(logger.info.call_count, 2)
+
+
+class TestProfileConnectorTimeout(unittest.TestCase):
+    """Tests del comportamiento de ProfileConnector ante un comando colgado."""
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_timeout_becomes_failed_result(self, mock_run):
+        mock_run.side_effect = CommandTimeoutError("netsh no ha respost")
+        connector = ProfileConnector()
+
+        result = connector._run_command(["netsh", "wlan", "connect", "name=x"])
+
+        self.assertEqual(result.returncode, -1)
+        self.assertIn("no ha respost", result.raw_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,13 +2,32 @@
 Tests unitarios para el módulo profile_connector.
 """
 
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock, call
 import os
+import statistics
 import time
 import xml.etree.ElementTree as ET
 
-from wifi_connector.core.profile_connector import ProfileConnector
+from wifi_connector.core.profile_connector import (
+    SCAN_TIMEOUT,
+    ProfileConnector,
+    VerifySchedule,
+)
+from wifi_connector.utils import translations as t
+
+
+def _show_interfaces(state: str, ssid: str = "gencat_ENS_EDU") -> bytes:
+    """
+    Salida de 'netsh wlan show interfaces' con un adaptador en el estado dado.
+
+    Como netsh, sin SSID ni perfil cuando el adaptador está desconectado.
+    """
+    lines = ["    Name                   : Wi-Fi", f"    State                  : {state}"]
+    if state != "disconnected":
+        lines += [f"    SSID                   : {ssid}", f"    Profile                : {ssid}"]
+    return "\n".join(lines).encode("utf-8")
 
 
 class TestProfileConnector(unittest.TestCase):
@@ -39,7 +58,7 @@ class TestProfileConnector(unittest.TestCase):
         self.assertEqual(connector.username, "testuser")
         self.assertEqual(connector.password, "testpass")
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     @patch("wifi_connector.core.profile_connector.os.path.exists")
     def test_install_wifi_profile_success(self, mock_exists, mock_run):
         """Test de instalación exitosa del perfil WiFi."""
@@ -67,7 +86,7 @@ class TestProfileConnector(unittest.TestCase):
         self.assertIn("profile", call_args)
         self.assertIn("user=all", call_args)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     @patch("wifi_connector.core.profile_connector.os.path.exists")
     def test_install_wifi_profile_already_exists(self, mock_exists, mock_run):
         """Test cuando el perfil WiFi ya existe."""
@@ -88,7 +107,26 @@ class TestProfileConnector(unittest.TestCase):
         self.assertTrue(success)
         self.assertIn("ja existia", message)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
+    @patch("wifi_connector.core.profile_connector.os.path.exists")
+    def test_install_wifi_profile_already_exists_cp850(self, mock_exists, mock_run):
+        """Test del perfil ya existente con la salida en cp850 (consola de Windows)."""
+        mock_exists.return_value = True
+        mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=b"Perfil eliminado", stderr=b""),
+            MagicMock(
+                returncode=1,
+                stdout="Le profil existe d\u00e9j\u00e0 sur l'interface".encode("cp850"),
+                stderr=b"",
+            ),
+        ]
+
+        success, message = self.connector._install_wifi_profile()
+
+        self.assertTrue(success)
+        self.assertIn("ja existia", message)
+
+    @patch("wifi_connector.core.profile_connector.run_process")
     @patch("wifi_connector.core.profile_connector.os.path.exists")
     def test_install_wifi_profile_file_not_found(self, mock_exists, mock_run):
         """Test cuando el archivo de perfil no existe."""
@@ -106,7 +144,7 @@ class TestProfileConnector(unittest.TestCase):
         self.assertFalse(success)
         self.assertIn("no trobat", message)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     @patch("wifi_connector.core.profile_connector.os.path.exists")
     def test_install_wifi_profile_netsh_error(self, mock_exists, mock_run):
         """Test cuando netsh falla."""
@@ -127,7 +165,7 @@ class TestProfileConnector(unittest.TestCase):
         self.assertFalse(success)
         self.assertIn("Error", message)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     def test_delete_existing_profile_success(self, mock_run):
         """Test de eliminación exitosa del perfil WiFi existente."""
         # Configurar mock
@@ -151,7 +189,7 @@ class TestProfileConnector(unittest.TestCase):
         self.assertIn("profile", call_args)
         self.assertIn("name=gencat_ENS_EDU", call_args)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     def test_delete_existing_profile_not_found(self, mock_run):
         """Test cuando el perfil no existe (comportamiento esperado)."""
         # Configurar mock - el perfil no existe
@@ -166,7 +204,7 @@ class TestProfileConnector(unittest.TestCase):
         self.assertTrue(success)
         self.assertIn("No existia", message)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     def test_delete_existing_profile_spanish_not_found(self, mock_run):
         """Test cuando el perfil no existe (mensaje en español)."""
         # Configurar mock - el perfil no existe (mensaje en español)
@@ -180,7 +218,7 @@ class TestProfileConnector(unittest.TestCase):
         # Verificar - debe ser exitoso aunque no exista el perfil
         self.assertTrue(success)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     def test_delete_existing_profile_error_continues(self, mock_run):
         """Test cuando hay un error al eliminar (no es crítico, continua)."""
         # Configurar mock - error desconocido
@@ -194,7 +232,7 @@ class TestProfileConnector(unittest.TestCase):
         # Verificar - debe continuar aunque haya error
         self.assertTrue(success)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     def test_delete_existing_profile_exception_continues(self, mock_run):
         """Test cuando hay una excepción (no es crítico, continua)."""
         # Configurar mock - lanza excepción
@@ -206,39 +244,53 @@ class TestProfileConnector(unittest.TestCase):
         # Verificar - debe continuar aunque haya excepción
         self.assertTrue(success)
 
-    @patch("wifi_connector.core.profile_connector.ET.parse")
-    @patch("wifi_connector.core.profile_connector.os.path.exists")
-    def test_update_credentials_xml_success(self, mock_exists, mock_parse):
-        """Test de actualización exitosa de credenciales en XML."""
-        # Configurar mocks
-        mock_exists.return_value = True
+    def _connector_with_template(self, template_text):
+        """Crea un conector cuyo directorio xml/ es temporal."""
+        import tempfile
 
-        # Mock del árbol XML
-        mock_tree = MagicMock()
-        mock_root = MagicMock()
-        mock_username_elem = MagicMock()
-        mock_password_elem = MagicMock()
+        from wifi_connector.core.eap_template import load_eap_template
 
-        mock_parse.return_value = mock_tree
-        mock_tree.getroot.return_value = mock_root
-        mock_root.find.side_effect = [mock_username_elem, mock_password_elem]
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(load_eap_template.cache_clear)
+        os.makedirs(os.path.join(tmp.name, "xml"))
+        with open(
+            os.path.join(tmp.name, "xml", "credentials_template.xml"),
+            "w",
+            encoding="utf-8",
+        ) as f:
+            f.write(template_text)
 
-        # Crear conector con credenciales
         connector = ProfileConnector(username="testuser", password="testpass")
+        connector._script_dir = tmp.name
+        return connector
+
+    def test_update_credentials_xml_success(self):
+        """Test de actualización exitosa de credenciales en XML."""
+        template_path = os.path.join(
+            self.parent_dir, "xml", "credentials_template.xml"
+        )
+        with open(template_path, encoding="utf-8") as f:
+            connector = self._connector_with_template(f.read())
 
-        # Ejecutar
         success, message = connector._update_credentials_xml()
 
-        # Verificar
         self.assertTrue(success)
         self.assertIn("actualitzades", message)
-        self.assertEqual(mock_username_elem.text, "testuser")
-        self.assertEqual(mock_password_elem.text, "testpass")
-        mock_tree.write.assert_called_once()
+        root = ET.fromstring(connector._eap_xml)
+        namespaces = {
+            "MsChapV2": "http://www.microsoft.com/provisioning/MsChapV2UserPropertiesV1"
+        }
+        self.assertEqual(
+            root.find(".//MsChapV2:Username", namespaces).text, "testuser"
+        )
+        self.assertEqual(
+            root.find(".//MsChapV2:Password", namespaces).text, "testpass"
+        )
 
     @patch("wifi_connector.core.profile_connector.os.path.exists")
     def test_update_credentials_xml_file_not_found(self, mock_exists):
-        """Test cuando el archivo credentials.xml no existe."""
+        """Test cuando la plantilla de credenciales no existe."""
         mock_exists.return_value = False
 
         connector = ProfileConnector(username="testuser", password="testpass")
@@ -247,38 +299,27 @@ class TestProfileConnector(unittest.TestCase):
         self.assertFalse(success)
         self.assertIn("no trobat", message)
 
-    @patch("wifi_connector.core.profile_connector.ET.parse")
-    @patch("wifi_connector.core.profile_connector.os.path.exists")
-    def test_update_credentials_xml_missing_elements(self, mock_exists, mock_parse):
-        """Test cuando los elementos Username/Password no se encuentran en el XML."""
-        mock_exists.return_value = True
-
-        mock_tree = MagicMock()
-        mock_root = MagicMock()
-        mock_parse.return_value = mock_tree
-        mock_tree.getroot.return_value = mock_root
-        mock_root.find.return_value = None  # No encuentra elementos
+    def test_update_credentials_xml_missing_elements(self):
+        """Test cuando los elementos Username/Password no están en la plantilla."""
+        connector = self._connector_with_template(
+            "<?xml version='1.0' encoding='UTF-8'?><Root />"
+        )
 
-        connector = ProfileConnector(username="testuser", password="testpass")
         success, message = connector._update_credentials_xml()
 
         self.assertFalse(success)
         self.assertIn("trobat", message.lower())
 
-    @patch("wifi_connector.core.profile_connector.ET.parse")
-    @patch("wifi_connector.core.profile_connector.os.path.exists")
-    def test_update_credentials_xml_parse_error(self, mock_exists, mock_parse):
-        """Test cuando hay error al parsear el XML."""
-        mock_exists.return_value = True
-        mock_parse.side_effect = ET.ParseError("Invalid XML")
+    def test_update_credentials_xml_parse_error(self):
+        """Test cuando la plantilla no es XML válido."""
+        connector = self._connector_with_template("<Root>")
 
-        connector = ProfileConnector(username="testuser", password="testpass")
         success, message = connector._update_credentials_xml()
 
         self.assertFalse(success)
         self.assertIn("parsejar", message)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     @patch("wifi_connector.core.profile_connector.os.path.exists")
     def test_configure_eap_credentials_success(self, mock_exists, mock_run):
         """Test de configuración exitosa de credenciales EAP."""
@@ -326,7 +367,7 @@ class TestProfileConnector(unittest.TestCase):
         self.assertFalse(success)
         self.assertIn("credentials.xml no trobat", message)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     @patch("wifi_connector.core.profile_connector.os.path.exists")
     def test_configure_eap_credentials_command_error(self, mock_exists, mock_run):
         """Test cuando WLANSetEAPUserData falla."""
@@ -343,7 +384,7 @@ class TestProfileConnector(unittest.TestCase):
         self.assertFalse(success)
         self.assertIn("Error en configurar credencials", message)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     def test_connect_to_network_success(self, mock_run):
         """Test de conexión exitosa a la red."""
         # Configurar mock
@@ -366,7 +407,7 @@ class TestProfileConnector(unittest.TestCase):
         self.assertIn("connect", call_args)
         self.assertIn("name=gencat_ENS_EDU", call_args)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
+    @patch("wifi_connector.core.profile_connector.run_process")
     def test_connect_to_network_error(self, mock_run):
         """Test cuando la conexión falla."""
         # Configurar mock
@@ -381,8 +422,24 @@ class TestProfileConnector(unittest.TestCase):
         self.assertFalse(success)
         self.assertIn("Error en connectar", message)
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
-    @patch("wifi_connector.core.profile_connector.time.sleep")
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_connect_to_network_other_languages(self, mock_run):
+        """Test que los errores y éxitos se reconocen en catalán y francés."""
+        cases = [
+            ("No hi ha cap perfil assignat a la interf\u00edcie especificada.".encode("utf-8"), False),
+            ("Le r\u00e9seau sp\u00e9cifi\u00e9 n\u2019est pas disponible.".encode("utf-8"), False),
+            ("La demande de connexion a \u00e9t\u00e9 effectu\u00e9e avec succ\u00e8s.".encode("utf-8"), True),
+        ]
+        for stdout, expected in cases:
+            with self.subTest(stdout=stdout):
+                mock_run.return_value = MagicMock(returncode=1, stdout=stdout, stderr=b"")
+
+                success, _ = self.connector._connect_to_network()
+
+                self.assertEqual(success, expected)
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    @patch.object(ProfileConnector, "_sleep")
     def test_verify_connection_success(self, mock_sleep, mock_run):
         """Test de verificación exitosa de conexión."""
         # Configurar mock - primera llamada muestra conectado
@@ -401,29 +458,82 @@ class TestProfileConnector(unittest.TestCase):
         mock_run.assert_called_once()
         mock_sleep.assert_not_called()  # No debe esperar si conecta en primer intento
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
-    @patch("wifi_connector.core.profile_connector.time.sleep")
+    @patch("wifi_connector.core.profile_connector.run_process")
+    @patch.object(ProfileConnector, "_sleep")
     def test_verify_connection_authentication_failure(self, mock_sleep, mock_run):
         """Test cuando las credenciales son inválidas."""
-        # Configurar mock - muestra desconectado (usando 'disconnected' porque
-        # 'desconectado' contiene 'conectado' y el código lo detecta primero)
+        # El adaptador se autentica en la red y cae; desconectado ya no muestra SSID
+        mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=_show_interfaces(state), stderr=b"")
+            for state in ("authenticating", "disconnected")
+        ]
+
+        # Ejecutar
+        success, message = self.connector._verify_connection(
+            max_attempts=5, wait_seconds=1
+        )
+
+        # Verificar
+        self.assertFalse(success)
+        self.assertEqual(message, t.PROFILE_ERROR_AUTH)
+        self.assertEqual(mock_run.call_count, 2)
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    @patch.object(ProfileConnector, "_sleep")
+    def test_verify_connection_disconnected_before_joining(self, mock_sleep, mock_run):
+        """Test: un adaptador desconectado que no se ha visto en la red no es un fallo."""
         mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout=b"SSID: gencat_ENS_EDU\nState: disconnected",
-            stderr=b"",
+            returncode=0, stdout=_show_interfaces("disconnected"), stderr=b""
         )
 
-        # Ejecutar
         success, message = self.connector._verify_connection(
             max_attempts=3, wait_seconds=1
         )
 
-        # Verificar
         self.assertFalse(success)
-        self.assertIn("credencials", message.lower())
+        self.assertNotEqual(message, t.PROFILE_ERROR_AUTH)
+        self.assertEqual(mock_run.call_count, 3)
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    @patch.object(ProfileConnector, "_sleep")
+    def test_verify_connection_other_adapter_disconnected(self, mock_sleep, mock_run):
+        """Test: solo cuenta la desconexión del adaptador que estaba en la red."""
+        other = b"    Name                   : Wi-Fi 2\n    State                  : disconnected\n"
+        mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=_show_interfaces(state) + b"\n" + other, stderr=b"")
+            for state in ("authenticating", "authenticating", "connected")
+        ]
+
+        success, _ = self.connector._verify_connection(max_attempts=3, wait_seconds=1)
+
+        self.assertTrue(success)
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    @patch.object(ProfileConnector, "_sleep")
+    def test_verify_connection_uses_the_adapter_on_the_network(self, mock_sleep, mock_run):
+        """Test con dos adaptadores: el primero desconectado, el segundo en la red."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                "    Nombre      : Wi-Fi\n"
+                "    Estado      : desconectado\n\n"
+                "    Nombre      : Wi-Fi 2\n"
+                "    Estado      : conectado\n"
+                "    SSID        : gencat_ENS_EDU\n"
+                "    Canal       : 36\n"
+                "    Señal       : 92%\n"
+            ).encode("utf-8"),
+            stderr=b"",
+        )
 
-    @patch("wifi_connector.core.profile_connector.subprocess.run")
-    @patch("wifi_connector.core.profile_connector.time.sleep")
+        success, _ = self.connector._verify_connection(max_attempts=3, wait_seconds=1)
+
+        self.assertTrue(success)
+        self.assertEqual(self.connector.interface.name, "Wi-Fi 2")
+        self.assertEqual(self.connector.interface.signal, 92)
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    @patch.object(ProfileConnector, "_sleep")
     def test_verify_connection_timeout(self, mock_sleep, mock_run):
         """Test cuando la conexión no se completa."""
         # Configurar mock - siempre muestra autenticando
@@ -674,53 +784,624 @@ class TestHasPermissionWarning(unittest.TestCase):
         self.assertTrue(self.connector._has_permission_warning(output))
 
 
-class TestCleanCredentialsFile(unittest.TestCase):
-    """Tests para el método estático clean_credentials_file()."""
+class TestEapCredentialsTempFile(unittest.TestCase):
+    """Tests del archivo temporal privado de credenciales EAP."""
 
-    @patch("wifi_connector.core.profile_connector.os.path.exists")
-    @patch("wifi_connector.core.profile_connector.shutil.copy2")
-    def test_clean_credentials_success(self, mock_copy, mock_exists):
-        """Test de limpieza exitosa de credenciales."""
-        mock_exists.return_value = True
+    def setUp(self):
+        self.connector = ProfileConnector(username="testuser", password="testpass")
+        self.connector._eap_xml = "<EapHostUserCredentials>secret</EapHostUserCredentials>"
+        self.seen = {}
+
+    def _fake_run(self, command, **kwargs):
+        path = command[3]
+        self.seen["path"] = path
+        self.seen["exists"] = os.path.exists(path)
+        with open(path, encoding="utf-8") as f:
+            self.seen["content"] = f.read()
+        return MagicMock(returncode=self.returncode, stdout=b"", stderr=b"")
+
+    def _configure(self, returncode=0):
+        self.returncode = returncode
+        real_exists = os.path.exists
+        exe = self.connector._eap_executable_path
+        with patch(
+            "wifi_connector.core.profile_connector.os.path.exists",
+            side_effect=lambda path: path == exe or real_exists(path),
+        ), patch(
+            "wifi_connector.core.profile_connector.run_process",
+            side_effect=self._fake_run,
+        ):
+            return self.connector._configure_eap_credentials()
+
+    def test_writes_rendered_xml_to_private_temp_file(self):
+        """El XML se escribe fuera del directorio del programa."""
+        success, _ = self._configure()
 
-        result = ProfileConnector.clean_credentials_file()
+        self.assertTrue(success)
+        self.assertTrue(self.seen["exists"])
+        self.assertEqual(self.seen["content"], self.connector._eap_xml)
+        self.assertNotEqual(
+            os.path.dirname(self.seen["path"]),
+            os.path.join(self.connector._script_dir, "xml"),
+        )
 
-        self.assertTrue(result)
-        mock_copy.assert_called_once()
+    def test_temp_dir_removed_after_success(self):
+        """El directorio temporal se elimina al terminar."""
+        self._configure()
 
-    @patch("wifi_connector.core.profile_connector.os.path.exists")
-    def test_clean_credentials_no_template(self, mock_exists):
-        """Test cuando no existe el archivo template."""
-        # El template no existe
-        mock_exists.side_effect = lambda path: "template" not in path
+        self.assertFalse(os.path.exists(os.path.dirname(self.seen["path"])))
 
-        result = ProfileConnector.clean_credentials_file()
+    def test_temp_dir_removed_after_failure(self):
+        """El directorio temporal se elimina aunque WLANSetEAPUserData falle."""
+        success, _ = self._configure(returncode=1)
 
-        self.assertFalse(result)
-
-    @patch("wifi_connector.core.profile_connector.os.path.exists")
-    @patch("wifi_connector.core.profile_connector.shutil.copy2")
-    def test_clean_credentials_no_credentials_file(self, mock_copy, mock_exists):
-        """Test cuando no existe el archivo de credenciales (no hay nada que limpiar)."""
-        # Template existe pero credentials.xml no
-        mock_exists.side_effect = lambda path: "template" in path
+        self.assertFalse(success)
+        self.assertFalse(os.path.exists(os.path.dirname(self.seen["path"])))
 
-        result = ProfileConnector.clean_credentials_file()
+    def test_each_attempt_uses_its_own_file(self):
+        """Cada intento usa un directorio temporal distinto."""
+        self._configure()
+        first = self.seen["path"]
+        self._configure()
 
-        self.assertTrue(result)  # Retorna True porque no hay nada que limpiar
-        mock_copy.assert_not_called()
+        self.assertNotEqual(first, self.seen["path"])
 
-    @patch("wifi_connector.core.profile_connector.os.path.exists")
-    @patch("wifi_connector.core.profile_connector.shutil.copy2")
-    def test_clean_credentials_copy_error(self, mock_copy, mock_exists):
-        """Test cuando hay un error al copiar el archivo."""
-        mock_exists.return_value = True
-        mock_copy.side_effect = Exception("Permission denied")
+    def test_without_credentials_uses_template(self):
+        """Sin credenciales se pasa la plantilla sin escribir nada."""
+        self.connector._eap_xml = None
 
-        result = ProfileConnector.clean_credentials_file()
+        self._configure()
 
-        self.assertFalse(result)
+        self.assertEqual(
+            self.seen["path"], self.connector._credentials_template_path
+        )
 
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestProfileReinstallSkip(unittest.TestCase):
+    """Tests para omitir la reinstalación del perfil sin cambios."""
+
+    def setUp(self):
+        import tempfile
+        from pathlib import Path
+
+        from wifi_connector.data.profile_state import ProfileState
+        from wifi_connector.utils.hashing import file_sha256
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self.state = ProfileState(Path(self._tmp.name) / "profile_state.json")
+        self.connector = ProfileConnector(profile_state=self.state)
+        self.profile_hash = file_sha256(self.connector._profile_path)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_install_records_profile_hash(self, mock_run):
+        mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=b"Perfil eliminado", stderr=b""),
+            MagicMock(returncode=0, stdout=b"Perfil agregado", stderr=b""),
+        ]
+
+        success, _ = self.connector._install_wifi_profile()
+
+        self.assertTrue(success)
+        self.assertEqual(
+            self.state.get_profile_hash("gencat_ENS_EDU"), self.profile_hash
+        )
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_unchanged_profile_skips_reinstall(self, mock_run):
+        self.state.set_profile_hash("gencat_ENS_EDU", self.profile_hash)
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=b"User profiles\n    All User Profile     : gencat_ENS_EDU\n",
+            stderr=b"",
+        )
+
+        success, message = self.connector._install_wifi_profile()
+
+        self.assertTrue(success)
+        self.assertIn("sense canvis", message)
+        mock_run.assert_called_once()
+        self.assertIn("show", mock_run.call_args[0][0])
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_missing_profile_is_reinstalled(self, mock_run):
+        self.state.set_profile_hash("gencat_ENS_EDU", self.profile_hash)
+        mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=b"Perfiles de usuario\n", stderr=b""),
+            MagicMock(returncode=0, stdout=b"", stderr=b""),
+            MagicMock(returncode=0, stdout=b"Perfil agregado", stderr=b""),
+        ]
+
+        success, _ = self.connector._install_wifi_profile()
+
+        self.assertTrue(success)
+        self.assertEqual(mock_run.call_count, 3)
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_changed_profile_is_reinstalled(self, mock_run):
+        self.state.set_profile_hash("gencat_ENS_EDU", "old-hash")
+        mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=b"", stderr=b""),
+            MagicMock(returncode=0, stdout=b"Perfil agregado", stderr=b""),
+        ]
+
+        success, _ = self.connector._install_wifi_profile()
+
+        self.assertTrue(success)
+        self.assertIn("add", mock_run.call_args_list[1][0][0])
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    def test_force_reinstall(self, mock_run):
+        self.state.set_profile_hash("gencat_ENS_EDU", self.profile_hash)
+        self.connector.force_reinstall = True
+        mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=b"", stderr=b""),
+            MagicMock(returncode=0, stdout=b"Perfil agregado", stderr=b""),
+        ]
+
+        success, _ = self.connector._install_wifi_profile()
+
+        self.assertTrue(success)
+        self.assertEqual(mock_run.call_count, 2)
+
+    @patch.object(ProfileConnector, "_verify_connection")
+    @patch.object(ProfileConnector, "_connect_to_network")
+    @patch.object(ProfileConnector, "_configure_eap_credentials")
+    @patch.object(ProfileConnector, "_install_wifi_profile")
+    def test_failed_connection_forgets_profile(
+        self, mock_install, mock_configure, mock_connect, mock_verify
+    ):
+        self.state.set_profile_hash("gencat_ENS_EDU", self.profile_hash)
+        mock_install.return_value = (True, "ok")
+        mock_configure.return_value = (True, "ok")
+        mock_connect.return_value = (False, "error")
+
+        success, _ = self.connector.connect_via_profile()
+
+        self.assertFalse(success)
+        self.assertIsNone(self.state.get_profile_hash("gencat_ENS_EDU"))
+
+
+class TestEapCredentialsSkip(unittest.TestCase):
+    """Tests para omitir WLANSetEAPUserData con credenciales sin cambios."""
+
+    def setUp(self):
+        import tempfile
+        from pathlib import Path
+
+        from wifi_connector.data.profile_state import ProfileState, derive_key
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self.state = ProfileState(
+            Path(self._tmp.name) / "profile_state.json", key=derive_key([b"k" * 32])
+        )
+        self.connector = ProfileConnector(
+            username="testuser", password="testpass", profile_state=self.state
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _patch_steps(self):
+        patches = {
+            name: patch.object(ProfileConnector, name, return_value=(True, "ok"))
+            for name in (
+                "_install_wifi_profile",
+                "_update_credentials_xml",
+                "_configure_eap_credentials",
+                "_connect_to_network",
+                "_verify_connection",
+            )
+        }
+        mocks = {name: p.start() for name, p in patches.items()}
+        for p in patches.values():
+            self.addCleanup(p.stop)
+        return mocks
+
+    def test_first_connect_applies_and_records_credentials(self):
+        mocks = self._patch_steps()
+
+        success, _ = self.connector.connect_via_profile()
+
+        self.assertTrue(success)
+        mocks["_configure_eap_credentials"].assert_called_once()
+        self.assertTrue(
+            self.state.eap_credentials_match("gencat_ENS_EDU", "testuser", "testpass")
+        )
+
+    def test_reconnect_with_same_credentials_skips_eap_steps(self):
+        self.state.set_eap_credentials("gencat_ENS_EDU", "testuser", "testpass")
+        mocks = self._patch_steps()
+
+        success, _ = self.connector.connect_via_profile()
+
+        self.assertTrue(success)
+        mocks["_update_credentials_xml"].assert_not_called()
+        mocks["_configure_eap_credentials"].assert_not_called()
+        mocks["_connect_to_network"].assert_called_once()
+
+    def test_different_center_reapplies_credentials(self):
+        self.state.set_eap_credentials("gencat_ENS_EDU", "otheruser", "otherpass")
+        mocks = self._patch_steps()
+
+        self.connector.connect_via_profile()
+
+        mocks["_update_credentials_xml"].assert_called_once()
+        mocks["_configure_eap_credentials"].assert_called_once()
+
+    def test_failed_eap_configuration_is_not_recorded(self):
+        mocks = self._patch_steps()
+        mocks["_configure_eap_credentials"].return_value = (False, "error")
+
+        success, _ = self.connector.connect_via_profile()
+
+        self.assertFalse(success)
+        self.assertFalse(
+            self.state.eap_credentials_match("gencat_ENS_EDU", "testuser", "testpass")
+        )
+
+
+class _FakeClock:
+    """Reloj simulado: la espera de la verificación avanza time.monotonic sin esperar."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _scripted_interfaces(clock, connected_at, final_state="connected"):
+    """Backend netsh simulado: autenticando hasta connected_at, luego final_state."""
+
+    def run(command, **kwargs):
+        state = final_state if clock.now >= connected_at else "authenticating"
+        return MagicMock(returncode=0, stdout=_show_interfaces(state), stderr=b"")
+
+    return run
+
+
+def _verify_with_clock(connector, connected_at, final_state="connected", **verify_kwargs):
+    """Verifica con el backend simulado; devuelve (éxito, mensaje, segundos)."""
+    clock = _FakeClock()
+    module = "wifi_connector.core.profile_connector"
+    with patch(f"{module}.time.monotonic", clock.monotonic), patch.object(
+        connector, "_sleep", clock.sleep
+    ), patch(
+        f"{module}.run_process",
+        side_effect=_scripted_interfaces(clock, connected_at, final_state),
+    ):
+        success, message = connector._verify_connection(**verify_kwargs)
+    return success, message, clock.now
+
+
+def _time_to_verified(connector, connected_at, **verify_kwargs):
+    success, _, elapsed = _verify_with_clock(connector, connected_at, **verify_kwargs)
+    return elapsed if success else None
+
+
+class TestAdaptiveVerification(unittest.TestCase):
+    """Tests para el calendario adaptativo de verificación."""
+
+    # Tiempos de asociación + RADIUS simulados (segundos)
+    CONNECT_TIMES = [
+        0.3, 0.5, 0.8, 0.8, 1.0, 1.2, 1.5, 2.0, 2.5, 3.5, 5.0, 8.0, 12.0
+    ]
+
+    def setUp(self):
+        self.connector = ProfileConnector("gencat_ENS_EDU")
+
+    def test_schedule_starts_fast_and_backs_off(self):
+        clock = _FakeClock()
+        schedule = VerifySchedule(
+            initial_delay=0.25, backoff=2, max_delay=1, deadline=3
+        )
+
+        with patch(
+            "wifi_connector.core.profile_connector.time.monotonic", clock.monotonic
+        ):
+            delays = []
+            for delay in schedule.delays(clock.now):
+                delays.append(delay)
+                clock.sleep(delay)
+
+        self.assertEqual(delays, [0.25, 0.5, 1, 1, 0.25])
+        self.assertAlmostEqual(clock.now, 3)
+
+    def test_returns_soon_after_fast_connection(self):
+        elapsed = _time_to_verified(self.connector, connected_at=0.8)
+
+        self.assertIsNotNone(elapsed)
+        self.assertLess(elapsed, 1.5)
+
+    def test_slow_handshake_verified_before_deadline(self):
+        elapsed = _time_to_verified(self.connector, connected_at=12.0)
+
+        self.assertIsNotNone(elapsed)
+        self.assertLessEqual(elapsed, self.connector.verify_schedule.deadline)
+
+    def test_gives_up_at_deadline(self):
+        elapsed = _time_to_verified(self.connector, connected_at=999)
+
+        self.assertIsNone(elapsed)
+
+    def test_auth_failure_returns_before_deadline(self):
+        """Un rechazo de RADIUS se detecta en el siguiente sondeo, no al plazo."""
+        success, message, elapsed = _verify_with_clock(
+            self.connector, connected_at=1.0, final_state="disconnected"
+        )
+
+        self.assertFalse(success)
+        self.assertEqual(message, t.PROFILE_ERROR_AUTH)
+        self.assertLess(elapsed, 2.0)
+
+    def test_adaptive_beats_fixed_schedule(self):
+        """Compara mediana y p95 de tiempo hasta verificado (fallo = plazo)."""
+
+        def stats(samples):
+            # Un fallo de verificación cuenta como no verificado (infinito)
+            ordered = sorted(x if x is not None else float("inf") for x in samples)
+            p95_index = max(0, int(round(0.95 * len(ordered))) - 1)
+            return statistics.median(ordered), ordered[p95_index]
+
+        fixed = [
+            _time_to_verified(self.connector, t, max_attempts=3, wait_seconds=3)
+            for t in self.CONNECT_TIMES
+        ]
+        adaptive = [_time_to_verified(self.connector, t) for t in self.CONNECT_TIMES]
+
+        fixed_median, fixed_p95 = stats(fixed)
+        adaptive_median, adaptive_p95 = stats(adaptive)
+
+        self.assertLess(adaptive_median, fixed_median)
+        self.assertLess(adaptive_p95, fixed_p95)
+        self.assertNotIn(None, adaptive)
+
+
+class TestConnectionStepGraph(unittest.TestCase):
+    """Tests para la ejecución concurrente de pasos independientes."""
+
+    @patch.object(ProfileConnector, "_verify_connection")
+    @patch.object(ProfileConnector, "_connect_to_network")
+    @patch.object(ProfileConnector, "_configure_eap_credentials")
+    @patch.object(ProfileConnector, "_update_credentials_xml")
+    @patch.object(ProfileConnector, "_install_wifi_profile")
+    def test_install_and_update_xml_overlap(
+        self, mock_install, mock_update, mock_configure, mock_connect, mock_verify
+    ):
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(message):
+            def step():
+                barrier.wait()
+                return True, message
+
+            return step
+
+        mock_install.side_effect = meet("Perfil instal·lat")
+        mock_update.side_effect = meet("Credencials actualitzades")
+        mock_configure.return_value = (True, "Credencials configurades")
+        mock_connect.return_value = (True, "Connectat")
+        mock_verify.return_value = (True, "Connexió verificada")
+
+        connector = ProfileConnector(username="testuser", password="testpass")
+        success, _ = connector.connect_via_profile()
+
+        self.assertTrue(success)
+        mock_configure.assert_called_once()
+
+    @patch.object(ProfileConnector, "_configure_eap_credentials")
+    @patch.object(ProfileConnector, "_update_credentials_xml")
+    @patch.object(ProfileConnector, "_install_wifi_profile")
+    def test_configure_waits_for_both_prerequisites(
+        self, mock_install, mock_update, mock_configure
+    ):
+        mock_install.return_value = (True, "Perfil instal·lat")
+        mock_update.return_value = (False, "Error XML")
+
+        connector = ProfileConnector(username="testuser", password="testpass")
+        success, message = connector.connect_via_profile()
+
+        self.assertFalse(success)
+        self.assertEqual(message, "Error XML")
+        mock_configure.assert_not_called()
+
+    @patch.object(ProfileConnector, "_verify_connection")
+    @patch.object(ProfileConnector, "_connect_to_network")
+    @patch.object(ProfileConnector, "_configure_eap_credentials")
+    @patch.object(ProfileConnector, "_install_wifi_profile")
+    def test_invisible_network_does_not_block_connection(
+        self, mock_install, mock_configure, mock_connect, mock_verify
+    ):
+        network_manager = MagicMock()
+        network_manager.is_network_available.return_value = False
+        mock_install.return_value = (True, "Perfil instal·lat")
+        mock_configure.return_value = (True, "Credencials configurades")
+        mock_connect.return_value = (True, "Connectat")
+        mock_verify.return_value = (True, "Connexió verificada")
+
+        connector = ProfileConnector(network_manager=network_manager)
+        success, _ = connector.connect_via_profile()
+
+        self.assertTrue(success)
+        network_manager.is_network_available.assert_called_once_with(
+            "gencat_ENS_EDU",
+            timeout=SCAN_TIMEOUT,
+            cancel_event=connector.cancel_event,
+        )
+
+    @patch.object(ProfileConnector, "_verify_connection")
+    @patch.object(ProfileConnector, "_connect_to_network")
+    @patch.object(ProfileConnector, "_configure_eap_credentials")
+    @patch.object(ProfileConnector, "_install_wifi_profile")
+    def test_hanging_scan_does_not_delay_connection(
+        self, mock_install, mock_configure, mock_connect, mock_verify
+    ):
+        import threading
+
+        release = threading.Event()
+        network_manager = MagicMock()
+        network_manager.is_network_available.side_effect = (
+            lambda *args, **kwargs: release.wait(10)
+        )
+        mock_install.return_value = (True, "Perfil instal·lat")
+        mock_configure.return_value = (True, "Credencials configurades")
+        mock_connect.return_value = (True, "Connectat")
+        mock_verify.return_value = (True, "Connexió verificada")
+
+        connector = ProfileConnector(network_manager=network_manager)
+        start = time.monotonic()
+        try:
+            success, _ = connector.connect_via_profile()
+        finally:
+            release.set()
+
+        self.assertTrue(success)
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_cancel_interrupts_hanging_scan(self):
+        import sys
+        import threading
+
+        from wifi_connector.core.exceptions import ConnectionCancelledError
+        from wifi_connector.network import process_runner
+        from wifi_connector.network.manager import NetworkManager
+
+        def hanging_netsh(command, **kwargs):
+            sleeper = [sys.executable, "-c", "import time; time.sleep(60)"]
+            return process_runner.run_process(sleeper, **kwargs)
+
+        connector = ProfileConnector(network_manager=NetworkManager())
+        threading.Timer(0.3, connector.cancel).start()
+
+        start = time.monotonic()
+        with patch(
+            "wifi_connector.network.manager.run_process", side_effect=hanging_netsh
+        ):
+            with self.assertRaises(ConnectionCancelledError):
+                connector._check_network_visible()
+
+        self.assertLess(time.monotonic() - start, 5)
+
+
+class TestAsyncConnection(unittest.TestCase):
+    """Tests para las variantes asyncio de conexión y verificación."""
+
+    def setUp(self):
+        self.connector = ProfileConnector(
+            "gencat_ENS_EDU",
+            verify_schedule=VerifySchedule(
+                initial_delay=0.01, backoff=1, max_delay=0.01, deadline=2
+            ),
+        )
+
+    @staticmethod
+    def _interfaces(states):
+        """Backend netsh asíncrono que devuelve los estados indicados en orden."""
+        states = iter(states)
+
+        async def run(command, **kwargs):
+            return MagicMock(
+                returncode=0, stdout=_show_interfaces(next(states)), stderr=b""
+            )
+
+        return run
+
+    def test_verify_async_polls_until_connected(self):
+        with patch(
+            "wifi_connector.core.profile_connector.run_process_async",
+            side_effect=self._interfaces(
+                ["authenticating", "authenticating", "connected"]
+            ),
+        ) as mock_run:
+            success, _ = asyncio.run(self.connector.verify_connection_async())
+
+        self.assertTrue(success)
+        self.assertEqual(mock_run.call_count, 3)
+
+    def test_verify_async_reports_auth_failure(self):
+        with patch(
+            "wifi_connector.core.profile_connector.run_process_async",
+            side_effect=self._interfaces(["authenticating", "disconnected"]),
+        ):
+            success, message = asyncio.run(self.connector.verify_connection_async())
+
+        self.assertFalse(success)
+        self.assertEqual(message, t.PROFILE_ERROR_AUTH)
+
+    def test_verify_async_can_be_cancelled(self):
+        polls = []
+
+        async def never_connects(command, **kwargs):
+            polls.append(command)
+            return MagicMock(returncode=0, stdout=b"State: connecting", stderr=b"")
+
+        async def cancel_after_start():
+            task = asyncio.ensure_future(self.connector.verify_connection_async())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        with patch(
+            "wifi_connector.core.profile_connector.run_process_async",
+            side_effect=never_connects,
+        ):
+            asyncio.run(cancel_after_start())
+            count = len(polls)
+            time.sleep(0.05)
+
+        self.assertGreater(count, 0)
+        self.assertEqual(len(polls), count)
+
+    @patch.object(ProfileConnector, "verify_connection_async")
+    @patch.object(ProfileConnector, "_run_connection_steps")
+    def test_connect_async_success(self, mock_steps, mock_verify):
+        mock_steps.return_value = (True, "Connectat")
+        mock_verify.return_value = (True, "Connexió verificada")
+        progress = []
+
+        success, _ = asyncio.run(
+            self.connector.connect_via_profile_async(progress_callback=progress.append)
+        )
+
+        self.assertTrue(success)
+        mock_steps.assert_called_once()
+        self.assertGreaterEqual(len(progress), 2)
+
+    @patch.object(ProfileConnector, "_forget_installed_profile")
+    @patch.object(ProfileConnector, "verify_connection_async")
+    @patch.object(ProfileConnector, "_run_connection_steps")
+    def test_connect_async_verification_failure_forgets_profile(
+        self, mock_steps, mock_verify, mock_forget
+    ):
+        mock_steps.return_value = (True, "Connectat")
+        mock_verify.return_value = (False, "Error d'autenticació")
+
+        success, message = asyncio.run(self.connector.connect_via_profile_async())
+
+        self.assertFalse(success)
+        self.assertEqual(message, "Error d'autenticació")
+        mock_forget.assert_called_once()
+
+    @patch.object(ProfileConnector, "verify_connection_async")
+    @patch.object(ProfileConnector, "_run_connection_steps")
+    def test_connect_async_stops_when_steps_fail(self, mock_steps, mock_verify):
+        mock_steps.return_value = (False, "Error instal·lant")
+
+        success, message = asyncio.run(self.connector.connect_via_profile_async())
+
+        self.assertFalse(success)
+        self.assertEqual(message, "Error instal·lant")
+        mock_verify.assert_not_called()
@@ -0,0 +1,93 @@
+"""Tests for ProfileState."""
+
+import json
+
+from wifi_connector.data.profile_state import ProfileState, derive_key
+
+
+KEY = derive_key([b"\x01" * 32])
+
+
+def test_missing_file_has_no_hash(tmp_path):
+    state = ProfileState(tmp_path / "profile_state.json")
+
+    assert state.get_profile_hash("gencat_ENS_EDU") is None
+
+
+def test_set_and_get_profile_hash(tmp_path):
+    path = tmp_path / "profile_state.json"
+    ProfileState(path).set_profile_hash("gencat_ENS_EDU", "abc")
+
+    assert ProfileState(path).get_profile_hash("gencat_ENS_EDU") == "abc"
+    assert not path.with_suffix(".tmp").exists()
+
+
+def test_forget_removes_entry(tmp_path):
+    state = ProfileState(tmp_path / "profile_state.json")
+    state.set_profile_hash("gencat_ENS_EDU", "abc")
+
+    state.forget("gencat_ENS_EDU")
+
+    assert state.get_profile_hash("gencat_ENS_EDU") is None
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    path = tmp_path / "profile_state.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert ProfileState(path).get_profile_hash("gencat_ENS_EDU") is None
+
+
+def test_eap_credentials_match_after_set(tmp_path):
+    state = ProfileState(tmp_path / "profile_state.json", key=KEY)
+    state.set_eap_credentials("gencat_ENS_EDU", "user", "pass")
+
+    assert state.eap_credentials_match("gencat_ENS_EDU", "user", "pass")
+    assert not state.eap_credentials_match("gencat_ENS_EDU", "user", "other")
+    assert not state.eap_credentials_match("other_ssid", "user", "pass")
+
+
+def test_eap_credentials_are_not_stored_in_plaintext(tmp_path):
+    path = tmp_path / "profile_state.json"
+    ProfileState(path, key=KEY).set_eap_credentials("gencat_ENS_EDU", "W0801", "s3cr3t!")
+
+    content = path.read_text(encoding="utf-8")
+    assert "W0801" not in content
+    assert "s3cr3t!" not in content
+
+
+def test_hmac_key_is_not_stored(tmp_path):
+    path = tmp_path / "profile_state.json"
+    ProfileState(path, key=KEY).set_eap_credentials("gencat_ENS_EDU", "user", "pass")
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert set(data) == {"profiles"}
+    assert KEY.hex() not in path.read_text(encoding="utf-8")
+
+
+def test_eap_record_needs_the_same_vault_key(tmp_path):
+    path = tmp_path / "profile_state.json"
+    ProfileState(path, key=KEY).set_eap_credentials("gencat_ENS_EDU", "user", "pass")
+
+    other = ProfileState(path, key=derive_key([b"\x02" * 32]))
+    assert not other.eap_credentials_match("gencat_ENS_EDU", "user", "pass")
+    assert ProfileState(path, key=KEY).eap_credentials_match("gencat_ENS_EDU", "user", "pass")
+
+
+def test_without_key_eap_credentials_are_not_recorded(tmp_path):
+    path = tmp_path / "profile_state.json"
+    state = ProfileState(path)
+
+    state.set_eap_credentials("gencat_ENS_EDU", "user", "pass")
+
+    assert not path.exists()
+    assert not state.eap_credentials_match("gencat_ENS_EDU", "user", "pass")
+
+
+def test_profile_reinstall_clears_eap_record(tmp_path):
+    state = ProfileState(tmp_path / "profile_state.json", key=KEY)
+    state.set_eap_credentials("gencat_ENS_EDU", "user", "pass")
+
+    state.set_profile_hash("gencat_ENS_EDU", "abc")
+
+    assert not state.eap_credentials_match("gencat_ENS_EDU", "user", "pass")
@@ -0,0 +1,81 @@
+"""Tests for SpeculativeUnlocker."""
+
+import threading
+from unittest.mock import MagicMock
+
+from wifi_connector.data.speculative_unlock import SpeculativeUnlocker
+
+
+def test_take_reuses_result_for_matching_password():
+    unlock = MagicMock(return_value=["unlocked"])
+    unlocker = SpeculativeUnlocker(unlock)
+
+    unlocker.schedule("secret")
+    result = unlocker.take("secret")
+    unlocker.shutdown()
+
+    assert result == ["unlocked"]
+    unlock.assert_called_once_with("secret")
+
+
+def test_take_returns_none_for_different_password():
+    unlocker = SpeculativeUnlocker(MagicMock(return_value=["unlocked"]))
+
+    unlocker.schedule("secre")
+    result = unlocker.take("secret")
+    unlocker.shutdown()
+
+    assert result is None
+
+
+def test_take_without_schedule_returns_none():
+    unlocker = SpeculativeUnlocker(MagicMock())
+
+    assert unlocker.take("secret") is None
+    unlocker.shutdown()
+
+
+def test_changed_input_cancels_pending_derivation():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def unlock(password):
+        calls.append(password)
+        started.set()
+        release.wait(timeout=5)
+        return [password]
+
+    unlocker = SpeculativeUnlocker(unlock)
+    unlocker.schedule("a")
+    assert started.wait(timeout=5)  # "a" en curso
+    unlocker.schedule("ab")  # pendiente, se cancela
+    unlocker.schedule("abc")
+    release.set()
+    result = unlocker.take("abc")
+    unlocker.shutdown()
+
+    assert result == ["abc"]
+    assert "ab" not in calls
+
+
+def test_same_input_is_not_rescheduled():
+    unlock = MagicMock(return_value=["unlocked"])
+    unlocker = SpeculativeUnlocker(unlock)
+
+    unlocker.schedule("secret")
+    unlocker.schedule("secret")
+    unlocker.take("secret")
+    unlocker.shutdown()
+
+    unlock.assert_called_once()
+
+
+def test_failed_derivation_falls_back():
+    unlocker = SpeculativeUnlocker(MagicMock(side_effect=OSError("boom")))
+
+    unlocker.schedule("secret")
+    result = unlocker.take("secret")
+    unlocker.shutdown()
+
+    assert result is None
@@ -0,0 +1,186 @@
+"""Tests for StepGraph."""
+
+import threading
+
+import pytest
+
+from wifi_connector.core.step_graph import Step, StepGraph
+
+
+def _ok(message="ok"):
+    return lambda: (True, message)
+
+
+def test_runs_steps_in_dependency_order():
+    order = []
+
+    def record(name):
+        def action():
+            order.append(name)
+            return True, name
+
+        return action
+
+    graph = StepGraph(
+        [
+            Step("a", record("a")),
+            Step("b", record("b"), ("a",)),
+            Step("c", record("c"), ("b",)),
+        ]
+    )
+
+    success, message, _ = graph.run()
+
+    assert success is True
+    assert message == "c"
+    assert order == ["a", "b", "c"]
+
+
+def test_independent_steps_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait_for_peer():
+        barrier.wait()
+        return True, "ok"
+
+    graph = StepGraph(
+        [
+            Step("a", wait_for_peer),
+            Step("b", wait_for_peer),
+            Step("c", _ok("done"), ("a", "b")),
+        ]
+    )
+
+    success, message, _ = graph.run()
+
+    assert success is True
+    assert message == "done"
+
+
+def test_reports_first_declared_failure():
+    graph = StepGraph(
+        [
+            Step("a", lambda: (False, "a failed")),
+            Step("b", lambda: (False, "b failed")),
+        ]
+    )
+
+    success, message, _ = graph.run()
+
+    assert (success, message) == (False, "a failed")
+
+
+def test_dependent_step_not_started_after_failure():
+    started = []
+
+    def record(name):
+        def action():
+            started.append(name)
+            return True, name
+
+        return action
+
+    graph = StepGraph(
+        [
+            Step("a", lambda: (False, "boom")),
+            Step("b", record("b"), ("a",)),
+        ]
+    )
+
+    success, message, _ = graph.run()
+
+    assert (success, message) == (False, "boom")
+    assert started == []
+
+
+def test_optional_step_failure_is_ignored():
+    graph = StepGraph(
+        [
+            Step("scan", lambda: (False, "not visible"), required=False),
+            Step("connect", _ok("connected"), ("scan",)),
+        ]
+    )
+
+    success, message, outcomes = graph.run()
+
+    assert (success, message) == (True, "connected")
+    assert outcomes["scan"].success is False
+
+
+def test_does_not_wait_for_running_optional_step():
+    release = threading.Event()
+
+    def hanging_scan():
+        release.wait(10)
+        return True, "visible"
+
+    graph = StepGraph(
+        [
+            Step("scan", hanging_scan, required=False),
+            Step("connect", _ok("connected")),
+        ]
+    )
+
+    try:
+        success, message, outcomes = graph.run()
+    finally:
+        release.set()
+
+    assert (success, message) == (True, "connected")
+    assert "scan" not in outcomes
+
+
+def test_failure_does_not_wait_for_running_optional_step():
+    release = threading.Event()
+
+    def hanging_scan():
+        release.wait(10)
+        return True, "visible"
+
+    graph = StepGraph(
+        [
+            Step("scan", hanging_scan, required=False),
+            Step("install", lambda: (False, "install failed")),
+        ]
+    )
+
+    try:
+        success, message, outcomes = graph.run()
+    finally:
+        release.set()
+
+    assert (success, message) == (False, "install failed")
+    assert "scan" not in outcomes
+
+
+def test_exception_is_reraised():
+    def explode():
+        raise RuntimeError("boom")
+
+    graph = StepGraph([Step("a", explode)])
+
+    with pytest.raises(RuntimeError, match="boom"):
+        graph.run()
+
+
+def test_callbacks_receive_each_step():
+    started, finished = [], []
+    graph = StepGraph([Step("a", _ok()), Step("b", _ok(), ("a",))])
+
+    graph.run(
+        on_start=lambda step: started.append(step.name),
+        on_finish=lambda step, outcome: finished.append((step.name, outcome.success)),
+    )
+
+    assert started == ["a", "b"]
+    assert finished == [("a", True), ("b", True)]
+
+
+def test_unknown_dependency_raises():
+    with pytest.raises(ValueError):
+        StepGraph([Step("a", _ok(), ("missing",))])
+
+
+def test_duplicate_step_raises():
+    with pytest.raises(ValueError):
+        StepGraph([Step("a", _ok()), Step("a", _ok())])
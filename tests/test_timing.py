@@ -0,0 +1,166 @@
+"""
+Tests unitarios para el módulo timing.
+"""
+
+import asyncio
+import json
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from wifi_connector.core.profile_connector import ProfileConnector
+from wifi_connector.core.step_graph import Step, StepGraph
+from wifi_connector.network.process_runner import run_process
+from wifi_connector.utils.timing import SpanRecorder, span_recorder
+
+
+class TestSpanRecorder(unittest.TestCase):
+    """Tests del almacén de spans."""
+
+    def setUp(self):
+        self.recorder = SpanRecorder()
+
+    def test_span_records_duration_and_attributes(self):
+        with self.recorder.trace("t1"):
+            with self.recorder.span("step.install", attempt=1) as attributes:
+                attributes["cached"] = True
+
+        (span,) = self.recorder.spans("t1")
+        self.assertEqual(span.name, "step.install")
+        self.assertEqual(span.status, "ok")
+        self.assertEqual(span.attributes, {"attempt": 1, "cached": True})
+        self.assertGreaterEqual(span.duration, 0)
+
+    def test_exception_marks_span_as_error(self):
+        with self.assertRaises(ValueError):
+            with self.recorder.span("step.connect"):
+                raise ValueError("boom")
+
+        (span,) = self.recorder.spans()
+        self.assertEqual(span.status, "error")
+        self.assertEqual(span.attributes["error"], "ValueError")
+
+    def test_block_can_override_status(self):
+        with self.recorder.span("verify.attempt") as attributes:
+            attributes["status"] = "pending"
+
+        self.assertEqual(self.recorder.spans()[0].status, "pending")
+
+    def test_spans_outside_trace_have_no_trace_id(self):
+        self.recorder.add("process.netsh", 0.01)
+
+        self.assertIsNone(self.recorder.spans()[0].trace_id)
+
+    def test_trace_propagates_to_threads_and_tasks(self):
+        def in_thread():
+            self.recorder.add("thread", 0.0)
+            return True, "ok"
+
+        async def in_task():
+            await asyncio.to_thread(self.recorder.add, "to_thread", 0.0)
+
+        with self.recorder.trace("t2"):
+            StepGraph([Step("a", in_thread), Step("b", in_thread, ("a",))]).run()
+            asyncio.run(in_task())
+
+        names = [span.name for span in self.recorder.spans("t2")]
+        self.assertEqual(names, ["thread", "thread", "to_thread"])
+
+    def test_summary_groups_by_name(self):
+        with self.recorder.trace("t3"):
+            self.recorder.add("verify.attempt", 0.5)
+            self.recorder.add("verify.attempt", 0.25)
+            self.recorder.add("step.connect", 1.0)
+
+        summary = self.recorder.summary("t3")
+
+        self.assertEqual(summary["verify.attempt"], {"count": 2, "total": 0.75})
+        self.assertEqual(summary["step.connect"], {"count": 1, "total": 1.0})
+
+    def test_spans_are_logged_as_json(self):
+        with patch("wifi_connector.utils.timing.Logger") as logger:
+            with self.recorder.trace("t4"):
+                self.recorder.add("process.netsh", 0.02, returncode=0)
+
+        payload = json.loads(logger.debug.call_args.kwargs["payload"])
+        self.assertEqual(payload["name"], "process.netsh")
+        self.assertEqual(payload["trace_id"], "t4")
+        self.assertEqual(payload["attributes"], {"returncode": 0})
+
+    def test_log_summary_lists_slowest_first(self):
+        with self.recorder.trace("t5"):
+            self.recorder.add("step.install", 0.1)
+            self.recorder.add("step.connect", 0.9)
+
+        with patch("wifi_connector.utils.timing.Logger") as logger:
+            self.recorder.log_summary("t5", total=1.0)
+
+        template, fields = logger.info.call_args
+        message = template[0].format(**fields)
+        self.assertLess(message.index("step.connect"), message.index("step.install"))
+        self.assertEqual(fields["duration_ms"], 1000.0)
+
+    def test_keeps_only_latest_spans(self):
+        recorder = SpanRecorder(max_spans=2)
+        for name in ("a", "b", "c"):
+            recorder.add(name, 0.0)
+
+        self.assertEqual([span.name for span in recorder.spans()], ["b", "c"])
+
+
+class TestConnectionSpans(unittest.TestCase):
+    """Tests de los spans que genera un intento de conexión."""
+
+    def setUp(self):
+        span_recorder.clear()
+
+    def test_process_span_is_recorded(self):
+        with span_recorder.trace("p1"):
+            run_process([sys.executable, "-c", "pass"], timeout=10)
+
+        (span,) = span_recorder.spans("p1")
+        self.assertTrue(span.name.startswith("process."))
+        self.assertEqual(span.attributes["returncode"], 0)
+
+    @patch("wifi_connector.core.profile_connector.run_process")
+    @patch.object(ProfileConnector, "_sleep")
+    def test_connect_records_steps_verify_attempts_and_commands(
+        self, mock_sleep, mock_run
+    ):
+        connector = ProfileConnector("gencat_ENS_EDU")
+        states = iter([b"authenticating", b"connected"])
+
+        def netsh(command, **kwargs):
+            if command[:4] == ["netsh", "wlan", "show", "interfaces"]:
+                output = b"SSID: gencat_ENS_EDU\nState: " + next(states)
+            else:
+                output = b"ok"
+            return MagicMock(returncode=0, stdout=output, stderr=b"")
+
+        mock_run.side_effect = netsh
+
+        with patch.object(
+            connector, "_install_wifi_profile", return_value=(True, "instal·lat")
+        ), patch.object(
+            connector, "_are_eap_credentials_current", return_value=True
+        ), patch.object(
+            span_recorder, "log_summary"
+        ) as log_summary:
+            success, _ = connector.connect_via_profile()
+
+        self.assertTrue(success)
+        trace_id = log_summary.call_args[0][0]
+        names = [span.name for span in span_recorder.spans(trace_id)]
+        self.assertIn("step.install", names)
+        self.assertIn("step.connect", names)
+        self.assertEqual(names.count("verify.attempt"), 2)
+        statuses = [
+            span.status
+            for span in span_recorder.spans(trace_id)
+            if span.name == "verify.attempt"
+        ]
+        self.assertEqual(statuses, ["pending", "ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
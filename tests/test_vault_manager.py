@@ -1,5 +1,7 @@
 """Tests for VaultManager."""
 
+from unittest.mock import patch
+
 import pytest
 
 from wifi_connector.core.exceptions import VaultDecryptionError, VaultFormatError
@@ -89,3 +91,78 @@ def test_load_vault_invalid_json(tmp_path):
 
     with pytest.raises(VaultFormatError):
         manager.load_vault("secret")
+
+
+def test_peek_metadata_reads_public_section_without_password(tmp_path):
+    payload = {
+        "metadata": {"source": "private"},
+        "centers": [{"Codi": "1", "Centre": "C", "Usuari": "u", "Contrasenya": "p"}],
+    }
+    public = {"version": "2.1", "generated_at": "2026-03-01T10:00:00"}
+    vault_path = write_vault_file(tmp_path, payload, "secret", public_metadata=public)
+
+    manager = VaultManager(str(vault_path))
+
+    with patch.object(VaultManager, "_derive_key") as mock_derive:
+        assert manager.peek_metadata() == public
+        mock_derive.assert_not_called()
+
+
+def test_peek_metadata_does_not_need_ciphertext(tmp_path):
+    payload = {"metadata": {}, "centers": [{"Codi": "1"}]}
+    public = {"version": "2.1"}
+    vault_path = write_vault_file(tmp_path, payload, "secret", public_metadata=public)
+    data = vault_path.read_bytes()
+    # Truncar justo después de la sección de metadatos
+    vault_path.write_bytes(data[: VLTB_HEADER_SIZE + 4 + len(b'{"version": "2.1"}')])
+
+    assert VaultManager(str(vault_path)).peek_metadata() == public
+
+
+def test_peek_metadata_v1_vault_returns_empty(tmp_path):
+    vault_path = write_vault_file(tmp_path, {"metadata": {}, "centers": []}, "secret")
+
+    assert VaultManager(str(vault_path)).peek_metadata() == {}
+
+
+def test_load_vault_v2_merges_public_and_encrypted_metadata(tmp_path):
+    payload = {
+        "metadata": {"version": "2.1", "source": "private"},
+        "centers": [{"Codi": "1", "Centre": "C", "Usuari": "u", "Contrasenya": "p"}],
+    }
+    public = {"version": "2.0", "generated_at": "2026-03-01"}
+    vault_path = write_vault_file(tmp_path, payload, "secret", public_metadata=public)
+
+    result = VaultManager(str(vault_path)).load_vault("secret")
+
+    assert result.metadata == {
+        "version": "2.1",
+        "generated_at": "2026-03-01",
+        "source": "private",
+    }
+
+
+def test_load_vault_rejects_tampered_public_metadata(tmp_path):
+    payload = {"metadata": {}, "centers": [{"Codi": "1"}]}
+    public = {"generated_at": "2026-03-01"}
+    vault_path = write_vault_file(tmp_path, payload, "secret", public_metadata=public)
+    data = vault_path.read_bytes()
+    vault_path.write_bytes(data.replace(b"2026-03-01", b"2099-03-01"))
+
+    manager = VaultManager(str(vault_path))
+
+    assert manager.peek_metadata() == {"generated_at": "2099-03-01"}
+    with pytest.raises(VaultDecryptionError):
+        manager.load_vault("secret")
+
+
+def test_peek_metadata_rejects_oversized_length(tmp_path):
+    vault_path = write_vault_file(
+        tmp_path, {"metadata": {}, "centers": []}, "secret", public_metadata={}
+    )
+    data = bytearray(vault_path.read_bytes())
+    data[VLTB_HEADER_SIZE : VLTB_HEADER_SIZE + 4] = (2**31).to_bytes(4, "big")
+    vault_path.write_bytes(bytes(data))
+
+    with pytest.raises(VaultFormatError):
+        VaultManager(str(vault_path)).peek_metadata()
@@ -0,0 +1,136 @@
+"""Tests for VaultUpdater."""
+
+from unittest.mock import patch
+
+import pytest
+
+from wifi_connector.data.vault_updater import PARTIAL_SUFFIX, VaultUpdater
+from wifi_connector.utils.hashing import file_sha256
+from tests.fixtures.vault_helpers import build_encrypted_vault_bytes
+
+
+CENTERS = [{"Codi": "1", "Centre": "C", "Usuari": "u", "Contrasenya": "p"}]
+
+
+def _vault_bytes(generated_at: str) -> bytes:
+    return build_encrypted_vault_bytes(
+        {"metadata": {}, "centers": CENTERS},
+        "secret",
+        n=2**10,
+        public_metadata={"version": "1", "generated_at": generated_at},
+    )
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    mirror = tmp_path / "mirror"
+    local = tmp_path / "vault"
+    mirror.mkdir()
+    local.mkdir()
+    return mirror, local
+
+
+def test_copies_new_vault_from_mirror(dirs):
+    mirror, local = dirs
+    (mirror / "vault.bin").write_bytes(_vault_bytes("2026-02-01"))
+
+    result = VaultUpdater(str(mirror), local).check_and_update()
+
+    assert result.updated == ["vault.bin"]
+    assert file_sha256(local / "vault.bin") == file_sha256(mirror / "vault.bin")
+    assert not (local / ("vault.bin" + PARTIAL_SUFFIX)).exists()
+
+
+def test_skips_identical_vault(dirs):
+    mirror, local = dirs
+    data = _vault_bytes("2026-02-01")
+    (mirror / "vault.bin").write_bytes(data)
+    (local / "vault.bin").write_bytes(data)
+
+    with patch("wifi_connector.data.vault_updater.os.replace") as mock_replace:
+        result = VaultUpdater(str(mirror), local).check_and_update()
+
+    assert result.skipped == ["vault.bin"]
+    mock_replace.assert_not_called()
+
+
+def test_replaces_changed_vault(dirs):
+    mirror, local = dirs
+    (local / "vault.bin").write_bytes(_vault_bytes("2026-01-01"))
+    (mirror / "vault.bin").write_bytes(_vault_bytes("2026-02-01"))
+
+    result = VaultUpdater(str(mirror), local).check_and_update()
+
+    assert result.updated == ["vault.bin"]
+    assert (local / "vault.bin").read_bytes() == (mirror / "vault.bin").read_bytes()
+
+
+def test_does_not_downgrade_newer_local_vault(dirs):
+    mirror, local = dirs
+    newer = _vault_bytes("2026-03-01")
+    (local / "vault.bin").write_bytes(newer)
+    (mirror / "vault.bin").write_bytes(_vault_bytes("2026-02-01"))
+
+    result = VaultUpdater(str(mirror), local).check_and_update()
+
+    assert result.skipped == ["vault.bin"]
+    assert (local / "vault.bin").read_bytes() == newer
+
+
+def test_resumes_partial_copy(dirs):
+    mirror, local = dirs
+    data = _vault_bytes("2026-02-01")
+    (mirror / "vault.bin").write_bytes(data)
+    partial = local / ("vault.bin" + PARTIAL_SUFFIX)
+    partial.write_bytes(data[:40])
+
+    with patch.object(
+        VaultUpdater, "_copy_chunked", wraps=VaultUpdater._copy_chunked
+    ) as spy:
+        result = VaultUpdater(str(mirror), local).check_and_update()
+
+    assert result.updated == ["vault.bin"]
+    assert spy.call_count == 1
+    assert (local / "vault.bin").read_bytes() == data
+
+
+def test_corrupt_partial_is_restarted_from_scratch(dirs):
+    mirror, local = dirs
+    data = _vault_bytes("2026-02-01")
+    (mirror / "vault.bin").write_bytes(data)
+    (local / ("vault.bin" + PARTIAL_SUFFIX)).write_bytes(b"X" * 40)
+
+    result = VaultUpdater(str(mirror), local).check_and_update()
+
+    assert result.updated == ["vault.bin"]
+    assert (local / "vault.bin").read_bytes() == data
+
+
+def test_invalid_mirror_file_is_not_installed(dirs):
+    mirror, local = dirs
+    original = _vault_bytes("2026-01-01")
+    (local / "vault.bin").write_bytes(original)
+    (mirror / "vault.bin").write_bytes(b"not a vault at all, just garbage bytes!!")
+
+    result = VaultUpdater(str(mirror), local).check_and_update()
+
+    assert "vault.bin" in result.errors
+    assert (local / "vault.bin").read_bytes() == original
+    assert not (local / ("vault.bin" + PARTIAL_SUFFIX)).exists()
+
+
+def test_missing_mirror_is_noop(tmp_path):
+    result = VaultUpdater(str(tmp_path / "missing"), tmp_path).check_and_update()
+
+    assert result.updated == [] and result.errors == {}
+
+
+def test_start_background_reports_result(dirs):
+    mirror, local = dirs
+    (mirror / "vault.bin").write_bytes(_vault_bytes("2026-02-01"))
+    results = []
+
+    thread = VaultUpdater(str(mirror), local).start_background(results.append)
+    thread.join(timeout=10)
+
+    assert results and results[0].updated == ["vault.bin"]
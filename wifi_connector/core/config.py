@@ -7,7 +7,9 @@ de configuración del sistema con soporte para cargar desde archivos y validaci
 import json
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
+from wifi_connector.utils.logger import Logger
 from wifi_connector.utils import translations as t
 
 
@@ -19,11 +21,38 @@ class Config:
         pause_duration: Duración de pausa entre operaciones (segundos)
         credential_dialog_wait_time: Tiempo de espera para diálogo de credenciales (segundos)
         debug_mode: Habilitar modo depuración con logs adicionales
+        vault_mirror_dir: Carpeta espejo (p. ej. recurso SMB) desde la que
+            actualizar los vaults al iniciar. None desactiva la actualización
+        speculative_unlock: Derivar la clave del vault en segundo plano
+            mientras se escribe la contraseña
+        speculative_unlock_delay_ms: Pausa al escribir antes de iniciar la
+            derivación especulativa (milisegundos)
+        force_profile_reinstall: Reinstalar siempre el perfil WLAN, aunque
+            no haya cambiado desde la última instalación
+        persistent_netsh: Reutilizar un único proceso netsh interactivo
+            para las consultas en lugar de lanzar uno por comando
+            (desactivado por defecto hasta validarlo con netsh real en Windows)
+        connection_history: Guardar cada intento de conexión en el
+            historial SQLite local (history.sqlite3)
+        metrics_textfile: Archivo .prom donde exportar métricas para el
+            textfile collector de node_exporter. None desactiva las métricas
+        metrics_interval: Segundos entre escrituras del archivo de métricas
+        json_logs: Escribir el log diario en JSON Lines (un objeto por
+            registro con identificador de evento) para la ingesta centralizada
     """
 
     pause_duration: float = 0.5
     credential_dialog_wait_time: int = 1
     debug_mode: bool = False
+    vault_mirror_dir: Optional[str] = None
+    speculative_unlock: bool = False
+    speculative_unlock_delay_ms: int = 400
+    force_profile_reinstall: bool = False
+    persistent_netsh: bool = False
+    connection_history: bool = True
+    metrics_textfile: Optional[str] = None
+    metrics_interval: float = 15.0
+    json_logs: bool = False
 
     def __post_init__(self):
         """Valida los valores de configuración después de la inicialización."""
@@ -51,6 +80,18 @@ class Config:
                 )
             )
 
+        if self.metrics_interval <= 0:
+            raise ValueError(
+                t.CONFIG_ERROR_METRICS_INTERVAL.format(value=self.metrics_interval)
+            )
+
+        if self.speculative_unlock_delay_ms < 0:
+            raise ValueError(
+                t.CONFIG_ERROR_DEBOUNCE_NEGATIVE.format(
+                    value=self.speculative_unlock_delay_ms
+                )
+            )
+
     @classmethod
     def from_file(cls, path: str) -> 'Config':
         """Carga la configuración desde un archivo JSON.
@@ -82,6 +123,30 @@ class Config:
 
         return cls(**data)
 
+    @classmethod
+    def load(cls) -> 'Config':
+        """Carga config.json de la carpeta de la aplicación si existe.
+
+        Un archivo ausente o inválido no impide arrancar: se registra el
+        problema y se usan los valores por defecto.
+
+        Returns:
+            Instancia de Config cargada o por defecto
+        """
+        from wifi_connector.utils.paths import get_config_path
+
+        path = get_config_path()
+        if not path.exists():
+            return cls.default()
+
+        try:
+            config = cls.from_file(str(path))
+            Logger.info(t.CONFIG_LOG_LOADED, path=path)
+            return config
+        except (OSError, ValueError, TypeError) as e:
+            Logger.warning(t.CONFIG_LOG_LOAD_FAILED, path=path, error=e)
+            return cls.default()
+
     @classmethod
     def default(cls) -> 'Config':
         """Crea configuración con valores por defecto.
@@ -0,0 +1,329 @@
+"""
+Intento de conexión como máquina de estados cancelable.
+
+Un ConnectionAttempt recorre los estados PENDING → PREPARING → VERIFYING →
+CONNECTED/FAILED, y puede pasar a CANCELLED desde cualquier estado no final.
+Los puntos de cancelación son el inicio de cada paso del grafo de conexión,
+cada comando externo (que se termina junto con sus subprocesos) y las esperas
+de la verificación.
+
+ConnectionController garantiza que solo haya un intento activo: uno nuevo
+cancela el anterior y espera a que termine antes de empezar, de modo que
+nunca hay dos secuencias de netsh intercaladas.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from enum import Enum
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+from wifi_connector.core.exceptions import ConnectionCancelledError
+from wifi_connector.network.event_loop import BackgroundLoop
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils.timing import span_recorder
+from wifi_connector.utils import translations as t
+
+
+class ConnectionState(Enum):
+    """Estados de un intento de conexión."""
+
+    PENDING = "pending"
+    PREPARING = "preparing"
+    VERIFYING = "verifying"
+    CONNECTED = "connected"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_terminal(self) -> bool:
+        """True si el intento ya ha terminado."""
+        return self in _TERMINAL_STATES
+
+
+_TERMINAL_STATES: FrozenSet[ConnectionState] = frozenset(
+    {ConnectionState.CONNECTED, ConnectionState.FAILED, ConnectionState.CANCELLED}
+)
+
+_TRANSITIONS: Dict[ConnectionState, FrozenSet[ConnectionState]] = {
+    ConnectionState.PENDING: frozenset(
+        {ConnectionState.PREPARING, ConnectionState.FAILED, ConnectionState.CANCELLED}
+    ),
+    ConnectionState.PREPARING: frozenset(
+        {ConnectionState.VERIFYING, ConnectionState.FAILED, ConnectionState.CANCELLED}
+    ),
+    ConnectionState.VERIFYING: frozenset(
+        {ConnectionState.CONNECTED, ConnectionState.FAILED, ConnectionState.CANCELLED}
+    ),
+}
+
+
+class ConnectionAttempt:
+    """
+    Un intento de conexión de un ProfileConnector, ejecutado en un bucle asyncio.
+
+    Usa los pasos internos del conector (_run_connection_steps,
+    verify_connection_async y _finish_verification) y añade el seguimiento
+    de estado y la cancelación.
+    """
+
+    def __init__(
+        self,
+        connector,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        on_state_change: Optional[Callable[[ConnectionState, str], None]] = None,
+        center_code: Optional[str] = None,
+    ) -> None:
+        """
+        Inicializa el intento sin empezarlo.
+
+        Args:
+            connector: ProfileConnector configurado para el centro
+            progress_callback: Función opcional para reportar progreso a la GUI
+            on_state_change: Callback (estado, mensaje) en cada transición
+                (se invoca desde el hilo del bucle)
+            center_code: Código del centro; si se indica, los registros JSON
+                del intento lo llevan en el campo center
+        """
+        self.connector = connector
+        self.center_code = center_code
+        self.progress_callback = progress_callback
+        self.on_state_change = on_state_change
+        self.state = ConnectionState.PENDING
+        self.message = ""
+        self.trace_id: Optional[str] = None
+        self.duration: Optional[float] = None
+        self.error_class: Optional[str] = None
+        self._lock = threading.Lock()
+        self._cancel_requested = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._finished = asyncio.Event()
+
+    def cancel(self) -> None:
+        """
+        Cancela el intento. Se puede llamar desde cualquier hilo.
+
+        Los comandos en marcha se terminan y la verificación se interrumpe;
+        el estado pasa a CANCELLED cuando el intento ha terminado de verdad.
+        """
+        with self._lock:
+            self._cancel_requested = True
+            loop, task = self._loop, self._task
+        self.connector.cancel()
+        if loop is not None and task is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(task.cancel)
+
+    async def wait_finished(self) -> None:
+        """Espera a que el intento llegue a un estado final."""
+        await self._finished.wait()
+
+    async def run(self) -> Tuple[bool, str]:
+        """
+        Ejecuta el intento completo.
+
+        Los pasos, sondeos y comandos quedan registrados como spans de la
+        traza self.trace_id, y al terminar se resume en el log el tiempo
+        dedicado a cada uno.
+
+        Returns:
+            Tupla (éxito, mensaje) donde éxito es True si la conexión fue exitosa
+
+        Raises:
+            asyncio.CancelledError: Si la tarea se cancela (el estado ya es
+                CANCELLED y los comandos en marcha ya han terminado)
+        """
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._task = asyncio.current_task()
+            cancel_requested = self._cancel_requested
+
+        with span_recorder.trace() as trace_id, Logger.context(center=self.center_code):
+            self.trace_id = trace_id
+            started = time.perf_counter()
+            try:
+                return await self._run_states(cancel_requested)
+            finally:
+                self.duration = time.perf_counter() - started
+                span_recorder.log_summary(trace_id, self.duration)
+                self._finished.set()
+
+    def step_durations(self) -> Dict[str, float]:
+        """
+        Tiempo total por span del intento (pasos, sondeos y comandos).
+
+        Returns:
+            Diccionario {nombre del span: segundos}; vacío si no ha empezado
+        """
+        if self.trace_id is None:
+            return {}
+        return {
+            name: entry["total"]
+            for name, entry in span_recorder.summary(self.trace_id).items()
+        }
+
+    async def _run_states(self, cancel_requested: bool) -> Tuple[bool, str]:
+        """Recorre los estados del intento (cuerpo de run())."""
+        try:
+            if cancel_requested:
+                return self._finish(ConnectionState.CANCELLED, t.PROFILE_CANCELLED)
+
+            Logger.info(t.PROFILE_LOG_STARTING)
+            self._progress(t.PROFILE_STARTING)
+            self._transition(ConnectionState.PREPARING)
+
+            steps = asyncio.ensure_future(
+                asyncio.to_thread(
+                    self.connector._run_connection_steps, self.progress_callback
+                )
+            )
+            try:
+                success, message = await asyncio.shield(steps)
+            except asyncio.CancelledError:
+                # El hilo de los pasos no se puede interrumpir: se cancelan sus
+                # comandos y se espera a que termine antes de dar por cerrado
+                self.connector.cancel()
+                await asyncio.wait({steps})
+                self._finish(ConnectionState.CANCELLED, t.PROFILE_CANCELLED)
+                raise
+
+            if self.connector.is_cancelled:
+                return self._finish(ConnectionState.CANCELLED, t.PROFILE_CANCELLED)
+            if not success:
+                return self._finish(
+                    ConnectionState.FAILED, message, self._failed_step() or "steps"
+                )
+
+            Logger.info(t.PROFILE_VERIFYING)
+            self._progress(t.PROFILE_STEP5)
+            self._transition(ConnectionState.VERIFYING)
+            try:
+                verify_result = await self.connector.verify_connection_async()
+            except asyncio.CancelledError:
+                self._finish(ConnectionState.CANCELLED, t.PROFILE_CANCELLED)
+                raise
+
+            success, message = self.connector._finish_verification(*verify_result)
+            if success:
+                return self._finish(ConnectionState.CONNECTED, message)
+            return self._finish(ConnectionState.FAILED, message, "verify")
+
+        except ConnectionCancelledError:
+            return self._finish(ConnectionState.CANCELLED, t.PROFILE_CANCELLED)
+        except Exception as e:
+            error_msg = t.PROFILE_ERROR_UNEXPECTED.format(error=e)
+            Logger.error(t.PROFILE_ERROR_UNEXPECTED, error=e, exc_info=True)
+            return self._finish(ConnectionState.FAILED, error_msg, type(e).__name__)
+
+    def _progress(self, message: str) -> None:
+        """Reporta progreso a la GUI si hay callback."""
+        if self.progress_callback:
+            self.progress_callback(message)
+
+    def _transition(self, state: ConnectionState, message: str = "") -> None:
+        """
+        Cambia de estado validando la transición.
+
+        Raises:
+            RuntimeError: Si la transición no está permitida
+        """
+        if state not in _TRANSITIONS.get(self.state, frozenset()):
+            raise RuntimeError(
+                t.CONNECT_ERROR_TRANSITION.format(
+                    source=self.state.value, target=state.value
+                )
+            )
+        Logger.debug(
+            t.CONNECT_LOG_TRANSITION, source=self.state.value, target=state.value
+        )
+        self.state = state
+        self.message = message
+        if self.on_state_change:
+            self.on_state_change(state, message)
+
+    def _failed_step(self) -> Optional[str]:
+        """Nombre del primer paso fallido según los spans del intento."""
+        for span in span_recorder.spans(self.trace_id):
+            if span.name.startswith("step.") and span.status == "error":
+                return span.name
+        return None
+
+    def _finish(
+        self, state: ConnectionState, message: str, error_class: Optional[str] = None
+    ) -> Tuple[bool, str]:
+        """
+        Pasa a un estado final y devuelve el resultado del intento.
+
+        Args:
+            state: Estado final
+            message: Mensaje del resultado
+            error_class: Categoría del fallo (paso fallido, "verify" o
+                nombre de la excepción); los cancelados usan "cancelled"
+        """
+        if state is ConnectionState.CANCELLED:
+            Logger.info(t.PROFILE_LOG_CANCELLED)
+            error_class = "cancelled"
+        self.error_class = error_class
+        self._transition(state, message)
+        return state is ConnectionState.CONNECTED, message
+
+
+class ConnectionController:
+    """Ejecuta un único intento de conexión a la vez; uno nuevo reemplaza al anterior."""
+
+    def __init__(self, loop: BackgroundLoop) -> None:
+        """
+        Inicializa el controlador.
+
+        Args:
+            loop: Bucle de fondo donde se ejecutan los intentos
+        """
+        self.loop = loop
+        self._lock = threading.Lock()
+        self._current: Optional[ConnectionAttempt] = None
+
+    @property
+    def current(self) -> Optional[ConnectionAttempt]:
+        """Último intento iniciado (puede haber terminado ya)."""
+        return self._current
+
+    def start(self, attempt: ConnectionAttempt) -> concurrent.futures.Future:
+        """
+        Inicia un intento, cancelando el que estuviera en marcha.
+
+        El nuevo intento no empieza hasta que el anterior ha terminado (y sus
+        comandos se han detenido).
+
+        Args:
+            attempt: Intento a ejecutar
+
+        Returns:
+            Future con la tupla (éxito, mensaje); se cancela si el intento
+            es cancelado o reemplazado
+        """
+        with self._lock:
+            previous, self._current = self._current, attempt
+
+        if previous is not None and not previous.state.is_terminal:
+            Logger.info(t.CONNECT_LOG_PREEMPTING)
+            previous.cancel()
+
+        async def run_after_previous() -> Tuple[bool, str]:
+            if previous is not None:
+                await previous.wait_finished()
+            return await attempt.run()
+
+        return self.loop.submit(run_after_previous())
+
+    def cancel(self) -> None:
+        """Cancela el intento en marcha, si lo hay."""
+        with self._lock:
+            current = self._current
+        if current is not None and not current.state.is_terminal:
+            current.cancel()
+
+    def is_current(self, attempt: ConnectionAttempt) -> bool:
+        """True si attempt es el último intento iniciado."""
+        with self._lock:
+            return self._current is attempt
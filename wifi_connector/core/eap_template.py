@@ -0,0 +1,97 @@
+"""Plantilla precompilada de credenciales EAP (EapHostUserCredentials).
+
+La plantilla XML se lee y valida una sola vez por proceso y se convierte en
+un string.Template con marcadores para usuario y contraseña. Cada conexión
+renderiza el XML en memoria, escapando los valores, sin volver a parsear
+ni registrar namespaces en ElementTree.
+"""
+
+from functools import lru_cache
+import re
+from string import Template
+from xml.sax.saxutils import escape
+import xml.etree.ElementTree as ET
+
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+MSCHAPV2_NAMESPACE = "http://www.microsoft.com/provisioning/MsChapV2UserPropertiesV1"
+
+
+class EapCredentialsTemplate:
+    """Plantilla EAP compilada lista para renderizar credenciales."""
+
+    def __init__(self, template_text: str) -> None:
+        """Valida y compila la plantilla.
+
+        Args:
+            template_text: Contenido XML de credentials_template.xml
+
+        Raises:
+            ET.ParseError: Si la plantilla no es XML válido
+            ValueError: Si faltan los elementos MsChapV2 Username/Password
+        """
+        root = ET.fromstring(template_text.encode("utf-8"))
+        namespaces = {"MsChapV2": MSCHAPV2_NAMESPACE}
+        if (
+            root.find(".//MsChapV2:Username", namespaces) is None
+            or root.find(".//MsChapV2:Password", namespaces) is None
+        ):
+            raise ValueError(t.PROFILE_ERROR_XML_ELEMENTS)
+
+        prefix_match = re.search(
+            r'xmlns:(\w+)="' + re.escape(MSCHAPV2_NAMESPACE) + '"', template_text
+        )
+        if prefix_match is None:
+            raise ValueError(t.PROFILE_ERROR_XML_ELEMENTS)
+        prefix = prefix_match.group(1)
+
+        # Escapar "$" del texto original antes de insertar los marcadores
+        compiled = template_text.replace("$", "$$")
+        placeholders = (("Username", "username"), ("Password", "password"))
+        for element, placeholder in placeholders:
+            compiled, count = re.subn(
+                rf"(<{prefix}:{element}>)[^<]*(</{prefix}:{element}>)",
+                rf"\g<1>${{{placeholder}}}\g<2>",
+                compiled,
+                count=1,
+            )
+            if count != 1:
+                raise ValueError(t.PROFILE_ERROR_XML_ELEMENTS)
+
+        self._template = Template(compiled)
+
+    def render(self, username: str, password: str) -> str:
+        """Renderiza el XML de credenciales con los valores escapados.
+
+        Args:
+            username: Usuario EAP
+            password: Contraseña EAP
+
+        Returns:
+            Documento XML completo
+        """
+        return self._template.substitute(
+            username=escape(username), password=escape(password)
+        )
+
+
+@lru_cache(maxsize=4)
+def load_eap_template(path: str) -> EapCredentialsTemplate:
+    """Carga y compila la plantilla EAP una sola vez por ruta.
+
+    Args:
+        path: Ruta a credentials_template.xml
+
+    Returns:
+        EapCredentialsTemplate compilada
+
+    Raises:
+        OSError: Si la plantilla no se puede leer
+        ET.ParseError: Si la plantilla no es XML válido
+        ValueError: Si faltan los elementos Username/Password
+    """
+    Logger.debug(t.PROFILE_LOG_PARSING_XML, path=path)
+    with open(path, "r", encoding="utf-8") as f:
+        return EapCredentialsTemplate(f.read())
@@ -59,3 +59,21 @@ class VaultFormatError(VaultError):
     """Lanzada cuando el formato o contenido del vault no es válido."""
 
     pass
+
+
+class NetshSessionError(WiFiConnectorError):
+    """Lanzada cuando la sesión interactiva de netsh no puede ejecutar un comando."""
+
+    pass
+
+
+class CommandTimeoutError(WiFiConnectorError):
+    """Lanzada cuando un comando externo supera su plazo y se ha terminado."""
+
+    pass
+
+
+class ConnectionCancelledError(WiFiConnectorError):
+    """Lanzada cuando un intento de conexión se cancela o es reemplazado."""
+
+    pass
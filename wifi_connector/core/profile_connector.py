@@ -3,17 +3,49 @@ Módulo para conectar a redes WiFi usando perfiles de red y configuración EAP.
 Este módulo usa netsh para gestionar perfiles WiFi y WLANSetEAPUserData para configurar credenciales EAP.
 """
 
-import subprocess
+import asyncio
 import os
 import shutil
+import tempfile
+import threading
 import xml.etree.ElementTree as ET
 import time
-from dataclasses import dataclass
-from typing import Tuple, Optional, Callable
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import Iterator, Tuple, Optional, Callable
+from wifi_connector.core.eap_template import load_eap_template
+from wifi_connector.core.exceptions import (
+    CommandTimeoutError,
+    ConnectionCancelledError,
+    NetshSessionError,
+)
+from wifi_connector.core.step_graph import Step, StepGraph, StepOutcome
+from wifi_connector.data.profile_state import ProfileState
+from wifi_connector.network.manager import NetworkManager
+from wifi_connector.network.netsh_output import (
+    NetshOutcome,
+    NetshOutput,
+    WlanInterface,
+    classify,
+    find_interface,
+    parse_interfaces,
+)
+from wifi_connector.network.netsh_session import NetshSession, is_query
+from wifi_connector.network.process_runner import (
+    DEFAULT_TIMEOUT,
+    run_process,
+    run_process_async,
+)
+from wifi_connector.utils.hashing import file_sha256
 from wifi_connector.utils.logger import Logger
+from wifi_connector.utils.timing import span_recorder
 from wifi_connector.utils import translations as t
 
 
+# El escaneo es informativo: no merece el plazo completo de un comando
+SCAN_TIMEOUT = 10.0
+
+
 @dataclass
 class CommandResult:
     """Resultado de ejecutar un comando del sistema."""
@@ -22,10 +54,15 @@ class CommandResult:
     stdout: str
     stderr: str
 
+    @cached_property
+    def output(self) -> NetshOutput:
+        """Salida clasificada (stdout y stderr juntos); se calcula una sola vez."""
+        return classify(self.stdout, self.stderr)
+
     @property
     def combined_output(self) -> str:
-        """Devuelve stdout y stderr combinados en minúsculas."""
-        return (self.stdout + " " + self.stderr).lower()
+        """Devuelve stdout y stderr combinados y normalizados (ver netsh_output.normalize)."""
+        return self.output.text
 
     @property
     def raw_error(self) -> str:
@@ -33,6 +70,44 @@ class CommandResult:
         return self.stdout.strip() or self.stderr.strip()
 
 
+@dataclass
+class VerifySchedule:
+    """Calendario adaptativo de sondeo para verificar la conexión.
+
+    Empieza sondeando rápido y alarga la espera con backoff exponencial
+    hasta max_delay, sin superar un plazo total (deadline).
+
+    Atributos:
+        initial_delay: Primera espera entre sondeos (segundos)
+        backoff: Factor multiplicativo de la espera tras cada sondeo
+        max_delay: Espera máxima entre sondeos (segundos)
+        deadline: Tiempo total máximo de verificación (segundos)
+    """
+
+    initial_delay: float = 0.25
+    backoff: float = 1.6
+    max_delay: float = 2.0
+    deadline: float = 15.0
+
+    def delays(self, start: float) -> Iterator[float]:
+        """Genera las esperas entre sondeos hasta agotar el plazo.
+
+        Args:
+            start: Instante de inicio según time.monotonic()
+
+        Yields:
+            Segundos a esperar antes del siguiente sondeo
+        """
+        end = start + self.deadline
+        delay = self.initial_delay
+        while True:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return
+            yield min(delay, remaining)
+            delay = min(delay * self.backoff, self.max_delay)
+
+
 def _decode_windows_output(raw_bytes: bytes) -> str:
     """
     Intenta decodificar la salida de comandos de Windows usando múltiples codificaciones.
@@ -59,32 +134,16 @@ def _decode_windows_output(raw_bytes: bytes) -> str:
 class ProfileConnector:
     """Clase para gestionar conexiones WiFi mediante perfiles de red."""
 
-    # Patrones que indican avisos de permisos de Windows (sin acentos para compatibilidad de encoding)
-    _PERMISSION_WARNING_PATTERNS: tuple[str, ...] = (
-        "ubicaci",  # "ubicación" sin acento
-        "location",
-        "elevaci",  # "elevación" sin acento
-        "wlangetavailablenetworklist",
-        "acceso denegado",
-        "access denied",
-        "error 5:",  # Código de error típico de acceso denegado
-        "error: 5",
-    )
-
-    # Namespaces XML para credenciales EAP de Microsoft
-    _EAP_NAMESPACES: dict[str, str] = {
-        "": "http://www.microsoft.com/provisioning/EapHostUserCredentials",
-        "eapCommon": "http://www.microsoft.com/provisioning/EapCommon",
-        "baseEap": "http://www.microsoft.com/provisioning/BaseEapUserPropertiesV1",
-        "MsPeap": "http://www.microsoft.com/provisioning/MsPeapUserPropertiesV1",
-        "MsChapV2": "http://www.microsoft.com/provisioning/MsChapV2UserPropertiesV1",
-    }
-
     def __init__(
         self,
         ssid: str = "gencat_ENS_EDU",
         username: Optional[str] = None,
         password: Optional[str] = None,
+        profile_state: Optional[ProfileState] = None,
+        force_reinstall: bool = False,
+        verify_schedule: Optional[VerifySchedule] = None,
+        network_manager: Optional[NetworkManager] = None,
+        netsh_session: Optional[NetshSession] = None,
     ):
         """
         Inicializa el conector de perfiles.
@@ -93,17 +152,37 @@ class ProfileConnector:
             ssid: Nombre de la red WiFi (SSID). Por defecto "gencat_ENS_EDU"
             username: Usuario para autenticación EAP (opcional)
             password: Contraseña para autenticación EAP (opcional)
+            profile_state: Estado local de perfiles instalados. Si se indica,
+                se omite la reinstalación del perfil cuando no ha cambiado
+            force_reinstall: Reinstalar el perfil aunque no haya cambiado
+            verify_schedule: Calendario de sondeo de la verificación. Si es
+                None, usa VerifySchedule() por defecto
+            network_manager: Si se indica, se comprueba en paralelo (de forma
+                informativa) que el SSID aparece en el escaneo
+            netsh_session: Sesión netsh persistente para las consultas
+                ("netsh ... show"). Si es None, cada comando lanza su proceso
         """
         self.ssid = ssid
         self.username = username
         self.password = password
+        self.profile_state = profile_state
+        self.force_reinstall = force_reinstall
+        self.verify_schedule = verify_schedule or VerifySchedule()
+        self.network_manager = network_manager
+        self.netsh_session = netsh_session
+        # Último estado del adaptador en la red, según la verificación
+        self.interface: Optional[WlanInterface] = None
+        # Adaptador visto en nuestra red durante la verificación en curso
+        self._joining: Optional[WlanInterface] = None
+        self._eap_xml: Optional[str] = None
+        self.cancel_event = threading.Event()
         self._script_dir = os.path.dirname(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         )
         Logger.info(
-            t.PROFILE_LOG_INIT.format(
-                ssid=ssid, username=username if username else "No especificat"
-            )
+            t.PROFILE_LOG_INIT,
+            ssid=ssid,
+            username=username if username else "No especificat",
         )
 
     # ─────────────────────────────────────────────────────────────────────────────
@@ -116,9 +195,9 @@ class ProfileConnector:
         return os.path.join(self._script_dir, "xml", "Wi-Fi-gencat_ENS_EDU.xml")
 
     @property
-    def _credentials_path(self) -> str:
-        """Ruta al archivo XML de credenciales."""
-        return os.path.join(self._script_dir, "xml", "credentials.xml")
+    def _credentials_template_path(self) -> str:
+        """Ruta a la plantilla XML de credenciales EAP."""
+        return os.path.join(self._script_dir, "xml", "credentials_template.xml")
 
     @property
     def _eap_executable_path(self) -> str:
@@ -127,29 +206,180 @@ class ProfileConnector:
             self._script_dir, "wlanseteapuserdata", "WLANSetEAPUserData.exe"
         )
 
+    # ─────────────────────────────────────────────────────────────────────────────
+    # Cancelación
+    # ─────────────────────────────────────────────────────────────────────────────
+
+    def cancel(self) -> None:
+        """
+        Cancela el intento de conexión en curso. Se puede llamar desde cualquier hilo.
+
+        Los comandos en marcha se terminan junto con sus subprocesos y no se
+        empieza ningún paso ni sondeo nuevo.
+        """
+        self.cancel_event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """True si se ha cancelado el intento."""
+        return self.cancel_event.is_set()
+
+    def _check_cancelled(self) -> None:
+        """
+        Punto de cancelación.
+
+        Raises:
+            ConnectionCancelledError: Si se ha cancelado el intento
+        """
+        if self.cancel_event.is_set():
+            raise ConnectionCancelledError(t.PROFILE_CANCELLED)
+
+    def _instrumented(self, step: Step) -> Step:
+        """Añade al paso un punto de cancelación previo y su span de tiempo."""
+        action = step.action
+
+        def run() -> Tuple[bool, str]:
+            self._check_cancelled()
+            with span_recorder.span(f"step.{step.name}") as attributes, Logger.context(
+                step=step.name
+            ):
+                success, message = action()
+                if not success:
+                    attributes["status"] = "error"
+                return success, message
+
+        return replace(step, action=run)
+
+    def _sleep(self, seconds: float) -> None:
+        """
+        Espera interrumpible: cancel() la despierta de inmediato.
+
+        Raises:
+            ConnectionCancelledError: Si se cancela durante la espera
+        """
+        self.cancel_event.wait(seconds)
+        self._check_cancelled()
+
     # ─────────────────────────────────────────────────────────────────────────────
     # Métodos auxiliares privados
     # ─────────────────────────────────────────────────────────────────────────────
 
-    def _run_command(self, command: list[str]) -> CommandResult:
+    def _run_command(
+        self, command: list[str], timeout: float = DEFAULT_TIMEOUT
+    ) -> CommandResult:
         """
         Ejecuta un comando del sistema y devuelve el resultado decodificado.
 
+        Si el comando supera el plazo se termina junto con sus subprocesos y
+        se devuelve como fallo (returncode -1) con el motivo en stderr. Si se
+        cancela el intento, también se termina y se propaga la cancelación.
+
         Args:
             command: Lista con el comando y sus argumentos
+            timeout: Segundos máximos de ejecución
 
         Returns:
             CommandResult con stdout, stderr y returncode
+
+        Raises:
+            ConnectionCancelledError: Si se cancela el intento
         """
-        Logger.debug(t.PROFILE_LOG_CMD_EXECUTING.format(command=" ".join(command)))
+        self._check_cancelled()
+        if Logger.is_enabled(Logger.DEBUG):
+            Logger.debug(t.PROFILE_LOG_CMD_EXECUTING, command=" ".join(command))
+
+        if self._uses_session(command):
+            started = time.monotonic()
+            session_result = self._run_in_session(command, timeout)
+            if session_result is not None:
+                return session_result
+            # El proceso de respaldo solo dispone del tiempo que quede
+            timeout = max(timeout - (time.monotonic() - started), 0.0)
+
+        try:
+            result = run_process(
+                command, timeout=timeout, cancel_event=self.cancel_event
+            )
+        except CommandTimeoutError as e:
+            return CommandResult(returncode=-1, stdout="", stderr=str(e))
+        return self._to_command_result(result)
 
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            check=False,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+    async def _run_command_async(
+        self, command: list[str], timeout: float = DEFAULT_TIMEOUT
+    ) -> CommandResult:
+        """
+        Variante asíncrona de _run_command (cancelable).
+
+        Args:
+            command: Lista con el comando y sus argumentos
+            timeout: Segundos máximos de ejecución
+
+        Returns:
+            CommandResult con stdout, stderr y returncode
+
+        Raises:
+            ConnectionCancelledError: Si se ha cancelado el intento
+        """
+        self._check_cancelled()
+        if Logger.is_enabled(Logger.DEBUG):
+            Logger.debug(t.PROFILE_LOG_CMD_EXECUTING, command=" ".join(command))
+
+        if self._uses_session(command):
+            started = time.monotonic()
+            session_result = await asyncio.to_thread(
+                self._run_in_session, command, timeout
+            )
+            if session_result is not None:
+                return session_result
+            timeout = max(timeout - (time.monotonic() - started), 0.0)
+
+        try:
+            result = await run_process_async(command, timeout=timeout)
+        except CommandTimeoutError as e:
+            return CommandResult(returncode=-1, stdout="", stderr=str(e))
+        return self._to_command_result(result)
+
+    def _uses_session(self, command: list[str]) -> bool:
+        """Indica si el comando es una consulta netsh que va por la sesión."""
+        return (
+            self.netsh_session is not None
+            and self.netsh_session.is_available
+            and command[0] == "netsh"
+            and is_query(command[1:])
         )
 
+    def _run_in_session(
+        self, command: list[str], timeout: float
+    ) -> Optional[CommandResult]:
+        """
+        Ejecuta una consulta netsh en la sesión persistente.
+
+        En modo interactivo netsh no da código de retorno, así que se asume 0.
+        La espera no supera ni timeout ni el plazo propio de la sesión, y
+        cancel() la interrumpe.
+
+        Returns:
+            CommandResult, o None si la sesión falla y hay que lanzar un proceso
+
+        Raises:
+            ConnectionCancelledError: Si se cancela el intento
+        """
+        try:
+            output = self.netsh_session.run(
+                command[1:],
+                timeout=min(timeout, self.netsh_session.timeout),
+                cancel_event=self.cancel_event,
+            )
+        except NetshSessionError as e:
+            Logger.warning(t.NETSH_SESSION_LOG_FALLBACK, error=e)
+            return None
+        return CommandResult(
+            returncode=0, stdout=_decode_windows_output(output), stderr=""
+        )
+
+    @staticmethod
+    def _to_command_result(result) -> CommandResult:
+        """Convierte un CompletedProcess con salida en bytes a CommandResult."""
         return CommandResult(
             returncode=result.returncode,
             stdout=_decode_windows_output(result.stdout),
@@ -169,7 +399,7 @@ class ProfileConnector:
         """
         if not os.path.exists(path):
             error_msg = error_template.format(path=path)
-            Logger.error(error_msg)
+            Logger.error(error_template, path=path)
             return error_msg
         return None
 
@@ -177,13 +407,16 @@ class ProfileConnector:
         """
         Detecta si la salida contiene avisos de permisos de Windows.
 
+        Para un CommandResult es más barato usar result.output, que ya
+        está clasificado.
+
         Args:
-            output: Texto de salida (stdout + stderr) en minúsculas
+            output: Texto de salida (stdout + stderr), en cualquier idioma
 
         Returns:
             True si se detectan avisos de permisos de Windows
         """
-        return any(pattern in output for pattern in self._PERMISSION_WARNING_PATTERNS)
+        return classify(output).has(NetshOutcome.PERMISSION)
 
     # ─────────────────────────────────────────────────────────────────────────────
     # Método público principal
@@ -196,103 +429,215 @@ class ProfileConnector:
         Conecta a la red WiFi usando método de perfil (netsh + WLANSetEAPUserData).
 
         Este método:
-        1. Instala el perfil WiFi desde el archivo XML
+        1. Instala el perfil WiFi desde el archivo XML (se omite si no ha cambiado)
         1.5. Actualiza las credenciales en el XML si se proporcionaron
         2. Configura las credenciales EAP usando WLANSetEAPUserData
+           (1.5 y 2 se omiten si las credenciales ya se aplicaron)
         3. Conecta a la red usando netsh
         4. Verifica que la conexión se estableció correctamente
 
+        Entre pasos, en cada comando y en las esperas de la verificación se
+        comprueba si se ha llamado a cancel(). Cada paso, sondeo y comando se
+        mide como span y al final se resume el tiempo del intento en el log.
+
         Args:
             progress_callback: Función opcional para reportar progreso a la GUI
 
         Returns:
             Tupla (éxito, mensaje) donde éxito es True si la conexión fue exitosa
         """
-        try:
-            Logger.info(t.PROFILE_LOG_STARTING)
-            if progress_callback:
-                progress_callback(t.PROFILE_STARTING)
-
-            Logger.info(t.PROFILE_INSTALLING)
-            if progress_callback:
-                progress_callback(t.PROFILE_STEP1)
-            success, message = self._install_wifi_profile()
-            if not success:
-                Logger.error(t.PROFILE_LOG_INSTALL_ERROR.format(message=message))
-                return False, message
-            Logger.info(f"✓ {message}")
-
-            if self.username and self.password:
-                Logger.info(t.PROFILE_UPDATING_CREDS)
+        with span_recorder.trace() as trace_id:
+            started = time.perf_counter()
+            try:
+                Logger.info(t.PROFILE_LOG_STARTING)
                 if progress_callback:
-                    progress_callback(t.PROFILE_STEP2)
-                success, message = self._update_credentials_xml()
+                    progress_callback(t.PROFILE_STARTING)
+
+                success, message = self._run_connection_steps(progress_callback)
+                self._check_cancelled()
                 if not success:
-                    Logger.error(t.PROFILE_LOG_UPDATE_ERROR.format(message=message))
                     return False, message
-                Logger.info(f"✓ {message}")
+
+                Logger.info(t.PROFILE_VERIFYING)
+                if progress_callback:
+                    progress_callback(t.PROFILE_STEP5)
+                return self._finish_verification(*self._verify_connection())
+
+            except ConnectionCancelledError:
+                Logger.info(t.PROFILE_LOG_CANCELLED)
+                return False, t.PROFILE_CANCELLED
+            except Exception as e:
+                error_msg = t.PROFILE_ERROR_UNEXPECTED.format(error=e)
+                Logger.error(t.PROFILE_ERROR_UNEXPECTED, error=e, exc_info=True)
+                return False, error_msg
+            finally:
+                span_recorder.log_summary(trace_id, time.perf_counter() - started)
+
+    async def connect_via_profile_async(
+        self, progress_callback: Optional[Callable[[str], None]] = None
+    ) -> Tuple[bool, str]:
+        """
+        Variante asíncrona de connect_via_profile() para el bucle de fondo.
+
+        Ejecuta un ConnectionAttempt: los pasos previos (grafo de instalación,
+        credenciales EAP y conexión) van en un hilo del ejecutor y la
+        verificación sondea de forma asíncrona. Cancelar la tarea termina los
+        comandos en marcha y detiene el intento.
+
+        Args:
+            progress_callback: Función opcional para reportar progreso a la GUI
+                (se invoca desde el hilo del bucle o del ejecutor)
+
+        Returns:
+            Tupla (éxito, mensaje) donde éxito es True si la conexión fue exitosa
+        """
+        from wifi_connector.core.connection_attempt import ConnectionAttempt
+
+        return await ConnectionAttempt(self, progress_callback).run()
+
+    def _finish_verification(
+        self, verify_success: bool, verify_message: str
+    ) -> Tuple[bool, str]:
+        """
+        Convierte el resultado de la verificación en el resultado final.
+
+        Args:
+            verify_success: Si la verificación confirmó la conexión
+            verify_message: Mensaje de la verificación
+
+        Returns:
+            Tupla (éxito, mensaje) de la conexión completa
+        """
+        if verify_success:
+            Logger.info(t.PROFILE_LOG_STEP_DONE, message=verify_message)
+            Logger.info(t.PROFILE_LOG_STEP_DONE, message=t.PROFILE_SUCCESS_COMPLETE)
+            return True, t.PROFILE_SUCCESS_COMPLETE
+
+        # La verificación falló - comprobar si es por permisos de Windows
+        is_permission_issue = (
+            "permisos" in verify_message.lower()
+            or "permission" in verify_message.lower()
+        )
+
+        if is_permission_issue:
+            # Los permisos de Windows impiden verificar, pero la conexión puede estar activa
+            Logger.warning(t.PROFILE_LOG_VERIFY_FAILED, message=verify_message)
+            Logger.info(t.PROFILE_LOG_VERIFY_PROBABLY_OK)
+            return (
+                True,
+                t.PROFILE_SUCCESS_COMPLETE + " " + t.PROFILE_INFO_VERIFICATION_LIMITED,
+            )
+
+        # Fallo de verificación real (no relacionado con permisos)
+        Logger.error(t.PROFILE_LOG_VERIFY_ERROR, message=verify_message)
+        self._forget_installed_profile()
+        return False, verify_message
+
+    def _run_connection_steps(
+        self, progress_callback: Optional[Callable[[str], None]] = None
+    ) -> Tuple[bool, str]:
+        """
+        Ejecuta los pasos previos a la verificación como grafo de dependencias.
+
+        La instalación del perfil y la preparación del XML de credenciales son
+        independientes y se ejecutan en paralelo, igual que el escaneo
+        informativo de la red. La configuración EAP espera a ambas y la
+        conexión espera a la configuración EAP.
+
+        Args:
+            progress_callback: Función opcional para reportar progreso a la GUI
+
+        Returns:
+            Tupla (éxito, mensaje) del primer paso fallido o del paso de conexión
+        """
+        steps = [Step("install", self._install_wifi_profile)]
+        start_logs = {"install": t.PROFILE_INSTALLING}
+        progress = {"install": t.PROFILE_STEP1}
+        error_logs = {"install": t.PROFILE_LOG_INSTALL_ERROR}
+
+        if self.network_manager is not None:
+            steps.append(Step("scan", self._check_network_visible, required=False))
+
+        eap_dependencies: Tuple[str, ...] = ("install",)
+        if self._are_eap_credentials_current():
+            # Mismas credenciales ya aplicadas: solo falta conectar
+            Logger.info(t.PROFILE_LOG_EAP_UNCHANGED, ssid=self.ssid)
+            connect_dependencies: Tuple[str, ...] = ("install",)
+        else:
+            if self.username and self.password:
+                steps.append(Step("update_xml", self._update_credentials_xml))
+                start_logs["update_xml"] = t.PROFILE_UPDATING_CREDS
+                progress["update_xml"] = t.PROFILE_STEP2
+                error_logs["update_xml"] = t.PROFILE_LOG_UPDATE_ERROR
+                eap_dependencies += ("update_xml",)
             else:
                 Logger.warning(t.PROFILE_WARNING_NO_CREDS)
 
-            Logger.info(t.PROFILE_CONFIGURING_EAP)
-            if progress_callback:
-                progress_callback(t.PROFILE_STEP3)
-            success, message = self._configure_eap_credentials()
-            if not success:
-                Logger.error(t.PROFILE_LOG_CONFIG_ERROR.format(message=message))
-                return False, message
-            Logger.info(f"✓ {message}")
-
-            Logger.info(t.PROFILE_CONNECTING)
-            if progress_callback:
-                progress_callback(t.PROFILE_STEP4)
-            connect_success, connect_message = self._connect_to_network()
-            if not connect_success:
-                Logger.error(
-                    t.PROFILE_LOG_CONNECT_ERROR.format(message=connect_message)
-                )
-                return False, connect_message
-            Logger.info(f"✓ {connect_message}")
-
-            Logger.info(t.PROFILE_VERIFYING)
-            if progress_callback:
-                progress_callback(t.PROFILE_STEP5)
-            verify_success, verify_message = self._verify_connection()
-
-            if verify_success:
-                Logger.info(f"✓ {verify_message}")
-                Logger.info(f"✓ {t.PROFILE_SUCCESS_COMPLETE}")
-                return True, t.PROFILE_SUCCESS_COMPLETE
-            else:
-                # La verificación falló - comprobar si es por permisos de Windows
-                is_permission_issue = (
-                    "permisos" in verify_message.lower()
-                    or "permission" in verify_message.lower()
-                )
+            steps.append(
+                Step("configure_eap", self._configure_eap_step, eap_dependencies)
+            )
+            start_logs["configure_eap"] = t.PROFILE_CONFIGURING_EAP
+            progress["configure_eap"] = t.PROFILE_STEP3
+            error_logs["configure_eap"] = t.PROFILE_LOG_CONFIG_ERROR
+            connect_dependencies = ("configure_eap",)
+
+        steps.append(Step("connect", self._connect_step, connect_dependencies))
+        start_logs["connect"] = t.PROFILE_CONNECTING
+        progress["connect"] = t.PROFILE_STEP4
+        error_logs["connect"] = t.PROFILE_LOG_CONNECT_ERROR
+
+        def on_start(step: Step) -> None:
+            if step.name in start_logs:
+                Logger.info(start_logs[step.name])
+            if progress_callback and step.name in progress:
+                progress_callback(progress[step.name])
+
+        def on_finish(step: Step, outcome: StepOutcome) -> None:
+            if outcome.success:
+                Logger.info(t.PROFILE_LOG_STEP_DONE, message=outcome.message)
+            elif step.name in error_logs and outcome.error is None:
+                Logger.error(error_logs[step.name], message=outcome.message)
+
+        # Cada paso empieza con un punto de cancelación y se mide como span
+        steps = [self._instrumented(step) for step in steps]
+        success, message, _ = StepGraph(steps).run(on_start, on_finish)
+        return success, message
+
+    def _configure_eap_step(self) -> Tuple[bool, str]:
+        """Configura las credenciales EAP y las registra si se aplicaron."""
+        success, message = self._configure_eap_credentials()
+        if success:
+            self._record_eap_credentials()
+        return success, message
+
+    def _connect_step(self) -> Tuple[bool, str]:
+        """Conecta a la red; si falla, olvida el perfil para reinstalarlo."""
+        success, message = self._connect_to_network()
+        if not success:
+            self._forget_installed_profile()
+        return success, message
+
+    def _check_network_visible(self) -> Tuple[bool, str]:
+        """
+        Comprueba (de forma informativa) si el SSID aparece en el escaneo.
 
-                if is_permission_issue:
-                    # Los permisos de Windows impiden verificar, pero la conexión puede estar activa
-                    Logger.warning(
-                        t.PROFILE_LOG_VERIFY_FAILED.format(message=verify_message)
-                    )
-                    Logger.info(t.PROFILE_LOG_VERIFY_PROBABLY_OK)
-                    return (
-                        True,
-                        t.PROFILE_SUCCESS_COMPLETE
-                        + " "
-                        + t.PROFILE_INFO_VERIFICATION_LIMITED,
-                    )
-                else:
-                    # Fallo de verificación real (no relacionado con permisos)
-                    Logger.error(
-                        t.PROFILE_LOG_VERIFY_ERROR.format(message=verify_message)
-                    )
-                    return False, verify_message
+        El escaneo tiene su propio plazo, más corto, y se interrumpe al
+        cancelar el intento.
 
-        except Exception as e:
-            error_msg = t.PROFILE_ERROR_UNEXPECTED.format(error=e)
-            Logger.error(error_msg, exc_info=True)
-            return False, error_msg
+        Returns:
+            Tupla (visible, mensaje). No visible no impide intentar conectar.
+
+        Raises:
+            ConnectionCancelledError: Si se cancela durante el escaneo
+        """
+        Logger.debug(t.PROFILE_LOG_SCANNING, ssid=self.ssid)
+        if self.network_manager.is_network_available(
+            self.ssid, timeout=SCAN_TIMEOUT, cancel_event=self.cancel_event
+        ):
+            return True, t.NET_LOG_NETWORK_AVAILABLE.format(ssid=self.ssid)
+        message = t.PROFILE_WARNING_NOT_VISIBLE.format(ssid=self.ssid)
+        Logger.warning(t.PROFILE_WARNING_NOT_VISIBLE, ssid=self.ssid)
+        return False, message
 
     # ─────────────────────────────────────────────────────────────────────────────
     # Métodos de pasos de conexión
@@ -306,7 +651,7 @@ class ProfileConnector:
             Tupla (éxito, mensaje) donde éxito es True si se eliminó o no existía
         """
         try:
-            Logger.info(t.PROFILE_LOG_DELETING_PROFILE.format(ssid=self.ssid))
+            Logger.info(t.PROFILE_LOG_DELETING_PROFILE, ssid=self.ssid)
 
             command = [
                 "netsh",
@@ -323,23 +668,19 @@ class ProfileConnector:
                 return True, t.PROFILE_SUCCESS_DELETED
 
             # Comprobar si el perfil no existía (esto es OK, no es un error)
-            output_lower = result.combined_output
-            if (
-                "no se encontr" in output_lower
-                or "not found" in output_lower
-                or "no existe" in output_lower
-                or "doesn't exist" in output_lower
-            ):
+            if result.output.has(NetshOutcome.NOT_FOUND):
                 Logger.debug(t.PROFILE_INFO_NO_EXISTING_PROFILE)
                 return True, t.PROFILE_INFO_NO_EXISTING_PROFILE
 
             # Error real al eliminar
-            Logger.warning(t.PROFILE_ERROR_DELETE_LOG.format(error=result.raw_error))
+            Logger.warning(t.PROFILE_ERROR_DELETE_LOG, error=result.raw_error)
             # Continuamos igualmente, no es crítico
             return True, t.PROFILE_INFO_NO_EXISTING_PROFILE
 
+        except ConnectionCancelledError:
+            raise
         except Exception as e:
-            Logger.warning(t.PROFILE_ERROR_DELETE_LOG.format(error=str(e)))
+            Logger.warning(t.PROFILE_ERROR_DELETE_LOG, error=str(e))
             # No es crítico, continuamos igualmente
             return True, t.PROFILE_INFO_NO_EXISTING_PROFILE
 
@@ -348,11 +689,17 @@ class ProfileConnector:
         Instala el perfil WiFi para todos los usuarios usando netsh.
 
         Primero elimina el perfil existente si existe, luego instala el nuevo.
+        Si hay estado de perfiles y el XML no ha cambiado desde la última
+        instalación (y el perfil sigue presente), no hace nada.
 
         Returns:
             Tupla (éxito, mensaje) donde éxito es True si se instaló correctamente
         """
         try:
+            if self._is_installed_profile_current():
+                Logger.info(t.PROFILE_LOG_PROFILE_UNCHANGED, ssid=self.ssid)
+                return True, t.PROFILE_SUCCESS_UNCHANGED
+
             # Primero eliminar el perfil existente
             self._delete_existing_profile()
 
@@ -373,91 +720,188 @@ class ProfileConnector:
 
             if result.returncode == 0:
                 Logger.info(t.PROFILE_SUCCESS_INSTALLED)
+                self._record_installed_profile()
                 return True, t.PROFILE_SUCCESS_INSTALLED
 
             # Comprobar si el perfil ya existía
-            if "ya está" in result.stdout.lower() or "already" in result.stdout.lower():
+            if result.output.has(NetshOutcome.ALREADY_EXISTS):
                 Logger.info(t.PROFILE_SUCCESS_EXISTED)
+                self._record_installed_profile()
                 return True, t.PROFILE_SUCCESS_EXISTED
 
-            Logger.error(t.PROFILE_ERROR_NETSH_LOG.format(error=result.raw_error))
+            Logger.error(t.PROFILE_ERROR_NETSH_LOG, error=result.raw_error)
             return False, t.PROFILE_ERROR_NETSH
 
+        except ConnectionCancelledError:
+            raise
         except Exception as e:
-            Logger.error(
-                t.PROFILE_ERROR_INSTALL_LOG.format(error=str(e)), exc_info=True
-            )
+            Logger.error(t.PROFILE_ERROR_INSTALL_LOG, error=str(e), exc_info=True)
             return False, t.PROFILE_ERROR_INSTALL
 
-    def _update_credentials_xml(self) -> Tuple[bool, str]:
+    def _is_installed_profile_current(self) -> bool:
         """
-        Actualiza el archivo credentials.xml con el usuario y contraseña proporcionados.
+        Comprueba si el perfil instalado coincide con el XML actual.
+
+        Compara el hash del XML con el registrado en la última instalación y,
+        solo si coincide, confirma con 'netsh wlan show profiles' que el
+        perfil sigue presente en el sistema.
 
         Returns:
-            Tupla (éxito, mensaje) donde éxito es True si se actualizó correctamente
+            True si se puede omitir la reinstalación
+        """
+        if self.profile_state is None:
+            return False
+
+        if self.force_reinstall:
+            Logger.info(t.PROFILE_LOG_FORCE_REINSTALL, ssid=self.ssid)
+            return False
+
+        if not os.path.exists(self._profile_path):
+            return False
+
+        recorded_hash = self.profile_state.get_profile_hash(self.ssid)
+        if recorded_hash is None or recorded_hash != file_sha256(self._profile_path):
+            return False
+
+        result = self._run_command(["netsh", "wlan", "show", "profiles"])
+        if result.returncode != 0 or not self._is_profile_listed(result.stdout):
+            Logger.info(t.PROFILE_LOG_PROFILE_MISSING, ssid=self.ssid)
+            return False
+
+        return True
+
+    def _is_profile_listed(self, output: str) -> bool:
         """
+        Busca el SSID en la salida de 'netsh wlan show profiles'.
+
+        Las líneas tienen la forma "<tipo de perfil> : <nombre>" en cualquier
+        idioma, así que se compara el valor tras los dos puntos.
+
+        Args:
+            output: Salida del comando netsh
+
+        Returns:
+            True si hay un perfil con el nombre del SSID
+        """
+        ssid_lower = self.ssid.lower()
+        for line in output.splitlines():
+            _, separator, value = line.partition(":")
+            if separator and value.strip().lower() == ssid_lower:
+                return True
+        return False
+
+    def _record_installed_profile(self) -> None:
+        """Registra el hash del XML recién instalado en el estado local."""
+        if self.profile_state is None:
+            return
         try:
-            if error := self._validate_file_exists(
-                self._credentials_path, t.PROFILE_ERROR_CREDS_NOT_FOUND
-            ):
-                return False, error
+            self.profile_state.set_profile_hash(
+                self.ssid, file_sha256(self._profile_path)
+            )
+        except OSError as e:
+            Logger.warning(t.PROFILE_STATE_LOG_SAVE_ERROR, error=e)
+
+    def _are_eap_credentials_current(self) -> bool:
+        """
+        Comprueba si las credenciales EAP actuales ya se aplicaron al perfil.
+
+        Returns:
+            True si se pueden omitir la preparación del XML de credenciales y
+            WLANSetEAPUserData
+        """
+        if self.profile_state is None or self.force_reinstall:
+            return False
+        if not (self.username and self.password):
+            return False
+        return self.profile_state.eap_credentials_match(
+            self.ssid, self.username, self.password
+        )
 
-            Logger.debug(t.PROFILE_LOG_PARSING_XML.format(path=self._credentials_path))
-            tree = ET.parse(self._credentials_path)
-            root = tree.getroot()
+    def _record_eap_credentials(self) -> None:
+        """Registra (como HMAC) las credenciales EAP recién aplicadas."""
+        if self.profile_state is None or not (self.username and self.password):
+            return
+        self.profile_state.set_eap_credentials(self.ssid, self.username, self.password)
 
-            # Registrar namespaces para preservar el formato XML
-            for prefix, uri in self._EAP_NAMESPACES.items():
-                ET.register_namespace(prefix if prefix else "", uri)
+    def _forget_installed_profile(self) -> None:
+        """Olvida el perfil registrado para que el próximo intento lo reinstale."""
+        if self.profile_state is not None:
+            self.profile_state.forget(self.ssid)
+
+    def _update_credentials_xml(self) -> Tuple[bool, str]:
+        """
+        Prepara el XML de credenciales EAP con el usuario y contraseña proporcionados.
 
-            username_elem = root.find(".//MsChapV2:Username", self._EAP_NAMESPACES)
-            password_elem = root.find(".//MsChapV2:Password", self._EAP_NAMESPACES)
+        El XML se renderiza en memoria desde la plantilla precompilada
+        (credentials_template.xml, leída una vez por proceso). Solo toca
+        disco en _configure_eap_credentials, en un archivo temporal privado.
 
-            if username_elem is None or password_elem is None:
-                Logger.error(t.PROFILE_ERROR_XML_ELEMENTS)
-                return False, t.PROFILE_ERROR_XML_ELEMENTS
+        Returns:
+            Tupla (éxito, mensaje) donde éxito es True si se preparó correctamente
+        """
+        try:
+            if error := self._validate_file_exists(
+                self._credentials_template_path, t.PROFILE_ERROR_CREDS_NOT_FOUND
+            ):
+                return False, error
 
-            Logger.debug(t.PROFILE_LOG_UPDATING_USER.format(username=self.username))
-            username_elem.text = self.username
-            password_elem.text = self.password
+            template = load_eap_template(self._credentials_template_path)
 
-            tree.write(self._credentials_path, encoding="UTF-8", xml_declaration=True)
-            Logger.info(t.PROFILE_LOG_CREDS_UPDATED.format(path=self._credentials_path))
+            Logger.debug(t.PROFILE_LOG_UPDATING_USER, username=self.username)
+            self._eap_xml = template.render(self.username, self.password)
 
             return True, t.PROFILE_SUCCESS_UPDATED
 
         except ET.ParseError as e:
             error_msg = t.PROFILE_ERROR_PARSING_XML.format(error=str(e))
-            Logger.error(error_msg, exc_info=True)
+            Logger.error(t.PROFILE_ERROR_PARSING_XML, error=str(e), exc_info=True)
             return False, error_msg
+        except ValueError as e:
+            Logger.error(t.PROFILE_LOG_TEMPLATE_ERROR, error=e)
+            return False, str(e)
         except Exception as e:
             error_msg = t.PROFILE_ERROR_UPDATE_CREDS.format(error=str(e))
-            Logger.error(error_msg, exc_info=True)
+            Logger.error(t.PROFILE_ERROR_UPDATE_CREDS, error=str(e), exc_info=True)
             return False, error_msg
 
     def _configure_eap_credentials(self) -> Tuple[bool, str]:
         """
         Configura las credenciales EAP usando WLANSetEAPUserData.exe.
 
+        El XML preparado por _update_credentials_xml se escribe en un archivo
+        dentro de un directorio temporal privado de este intento, que se
+        elimina en cuanto WLANSetEAPUserData termina. Sin credenciales se usa
+        la plantilla tal cual (credenciales por defecto).
+
         Returns:
             Tupla (éxito, mensaje) donde éxito es True si se configuró correctamente
         """
+        temp_dir: Optional[str] = None
         try:
             if error := self._validate_file_exists(
                 self._eap_executable_path, t.PROFILE_ERROR_EXE_NOT_FOUND
             ):
                 return False, error
 
-            if error := self._validate_file_exists(
-                self._credentials_path, t.PROFILE_ERROR_CREDS_NOT_FOUND
-            ):
-                return False, error
+            if self._eap_xml is None:
+                if error := self._validate_file_exists(
+                    self._credentials_template_path, t.PROFILE_ERROR_CREDS_NOT_FOUND
+                ):
+                    return False, error
+                credentials_path = self._credentials_template_path
+            else:
+                # mkdtemp crea el directorio accesible solo por el usuario actual
+                temp_dir = tempfile.mkdtemp(prefix="wifi_connector_eap_")
+                credentials_path = os.path.join(temp_dir, "credentials.xml")
+                with open(credentials_path, "w", encoding="utf-8") as f:
+                    f.write(self._eap_xml)
+                Logger.debug(t.PROFILE_LOG_CREDS_UPDATED, path=credentials_path)
 
             command = [
                 self._eap_executable_path,
                 self.ssid,
                 "1",
-                self._credentials_path,
+                credentials_path,
                 "/i",
             ]
             result = self._run_command(command)
@@ -466,15 +910,20 @@ class ProfileConnector:
                 Logger.info(t.PROFILE_SUCCESS_EAP)
                 return True, t.PROFILE_SUCCESS_EAP
 
-            Logger.error(t.PROFILE_ERROR_EAP_LOG.format(error=result.raw_error))
+            Logger.error(t.PROFILE_ERROR_EAP_LOG, error=result.raw_error)
             return False, t.PROFILE_ERROR_EAP
 
+        except ConnectionCancelledError:
+            raise
         except Exception as e:
-            Logger.error(
-                t.PROFILE_ERROR_CONFIG_EAP_LOG.format(error=str(e)), exc_info=True
-            )
+            Logger.error(t.PROFILE_ERROR_CONFIG_EAP_LOG, error=str(e), exc_info=True)
             return False, t.PROFILE_ERROR_CONFIG_EAP
 
+        finally:
+            if temp_dir is not None:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                Logger.debug(t.PROFILE_LOG_CREDS_REMOVED, path=temp_dir)
+
     def _connect_to_network(self) -> Tuple[bool, str]:
         """
         Conecta a la red WiFi usando netsh.
@@ -487,202 +936,230 @@ class ProfileConnector:
             result = self._run_command(command)
 
             # Debug: mostrar qué contiene la salida
-            Logger.debug(t.PROFILE_LOG_RETURNCODE.format(code=result.returncode))
+            Logger.debug(t.PROFILE_LOG_RETURNCODE, returncode=result.returncode)
             Logger.debug(
-                t.PROFILE_LOG_STDOUT.format(
-                    output=result.stdout[:200] if result.stdout else "(buit)"
-                )
+                t.PROFILE_LOG_STDOUT,
+                output=result.stdout[:200] if result.stdout else "(buit)",
             )
             Logger.debug(
-                t.PROFILE_LOG_STDERR.format(
-                    output=result.stderr[:200] if result.stderr else "(buit)"
-                )
+                t.PROFILE_LOG_STDERR,
+                output=result.stderr[:200] if result.stderr else "(buit)",
             )
 
             # Detectar avisos de permisos de Windows
-            if self._has_permission_warning(result.combined_output):
+            output = result.output
+            if output.has(NetshOutcome.PERMISSION):
                 Logger.warning(t.PROFILE_WARNING_PERMISSIONS_IGNORED)
                 Logger.info(t.PROFILE_INFO_CMD_EXECUTED)
                 return True, t.PROFILE_SUCCESS_CMD_PENDING
 
             # Buscar mensajes de error reales (no de permisos)
-            stdout_lower = result.stdout.lower()
-            has_real_error = (
-                ("no se encuentra" in stdout_lower or "not found" in stdout_lower)
-                and not self._has_permission_warning(result.combined_output)
-            ) or (
-                ("no disponible" in stdout_lower or "not available" in stdout_lower)
-                and not self._has_permission_warning(result.combined_output)
-            )
-
-            if has_real_error:
-                Logger.error(t.PROFILE_ERROR_CONNECT_LOG.format(error=result.raw_error))
+            if output.has(NetshOutcome.NOT_FOUND, NetshOutcome.NOT_AVAILABLE):
+                Logger.error(t.PROFILE_ERROR_CONNECT_LOG, error=result.raw_error)
                 return False, t.PROFILE_ERROR_CONNECT
 
             # Buscar mensajes de éxito
-            has_success = (
-                result.returncode == 0
-                or "correctamente" in stdout_lower
-                or "successfully" in stdout_lower
-            )
-
-            if has_success:
+            if result.returncode == 0 or output.has(NetshOutcome.SUCCESS):
                 success_msg = t.PROFILE_SUCCESS_COMMAND.format(ssid=self.ssid)
-                Logger.info(success_msg)
+                Logger.info(t.PROFILE_SUCCESS_COMMAND, ssid=self.ssid)
                 return True, success_msg
 
             # Sin éxito claro ni warning conocido -> error
-            Logger.error(t.PROFILE_ERROR_CONNECT_LOG.format(error=result.raw_error))
+            Logger.error(t.PROFILE_ERROR_CONNECT_LOG, error=result.raw_error)
             return False, t.PROFILE_ERROR_CONNECT
 
+        except ConnectionCancelledError:
+            raise
         except Exception as e:
             Logger.error(
-                t.PROFILE_ERROR_CONNECT_COMMAND_LOG.format(error=str(e)), exc_info=True
+                t.PROFILE_ERROR_CONNECT_COMMAND_LOG, error=str(e), exc_info=True
             )
             return False, t.PROFILE_ERROR_CONNECT_COMMAND
 
-    def _parse_connection_state(self, output: str) -> Optional[str]:
-        """
-        Parsea la salida de 'netsh wlan show interfaces' para obtener el estado.
-
-        Args:
-            output: Salida del comando netsh
-
-        Returns:
-            Estado de la conexión: 'connected', 'disconnected', 'authenticating',
-            'connecting', o None si no se encuentra
-        """
-        for line in output.split("\n"):
-            line_lower = line.lower()
-            if "estado" not in line_lower and "state" not in line_lower:
-                continue
-
-            if "desconectado" in line_lower or "disconnected" in line_lower:
-                return "disconnected"
-            if "autenticando" in line_lower or "authenticating" in line_lower:
-                return "authenticating"
-            if "conectando" in line_lower or "connecting" in line_lower:
-                return "connecting"
-            if "conectado" in line_lower or "connected" in line_lower:
-                return "connected"
-
-        return None
-
     def _verify_connection(
-        self, max_attempts: int = 3, wait_seconds: int = 3
+        self,
+        max_attempts: Optional[int] = None,
+        wait_seconds: Optional[float] = None,
     ) -> Tuple[bool, str]:
         """
         Verifica que la conexión WiFi se estableció correctamente.
 
-        Usa 'netsh wlan show interfaces' para comprobar el estado real de la conexión.
-        Espera hasta max_attempts intentos para que la conexión se complete.
+        Usa 'netsh wlan show interfaces' para comprobar el estado real de la conexión
+        y devuelve en cuanto el estado es conectado o desconectado. Por defecto
+        sondea según self.verify_schedule (rápido al principio, con backoff
+        exponencial y un plazo total). Si se indica max_attempts o wait_seconds,
+        usa un calendario fijo de max_attempts intentos separados wait_seconds.
 
         Args:
-            max_attempts: Número máximo de intentos de verificación (por defecto 3)
-            wait_seconds: Segundos entre cada intento (por defecto 3)
+            max_attempts: Número de intentos del calendario fijo (por defecto 3)
+            wait_seconds: Segundos entre intentos del calendario fijo (por defecto 3)
 
         Returns:
             Tupla (éxito, mensaje) donde éxito es True si está conectado
         """
+        self._joining = None
         try:
-            Logger.info(
-                t.PROFILE_LOG_VERIFYING.format(ssid=self.ssid, attempts=max_attempts)
-            )
+            start = time.monotonic()
+            delays = self._verify_delays(start, max_attempts, wait_seconds)
 
-            for attempt in range(1, max_attempts + 1):
+            attempt = 0
+            while True:
+                attempt += 1
                 Logger.debug(
-                    t.PROFILE_LOG_ATTEMPT.format(
-                        attempt=attempt, max_attempts=max_attempts
-                    )
+                    t.PROFILE_LOG_ATTEMPT_ELAPSED,
+                    attempt=attempt,
+                    elapsed=time.monotonic() - start,
                 )
 
-                result = self._run_command(["netsh", "wlan", "show", "interfaces"])
+                with span_recorder.span("verify.attempt", attempt=attempt) as span:
+                    result = self._run_command(["netsh", "wlan", "show", "interfaces"])
+                    verdict = self._evaluate_interfaces(result, attempt)
+                    span["status"] = self._verdict_status(verdict)
+                if verdict is not None:
+                    return verdict
 
-                # Detectar avisos de permisos de Windows
-                if self._has_permission_warning(result.combined_output):
-                    Logger.warning(t.PROFILE_WARNING_PERMISSIONS_VERIFY)
-                    Logger.info(t.PROFILE_WARNING_PERMISSIONS_MAY_WORK)
-                    return False, t.PROFILE_ERROR_PERMISSIONS_VERIFY
+                delay = next(delays, None)
+                if delay is None:
+                    break
+                self._sleep(delay)
 
-                if result.returncode != 0:
-                    if attempt < max_attempts:
-                        time.sleep(wait_seconds)
-                    continue
+            return self._verify_gave_up(attempt)
 
-                # Verificar que el SSID aparece en la salida
-                if self.ssid.lower() not in result.stdout.lower():
-                    if attempt < max_attempts:
-                        time.sleep(wait_seconds)
-                    continue
+        except ConnectionCancelledError:
+            raise
+        except Exception as e:
+            error_msg = t.PROFILE_ERROR_VERIFY.format(error=str(e))
+            Logger.error(t.PROFILE_ERROR_VERIFY, error=str(e), exc_info=True)
+            return False, error_msg
 
-                # Parsear estado de conexión
-                state = self._parse_connection_state(result.stdout)
+    async def verify_connection_async(
+        self,
+        max_attempts: Optional[int] = None,
+        wait_seconds: Optional[float] = None,
+    ) -> Tuple[bool, str]:
+        """
+        Variante asíncrona de _verify_connection: sondea sin bloquear un hilo.
 
-                if state == "connected":
-                    success_msg = t.PROFILE_SUCCESS_VERIFIED.format(ssid=self.ssid)
-                    Logger.info(success_msg)
-                    return True, success_msg
+        Cancelar la tarea detiene el sondeo (y el netsh en curso, si lo hay).
 
-                if state == "disconnected":
-                    error_msg = t.PROFILE_ERROR_AUTH
-                    Logger.error(error_msg)
-                    return False, error_msg
+        Args:
+            max_attempts: Número de intentos del calendario fijo (por defecto 3)
+            wait_seconds: Segundos entre intentos del calendario fijo (por defecto 3)
+
+        Returns:
+            Tupla (éxito, mensaje) donde éxito es True si está conectado
+        """
+        self._joining = None
+        try:
+            start = time.monotonic()
+            delays = self._verify_delays(start, max_attempts, wait_seconds)
 
-                if state == "authenticating":
-                    Logger.debug(t.PROFILE_LOG_STATE_AUTH.format(attempt=attempt))
-                elif state == "connecting":
-                    Logger.debug(t.PROFILE_LOG_STATE_CONNECTING.format(attempt=attempt))
+            attempt = 0
+            while True:
+                attempt += 1
+                Logger.debug(
+                    t.PROFILE_LOG_ATTEMPT_ELAPSED,
+                    attempt=attempt,
+                    elapsed=time.monotonic() - start,
+                )
 
-                if attempt < max_attempts:
-                    time.sleep(wait_seconds)
+                with span_recorder.span("verify.attempt", attempt=attempt) as span:
+                    result = await self._run_command_async(
+                        ["netsh", "wlan", "show", "interfaces"]
+                    )
+                    verdict = self._evaluate_interfaces(result, attempt)
+                    span["status"] = self._verdict_status(verdict)
+                if verdict is not None:
+                    return verdict
 
-            error_msg = t.PROFILE_ERROR_NO_VERIFY.format(
-                ssid=self.ssid, attempts=max_attempts
-            )
-            Logger.warning(error_msg)
-            return False, error_msg
+                delay = next(delays, None)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
 
+            return self._verify_gave_up(attempt)
+
+        except ConnectionCancelledError:
+            raise
         except Exception as e:
             error_msg = t.PROFILE_ERROR_VERIFY.format(error=str(e))
-            Logger.error(error_msg, exc_info=True)
+            Logger.error(t.PROFILE_ERROR_VERIFY, error=str(e), exc_info=True)
             return False, error_msg
 
-    @staticmethod
-    def clean_credentials_file() -> bool:
+    def _verify_delays(
+        self,
+        start: float,
+        max_attempts: Optional[int],
+        wait_seconds: Optional[float],
+    ) -> Iterator[float]:
+        """Esperas entre sondeos: calendario adaptativo o fijo si se indica."""
+        if max_attempts is None and wait_seconds is None:
+            Logger.info(
+                t.PROFILE_LOG_VERIFYING_DEADLINE,
+                ssid=self.ssid,
+                seconds=self.verify_schedule.deadline,
+            )
+            return self.verify_schedule.delays(start)
+
+        max_attempts = 3 if max_attempts is None else max_attempts
+        wait_seconds = 3 if wait_seconds is None else wait_seconds
+        Logger.info(t.PROFILE_LOG_VERIFYING, ssid=self.ssid, attempts=max_attempts)
+        return iter([wait_seconds] * (max_attempts - 1))
+
+    def _evaluate_interfaces(
+        self, result: CommandResult, attempt: int
+    ) -> Optional[Tuple[bool, str]]:
         """
-        Restaura el archivo credentials.xml a su configuración por defecto.
+        Interpreta un sondeo de 'netsh wlan show interfaces'.
 
-        Este método limpia las credenciales del usuario del archivo XML
-        restaurándolo desde el template, para mayor seguridad cuando se cierra
-        la aplicación.
+        Si un adaptador que se ha visto en nuestra red pasa a desconectado es un
+        fallo de autenticación, aunque netsh ya no muestre su SSID ni su perfil.
 
         Returns:
-            True si se limpió exitosamente, False en caso de error
+            Tupla (éxito, mensaje) si el estado es definitivo, None para seguir
         """
-        try:
-            script_dir = os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        # Detectar avisos de permisos de Windows
+        if result.output.has(NetshOutcome.PERMISSION):
+            Logger.warning(t.PROFILE_WARNING_PERMISSIONS_VERIFY)
+            Logger.info(t.PROFILE_WARNING_PERMISSIONS_MAY_WORK)
+            return False, t.PROFILE_ERROR_PERMISSIONS_VERIFY
+
+        # Solo cuenta el adaptador que está en nuestra red (puede haber varios)
+        interfaces = parse_interfaces(result.stdout) if result.returncode == 0 else []
+        interface = find_interface(interfaces, self.ssid)
+        if interface is not None:
+            self.interface = self._joining = interface
+        elif self._joining is not None:
+            # Desconectado, netsh ya no muestra SSID ni perfil: se sigue por nombre
+            interface = next(
+                (i for i in interfaces if i.name == self._joining.name), None
             )
-            credentials_path = os.path.join(script_dir, "xml", "credentials.xml")
-            template_path = os.path.join(script_dir, "xml", "credentials_template.xml")
+        state = interface.state if interface else None
 
-            if not os.path.exists(template_path):
-                Logger.warning(
-                    t.PROFILE_CLEAN_TEMPLATE_NOT_FOUND.format(path=template_path)
-                )
-                return False
+        if state == "connected":
+            success_msg = t.PROFILE_SUCCESS_VERIFIED.format(ssid=self.ssid)
+            Logger.info(t.PROFILE_SUCCESS_VERIFIED, ssid=self.ssid)
+            return True, success_msg
 
-            if not os.path.exists(credentials_path):
-                Logger.warning(
-                    t.PROFILE_CLEAN_FILE_NOT_EXISTS.format(path=credentials_path)
-                )
-                return True  # No hay nada que limpiar
+        if state == "disconnected":
+            Logger.error(t.PROFILE_ERROR_AUTH)
+            return False, t.PROFILE_ERROR_AUTH
 
-            # Copiar el template sobre el archivo de credenciales
-            shutil.copy2(template_path, credentials_path)
-            Logger.info(t.PROFILE_CLEAN_SUCCESS)
-            return True
+        if state == "authenticating":
+            Logger.debug(t.PROFILE_LOG_STATE_AUTH, attempt=attempt)
+        elif state == "connecting":
+            Logger.debug(t.PROFILE_LOG_STATE_CONNECTING, attempt=attempt)
+        return None
 
-        except Exception as e:
-            Logger.error(t.PROFILE_CLEAN_ERROR.format(error=e), exc_info=True)
-            return False
+    @staticmethod
+    def _verdict_status(verdict: Optional[Tuple[bool, str]]) -> str:
+        """Estado del span de un sondeo: ok, error o pending si hay que seguir."""
+        if verdict is None:
+            return "pending"
+        return "ok" if verdict[0] else "error"
+
+    def _verify_gave_up(self, attempts: int) -> Tuple[bool, str]:
+        """Resultado cuando se agotan los sondeos sin estado definitivo."""
+        error_msg = t.PROFILE_ERROR_NO_VERIFY.format(ssid=self.ssid, attempts=attempts)
+        Logger.warning(t.PROFILE_ERROR_NO_VERIFY, ssid=self.ssid, attempts=attempts)
+        return False, error_msg
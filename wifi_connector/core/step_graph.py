@@ -0,0 +1,174 @@
+"""Ejecución de pasos de conexión como un pequeño grafo de dependencias.
+
+Cada paso declara de qué pasos depende; los que no dependen entre sí se
+ejecutan en paralelo. La semántica de fallo es la de la ejecución
+secuencial: cuando un paso obligatorio falla no se inicia ningún paso más,
+se espera a que terminen los obligatorios que ya estaban en marcha y se
+informa el fallo del primer paso en orden de declaración.
+
+Los pasos informativos (required=False) no retienen el resultado: el grafo
+termina en cuanto se han resuelto todos los pasos obligatorios, y los
+informativos que sigan en marcha acaban en segundo plano sin resultado.
+"""
+
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from wifi_connector.utils import translations as t
+
+
+@dataclass
+class Step:
+    """Paso del grafo de conexión.
+
+    Atributos:
+        name: Identificador único del paso
+        action: Función que ejecuta el paso y devuelve (éxito, mensaje)
+        depends_on: Pasos que deben completarse antes
+        required: Si es False, el paso es informativo: su fallo no detiene
+            el grafo y no bloquea a los pasos que dependen de él
+    """
+
+    name: str
+    action: Callable[[], Tuple[bool, str]]
+    depends_on: Tuple[str, ...] = ()
+    required: bool = True
+
+
+@dataclass
+class StepOutcome:
+    """Resultado de un paso ejecutado."""
+
+    success: bool
+    message: str
+    error: Optional[BaseException] = None
+
+
+class StepGraph:
+    """Ejecuta pasos respetando sus dependencias, en paralelo cuando es posible."""
+
+    def __init__(self, steps: Sequence[Step]) -> None:
+        """Inicializa el grafo.
+
+        Args:
+            steps: Pasos en orden de declaración. Cada dependencia debe
+                declararse antes que el paso que la usa (grafo acíclico)
+
+        Raises:
+            ValueError: Si hay nombres duplicados o dependencias desconocidas
+        """
+        seen: List[str] = []
+        for step in steps:
+            if step.name in seen:
+                raise ValueError(t.STEP_ERROR_DUPLICATE.format(name=step.name))
+            for dependency in step.depends_on:
+                if dependency not in seen:
+                    raise ValueError(
+                        t.STEP_ERROR_UNKNOWN_DEPENDENCY.format(
+                            name=step.name, dependency=dependency
+                        )
+                    )
+            seen.append(step.name)
+        self.steps = list(steps)
+
+    def run(
+        self,
+        on_start: Optional[Callable[[Step], None]] = None,
+        on_finish: Optional[Callable[[Step, StepOutcome], None]] = None,
+    ) -> Tuple[bool, str, Dict[str, StepOutcome]]:
+        """Ejecuta el grafo.
+
+        Args:
+            on_start: Callback al iniciar cada paso (desde el hilo coordinador)
+            on_finish: Callback al terminar cada paso (desde el hilo coordinador)
+
+        Returns:
+            Tupla (éxito, mensaje, resultados por paso). Los pasos
+            informativos que no habían terminado no tienen resultado. Si un paso
+            obligatorio falló, el mensaje es el del primero en orden de
+            declaración; si todo fue bien, el del último paso declarado
+
+        Raises:
+            Exception: La excepción lanzada por el primer paso obligatorio
+                fallido en orden de declaración, si falló con una excepción
+        """
+        outcomes: Dict[str, StepOutcome] = {}
+        pending = list(self.steps)
+        running: Dict[Future, Step] = {}
+        failed = False
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.steps)), thread_name_prefix="connect-step"
+        )
+        try:
+            while pending or running:
+                if not failed:
+                    for step in [s for s in pending if self._is_ready(s, outcomes)]:
+                        pending.remove(step)
+                        if on_start:
+                            on_start(step)
+                        # Cada paso hereda el contexto (p. ej. la traza de tiempos)
+                        context = contextvars.copy_context()
+                        running[executor.submit(context.run, step.action)] = step
+
+                if self._settled(pending, running, failed):
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    try:
+                        success, message = future.result()
+                        outcome = StepOutcome(success, message)
+                    except Exception as e:
+                        outcome = StepOutcome(False, str(e), error=e)
+                    outcomes[step.name] = outcome
+                    if on_finish:
+                        on_finish(step, outcome)
+                    if not outcome.success and step.required:
+                        failed = True
+        finally:
+            # Los pasos informativos que sigan en marcha terminan en segundo plano
+            executor.shutdown(wait=False)
+
+        for step in self.steps:
+            outcome = outcomes.get(step.name)
+            if outcome is None or outcome.success or not step.required:
+                continue
+            if outcome.error is not None:
+                raise outcome.error
+            return False, outcome.message, outcomes
+
+        last = outcomes.get(self.steps[-1].name) if self.steps else None
+        return True, last.message if last else "", outcomes
+
+    @staticmethod
+    def _settled(
+        pending: List[Step], running: Dict[Future, Step], failed: bool
+    ) -> bool:
+        """El grafo ha terminado cuando no queda ningún paso obligatorio por resolver.
+
+        Tras un fallo solo cuentan los pasos obligatorios ya en marcha; si no,
+        también los pendientes, que pueden depender de un paso informativo.
+        """
+        if any(step.required for step in running.values()):
+            return False
+        if failed or not running:
+            return True
+        return not any(step.required for step in pending)
+
+    def _is_ready(self, step: Step, outcomes: Dict[str, StepOutcome]) -> bool:
+        """Un paso está listo cuando todas sus dependencias han terminado bien.
+
+        Las dependencias informativas solo necesitan haber terminado.
+        """
+        required = {s.name: s.required for s in self.steps}
+        for dependency in step.depends_on:
+            outcome = outcomes.get(dependency)
+            if outcome is None:
+                return False
+            if not outcome.success and required[dependency]:
+                return False
+        return True
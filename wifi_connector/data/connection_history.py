@@ -0,0 +1,438 @@
+"""Historial local de intentos de conexión en SQLite.
+
+Cada intento se guarda como una fila con el código de centro, el resultado,
+la duración total y por paso, la categoría del error y las versiones de la
+aplicación y del vault. Sirve para comprobar si conectar se ha vuelto más
+lento tras una actualización de Windows o un cambio de vault.
+
+Las escrituras nunca bloquean a quien registra: record() solo encola la fila
+y un hilo escritor las inserta por lotes (una transacción por lote). Las
+consultas abren su propia conexión de solo lectura.
+
+También se puede consultar desde la línea de comandos:
+
+    python -m wifi_connector.data.connection_history --days 30 --window 1
+"""
+
+import argparse
+import json
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    center_code TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    total_ms REAL NOT NULL,
+    steps TEXT NOT NULL,
+    error_class TEXT,
+    app_version TEXT,
+    vault_version TEXT
+);
+CREATE INDEX IF NOT EXISTS attempts_started_at ON attempts (started_at);
+"""
+
+_INSERT = (
+    "INSERT INTO attempts (started_at, center_code, outcome, total_ms, steps, "
+    "error_class, app_version, vault_version) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+@dataclass
+class AttemptRecord:
+    """Fila del historial.
+
+    Atributos:
+        center_code: Código del centro
+        outcome: Estado final del intento ("connected", "failed", "cancelled")
+        total_ms: Duración total del intento en milisegundos
+        steps: Milisegundos por paso, sondeo o comando (nombre del span)
+        error_class: Categoría del fallo, o None si conectó
+        app_version: Versión de la aplicación
+        vault_version: Versión del vault cargado, si se conoce
+        started_at: Inicio del intento (segundos desde epoch)
+    """
+
+    center_code: str
+    outcome: str
+    total_ms: float
+    steps: Dict[str, float] = field(default_factory=dict)
+    error_class: Optional[str] = None
+    app_version: Optional[str] = None
+    vault_version: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_attempt(
+        cls,
+        attempt,
+        center_code: str,
+        app_version: Optional[str] = None,
+        vault_version: Optional[str] = None,
+    ) -> "AttemptRecord":
+        """Crea la fila a partir de un ConnectionAttempt terminado.
+
+        Args:
+            attempt: ConnectionAttempt en estado final
+            center_code: Código del centro al que se intentó conectar
+            app_version: Versión de la aplicación
+            vault_version: Versión del vault cargado
+
+        Returns:
+            AttemptRecord listo para ConnectionHistory.record()
+        """
+        duration = attempt.duration or 0.0
+        return cls(
+            center_code=center_code,
+            outcome=attempt.state.value,
+            total_ms=duration * 1000,
+            steps={
+                name: seconds * 1000
+                for name, seconds in attempt.step_durations().items()
+            },
+            error_class=attempt.error_class,
+            app_version=app_version,
+            vault_version=vault_version,
+            started_at=time.time() - duration,
+        )
+
+    def as_row(self) -> Tuple:
+        """Valores en el orden de la sentencia INSERT."""
+        return (
+            self.started_at,
+            self.center_code,
+            self.outcome,
+            self.total_ms,
+            json.dumps(self.steps, sort_keys=True),
+            self.error_class,
+            self.app_version,
+            self.vault_version,
+        )
+
+
+@dataclass
+class LatencySummary:
+    """Resumen de los intentos de una ventana de tiempo.
+
+    Los percentiles (en milisegundos) se calculan sobre todos los intentos
+    terminados, conecten o no; los cancelados no cuentan.
+    """
+
+    count: int
+    success_rate: float
+    p50: float
+    p95: float
+    p99: float
+    window_start: Optional[float] = None
+
+
+def _percentile(values: Sequence[float], percent: int) -> float:
+    """Percentil por rango más cercano sobre una lista ordenada."""
+    if not values:
+        return 0.0
+    rank = -(-percent * len(values) // 100)
+    return values[max(0, rank - 1)]
+
+
+def summarize(
+    rows: Sequence[Tuple[float, str]], window_start: Optional[float] = None
+) -> LatencySummary:
+    """Calcula tasa de éxito y percentiles de filas (total_ms, outcome).
+
+    Args:
+        rows: Pares (duración en ms, resultado)
+        window_start: Inicio de la ventana, para el informe
+
+    Returns:
+        LatencySummary de las filas no canceladas
+    """
+    finished = [(ms, outcome) for ms, outcome in rows if outcome != "cancelled"]
+    durations = sorted(ms for ms, _ in finished)
+    connected = sum(1 for _, outcome in finished if outcome == "connected")
+    return LatencySummary(
+        count=len(finished),
+        success_rate=connected / len(finished) if finished else 0.0,
+        p50=_percentile(durations, 50),
+        p95=_percentile(durations, 95),
+        p99=_percentile(durations, 99),
+        window_start=window_start,
+    )
+
+
+class ConnectionHistory:
+    """Base de datos SQLite de intentos con escritura por lotes en segundo plano.
+
+    Attributes:
+        db_path: Path al archivo SQLite
+        batch_size: Filas máximas por transacción
+        flush_interval: Segundos máximos que una fila espera en la cola
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        batch_size: int = 20,
+        flush_interval: float = 2.0,
+    ) -> None:
+        """Inicializa el historial sin abrir todavía la base de datos.
+
+        Args:
+            db_path: Path al archivo SQLite. Si es None, usa
+                get_history_path()
+            batch_size: Filas máximas por transacción
+            flush_interval: Segundos máximos que una fila espera en la cola
+        """
+        if db_path is None:
+            from wifi_connector.utils.paths import get_history_path
+
+            db_path = get_history_path()
+
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[AttemptRecord]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+
+    def record(self, record: AttemptRecord) -> None:
+        """Encola un intento para guardarlo; no bloquea.
+
+        Args:
+            record: Fila a guardar
+        """
+        with self._lock:
+            if self._closed:
+                return
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="history-writer", daemon=True
+                )
+                self._writer.start()
+        self._queue.put(record)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Espera a que se hayan escrito todas las filas encoladas.
+
+        Args:
+            timeout: Segundos máximos de espera
+
+        Returns:
+            True si la cola se vació a tiempo
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Escribe lo pendiente y detiene el hilo escritor.
+
+        Args:
+            timeout: Segundos máximos de espera
+        """
+        with self._lock:
+            self._closed = True
+            writer = self._writer
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)
+            writer.join(timeout)
+
+    def summary(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        center_code: Optional[str] = None,
+    ) -> LatencySummary:
+        """Resumen de latencia y éxito en un intervalo.
+
+        Args:
+            since: Inicio (segundos desde epoch); None = desde el principio
+            until: Fin (segundos desde epoch); None = hasta ahora
+            center_code: Si se indica, solo los intentos de ese centro
+
+        Returns:
+            LatencySummary del intervalo
+        """
+        rows = self._select(since, until, center_code)
+        return summarize([(ms, outcome) for _, ms, outcome in rows], since)
+
+    def summary_by_window(
+        self,
+        window: float,
+        since: float,
+        until: Optional[float] = None,
+        center_code: Optional[str] = None,
+    ) -> List[LatencySummary]:
+        """Resumen por ventanas consecutivas de tamaño fijo.
+
+        Args:
+            window: Tamaño de cada ventana en segundos
+            since: Inicio de la primera ventana (segundos desde epoch)
+            until: Fin (segundos desde epoch); None = hasta ahora
+            center_code: Si se indica, solo los intentos de ese centro
+
+        Returns:
+            Un LatencySummary por ventana con intentos, en orden cronológico
+        """
+        buckets: Dict[int, List[Tuple[float, str]]] = {}
+        for started_at, ms, outcome in self._select(since, until, center_code):
+            buckets.setdefault(int((started_at - since) // window), []).append(
+                (ms, outcome)
+            )
+        return [
+            summarize(rows, window_start=since + index * window)
+            for index, rows in sorted(buckets.items())
+        ]
+
+    def _select(
+        self,
+        since: Optional[float],
+        until: Optional[float],
+        center_code: Optional[str],
+    ) -> List[Tuple[float, float, str]]:
+        """Filas (started_at, total_ms, outcome) del intervalo."""
+        if not self.db_path.exists():
+            return []
+
+        clauses, params = [], []
+        if since is not None:
+            clauses.append("started_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("started_at < ?")
+            params.append(until)
+        if center_code is not None:
+            clauses.append("center_code = ?")
+            params.append(center_code)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        connection = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True
+        )
+        try:
+            return connection.execute(
+                f"SELECT started_at, total_ms, outcome FROM attempts{where} "
+                "ORDER BY started_at",
+                params,
+            ).fetchall()
+        finally:
+            connection.close()
+
+    def _open(self) -> sqlite3.Connection:
+        """Abre la base de datos (creándola si hace falta) en el hilo escritor."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.db_path))
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _write_loop(self) -> None:
+        """Cuerpo del hilo escritor: agrupa filas y las inserta por lotes."""
+        try:
+            connection = self._open()
+        except (OSError, sqlite3.Error) as e:
+            Logger.warning(t.HISTORY_LOG_OPEN_FAILED, path=self.db_path, error=e)
+            connection = None
+
+        stop = False
+        while not stop:
+            batch: List[AttemptRecord] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+
+            self._write_batch(connection, batch)
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+
+        if connection is not None:
+            connection.close()
+
+    def _write_batch(
+        self, connection: Optional[sqlite3.Connection], batch: List[AttemptRecord]
+    ) -> None:
+        """Inserta un lote en una sola transacción."""
+        if connection is None or not batch:
+            return
+        try:
+            with connection:
+                connection.executemany(_INSERT, [record.as_row() for record in batch])
+            Logger.debug(t.HISTORY_LOG_WRITTEN, count=len(batch))
+        except sqlite3.Error as e:
+            Logger.warning(t.HISTORY_LOG_WRITE_FAILED, count=len(batch), error=e)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Imprime la latencia y la tasa de éxito del historial.
+
+    Args:
+        argv: Argumentos de línea de comandos (por defecto sys.argv[1:])
+
+    Returns:
+        Código de salida
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m wifi_connector.data.connection_history",
+        description=t.HISTORY_CLI_DESCRIPTION,
+    )
+    parser.add_argument("--db", type=Path, default=None, help=t.HISTORY_CLI_HELP_DB)
+    parser.add_argument("--days", type=float, default=30, help=t.HISTORY_CLI_HELP_DAYS)
+    parser.add_argument(
+        "--window", type=float, default=None, help=t.HISTORY_CLI_HELP_WINDOW
+    )
+    parser.add_argument("--center", default=None, help=t.HISTORY_CLI_HELP_CENTER)
+    args = parser.parse_args(argv)
+
+    history = ConnectionHistory(args.db)
+    since = time.time() - args.days * 86400
+    if args.window:
+        summaries = history.summary_by_window(
+            args.window * 86400, since, center_code=args.center
+        )
+    else:
+        summaries = [history.summary(since, center_code=args.center)]
+
+    print(t.HISTORY_CLI_HEADER)
+    for summary in summaries:
+        start = summary.window_start if summary.window_start is not None else since
+        print(
+            t.HISTORY_CLI_ROW.format(
+                start=time.strftime("%Y-%m-%d %H:%M", time.localtime(start)),
+                count=summary.count,
+                success=summary.success_rate * 100,
+                p50=summary.p50,
+                p95=summary.p95,
+                p99=summary.p99,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
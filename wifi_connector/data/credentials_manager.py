@@ -4,18 +4,27 @@ Este módulo proporciona clases para cargar y gestionar credenciales WiFi
 desde archivos JSON, incluyendo funcionalidad de búsqueda y filtrado.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
 
 from wifi_connector.core.exceptions import (
     CredentialsFileError,
     JSONParseError,
     VaultError,
 )
-from wifi_connector.data.vault_manager import VaultManager
+from wifi_connector.data.index_cache import CachedIndex, IndexCache
+from wifi_connector.data.profile_state import derive_key
+from wifi_connector.data.vault_manager import (
+    UnlockedVault,
+    VaultManager,
+    VaultPayload,
+)
 from wifi_connector.utils.logger import Logger
 from wifi_connector.utils import translations as t
 
+T = TypeVar("T")
+
 
 @dataclass
 class CenterCredentials:
@@ -55,38 +64,68 @@ class CenterCredentials:
 class CredentialsManager:
     """Gestor para cargar y acceder a credenciales WiFi desde vault cifrado.
 
-    Proporciona métodos para cargar credenciales desde un vault y
+    Proporciona métodos para cargar credenciales desde uno o varios vaults y
     buscar/filtrar centros por código o nombre.
     """
 
-    def __init__(self, vault_path: Optional[str] = None):
+    def __init__(
+        self,
+        vault_path: Union[str, Sequence[str], None] = None,
+        index_cache: Optional[IndexCache] = None,
+    ):
         """Inicializa el gestor de credenciales con la ruta del vault.
 
         Args:
-            vault_path: Ruta al archivo vault.bin que contiene las credenciales.
-                       Si es None, usa la ruta por defecto que funciona tanto
-                       en modo script como ejecutable.
+            vault_path: Ruta al archivo vault.bin que contiene las credenciales,
+                       o secuencia de rutas si se combinan varios vaults.
+                       Si es None, usa los vaults de la carpeta por defecto que
+                       funciona tanto en modo script como ejecutable.
+            index_cache: Caché cifrada de la tabla de centros. Si es None, la
+                       tabla se reconstruye siempre desde el vault.
         """
         if vault_path is None:
-            from wifi_connector.utils.paths import get_vault_path
+            from wifi_connector.utils.paths import get_vault_files
+
+            self.vault_paths = [str(path) for path in get_vault_files()]
 
-            self.vault_path = str(get_vault_path() / "vault.bin")
+        elif isinstance(vault_path, str):
+            self.vault_paths = [vault_path]
 
         else:
-            self.vault_path = vault_path
+            self.vault_paths = [str(path) for path in vault_path]
 
-        self.centers: List[CenterCredentials] = []
-        self.vault_metadata: dict = {}
-        Logger.debug(t.CREDS_LOG_INIT.format(path=self.vault_path))
+        if not self.vault_paths:
+            raise CredentialsFileError(t.CREDS_ERROR_NO_VAULTS)
 
-    def load_credentials(self, password: str) -> bool:
-        """Carga las credenciales desde el vault cifrado.
+        # Ruta principal, conservada por compatibilidad con el modo de un solo vault
+        self.vault_path = self.vault_paths[0]
 
-        Descifra el vault en memoria usando la contraseña proporcionada y
-        carga todas las credenciales de los centros.
+        self.centers: List[CenterCredentials] = []
+        self.vault_metadata: dict = {}
+        self.vaults_metadata: Dict[str, dict] = {}
+        self._code_index: Dict[str, CenterCredentials] = {}
+        self.index_cache = index_cache
+        # Clave HMAC de ProfileState derivada de los vaults desbloqueados; solo
+        # existe si la carga pasa por unlock_vaults (con caché o especulativa)
+        self.state_key: Optional[bytes] = None
+        Logger.debug(t.CREDS_LOG_INIT, path=", ".join(self.vault_paths))
+
+    def load_credentials(
+        self, password: str, unlocked: Optional[List[UnlockedVault]] = None
+    ) -> bool:
+        """Carga las credenciales desde el vault o vaults cifrados.
+
+        Descifra cada vault en memoria usando la contraseña proporcionada y
+        carga todas las credenciales de los centros. Con varios vaults, la
+        derivación de clave y el descifrado se ejecutan en paralelo (un worker
+        por vault) y los resultados se combinan en una única tabla indexada.
+        Si hay caché del índice y los vaults no han cambiado, la tabla se
+        carga del snapshot sin descifrar ni parsear los vaults.
 
         Args:
             password: Contraseña del vault
+            unlocked: Vaults ya desbloqueados con esta contraseña (por ejemplo,
+                     por la derivación especulativa). Evita repetir Scrypt.
 
         Returns:
             True si las credenciales se cargaron exitosamente, False en caso contrario
@@ -95,22 +134,218 @@ class CredentialsManager:
             CredentialsFileError: Si el archivo de vault no se puede encontrar o leer
             JSONParseError: Si el contenido descifrado no es válido
         """
-        Logger.info(t.CREDS_LOG_LOADING_VAULT.format(path=self.vault_path))
+        Logger.info(t.CREDS_LOG_LOADING_VAULT, path=", ".join(self.vault_paths))
 
         try:
-            vault_manager = VaultManager(self.vault_path)
-            payload = vault_manager.load_vault(password)
-            self.vault_metadata = payload.metadata
-            return self._load_from_entries(payload.centers)
+            if unlocked is None and self.index_cache is None:
+                return self._build_table(self._load_vaults_parallel(password))
+
+            if unlocked is None:
+                unlocked = self.unlock_vaults(password)
+            return self._load_unlocked(unlocked)
 
         except (JSONParseError, VaultError):
             raise
 
         except Exception as e:
             error_msg = t.CREDS_ERROR_UNEXPECTED.format(error=e)
-            Logger.error(error_msg, exc_info=True)
+            Logger.error(t.CREDS_ERROR_UNEXPECTED, error=e, exc_info=True)
             raise CredentialsFileError(error_msg)
 
+    def unlock_vaults(self, password: str) -> List[UnlockedVault]:
+        """Lee los vaults y deriva sus claves (en paralelo) sin descifrarlos.
+
+        Es la parte costosa del desbloqueo (Scrypt). El resultado se puede
+        pasar a load_credentials(unlocked=...).
+
+        Args:
+            password: Contraseña común de los vaults
+
+        Returns:
+            UnlockedVault de cada vault en el orden de self.vault_paths
+        """
+        return self._run_per_vault(lambda path: VaultManager(path).unlock(password))
+
+    def peek_metadata(self) -> dict:
+        """Obtiene los metadatos públicos del vault más reciente sin contraseña.
+
+        Lee solo el header y la sección de metadatos de cada vault (formato
+        v2). Los vaults sin metadatos públicos o ilegibles se ignoran.
+
+        Returns:
+            Metadatos públicos del vault con `generated_at` más reciente,
+            o diccionario vacío si ninguno los expone
+        """
+        newest: dict = {}
+        newest_generated: Optional[str] = None
+        for path in self.vault_paths:
+            try:
+                metadata = VaultManager(path).peek_metadata()
+            except VaultError as e:
+                Logger.debug(t.CREDS_LOG_PEEK_FAILED, path=path, error=e)
+                continue
+            if not metadata:
+                continue
+            generated = str(metadata.get("generated_at") or "")
+            if newest_generated is None or generated > newest_generated:
+                newest, newest_generated = metadata, generated
+        return newest
+
+    def _load_unlocked(self, unlocked: List[UnlockedVault]) -> bool:
+        """Carga la tabla desde vaults ya desbloqueados.
+
+        Si hay caché del índice, se intenta primero el snapshot: ahorra el
+        descifrado, el parseo y la combinación. Como el snapshot está cifrado
+        con una clave derivada de la del vault, descifrarlo también verifica
+        la contraseña. Si no descifra (contraseña incorrecta, vault cambiado o
+        caché dañada), se recurre al vault, que reporta el error real.
+
+        Args:
+            unlocked: UnlockedVault de cada vault en el orden de self.vault_paths
+
+        Returns:
+            True si las credenciales se cargaron exitosamente
+        """
+        content_hashes = [vault.content_hash for vault in unlocked]
+        keys = [vault.key for vault in unlocked]
+
+        if self.index_cache is not None:
+            cached = self.index_cache.load(content_hashes, keys)
+            if cached is not None:
+                self._apply_snapshot(cached)
+                self.state_key = derive_key(keys)
+                Logger.info(t.INDEX_CACHE_LOG_HIT, count=len(self.centers))
+                return True
+            Logger.debug(t.INDEX_CACHE_LOG_MISS)
+
+        payloads = [
+            VaultManager(path).decrypt(vault)
+            for path, vault in zip(self.vault_paths, unlocked)
+        ]
+        self._build_table(payloads)
+        self.state_key = derive_key(keys)
+
+        if self.index_cache is not None:
+            self.index_cache.save(content_hashes, keys, self._snapshot())
+        return True
+
+    def _snapshot(self) -> CachedIndex:
+        """Construye el snapshot de la tabla de centros actual."""
+        return CachedIndex(
+            metadata=self.vault_metadata,
+            vaults_metadata=[
+                self.vaults_metadata.get(path, {}) for path in self.vault_paths
+            ],
+            rows=[
+                [c.center_code, c.center_name, c.username, c.password]
+                for c in self.centers
+            ],
+        )
+
+    def _apply_snapshot(self, snapshot: CachedIndex) -> None:
+        """Restaura la tabla de centros desde un snapshot de la caché."""
+        self.vault_metadata = snapshot.metadata
+        self.vaults_metadata = dict(zip(self.vault_paths, snapshot.vaults_metadata))
+        self._set_centers([CenterCredentials(*row) for row in snapshot.rows])
+
+    def _run_per_vault(self, func: Callable[[str], T]) -> List[T]:
+        """Ejecuta func para cada vault, en paralelo si hay más de uno.
+
+        Si alguna llamada falla, se propaga el primer error en el orden de
+        las rutas configuradas.
+
+        Args:
+            func: Función que recibe la ruta de un vault
+
+        Returns:
+            Resultados en el mismo orden que self.vault_paths
+        """
+        if len(self.vault_paths) == 1:
+            return [func(self.vault_path)]
+
+        with ThreadPoolExecutor(
+            max_workers=len(self.vault_paths), thread_name_prefix="vault"
+        ) as executor:
+            return list(executor.map(func, self.vault_paths))
+
+    def _load_vaults_parallel(self, password: str) -> List[VaultPayload]:
+        """Descifra todos los vaults en paralelo, un worker por vault.
+
+        El tiempo total queda acotado por el vault más lento en lugar de la
+        suma de todos. Si algún vault falla, se propaga el primer error en el
+        orden de las rutas configuradas.
+
+        Args:
+            password: Contraseña común de los vaults
+
+        Returns:
+            Lista de VaultPayload en el mismo orden que self.vault_paths
+        """
+        return self._run_per_vault(
+            lambda path: VaultManager(path).load_vault(password)
+        )
+
+    def _build_table(self, payloads: Sequence[VaultPayload]) -> bool:
+        """Construye la tabla de centros a partir de los payloads descifrados.
+
+        Args:
+            payloads: Payloads descifrados en el orden de self.vault_paths
+
+        Returns:
+            True si las credenciales se cargaron exitosamente
+        """
+        if len(payloads) == 1:
+            self.vault_metadata = payloads[0].metadata
+            self.vaults_metadata = {self.vault_path: payloads[0].metadata}
+            return self._load_from_entries(payloads[0].centers)
+
+        return self._merge_payloads(payloads)
+
+    def _merge_payloads(self, payloads: Sequence[VaultPayload]) -> bool:
+        """Combina los centros de varios vaults en una única tabla.
+
+        Precedencia ante códigos duplicados: gana el vault con el
+        `generated_at` más reciente (comparación ISO 8601 como texto); en caso
+        de empate gana el vault que aparece antes en la lista de rutas. El
+        orden de la tabla es el de primera aparición de cada código.
+
+        Args:
+            payloads: Payloads descifrados en el orden de self.vault_paths
+
+        Returns:
+            True si las credenciales se combinaron exitosamente
+        """
+        merged: Dict[str, Tuple[Tuple[str, int], CenterCredentials]] = {}
+        self.vaults_metadata = {}
+
+        for index, (path, payload) in enumerate(zip(self.vault_paths, payloads)):
+            self.vaults_metadata[path] = payload.metadata
+            precedence = (str(payload.metadata.get("generated_at") or ""), -index)
+
+            for center in self._parse_entries(payload.centers, path):
+                key = center.center_code.lower()
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = (precedence, center)
+                    continue
+                if precedence > existing[0]:
+                    merged[key] = (precedence, center)
+                Logger.debug(
+                    t.CREDS_LOG_DUPLICATE_CODE, code=center.center_code, path=path
+                )
+
+        newest = max(
+            range(len(payloads)),
+            key=lambda i: (str(payloads[i].metadata.get("generated_at") or ""), -i),
+        )
+        self.vault_metadata = payloads[newest].metadata
+        self._set_centers([center for _, center in merged.values()])
+
+        Logger.info(
+            t.CREDS_LOG_MERGED_VAULTS, vaults=len(payloads), count=len(self.centers)
+        )
+        return True
+
     def _load_from_entries(self, data: list) -> bool:
         """Carga y valida credenciales desde una lista de entradas.
 
@@ -120,22 +355,45 @@ class CredentialsManager:
         Returns:
             True si las credenciales se cargaron exitosamente
         """
+        self._set_centers(self._parse_entries(data, self.vault_path))
+        Logger.info(t.CREDS_LOG_LOADED_SUCCESS, count=len(self.centers))
+        return True
+
+    def _parse_entries(self, data: list, path: str) -> List[CenterCredentials]:
+        """Parsea una lista de entradas descartando las inválidas.
+
+        Args:
+            data: Lista de entradas con campos Codi, Centre, Usuari, Contrasenya
+            path: Ruta del vault de origen (para mensajes de error)
+
+        Returns:
+            Lista de CenterCredentials válidos
+
+        Raises:
+            JSONParseError: Si data no es una lista
+        """
         if not isinstance(data, list):
-            raise JSONParseError(
-                t.CREDS_ERROR_INVALID_STRUCTURE.format(path=self.vault_path)
-            )
+            raise JSONParseError(t.CREDS_ERROR_INVALID_STRUCTURE.format(path=path))
 
-        self.centers = []
+        centers: List[CenterCredentials] = []
         for entry in data:
             try:
-                center = self._parse_center_entry(entry)
-                self.centers.append(center)
+                centers.append(self._parse_center_entry(entry))
             except (KeyError, TypeError) as e:
-                Logger.warning(t.CREDS_WARNING_SKIP_ENTRY.format(error=e))
+                Logger.warning(t.CREDS_WARNING_SKIP_ENTRY, error=e)
                 continue
+        return centers
 
-        Logger.info(t.CREDS_LOG_LOADED_SUCCESS.format(count=len(self.centers)))
-        return True
+    def _set_centers(self, centers: List[CenterCredentials]) -> None:
+        """Establece la tabla de centros y reconstruye el índice por código.
+
+        Args:
+            centers: Lista de centros cargados
+        """
+        self.centers = centers
+        self._code_index = {}
+        for center in centers:
+            self._code_index.setdefault(center.center_code.lower(), center)
 
     def get_all_centers(self) -> List[CenterCredentials]:
         """Obtiene la lista de todos los centros.
@@ -143,7 +401,7 @@ class CredentialsManager:
         Returns:
             Lista de todos los objetos CenterCredentials
         """
-        Logger.debug(t.CREDS_LOG_RETURNING_ALL.format(count=len(self.centers)))
+        Logger.debug(t.CREDS_LOG_RETURNING_ALL, count=len(self.centers))
         return self.centers.copy()
 
     def get_center_by_code(self, code: str) -> Optional[CenterCredentials]:
@@ -157,15 +415,14 @@ class CredentialsManager:
         Returns:
             Objeto CenterCredentials si se encuentra, None en caso contrario
         """
-        Logger.debug(t.CREDS_LOG_SEARCH_CODE.format(code=code))
+        Logger.debug(t.CREDS_LOG_SEARCH_CODE, code=code)
 
-        code_lower = code.lower()
-        for center in self.centers:
-            if center.center_code.lower() == code_lower:
-                Logger.debug(t.CREDS_LOG_FOUND_CENTER.format(name=center.center_name))
-                return center
+        center = self._code_index.get(code.lower())
+        if center is not None:
+            Logger.debug(t.CREDS_LOG_FOUND_CENTER, name=center.center_name)
+            return center
 
-        Logger.debug(t.CREDS_LOG_CODE_NOT_FOUND.format(code=code))
+        Logger.debug(t.CREDS_LOG_CODE_NOT_FOUND, code=code)
         return None
 
     def get_center_by_name(self, name: str) -> Optional[CenterCredentials]:
@@ -179,15 +436,15 @@ class CredentialsManager:
         Returns:
             Objeto CenterCredentials si se encuentra, None en caso contrario
         """
-        Logger.debug(t.CREDS_LOG_SEARCH_NAME.format(name=name))
+        Logger.debug(t.CREDS_LOG_SEARCH_NAME, name=name)
 
         name_lower = name.lower()
         for center in self.centers:
             if center.center_name.lower() == name_lower:
-                Logger.debug(t.CREDS_LOG_FOUND_CENTER.format(name=center.center_code))
+                Logger.debug(t.CREDS_LOG_FOUND_CENTER, name=center.center_code)
                 return center
 
-        Logger.debug(t.CREDS_LOG_NAME_NOT_FOUND.format(name=name))
+        Logger.debug(t.CREDS_LOG_NAME_NOT_FOUND, name=name)
         return None
 
     def search_centers(self, query: str) -> List[CenterCredentials]:
@@ -202,7 +459,7 @@ class CredentialsManager:
         Returns:
             Lista de objetos CenterCredentials que coinciden
         """
-        Logger.debug(t.CREDS_LOG_SEARCHING.format(query=query))
+        Logger.debug(t.CREDS_LOG_SEARCHING, query=query)
 
         if not query:
             Logger.debug(t.CREDS_LOG_EMPTY_QUERY)
@@ -210,7 +467,7 @@ class CredentialsManager:
 
         results = [center for center in self.centers if center.matches_query(query)]
 
-        Logger.debug(t.CREDS_LOG_FOUND_MATCHING.format(count=len(results)))
+        Logger.debug(t.CREDS_LOG_FOUND_MATCHING, count=len(results))
         return results
 
     def _parse_center_entry(self, entry: dict) -> CenterCredentials:
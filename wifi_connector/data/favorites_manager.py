@@ -59,7 +59,7 @@ class FavoritesManager:
         """
         try:
             if not self.favorites_path.exists():
-                Logger.info(t.FAV_LOG_FILE_NOT_EXISTS.format(path=self.favorites_path))
+                Logger.info(t.FAV_LOG_FILE_NOT_EXISTS, path=self.favorites_path)
                 self._favorite_codes = []
                 return False
 
@@ -89,9 +89,7 @@ class FavoritesManager:
                     had_legacy_format = True
                     continue
                 Logger.warning(
-                    t.FAV_LOG_INVALID_ENTRY.format(
-                        error=t.FAV_ERROR_INVALID_ENTRY_FORMAT
-                    )
+                    t.FAV_LOG_INVALID_ENTRY, error=t.FAV_ERROR_INVALID_ENTRY_FORMAT
                 )
 
             # Filtrar favoritos obsoletos
@@ -100,27 +98,27 @@ class FavoritesManager:
                 if code in valid_codes:
                     valid_favorites.append(code)
                 else:
-                    Logger.debug(t.FAV_LOG_OBSOLETE_REMOVED.format(code=code, name=""))
+                    Logger.debug(t.FAV_LOG_OBSOLETE_REMOVED, code=code, name="")
 
             # Si se removieron favoritos obsoletos o se migró formato, guardar archivo limpio
             if len(valid_favorites) < len(normalized_codes) or had_legacy_format:
                 removed_count = len(normalized_codes) - len(valid_favorites)
                 if removed_count > 0:
-                    Logger.warning(t.FAV_LOG_AUTO_CLEANUP.format(count=removed_count))
+                    Logger.warning(t.FAV_LOG_AUTO_CLEANUP, count=removed_count)
                 if had_legacy_format:
                     Logger.info(t.FAV_LOG_FORMAT_MIGRATED)
                 self._save_favorites(valid_favorites)
 
             self._favorite_codes = valid_favorites
-            Logger.info(t.FAV_LOG_LOADED.format(count=len(self._favorite_codes)))
+            Logger.info(t.FAV_LOG_LOADED, count=len(self._favorite_codes))
             return True
 
         except json.JSONDecodeError as e:
-            Logger.warning(t.FAV_LOG_PARSE_ERROR.format(error=e))
+            Logger.warning(t.FAV_LOG_PARSE_ERROR, error=e)
             self._favorite_codes = []
             return False
         except Exception as e:
-            Logger.error(t.FAV_LOG_UNEXPECTED_ERROR.format(error=e))
+            Logger.error(t.FAV_LOG_UNEXPECTED_ERROR, error=e)
             self._favorite_codes = []
             return False
 
@@ -140,25 +138,23 @@ class FavoritesManager:
             c.center_code for c in self.credentials_manager.get_all_centers()
         }
         if center.center_code not in valid_codes:
-            Logger.warning(t.FAV_LOG_INVALID_CENTER.format(code=center.center_code))
+            Logger.warning(t.FAV_LOG_INVALID_CENTER, code=center.center_code)
             return
 
         # Verificar si ya es favorito
         if self.is_favorite(center.center_code):
-            Logger.debug(t.FAV_LOG_ALREADY_FAVORITE.format(code=center.center_code))
+            Logger.debug(t.FAV_LOG_ALREADY_FAVORITE, code=center.center_code)
             return
 
         # Añadir a favoritos
         self._favorite_codes.append(center.center_code)
-        Logger.info(
-            t.FAV_LOG_ADDED.format(code=center.center_code, name=center.center_name)
-        )
+        Logger.info(t.FAV_LOG_ADDED, code=center.center_code, name=center.center_name)
 
         # Persistir inmediatamente
         try:
             self._save_favorites(self._favorite_codes)
         except Exception as e:
-            Logger.error(t.FAV_LOG_ERROR_SAVING_ADD.format(error=e))
+            Logger.error(t.FAV_LOG_ERROR_SAVING_ADD, error=e)
             # Mantener estado en memoria incluso si escritura falla
             pass
 
@@ -181,15 +177,15 @@ class FavoritesManager:
 
         if len(self._favorite_codes) == original_count:
             # No se encontró el favorito
-            Logger.debug(t.FAV_LOG_NOT_FAVORITE.format(code=center_code))
+            Logger.debug(t.FAV_LOG_NOT_FAVORITE, code=center_code)
             return
 
-        Logger.info(t.FAV_LOG_REMOVED.format(code=center_code))
+        Logger.info(t.FAV_LOG_REMOVED, code=center_code)
 
         try:
             self._save_favorites(self._favorite_codes)
         except Exception as e:
-            Logger.error(t.FAV_LOG_ERROR_SAVING_REMOVE.format(error=e))
+            Logger.error(t.FAV_LOG_ERROR_SAVING_REMOVE, error=e)
             # Mantener estado en memoria incluso si escritura falla
             pass
 
@@ -231,39 +227,32 @@ class FavoritesManager:
         """
         try:
             Logger.debug(
-                t.FAV_LOG_ATTEMPTING_SAVE.format(
-                    count=len(favorites), path=self.favorites_path
-                )
+                t.FAV_LOG_ATTEMPTING_SAVE,
+                count=len(favorites),
+                path=self.favorites_path,
             )
 
             # Crear directorio Json/ si no existe
             self.favorites_path.parent.mkdir(parents=True, exist_ok=True)
-            Logger.debug(
-                t.FAV_LOG_DIR_CONFIRMED.format(path=self.favorites_path.parent)
-            )
+            Logger.debug(t.FAV_LOG_DIR_CONFIRMED, path=self.favorites_path.parent)
 
             # Serializar a JSON
             data = list(favorites)
 
             # Escritura atómica: temp file + rename
             temp_path = self.favorites_path.with_suffix(".tmp")
-            Logger.debug(t.FAV_LOG_WRITING_TEMP.format(path=temp_path))
+            Logger.debug(t.FAV_LOG_WRITING_TEMP, path=temp_path)
 
             with open(temp_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
-            Logger.debug(
-                t.FAV_LOG_RENAMING.format(temp=temp_path, final=self.favorites_path)
-            )
+            Logger.debug(t.FAV_LOG_RENAMING, temp=temp_path, final=self.favorites_path)
             temp_path.replace(self.favorites_path)
 
-            Logger.info(
-                t.FAV_LOG_SAVED.format(path=self.favorites_path, count=len(favorites))
-            )
+            Logger.info(t.FAV_LOG_SAVED, path=self.favorites_path, count=len(favorites))
 
         except Exception as e:
             Logger.error(
-                t.FAV_LOG_ERROR_SAVING.format(path=self.favorites_path, error=e),
-                exc_info=True,
+                t.FAV_LOG_ERROR_SAVING, path=self.favorites_path, error=e, exc_info=True
             )
             raise IOError(t.FAV_ERROR_SAVE_FAILED.format(error=e)) from e
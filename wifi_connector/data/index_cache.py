@@ -0,0 +1,179 @@
+"""Caché cifrada en disco de la tabla de centros ya construida.
+
+Tras desbloquear el vault, la tabla de centros parseada, combinada y sin
+duplicados se guarda como un snapshot compacto. En el siguiente arranque,
+si los vaults no han cambiado, se carga con una sola lectura en lugar de
+descifrar, parsear y reindexar el JSON completo.
+
+Formato del archivo:
+    magic (4) | versión (1) | nonce (12) | ciphertext (AES-GCM)
+
+La clave se deriva con HKDF-SHA256 a partir de la clave del vault (ya
+derivada con Scrypt), por lo que no se almacena ningún secreto nuevo. El
+nombre del archivo y el AAD dependen del hash del contenido de los vaults:
+cualquier cambio en un vault invalida el snapshot.
+"""
+
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import secrets
+from typing import Any, Dict, List, Optional, Sequence
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+CACHE_MAGIC = b"WCIX"
+CACHE_VERSION = 1
+CACHE_SUFFIX = ".idx"
+CACHE_KEY_INFO = b"wifi-connector index cache v1"
+NONCE_LENGTH = 12
+KEY_LENGTH = 32
+
+
+@dataclass
+class CachedIndex:
+    """Contenido de un snapshot de la caché.
+
+    Atributos:
+        metadata: Metadatos del vault principal (el más reciente)
+        vaults_metadata: Metadatos de cada vault en el orden de las rutas
+        rows: Filas (código, nombre, usuario, contraseña) en orden de la tabla
+    """
+
+    metadata: Dict[str, Any]
+    vaults_metadata: List[Dict[str, Any]]
+    rows: List[List[str]]
+
+
+class IndexCache:
+    """Guarda y recupera snapshots cifrados de la tabla de centros."""
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        """Inicializa la caché.
+
+        Args:
+            cache_dir: Carpeta de la caché. Si es None, usa get_index_cache_path()
+        """
+        if cache_dir is None:
+            from wifi_connector.utils.paths import get_index_cache_path
+
+            cache_dir = get_index_cache_path()
+
+        self.cache_dir = Path(cache_dir)
+
+    def load(
+        self, content_hashes: Sequence[str], keys: Sequence[bytes]
+    ) -> Optional[CachedIndex]:
+        """Carga el snapshot correspondiente a los vaults indicados.
+
+        Args:
+            content_hashes: SHA-256 de cada vault, en el orden de las rutas
+            keys: Clave derivada de cada vault, en el mismo orden
+
+        Returns:
+            CachedIndex si existe un snapshot válido, None en caso contrario
+            (no existe, vaults cambiados, clave incorrecta o archivo dañado)
+        """
+        cache_id = self._cache_id(content_hashes)
+        path = self._path_for(cache_id)
+        if not path.exists():
+            return None
+
+        try:
+            data = path.read_bytes()
+            header_size = len(CACHE_MAGIC) + 1
+            if data[: len(CACHE_MAGIC)] != CACHE_MAGIC:
+                raise ValueError("magic")
+            if data[len(CACHE_MAGIC)] != CACHE_VERSION:
+                raise ValueError("version")
+            nonce = data[header_size : header_size + NONCE_LENGTH]
+            ciphertext = data[header_size + NONCE_LENGTH :]
+            plaintext = AESGCM(self._derive_key(keys)).decrypt(
+                nonce, ciphertext, self._aad(cache_id)
+            )
+            snapshot = json.loads(plaintext.decode("utf-8"))
+            return CachedIndex(
+                metadata=snapshot["metadata"],
+                vaults_metadata=snapshot["vaults_metadata"],
+                rows=snapshot["rows"],
+            )
+        except (OSError, ValueError, KeyError, IndexError, TypeError, InvalidTag) as e:
+            Logger.debug(t.INDEX_CACHE_LOG_INVALID, path=path, error=repr(e))
+            return None
+
+    def save(
+        self,
+        content_hashes: Sequence[str],
+        keys: Sequence[bytes],
+        snapshot: CachedIndex,
+    ) -> None:
+        """Guarda el snapshot y elimina los de vaults anteriores.
+
+        Los errores de escritura se registran pero no se propagan: la caché
+        es solo una optimización.
+
+        Args:
+            content_hashes: SHA-256 de cada vault, en el orden de las rutas
+            keys: Clave derivada de cada vault, en el mismo orden
+            snapshot: Tabla de centros y metadatos a guardar
+        """
+        cache_id = self._cache_id(content_hashes)
+        path = self._path_for(cache_id)
+        plaintext = json.dumps(
+            asdict(snapshot), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        nonce = secrets.token_bytes(NONCE_LENGTH)
+        ciphertext = AESGCM(self._derive_key(keys)).encrypt(
+            nonce, plaintext, self._aad(cache_id)
+        )
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Escritura atómica: temp file + rename
+            temp_path = path.with_suffix(".tmp")
+            with open(temp_path, "wb") as f:
+                f.write(CACHE_MAGIC + bytes([CACHE_VERSION]) + nonce + ciphertext)
+            os.replace(temp_path, path)
+
+            for stale in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            Logger.warning(t.INDEX_CACHE_LOG_SAVE_FAILED, error=e)
+            return
+
+        Logger.debug(t.INDEX_CACHE_LOG_SAVED, path=path)
+
+    def _path_for(self, cache_id: str) -> Path:
+        """Ruta del snapshot para un identificador de caché."""
+        return self.cache_dir / f"{cache_id[:32]}{CACHE_SUFFIX}"
+
+    @staticmethod
+    def _cache_id(content_hashes: Sequence[str]) -> str:
+        """Identificador estable del conjunto ordenado de vaults."""
+        return hashlib.sha256("\n".join(content_hashes).encode("ascii")).hexdigest()
+
+    @staticmethod
+    def _aad(cache_id: str) -> bytes:
+        """AAD que liga el snapshot al formato y a los vaults de origen."""
+        return CACHE_MAGIC + bytes([CACHE_VERSION]) + cache_id.encode("ascii")
+
+    @staticmethod
+    def _derive_key(keys: Sequence[bytes]) -> bytes:
+        """Deriva la clave de la caché a partir de las claves de los vaults."""
+        return HKDF(
+            algorithm=hashes.SHA256(),
+            length=KEY_LENGTH,
+            salt=None,
+            info=CACHE_KEY_INFO,
+        ).derive(b"".join(keys))
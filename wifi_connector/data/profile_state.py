@@ -0,0 +1,180 @@
+"""Estado local de los perfiles WLAN instalados por la aplicación.
+
+Guarda, por SSID, el hash del XML de perfil instalado la última vez para que
+ProfileConnector pueda omitir la reinstalación (netsh delete + add) cuando el
+perfil no ha cambiado, y un HMAC de las últimas credenciales EAP aplicadas
+para omitir WLANSetEAPUserData al reconectar al mismo centro. Las
+credenciales nunca se guardan en claro, y la clave del HMAC tampoco se guarda:
+se deriva con HKDF-SHA256 de la clave del vault desbloqueado (ver
+derive_key), así que el archivo solo no basta para probar contraseñas. El
+archivo es solo una pista: si se pierde o está dañado, o la clave cambia, el
+perfil y las credenciales simplemente se reaplican.
+"""
+
+import hashlib
+import hmac
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+STATE_KEY_INFO = b"wifi-connector profile state v1"
+KEY_LENGTH = 32
+
+
+def derive_key(vault_keys: Sequence[bytes]) -> bytes:
+    """Deriva la clave HMAC del estado a partir de las claves de los vaults.
+
+    Args:
+        vault_keys: Clave derivada (Scrypt) de cada vault desbloqueado
+
+    Returns:
+        Clave de KEY_LENGTH bytes
+    """
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=KEY_LENGTH,
+        salt=None,
+        info=STATE_KEY_INFO,
+    ).derive(b"".join(vault_keys))
+
+
+class ProfileState:
+    """Persistencia del estado de perfiles WLAN en profile_state.json.
+
+    Attributes:
+        state_path: Path al archivo de estado
+    """
+
+    def __init__(
+        self, state_path: Optional[Path] = None, key: Optional[bytes] = None
+    ) -> None:
+        """Inicializa el estado de perfiles.
+
+        Args:
+            state_path: Path al archivo de estado. Si es None, usa
+                get_profile_state_path()
+            key: Clave HMAC de las credenciales EAP (ver derive_key). Si es
+                None, no se registran credenciales y siempre se reaplican
+        """
+        if state_path is None:
+            from wifi_connector.utils.paths import get_profile_state_path
+
+            state_path = get_profile_state_path()
+
+        self.state_path = Path(state_path)
+        self._key = key
+
+    def get_profile_hash(self, ssid: str) -> Optional[str]:
+        """Obtiene el hash del perfil instalado para un SSID.
+
+        Args:
+            ssid: Nombre de la red
+
+        Returns:
+            Hash registrado o None si no hay registro
+        """
+        value = self._load().get(ssid, {}).get("profile_sha256")
+        return value if isinstance(value, str) else None
+
+    def set_profile_hash(self, ssid: str, profile_hash: str) -> None:
+        """Registra el hash del perfil recién instalado.
+
+        Reinstalar el perfil borra los datos EAP asociados en Windows, así
+        que también se descarta el registro de credenciales EAP.
+
+        Args:
+            ssid: Nombre de la red
+            profile_hash: SHA-256 del XML instalado
+        """
+        data = self._load()
+        data[ssid] = {"profile_sha256": profile_hash}
+        self._save(data)
+
+    def eap_credentials_match(self, ssid: str, username: str, password: str) -> bool:
+        """Comprueba si las credenciales son las últimas aplicadas para el SSID.
+
+        Args:
+            ssid: Nombre de la red
+            username: Usuario EAP
+            password: Contraseña EAP
+
+        Returns:
+            True si coinciden con el registro (False si no hay clave)
+        """
+        if self._key is None:
+            return False
+        recorded = self._load().get(ssid, {}).get("eap_hmac")
+        if not isinstance(recorded, str):
+            return False
+        return hmac.compare_digest(recorded, self._eap_hmac(username, password))
+
+    def set_eap_credentials(self, ssid: str, username: str, password: str) -> None:
+        """Registra (como HMAC) las credenciales EAP recién aplicadas.
+
+        Sin clave no registra nada.
+
+        Args:
+            ssid: Nombre de la red
+            username: Usuario EAP
+            password: Contraseña EAP
+        """
+        if self._key is None:
+            return
+        data = self._load()
+        data.setdefault(ssid, {})["eap_hmac"] = self._eap_hmac(username, password)
+        self._save(data)
+
+    def forget(self, ssid: str) -> None:
+        """Elimina el registro de un SSID para forzar su reinstalación.
+
+        Args:
+            ssid: Nombre de la red
+        """
+        data = self._load()
+        if data.pop(ssid, None) is not None:
+            self._save(data)
+
+    def _eap_hmac(self, username: str, password: str) -> str:
+        """HMAC-SHA256 de las credenciales EAP con la clave del estado."""
+        message = json.dumps([username, password]).encode("utf-8")
+        return hmac.new(self._key, message, hashlib.sha256).hexdigest()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Lee el archivo de estado; devuelve vacío si falta o es inválido."""
+        try:
+            if not self.state_path.exists():
+                return {}
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            Logger.warning(t.PROFILE_STATE_LOG_LOAD_ERROR, error=e)
+            return {}
+
+        profiles = data.get("profiles") if isinstance(data, dict) else None
+        if not isinstance(profiles, dict):
+            return {}
+        return {
+            ssid: entry for ssid, entry in profiles.items() if isinstance(entry, dict)
+        }
+
+    def _save(self, profiles: Dict[str, Dict[str, Any]]) -> None:
+        """Persiste el estado con escritura atómica (temp file + rename).
+
+        Los errores se registran pero no se propagan: perder el estado solo
+        provoca una reinstalación del perfil.
+        """
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.state_path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"profiles": profiles}, f, indent=2, ensure_ascii=False)
+            temp_path.replace(self.state_path)
+        except OSError as e:
+            Logger.warning(t.PROFILE_STATE_LOG_SAVE_ERROR, error=e)
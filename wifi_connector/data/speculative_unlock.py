@@ -0,0 +1,109 @@
+"""Derivación especulativa de la clave del vault mientras se escribe.
+
+Scrypt domina el tiempo de desbloqueo y normalmente empieza cuando el
+usuario pulsa Enter. En modo especulativo, el diálogo de contraseña avisa
+tras una pausa al escribir y la derivación del texto actual arranca en un
+worker. Si el texto cambia, el trabajo pendiente se cancela y el que esté
+en curso se descarta al terminar (Scrypt no se puede interrumpir). Si la
+contraseña enviada coincide, se reutiliza la clave ya derivada.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import hmac
+import threading
+from typing import Callable, List, Optional
+
+from wifi_connector.data.vault_manager import UnlockedVault
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+class SpeculativeUnlocker:
+    """Ejecuta la derivación de clave en segundo plano para el texto actual.
+
+    Solo hay un worker: como mucho una derivación en curso y una pendiente,
+    de modo que escribir rápido no acumula trabajos de Scrypt.
+    """
+
+    def __init__(self, unlock: Callable[[str], List[UnlockedVault]]) -> None:
+        """Inicializa el desbloqueo especulativo.
+
+        Args:
+            unlock: Función que deriva las claves de los vaults para una
+                contraseña (CredentialsManager.unlock_vaults)
+        """
+        self._unlock = unlock
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="speculative-kdf"
+        )
+        self._lock = threading.Lock()
+        self._password: Optional[str] = None
+        self._future: Optional[Future] = None
+
+    def schedule(self, password: str) -> None:
+        """Inicia la derivación para el texto actual, descartando la anterior.
+
+        Args:
+            password: Texto actual del campo de contraseña
+        """
+        if not password:
+            return
+
+        with self._lock:
+            if self._password is not None and hmac.compare_digest(
+                self._password.encode("utf-8"), password.encode("utf-8")
+            ):
+                return
+
+            if self._future is not None:
+                self._future.cancel()
+
+            Logger.debug(t.SPECULATIVE_LOG_STARTED)
+            self._password = password
+            self._future = self._executor.submit(self._unlock, password)
+
+    def take(self, password: str) -> Optional[List[UnlockedVault]]:
+        """Devuelve las claves derivadas si corresponden a la contraseña enviada.
+
+        Si la derivación sigue en curso, espera a que termine: ya lleva parte
+        del trabajo hecho. Si el texto no coincide o la derivación falló,
+        devuelve None y el llamador debe desbloquear de la forma habitual.
+
+        Args:
+            password: Contraseña enviada por el usuario
+
+        Returns:
+            Lista de UnlockedVault o None
+        """
+        with self._lock:
+            future = self._future
+            matches = self._password is not None and hmac.compare_digest(
+                self._password.encode("utf-8"), password.encode("utf-8")
+            )
+            self._password = None
+            self._future = None
+
+        if future is None:
+            return None
+
+        if not matches:
+            future.cancel()
+            return None
+
+        try:
+            unlocked = future.result()
+        except Exception as e:
+            Logger.debug(t.SPECULATIVE_LOG_FAILED, error=e)
+            return None
+
+        Logger.info(t.SPECULATIVE_LOG_REUSED)
+        return unlocked
+
+    def shutdown(self) -> None:
+        """Cancela el trabajo pendiente y libera el worker sin esperar."""
+        with self._lock:
+            if self._future is not None:
+                self._future.cancel()
+            self._password = None
+            self._future = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -2,9 +2,18 @@
 
 Este módulo proporciona utilidades para descifrar el vault en memoria
 y obtener la estructura de datos equivalente a wifi.json.
+
+Formato VLTB:
+    v1: header (32) | salt | nonce | ciphertext
+    v2: header (32) | metadata_len (4) | metadata JSON | salt | nonce | ciphertext
+
+En v2 los metadatos van en claro pero autenticados: forman parte del AAD de
+AES-GCM junto con el header, de modo que cualquier modificación hace fallar
+el descifrado. Pueden leerse sin contraseña con VaultManager.peek_metadata().
 """
 
 from dataclasses import dataclass
+import hashlib
 import json
 from pathlib import Path
 import struct
@@ -27,6 +36,12 @@ from wifi_connector.utils import translations as t
 MAGIC = b"VLTB"
 VLTB_HEADER_STRUCT = struct.Struct(">4sBBBBIIIIII")
 VLTB_HEADER_SIZE = 32
+VLTB_METADATA_LEN_STRUCT = struct.Struct(">I")
+MAX_METADATA_LENGTH = 64 * 1024
+
+# Versiones del formato VLTB
+VLTB_VERSION_1 = 1
+VLTB_VERSION_2 = 2
 
 # Constantes criptográficas
 KEY_LENGTH = 32
@@ -39,6 +54,21 @@ KDF_SCRYPT = 1
 AEAD_AESGCM = 1
 
 
+@dataclass
+class _VaultLayout:
+    """Componentes de un vault VLTB ya separados."""
+
+    version: int
+    n: int
+    r: int
+    p: int
+    aad: bytes
+    public_metadata: Dict[str, Any]
+    salt: bytes
+    nonce: bytes
+    ciphertext: bytes
+
+
 @dataclass
 class VaultPayload:
     """Representa el contenido descifrado del vault."""
@@ -47,12 +77,27 @@ class VaultPayload:
     centers: List[Dict[str, Any]]
 
 
+@dataclass
+class UnlockedVault:
+    """Vault leído con su clave ya derivada, pendiente de descifrar.
+
+    Atributos:
+        key: Clave AES derivada con Scrypt (no verificada hasta descifrar)
+        content_hash: SHA-256 en hexadecimal del archivo vault completo
+        layout: Componentes del vault ya separados
+    """
+
+    key: bytes
+    content_hash: str
+    layout: _VaultLayout
+
+
 class VaultManager:
     """Gestor para cargar y descifrar el vault binario."""
 
     def __init__(self, vault_path: str) -> None:
         self.vault_path = Path(vault_path)
-        Logger.debug(t.VAULT_LOG_INIT.format(path=self.vault_path))
+        Logger.debug(t.VAULT_LOG_INIT, path=self.vault_path)
 
     def load_vault(self, password: str) -> VaultPayload:
         """Carga y descifra el vault usando la contraseña proporcionada.
@@ -68,6 +113,25 @@ class VaultManager:
             VaultDecryptionError: Si la contraseña es inválida o el vault no se puede descifrar
             VaultFormatError: Si el vault no tiene el formato esperado
         """
+        return self.decrypt(self.unlock(password))
+
+    def unlock(self, password: str) -> UnlockedVault:
+        """Lee el vault y deriva su clave sin descifrar el payload.
+
+        Permite reutilizar la clave (por ejemplo, para la caché del índice)
+        antes de pagar el descifrado y el parseo. La contraseña no queda
+        verificada hasta que algo se descifra con la clave.
+
+        Args:
+            password: Contraseña del vault
+
+        Returns:
+            UnlockedVault con la clave, el hash del contenido y el layout
+
+        Raises:
+            VaultFileError: Si el archivo de vault no existe o no se puede leer
+            VaultFormatError: Si el vault no tiene el formato esperado
+        """
         if not self.vault_path.exists():
             raise VaultFileError(
                 t.VAULT_ERROR_FILE_NOT_FOUND.format(path=self.vault_path)
@@ -80,7 +144,29 @@ class VaultManager:
                 t.VAULT_ERROR_FILE_READ.format(path=self.vault_path, error=e)
             ) from e
 
-        payload = self._decrypt_payload(encrypted, password)
+        layout = self._parse_layout(encrypted)
+        key = self._derive_key(password, layout.salt, layout.n, layout.r, layout.p)
+        return UnlockedVault(
+            key=key,
+            content_hash=hashlib.sha256(encrypted).hexdigest(),
+            layout=layout,
+        )
+
+    def decrypt(self, unlocked: UnlockedVault) -> VaultPayload:
+        """Descifra y valida el payload de un vault ya desbloqueado.
+
+        Args:
+            unlocked: Resultado de unlock()
+
+        Returns:
+            VaultPayload con metadatos y centros
+
+        Raises:
+            VaultDecryptionError: Si la clave es inválida o el vault no se puede descifrar
+            VaultFormatError: Si el vault no tiene el formato esperado
+        """
+        layout = unlocked.layout
+        payload = self._decrypt_payload(layout, unlocked.key)
         Logger.info(t.VAULT_LOG_DECRYPTED)
 
         if isinstance(payload, dict):
@@ -100,15 +186,18 @@ class VaultManager:
         if not isinstance(centers, list):
             raise VaultFormatError(t.VAULT_ERROR_INVALID_STRUCTURE)
 
-        Logger.info(t.VAULT_LOG_LOADED.format(count=len(centers)))
+        # Los metadatos cifrados tienen prioridad sobre los públicos
+        metadata = {**layout.public_metadata, **metadata}
+
+        Logger.info(t.VAULT_LOG_LOADED, count=len(centers))
         return VaultPayload(metadata=metadata, centers=centers)
 
-    def _decrypt_payload(self, encrypted: bytes, password: str) -> Any:
+    def _decrypt_payload(self, layout: _VaultLayout, key: bytes) -> Any:
         """Descifra el payload en formato VLTB y devuelve el JSON decodificado.
 
         Args:
-            encrypted: Bytes del archivo vault completo
-            password: Contraseña del vault
+            layout: Componentes del vault ya separados por _parse_layout
+            key: Clave derivada con Scrypt
 
         Returns:
             Diccionario parseado del JSON descifrado
@@ -117,64 +206,185 @@ class VaultManager:
             VaultFormatError: Si el formato del vault es inválido
             VaultDecryptionError: Si la contraseña es incorrecta
         """
-        # Validar longitud mínima
-        if len(encrypted) < VLTB_HEADER_SIZE:
+        # Desencriptar con AES-GCM usando header (y metadatos públicos) como AAD
+        try:
+            plaintext = AESGCM(key).decrypt(
+                layout.nonce, layout.ciphertext, layout.aad
+            )
+        except InvalidTag as e:
+            raise VaultDecryptionError(t.VAULT_ERROR_INVALID_PASSWORD) from e
+        except Exception as e:
+            raise VaultDecryptionError(
+                t.VAULT_ERROR_DECRYPT_FAILED.format(error=e)
+            ) from e
+
+        # Parsear JSON
+        try:
+            return json.loads(plaintext.decode("utf-8"))
+        except json.JSONDecodeError as e:
+            raise VaultFormatError(t.VAULT_ERROR_INVALID_JSON.format(error=e)) from e
+
+    def peek_metadata(self) -> Dict[str, Any]:
+        """Lee los metadatos públicos del vault sin contraseña.
+
+        Solo lee el header y la sección de metadatos, sin tocar el
+        ciphertext ni ejecutar Scrypt. Los metadatos quedan autenticados
+        en el siguiente desbloqueo: si se han alterado, load_vault falla.
+
+        Returns:
+            Diccionario de metadatos públicos (vacío en vaults v1)
+
+        Raises:
+            VaultFileError: Si el archivo de vault no existe o no se puede leer
+            VaultFormatError: Si el header o los metadatos no son válidos
+        """
+        if not self.vault_path.exists():
+            raise VaultFileError(
+                t.VAULT_ERROR_FILE_NOT_FOUND.format(path=self.vault_path)
+            )
+
+        try:
+            with open(self.vault_path, "rb") as f:
+                header = f.read(VLTB_HEADER_SIZE)
+                version = self._unpack_header(header)[1]
+                if version < VLTB_VERSION_2:
+                    return {}
+                length_bytes = f.read(VLTB_METADATA_LEN_STRUCT.size)
+                metadata_len = self._unpack_metadata_length(length_bytes)
+                metadata_bytes = f.read(metadata_len)
+        except OSError as e:
+            raise VaultFileError(
+                t.VAULT_ERROR_FILE_READ.format(path=self.vault_path, error=e)
+            ) from e
+
+        if len(metadata_bytes) != metadata_len:
             raise VaultFormatError(t.VAULT_ERROR_INVALID_FORMAT)
 
-        # Parsear header VLTB (32 bytes)
+        return self._parse_public_metadata(metadata_bytes)
+
+    def _parse_layout(self, encrypted: bytes) -> _VaultLayout:
+        """Separa un vault VLTB (v1 o v2) en sus componentes.
+
+        Args:
+            encrypted: Bytes del archivo vault completo
+
+        Returns:
+            _VaultLayout con parámetros KDF, AAD, metadatos públicos y payload
+
+        Raises:
+            VaultFormatError: Si el formato del vault es inválido
+        """
         header = encrypted[:VLTB_HEADER_SIZE]
-        try:
-            (
-                magic,
-                version,
-                kdf_type,
-                aead_type,
-                reserved,
-                n,
-                r,
-                p,
-                salt_len,
-                nonce_len,
-                ct_len,
-            ) = VLTB_HEADER_STRUCT.unpack(header)
-        except struct.error as e:
-            raise VaultFormatError(t.VAULT_ERROR_INVALID_FORMAT) from e
+        (
+            _magic,
+            version,
+            _kdf_type,
+            _aead_type,
+            _reserved,
+            n,
+            r,
+            p,
+            salt_len,
+            nonce_len,
+            ct_len,
+        ) = self._unpack_header(header)
 
-        # Validar magic header
-        if magic != MAGIC:
-            raise VaultFormatError(t.VAULT_ERROR_INVALID_MAGIC)
+        offset = VLTB_HEADER_SIZE
+        public_metadata: Dict[str, Any] = {}
+        if version >= VLTB_VERSION_2:
+            length_end = offset + VLTB_METADATA_LEN_STRUCT.size
+            metadata_len = self._unpack_metadata_length(encrypted[offset:length_end])
+            metadata_bytes = encrypted[length_end : length_end + metadata_len]
+            if len(metadata_bytes) != metadata_len:
+                raise VaultFormatError(t.VAULT_ERROR_INVALID_FORMAT)
+            public_metadata = self._parse_public_metadata(metadata_bytes)
+            offset = length_end + metadata_len
 
         # Validar longitud total esperada
-        expected_len = VLTB_HEADER_SIZE + salt_len + nonce_len + ct_len
-        if len(encrypted) != expected_len:
+        if len(encrypted) != offset + salt_len + nonce_len + ct_len:
             raise VaultFormatError(t.VAULT_ERROR_INVALID_FORMAT)
 
-        # Extraer componentes del vault
-        offset = VLTB_HEADER_SIZE
+        # Todo lo anterior a salt (header + metadatos públicos) se autentica como AAD
+        aad = encrypted[:offset]
         salt = encrypted[offset : offset + salt_len]
         offset += salt_len
         nonce = encrypted[offset : offset + nonce_len]
         offset += nonce_len
         ciphertext = encrypted[offset : offset + ct_len]
 
-        # Derivar clave con Scrypt
-        key = self._derive_key(password, salt, n, r, p)
+        return _VaultLayout(
+            version=version,
+            n=n,
+            r=r,
+            p=p,
+            aad=aad,
+            public_metadata=public_metadata,
+            salt=salt,
+            nonce=nonce,
+            ciphertext=ciphertext,
+        )
+
+    @staticmethod
+    def _unpack_header(header: bytes) -> tuple:
+        """Desempaqueta y valida el header VLTB de 32 bytes.
+
+        Args:
+            header: Primeros bytes del vault
+
+        Returns:
+            Tupla con los campos del header
+
+        Raises:
+            VaultFormatError: Si el header es inválido
+        """
+        if len(header) < VLTB_HEADER_SIZE:
+            raise VaultFormatError(t.VAULT_ERROR_INVALID_FORMAT)
 
-        # Desencriptar con AES-GCM usando header completo como AAD
         try:
-            plaintext = AESGCM(key).decrypt(nonce, ciphertext, header)
-        except InvalidTag as e:
-            raise VaultDecryptionError(t.VAULT_ERROR_INVALID_PASSWORD) from e
-        except Exception as e:
-            raise VaultDecryptionError(
-                t.VAULT_ERROR_DECRYPT_FAILED.format(error=e)
-            ) from e
+            fields = VLTB_HEADER_STRUCT.unpack(header[:VLTB_HEADER_SIZE])
+        except struct.error as e:
+            raise VaultFormatError(t.VAULT_ERROR_INVALID_FORMAT) from e
 
-        # Parsear JSON
+        if fields[0] != MAGIC:
+            raise VaultFormatError(t.VAULT_ERROR_INVALID_MAGIC)
+
+        if fields[1] not in (VLTB_VERSION_1, VLTB_VERSION_2):
+            raise VaultFormatError(
+                t.VAULT_ERROR_UNSUPPORTED_VERSION.format(version=fields[1])
+            )
+
+        return fields
+
+    @staticmethod
+    def _unpack_metadata_length(length_bytes: bytes) -> int:
+        """Lee la longitud de la sección de metadatos públicos (v2).
+
+        Raises:
+            VaultFormatError: Si la longitud falta o excede el máximo
+        """
+        if len(length_bytes) != VLTB_METADATA_LEN_STRUCT.size:
+            raise VaultFormatError(t.VAULT_ERROR_INVALID_FORMAT)
+        (metadata_len,) = VLTB_METADATA_LEN_STRUCT.unpack(length_bytes)
+        if metadata_len > MAX_METADATA_LENGTH:
+            raise VaultFormatError(t.VAULT_ERROR_METADATA_INVALID)
+        return metadata_len
+
+    @staticmethod
+    def _parse_public_metadata(metadata_bytes: bytes) -> Dict[str, Any]:
+        """Decodifica la sección de metadatos públicos (JSON objeto).
+
+        Raises:
+            VaultFormatError: Si no es un objeto JSON válido
+        """
+        if not metadata_bytes:
+            return {}
         try:
-            return json.loads(plaintext.decode("utf-8"))
-        except json.JSONDecodeError as e:
-            raise VaultFormatError(t.VAULT_ERROR_INVALID_JSON.format(error=e)) from e
+            metadata = json.loads(metadata_bytes.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise VaultFormatError(t.VAULT_ERROR_METADATA_INVALID) from e
+        if not isinstance(metadata, dict):
+            raise VaultFormatError(t.VAULT_ERROR_METADATA_INVALID)
+        return metadata
 
     @staticmethod
     def _derive_key(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
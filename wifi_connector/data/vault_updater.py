@@ -0,0 +1,196 @@
+"""Actualización de vaults desde una carpeta espejo.
+
+Este módulo compara los vaults locales con los de una carpeta espejo
+(típicamente un recurso SMB compartido) y copia solo los que han cambiado.
+Las copias se hacen por bloques a un archivo temporal reanudable, se
+verifican por hash y se intercambian de forma atómica junto al ejecutable.
+"""
+
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import threading
+from typing import Callable, Dict, List, Optional
+
+from wifi_connector.core.exceptions import VaultError, VaultFileError
+from wifi_connector.data.vault_manager import VaultManager
+from wifi_connector.utils.hashing import file_sha256
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+CHUNK_SIZE = 1024 * 1024
+PARTIAL_SUFFIX = ".part"
+
+
+@dataclass
+class VaultUpdateResult:
+    """Resultado de una pasada de actualización.
+
+    Atributos:
+        updated: Nombres de vaults reemplazados por la versión del espejo
+        skipped: Nombres de vaults que ya estaban al día (o eran más recientes)
+        errors: Errores por nombre de vault
+    """
+
+    updated: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+class VaultUpdater:
+    """Sincroniza los vaults locales con una carpeta espejo."""
+
+    def __init__(self, mirror_dir: str, local_dir: Optional[Path] = None) -> None:
+        """Inicializa el actualizador.
+
+        Args:
+            mirror_dir: Carpeta espejo con los vaults publicados
+            local_dir: Carpeta local de vaults. Si es None, usa get_vault_path()
+        """
+        if local_dir is None:
+            from wifi_connector.utils.paths import get_vault_path
+
+            local_dir = get_vault_path()
+
+        self.mirror_dir = Path(mirror_dir)
+        self.local_dir = Path(local_dir)
+
+    def check_and_update(self) -> VaultUpdateResult:
+        """Compara cada vault del espejo con el local y copia los que difieren.
+
+        Returns:
+            VaultUpdateResult con los vaults actualizados, omitidos y errores
+        """
+        result = VaultUpdateResult()
+        Logger.info(t.VAULT_UPDATE_LOG_CHECKING, mirror=self.mirror_dir)
+
+        try:
+            remote_vaults = sorted(self.mirror_dir.glob("*.bin"))
+            mirror_available = self.mirror_dir.is_dir()
+        except OSError:
+            mirror_available = False
+        if not mirror_available:
+            Logger.warning(t.VAULT_UPDATE_LOG_MIRROR_MISSING, mirror=self.mirror_dir)
+            return result
+
+        for remote in remote_vaults:
+            local = self.local_dir / remote.name
+            try:
+                if self._update_one(remote, local):
+                    result.updated.append(remote.name)
+                else:
+                    result.skipped.append(remote.name)
+            except Exception as e:
+                Logger.error(t.VAULT_UPDATE_LOG_ERROR, name=remote.name, error=e)
+                result.errors[remote.name] = str(e)
+
+        Logger.info(t.VAULT_UPDATE_LOG_FINISHED, updated=len(result.updated))
+        return result
+
+    def start_background(
+        self, on_complete: Optional[Callable[[VaultUpdateResult], None]] = None
+    ) -> threading.Thread:
+        """Ejecuta check_and_update en un hilo daemon sin bloquear la GUI.
+
+        Args:
+            on_complete: Callback opcional con el resultado (se invoca en el hilo
+                de fondo; la GUI debe reenviarlo con window.after)
+
+        Returns:
+            El hilo iniciado
+        """
+
+        def worker() -> None:
+            update_result = self.check_and_update()
+            if on_complete:
+                on_complete(update_result)
+
+        thread = threading.Thread(target=worker, name="vault-updater", daemon=True)
+        thread.start()
+        return thread
+
+    def _update_one(self, remote: Path, local: Path) -> bool:
+        """Actualiza un vault si el del espejo difiere del local.
+
+        Returns:
+            True si se reemplazó el vault local, False si ya estaba al día
+        """
+        remote_metadata = self._peek(remote)
+        remote_size = remote.stat().st_size
+
+        if local.exists():
+            local_metadata = self._peek(local)
+            local_generated = str(local_metadata.get("generated_at") or "")
+            remote_generated = str(remote_metadata.get("generated_at") or "")
+            if remote_generated and local_generated > remote_generated:
+                Logger.info(t.VAULT_UPDATE_LOG_LOCAL_NEWER, name=local.name)
+                return False
+
+            # Comparación barata primero (metadatos y tamaño); el hash decide
+            if (
+                local_metadata == remote_metadata
+                and local.stat().st_size == remote_size
+                and file_sha256(local) == file_sha256(remote)
+            ):
+                Logger.debug(t.VAULT_UPDATE_LOG_UP_TO_DATE, name=local.name)
+                return False
+
+        expected_hash = file_sha256(remote)
+        partial = local.with_name(local.name + PARTIAL_SUFFIX)
+        self.local_dir.mkdir(parents=True, exist_ok=True)
+
+        # Un único reintento desde cero si la copia reanudada no verifica
+        for resume in (True, False):
+            self._copy_chunked(remote, partial, remote_size, resume=resume)
+            if file_sha256(partial) == expected_hash:
+                break
+            Logger.warning(t.VAULT_UPDATE_LOG_HASH_MISMATCH, name=local.name)
+            partial.unlink(missing_ok=True)
+        else:
+            raise VaultFileError(t.VAULT_UPDATE_ERROR_VERIFY)
+
+        # Validar que lo copiado es un vault legible antes de sustituir
+        try:
+            VaultManager(str(partial)).peek_metadata()
+        except VaultError:
+            partial.unlink(missing_ok=True)
+            raise
+        os.replace(partial, local)
+        Logger.info(t.VAULT_UPDATE_LOG_UPDATED, name=local.name)
+        return True
+
+    @staticmethod
+    def _copy_chunked(
+        source: Path, partial: Path, total_size: int, resume: bool
+    ) -> None:
+        """Copia source a partial por bloques, reanudando si ya existe.
+
+        Args:
+            source: Archivo de origen en el espejo
+            partial: Archivo temporal de destino
+            total_size: Tamaño esperado del origen
+            resume: Si es True y partial existe, continúa desde su tamaño
+        """
+        offset = 0
+        if resume and partial.exists():
+            offset = partial.stat().st_size
+            if offset > total_size:
+                offset = 0
+
+        Logger.info(t.VAULT_UPDATE_LOG_COPYING, name=source.name, offset=offset)
+        mode = "ab" if offset else "wb"
+        with open(source, "rb") as src, open(partial, mode) as dst:
+            src.seek(offset)
+            for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+                dst.write(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+
+    @staticmethod
+    def _peek(path: Path) -> dict:
+        """Lee los metadatos públicos de un vault, vacío si no los tiene."""
+        try:
+            return VaultManager(str(path)).peek_metadata()
+        except VaultError:
+            return {}
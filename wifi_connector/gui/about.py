@@ -33,7 +33,7 @@ class AboutWindow(ctk.CTkToplevel):
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
         title_label = ctk.CTkLabel(
-            main_frame, text=t.ABOUT_TITLE, font=ctk.CTkFont(size=20, weight="bold")
+            main_frame, text=t.WINDOW_TITLE_MAIN, font=ctk.CTkFont(size=20, weight="bold")
         )
         title_label.pack(pady=(10, 5))
 
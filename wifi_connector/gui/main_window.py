@@ -4,22 +4,40 @@ Este módulo proporciona la clase MainWindow que implementa la interfaz
 gráfica de usuario principal para la aplicación WiFi Connector.
 """
 
-import threading
+import concurrent.futures
 from typing import Optional, List
 from pathlib import Path
 import customtkinter as ctk
 from PIL import Image, ImageTk
 import os
+import time
 import tkinter.messagebox as messagebox
 
+from wifi_connector import __version__
+from wifi_connector.data.connection_history import AttemptRecord, ConnectionHistory
 from wifi_connector.data.credentials_manager import (
     CredentialsManager,
     CenterCredentials,
 )
 from wifi_connector.data.favorites_manager import FavoritesManager
+from wifi_connector.data.index_cache import IndexCache
+from wifi_connector.data.profile_state import ProfileState
+from wifi_connector.data.speculative_unlock import SpeculativeUnlocker
+from wifi_connector.data.vault_updater import VaultUpdater, VaultUpdateResult
+from wifi_connector.core.config import Config
+from wifi_connector.core.connection_attempt import (
+    ConnectionAttempt,
+    ConnectionController,
+    ConnectionState,
+)
 from wifi_connector.core.profile_connector import ProfileConnector
+from wifi_connector.network.event_loop import BackgroundLoop
 from wifi_connector.network.manager import NetworkManager
+from wifi_connector.network.netsh_output import WlanInterface
+from wifi_connector.network.netsh_session import NetshSession
+from wifi_connector.network.process_runner import latency_stats
 
+from wifi_connector.utils import metrics
 from wifi_connector.utils.logger import Logger
 from wifi_connector.utils.paths import get_base_path, get_favorites_path
 from wifi_connector.utils import translations as t
@@ -35,10 +53,33 @@ class MainWindow:
     a redes WiFi usando customTkinter.
     """
 
-    def __init__(self):
-        """Inicializa la ventana principal de la GUI."""
+    def __init__(self, config: Optional[Config] = None):
+        """Inicializa la ventana principal de la GUI.
+
+        Args:
+            config: Configuración de la aplicación. Si es None, usa la de por defecto.
+        """
         Logger.info(t.MAIN_LOG_INIT)
 
+        self.config = config or Config.default()
+        # El proceso netsh interactivo se lanza en la primera consulta
+        self.netsh_session: Optional[NetshSession] = (
+            NetshSession() if self.config.persistent_netsh else None
+        )
+        # Bucle asyncio compartido por conexión, verificación y desconexión
+        self.network_loop = BackgroundLoop()
+        # Un único intento de conexión activo; uno nuevo cancela el anterior
+        self.connection_controller = ConnectionController(self.network_loop)
+        # Historial SQLite de intentos (escrito por lotes en segundo plano)
+        self.connection_history: Optional[ConnectionHistory] = (
+            ConnectionHistory() if self.config.connection_history else None
+        )
+        # Métricas para node_exporter; sin archivo configurado no cuestan nada
+        if self.config.metrics_textfile:
+            metrics.enable(
+                Path(self.config.metrics_textfile), self.config.metrics_interval
+            )
+
         self.window = ctk.CTk()
         self.window.title("Wifi de Centres Educatius de Catalunya")
         self.window.geometry("700x600")
@@ -49,11 +90,11 @@ class MainWindow:
             ico_path = get_base_path() / "images" / "wifi_icon.ico"
             if ico_path.exists():
                 self.window.iconbitmap(str(ico_path))
-                Logger.info(t.MAIN_LOG_ICON_SET.format(path=ico_path))
+                Logger.info(t.MAIN_LOG_ICON_SET, path=ico_path)
             else:
-                Logger.warning(t.MAIN_LOG_ICON_NOT_FOUND.format(path=ico_path))
+                Logger.warning(t.MAIN_LOG_ICON_NOT_FOUND, path=ico_path)
         except Exception as e:
-            Logger.error(t.MAIN_LOG_ICON_ERROR.format(error=e), exc_info=True)
+            Logger.error(t.MAIN_LOG_ICON_ERROR, error=e, exc_info=True)
 
         # Cargar iconos de favoritos
         try:
@@ -74,18 +115,18 @@ class MainWindow:
                 Logger.info(t.MAIN_LOG_FAV_ICONS_LOADED)
             else:
                 Logger.warning(
-                    t.MAIN_LOG_FAV_ICONS_NOT_FOUND.format(
-                        fav_path=fav_path, fav_unchecked_path=fav_unchecked_path
-                    )
+                    t.MAIN_LOG_FAV_ICONS_NOT_FOUND,
+                    fav_path=fav_path,
+                    fav_unchecked_path=fav_unchecked_path,
                 )
                 self.fav_icon = None
                 self.fav_unchecked_icon = None
         except Exception as e:
-            Logger.error(t.MAIN_LOG_ERROR_LOADING_ICONS.format(error=e), exc_info=True)
+            Logger.error(t.MAIN_LOG_ERROR_LOADING_ICONS, error=e, exc_info=True)
             self.fav_icon = None
             self.fav_unchecked_icon = None
 
-        self.credentials_manager = CredentialsManager()
+        self.credentials_manager = CredentialsManager(index_cache=IndexCache())
         self.vault_metadata = {}
 
         if not self._unlock_and_load_vault():
@@ -130,11 +171,13 @@ class MainWindow:
             )
             self._update_vault_status()
         except Exception as e:
-            Logger.error(t.MAIN_LOG_LOAD_ERROR.format(error=e))
+            Logger.error(t.MAIN_LOG_LOAD_ERROR, error=e)
             self.update_status(t.STATUS_ERROR_LOAD_CREDS.format(error=e), "error")
 
         self.window.protocol("WM_DELETE_WINDOW", self._on_window_close)
 
+        self._start_vault_update()
+
         Logger.info(t.MAIN_LOG_INIT_SUCCESS)
 
     def run(self) -> None:
@@ -143,18 +186,50 @@ class MainWindow:
         self.window.mainloop()
 
     def _unlock_and_load_vault(self) -> bool:
-        """Solicita la contraseña del vault y carga las credenciales."""
+        """Solicita la contraseña del vault y carga las credenciales.
+
+        Con config.speculative_unlock, la derivación de clave empieza en
+        segundo plano cuando el usuario deja de escribir.
+        """
+        speculative: Optional[SpeculativeUnlocker] = None
+        if self.config.speculative_unlock:
+            speculative = SpeculativeUnlocker(self.credentials_manager.unlock_vaults)
+        try:
+            return self._prompt_and_load_vault(speculative)
+        finally:
+            if speculative is not None:
+                speculative.shutdown()
+
+    def _prompt_and_load_vault(
+        self, speculative: Optional[SpeculativeUnlocker]
+    ) -> bool:
+        """Bucle de petición de contraseña hasta cargar o cancelar."""
         error_message = ""
 
+        # Metadatos públicos disponibles antes del desbloqueo (vaults v2)
+        self.vault_metadata = self.credentials_manager.peek_metadata()
+
         while True:
-            dialog = VaultPasswordDialog(self.window, error_message=error_message)
+            dialog = VaultPasswordDialog(
+                self.window,
+                error_message=error_message,
+                on_typing_paused=speculative.schedule if speculative else None,
+                typing_pause_ms=self.config.speculative_unlock_delay_ms,
+            )
             password = dialog.get_password()
             if password is None:
                 Logger.warning(t.VAULT_LOG_PASSWORD_CANCELLED)
                 return False
 
             try:
-                self.credentials_manager.load_credentials(password)
+                started = time.perf_counter()
+                unlocked = speculative.take(password) if speculative else None
+                self.credentials_manager.load_credentials(password, unlocked=unlocked)
+                app_metrics = metrics.active()
+                if app_metrics is not None:
+                    app_metrics.vault_unlock_duration.observe(
+                        time.perf_counter() - started
+                    )
                 self.vault_metadata = self.credentials_manager.vault_metadata or {}
                 return True
             except VaultDecryptionError as e:
@@ -162,20 +237,38 @@ class MainWindow:
                 error_message = t.VAULT_ERROR_INVALID_PASSWORD
                 continue
             except VaultError as e:
-                Logger.error(t.VAULT_LOG_LOAD_ERROR.format(error=e))
+                Logger.error(t.VAULT_LOG_LOAD_ERROR, error=e)
                 messagebox.showerror(
                     t.VAULT_ERROR_TITLE,
                     t.VAULT_ERROR_UNREADABLE.format(error=e),
                 )
                 return False
             except Exception as e:
-                Logger.error(t.VAULT_LOG_LOAD_ERROR.format(error=e))
+                Logger.error(t.VAULT_LOG_LOAD_ERROR, error=e)
                 messagebox.showerror(
                     t.VAULT_ERROR_TITLE,
                     t.VAULT_ERROR_UNREADABLE.format(error=e),
                 )
                 return False
 
+    def _start_vault_update(self) -> None:
+        """Lanza la actualización de vaults desde el espejo en segundo plano.
+
+        Solo se ejecuta si config.vault_mirror_dir está definido. Los vaults
+        nuevos se aplican en el siguiente arranque.
+        """
+        if not self.config.vault_mirror_dir:
+            return
+
+        def on_complete(result: VaultUpdateResult) -> None:
+            if result.updated:
+                self.window.after(
+                    0,
+                    lambda: self.update_status(t.VAULT_UPDATE_STATUS_UPDATED, "info"),
+                )
+
+        VaultUpdater(self.config.vault_mirror_dir).start_background(on_complete)
+
     def _update_vault_status(self) -> None:
         """Actualiza el estado con la información del vault cargado."""
         if not self.vault_metadata:
@@ -203,7 +296,7 @@ class MainWindow:
             message: Mensaje de estado a mostrar
             status_type: Tipo de estado - "success", "error", o "info"
         """
-        Logger.debug(t.MAIN_LOG_STATUS_UPDATE.format(type=status_type, message=message))
+        Logger.debug(t.MAIN_LOG_STATUS_UPDATE, type=status_type, message=message)
 
         color_map = {"success": "#2ecc71", "error": "#e74c3c", "info": "#3498db"}
 
@@ -309,8 +402,15 @@ class MainWindow:
             event: Objeto evento de Tkinter.
         """
         query = self.search_entry.get() if self.search_entry else ""
-        Logger.debug(t.MAIN_LOG_SEARCH_CHANGED.format(query=query))
+        Logger.debug(t.MAIN_LOG_SEARCH_CHANGED, query=query)
+        app_metrics = metrics.active()
+        if app_metrics is None:
+            self._filter_centers(query)
+            return
+
+        started = time.perf_counter()
         self._filter_centers(query)
+        app_metrics.search_duration.observe(time.perf_counter() - started)
 
     def _filter_centers(self, query: str) -> None:
         """Filtra y actualiza la tabla de centros según la consulta y el modo de vista.
@@ -318,15 +418,15 @@ class MainWindow:
         Args:
             query: Cadena de texto de búsqueda.
         """
-        Logger.debug(t.MAIN_LOG_FILTERING.format(query=query))
+        Logger.debug(t.MAIN_LOG_FILTERING, query=query)
 
         # Determinar la lista base según el modo de vista
         if self.view_mode == "favorites":
             base_centers = self.favorites_manager.get_favorites()
-            Logger.debug(t.MAIN_LOG_FILTERING_FAVORITES.format(count=len(base_centers)))
+            Logger.debug(t.MAIN_LOG_FILTERING_FAVORITES, count=len(base_centers))
         else:
             base_centers = self.all_centers
-            Logger.debug(t.MAIN_LOG_FILTERING_ALL.format(count=len(base_centers)))
+            Logger.debug(t.MAIN_LOG_FILTERING_ALL, count=len(base_centers))
 
         if not query:
             # Sin consulta de búsqueda
@@ -375,7 +475,7 @@ class MainWindow:
         else:
             # Buscar en todos los centros
             filtered_centers = self.credentials_manager.search_centers(query)
-            Logger.debug(t.MAIN_LOG_FOUND_MATCHING.format(count=len(filtered_centers)))
+            Logger.debug(t.MAIN_LOG_FOUND_MATCHING, count=len(filtered_centers))
             self._populate_centers_table(filtered_centers)
 
     def _create_centers_table(self, parent: ctk.CTkFrame) -> None:
@@ -419,7 +519,7 @@ class MainWindow:
             centers: Lista de CenterCredentials a mostrar.
             show_prompt: Si es True, muestra mensaje de búsqueda en lugar de "Sin resultados".
         """
-        Logger.debug(t.MAIN_LOG_POPULATING.format(count=len(centers)))
+        Logger.debug(t.MAIN_LOG_POPULATING, count=len(centers))
 
         # Limpiar widgets existentes (tanto marcos como botones)
         for widget in self.center_buttons:
@@ -546,13 +646,13 @@ class MainWindow:
         try:
             if self.favorites_manager.is_favorite(center.center_code):
                 self.favorites_manager.remove_favorite(center.center_code)
-                Logger.info(t.VIEW_LOG_FAV_REMOVED.format(code=center.center_code))
+                Logger.info(t.VIEW_LOG_FAV_REMOVED, code=center.center_code)
                 self.update_status(
                     t.STATUS_FAV_REMOVED.format(code=center.center_code), "info"
                 )
             else:
                 self.favorites_manager.add_favorite(center)
-                Logger.info(t.VIEW_LOG_FAV_ADDED.format(code=center.center_code))
+                Logger.info(t.VIEW_LOG_FAV_ADDED, code=center.center_code)
                 self.update_status(
                     t.STATUS_FAV_ADDED.format(code=center.center_code), "success"
                 )
@@ -562,7 +662,9 @@ class MainWindow:
             self._filter_centers(query)
         except Exception as e:
             Logger.error(
-                t.MAIN_LOG_ERROR_TOGGLE_FAV.format(code=center.center_code, error=e),
+                t.MAIN_LOG_ERROR_TOGGLE_FAV,
+                code=center.center_code,
+                error=e,
                 exc_info=True,
             )
             self.update_status(t.STATUS_ERROR_TOGGLE_FAV.format(error=e), "error")
@@ -587,7 +689,7 @@ class MainWindow:
             query = self.search_entry.get() if self.search_entry else ""
             self._filter_centers(query)
         except Exception as e:
-            Logger.error(t.MAIN_LOG_ERROR_TOGGLE_VIEW.format(error=e), exc_info=True)
+            Logger.error(t.MAIN_LOG_ERROR_TOGGLE_VIEW, error=e, exc_info=True)
             self.update_status(t.STATUS_ERROR_TOGGLE_VIEW.format(error=e), "error")
 
     def _on_center_selected(self, center: CenterCredentials) -> None:
@@ -597,9 +699,7 @@ class MainWindow:
             center: Objeto CenterCredentials seleccionado.
         """
         Logger.info(
-            t.MAIN_LOG_CENTER_SELECTED.format(
-                code=center.center_code, name=center.center_name
-            )
+            t.MAIN_LOG_CENTER_SELECTED, code=center.center_code, name=center.center_name
         )
 
         self.selected_center = center
@@ -646,6 +746,10 @@ class MainWindow:
             # Forzar la ventana a actualizar el diseño
             self.window.update_idletasks()
 
+        # Con una conexión en curso se puede elegir otro centro y reemplazarla
+        if self.is_connecting and self.connect_profile_button:
+            self.connect_profile_button.configure(state="normal", text=t.CONNECT_BUTTON)
+
         self.update_status(f"Seleccionat: {center.center_name}", "info")
 
     def _create_credentials_panel(self, parent: ctk.CTkFrame) -> None:
@@ -859,10 +963,10 @@ class MainWindow:
             self.update_status(t.STATUS_ERROR_NO_CENTER, "error")
             return
 
+        center = self.selected_center
         if self.is_connecting:
-            Logger.warning(t.MAIN_LOG_CONNECT_IN_PROGRESS)
-            self.update_status(t.STATUS_CONNECTING_STARTING, "info")
-            return
+            # El intento en curso se cancela (y sus comandos se aturan)
+            Logger.info(t.MAIN_LOG_CONNECT_PREEMPT, code=center.center_code)
 
         # Deshabilitar botón y mostrar estado de carga
         if self.connect_profile_button:
@@ -871,72 +975,128 @@ class MainWindow:
             )
 
         self.update_status(t.STATUS_CONNECTING_PROFILE, "info")
+        Logger.info(t.MAIN_LOG_PROFILE_STARTING, code=center.center_code)
+
+        # Definir callback de progreso para actualizar GUI en tiempo real
+        def update_progress(message: str):
+            self.window.after(0, lambda msg=message: self.update_status(msg, "info"))
+
+        # Crear ProfileConnector con credenciales del centro seleccionado
+        profile_connector = ProfileConnector(
+            ssid="gencat_ENS_EDU",
+            username=center.username,
+            password=center.password,
+            profile_state=ProfileState(key=self.credentials_manager.state_key),
+            force_reinstall=self.config.force_profile_reinstall,
+            network_manager=NetworkManager(netsh_session=self.netsh_session),
+            netsh_session=self.netsh_session,
+        )
+        attempt = ConnectionAttempt(
+            profile_connector,
+            progress_callback=update_progress,
+            center_code=center.center_code,
+        )
 
-        # Ejecutar conexión en hilo en segundo plano
-        def profile_connection_worker():
-            try:
-                self.is_connecting = True
-                Logger.info(
-                    t.MAIN_LOG_PROFILE_STARTING.format(
-                        code=self.selected_center.center_code
-                    )
-                )
+        # Ejecutar conexión como tarea del bucle de red en segundo plano
+        self.is_connecting = True
+        future = self.connection_controller.start(attempt)
+        future.add_done_callback(
+            lambda done: self._record_attempt(attempt, center.center_code)
+        )
+        future.add_done_callback(
+            lambda done: self.window.after(
+                0, lambda: self._on_profile_connection_done(attempt, done)
+            )
+        )
 
-                # Definir callback de progreso para actualizar GUI en tiempo real
-                def update_progress(message: str):
-                    self.window.after(
-                        0, lambda msg=message: self.update_status(msg, "info")
-                    )
+    def _record_attempt(self, attempt: ConnectionAttempt, center_code: str) -> None:
+        """Registra un intento terminado en las métricas y en el historial.
 
-                # Crear ProfileConnector con credenciales del centro seleccionado
-                profile_connector = ProfileConnector(
-                    ssid="gencat_ENS_EDU",
-                    username=self.selected_center.username,
-                    password=self.selected_center.password,
-                )
-                success, message = profile_connector.connect_via_profile(
-                    progress_callback=update_progress
-                )
+        Se invoca desde el hilo del bucle de red: ninguna de las dos cosas
+        escribe a disco aquí (las métricas son contadores en memoria y el
+        historial solo encola la fila).
 
-                # Actualizar UI en el hilo principal
-                if success:
-                    self.window.after(
-                        0,
-                        lambda: self.update_status(
-                            "Connectat correctament via perfil!", "success"
-                        ),
-                    )
-                else:
-                    self.window.after(
-                        0,
-                        lambda: self.update_status(
-                            f"Error de connexió: {message}", "error"
-                        ),
-                    )
+        Args:
+            attempt: Intento en estado final
+            center_code: Código del centro del intento
+        """
+        app_metrics = metrics.active()
+        if app_metrics is not None:
+            app_metrics.attempt_finished(
+                attempt.state.value, attempt.duration or 0.0, attempt.step_durations()
+            )
+            if attempt.connector.interface is not None:
+                app_metrics.interface_observed(attempt.connector.interface)
 
-            except Exception as e:
-                Logger.error(t.MAIN_LOG_PROFILE_ERROR.format(error=e), exc_info=True)
-                error_msg = f"Error de connexió: {str(e)}"
-                self.window.after(0, lambda: self.update_status(error_msg, "error"))
-
-            finally:
-                # Restablecer estado de conexión y botón
-                self.is_connecting = False
-
-                def reset_button():
-                    if self.connect_profile_button:
-                        self.connect_profile_button.configure(
-                            state="normal", text=t.CONNECT_BUTTON
-                        )
+        if self.connection_history is None:
+            return
+        vault_version = (
+            self.vault_metadata.get("version")
+            or self.vault_metadata.get("vault_version")
+            if self.vault_metadata
+            else None
+        )
+        self.connection_history.record(
+            AttemptRecord.from_attempt(
+                attempt,
+                center_code,
+                app_version=__version__,
+                vault_version=str(vault_version) if vault_version else None,
+            )
+        )
+
+    def _on_profile_connection_done(
+        self, attempt: ConnectionAttempt, future: concurrent.futures.Future
+    ) -> None:
+        """
+        Muestra el resultado de un intento de conexión (en el hilo principal).
+
+        Un intento reemplazado por otro más nuevo no toca la interfaz.
+
+        Args:
+            attempt: Intento que ha terminado
+            future: Future devuelto por ConnectionController.start()
+        """
+        if not self.connection_controller.is_current(attempt):
+            return
 
-                self.window.after(0, reset_button)
-                Logger.info(t.MAIN_LOG_PROFILE_COMPLETED)
+        if future.cancelled() or attempt.state is ConnectionState.CANCELLED:
+            self.update_status(t.STATUS_CONNECTION_CANCELLED, "info")
+        elif future.exception() is not None:
+            error = future.exception()
+            Logger.error(t.MAIN_LOG_PROFILE_ERROR, error=error)
+            self.update_status(f"Error de connexió: {error}", "error")
+        else:
+            success, message = future.result()
+            if success:
+                self.update_status(
+                    self._connected_status(attempt.connector.interface), "success"
+                )
+            else:
+                self.update_status(f"Error de connexió: {message}", "error")
 
-        # Iniciar hilo
-        connection_thread = threading.Thread(
-            target=profile_connection_worker, daemon=True
+        # Restablecer estado de conexión y botón
+        self.is_connecting = False
+        if self.connect_profile_button:
+            self.connect_profile_button.configure(state="normal", text=t.CONNECT_BUTTON)
+        Logger.info(t.MAIN_LOG_PROFILE_COMPLETED)
+
+    @staticmethod
+    def _connected_status(interface: Optional[WlanInterface]) -> str:
+        """Mensaje de estado al conectar, con la señal y la velocidad si se conocen."""
+        details = []
+        if interface is not None:
+            if interface.signal is not None:
+                details.append(t.STATUS_LINK_SIGNAL.format(signal=interface.signal))
+            if interface.channel is not None:
+                details.append(t.STATUS_LINK_CHANNEL.format(channel=interface.channel))
+            if interface.receive_rate is not None:
+                details.append(t.STATUS_LINK_RATE.format(rate=interface.receive_rate))
+        if not details:
+            return t.STATUS_CONNECTED_PROFILE
+        return t.STATUS_CONNECTED_PROFILE_DETAILS.format(
+            status=t.STATUS_CONNECTED_PROFILE, details=" · ".join(details)
         )
-        connection_thread.start()
 
     def _on_open_logs_clicked(self) -> None:
         """Maneja el clic del botón Abrir Logs para abrir la carpeta de logs."""
@@ -955,10 +1115,10 @@ class MainWindow:
 
             # Abrir carpeta en el Explorador de Windows
             subprocess.run(["explorer", str(logs_folder)], shell=True)
-            Logger.info(t.MAIN_LOG_LOGS_OPENED.format(path=logs_folder))
+            Logger.info(t.MAIN_LOG_LOGS_OPENED, path=logs_folder)
 
         except Exception as e:
-            Logger.error(t.MAIN_LOG_LOGS_ERROR.format(error=e))
+            Logger.error(t.MAIN_LOG_LOGS_ERROR, error=e)
             self.update_status(t.STATUS_ERROR_OPEN_LOGS.format(error=e), "error")
 
     def _on_about_clicked(self) -> None:
@@ -967,7 +1127,7 @@ class MainWindow:
         try:
             AboutWindow(self.window, vault_metadata=self.vault_metadata)
         except Exception as e:
-            Logger.error(t.MAIN_LOG_ERROR_OPENING_ABOUT.format(error=e))
+            Logger.error(t.MAIN_LOG_ERROR_OPENING_ABOUT, error=e)
             self.update_status(t.STATUS_ERROR_OPEN_ABOUT.format(error=e), "error")
 
     def _on_disconnect_clicked(self) -> None:
@@ -981,12 +1141,12 @@ class MainWindow:
 
         self.update_status(t.STATUS_DISCONNECTING, "info")
 
-        # Ejecutar desconexión en hilo en segundo plano para evitar bloquear la GUI
-        def disconnect_worker():
+        # Ejecutar desconexión en el bucle de red para evitar bloquear la GUI
+        async def disconnect_task():
             try:
-                network_manager = NetworkManager()
+                network_manager = NetworkManager(netsh_session=self.netsh_session)
 
-                if network_manager.disconnect():
+                if await network_manager.disconnect_async():
                     self.window.after(
                         0,
                         lambda: self.update_status(
@@ -1001,7 +1161,7 @@ class MainWindow:
                         ),
                     )
             except Exception as e:
-                Logger.error(t.MAIN_LOG_DISCONNECT_ERROR.format(error=e))
+                Logger.error(t.MAIN_LOG_DISCONNECT_ERROR, error=e)
                 self.window.after(
                     0,
                     lambda: self.update_status(
@@ -1009,8 +1169,7 @@ class MainWindow:
                     ),
                 )
 
-        disconnect_thread = threading.Thread(target=disconnect_worker, daemon=True)
-        disconnect_thread.start()
+        self.network_loop.submit(disconnect_task())
 
     def _on_window_close(self) -> None:
         """Maneja el evento de cierre de ventana de forma controlada."""
@@ -1018,15 +1177,17 @@ class MainWindow:
 
         if self.is_connecting:
             Logger.warning(t.MAIN_LOG_CONNECTION_IN_PROGRESS)
-            self.update_status("Espera que la connexió es realitzi...", "info")
-            # En una aplicación de producción, podrías querer cancelar el hilo
-            # Por ahora, simplemente dejaremos que se complete
-
-        # Limpiar archivo de credenciales por seguridad
-        try:
-            ProfileConnector.clean_credentials_file()
-        except Exception as e:
-            Logger.error(t.PROFILE_CLEAN_ERROR_ON_CLOSE.format(error=e))
+            self.update_status(t.STATUS_CANCELLING, "info")
+            self.connection_controller.cancel()
+
+        # Cancela las tareas pendientes y detiene el bucle de red
+        self.network_loop.stop(timeout=1.0)
+        if self.netsh_session is not None:
+            self.netsh_session.close()
+        if self.connection_history is not None:
+            self.connection_history.close(timeout=1.0)
+        metrics.disable()
+        latency_stats.log_summary()
 
         self.window.destroy()
         Logger.info(t.MAIN_LOG_WINDOW_CLOSED)
@@ -1,6 +1,6 @@
 """Diálogo modal para solicitar la contraseña del vault."""
 
-from typing import Optional
+from typing import Callable, Optional
 import customtkinter as ctk
 
 from wifi_connector.utils import translations as t
@@ -9,10 +9,28 @@ from wifi_connector.utils import translations as t
 class VaultPasswordDialog(ctk.CTkToplevel):
     """Diálogo modal para introducir la contraseña del vault."""
 
-    def __init__(self, parent: ctk.CTk, error_message: str = "") -> None:
+    def __init__(
+        self,
+        parent: ctk.CTk,
+        error_message: str = "",
+        on_typing_paused: Optional[Callable[[str], None]] = None,
+        typing_pause_ms: int = 400,
+    ) -> None:
+        """Crea el diálogo.
+
+        Args:
+            parent: Ventana principal
+            error_message: Mensaje de error a mostrar (p. ej. contraseña incorrecta)
+            on_typing_paused: Callback opcional con el texto actual cuando el
+                usuario deja de escribir durante typing_pause_ms
+            typing_pause_ms: Pausa al escribir antes de invocar on_typing_paused
+        """
         super().__init__(parent)
 
         self._password: Optional[str] = None
+        self._on_typing_paused = on_typing_paused
+        self._typing_pause_ms = typing_pause_ms
+        self._pause_job: Optional[str] = None
 
         self.title(t.VAULT_DIALOG_TITLE)
         # Aumentar altura para acomodar mensajes de error sin comprimir los botones
@@ -52,6 +70,8 @@ class VaultPasswordDialog(ctk.CTkToplevel):
         self._entry.pack(fill="x", padx=10)
         self._entry.focus_set()
         self._entry.bind("<Return>", lambda event: self._submit())
+        if self._on_typing_paused is not None:
+            self._entry.bind("<KeyRelease>", lambda event: self._restart_pause_timer())
 
         if error_message:
             error_label = ctk.CTkLabel(
@@ -85,15 +105,35 @@ class VaultPasswordDialog(ctk.CTkToplevel):
 
         self.protocol("WM_DELETE_WINDOW", self._cancel)
 
+    def _restart_pause_timer(self) -> None:
+        """Reinicia la espera de pausa tras cada pulsación."""
+        self._cancel_pause_timer()
+        self._pause_job = self.after(self._typing_pause_ms, self._notify_typing_paused)
+
+    def _cancel_pause_timer(self) -> None:
+        """Anula la espera de pausa pendiente, si la hay."""
+        if self._pause_job is not None:
+            self.after_cancel(self._pause_job)
+            self._pause_job = None
+
+    def _notify_typing_paused(self) -> None:
+        """Avisa de la pausa con la contraseña escrita hasta ahora."""
+        self._pause_job = None
+        value = self._entry.get().strip()
+        if value and self._on_typing_paused is not None:
+            self._on_typing_paused(value)
+
     def _submit(self) -> None:
         value = self._entry.get().strip()
         if not value:
             return
         self._password = value
+        self._cancel_pause_timer()
         self.destroy()
 
     def _cancel(self) -> None:
         self._password = None
+        self._cancel_pause_timer()
         self.destroy()
 
     def get_password(self) -> Optional[str]:
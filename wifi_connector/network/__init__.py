@@ -1,5 +1,7 @@
 """Módulo de operaciones de red."""
 
+from wifi_connector.network.event_loop import BackgroundLoop
 from wifi_connector.network.manager import NetworkManager
+from wifi_connector.network.netsh_session import NetshSession
 
-__all__ = ["NetworkManager"]
+__all__ = ["BackgroundLoop", "NetworkManager", "NetshSession"]
@@ -0,0 +1,109 @@
+"""
+Bucle asyncio en un hilo de fondo para las operaciones de red.
+
+La GUI (tkinter) tiene su propio bucle en el hilo principal. Las operaciones
+de red asíncronas se envían a un único bucle asyncio que vive en un hilo
+daemon; submit() devuelve un concurrent.futures.Future al que la GUI puede
+añadir callbacks (reenviados con window.after) o cancelar.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional
+
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+class BackgroundLoop:
+    """Bucle asyncio compartido que se ejecuta en un hilo daemon."""
+
+    def __init__(self, name: str = "network-loop") -> None:
+        """
+        Inicializa el bucle sin arrancar todavía el hilo.
+
+        Args:
+            name: Nombre del hilo (aparece en los logs y depuradores)
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """True si el hilo del bucle está en marcha."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, coroutine: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """
+        Programa una corrutina en el bucle de fondo, arrancándolo si hace falta.
+
+        Args:
+            coroutine: Corrutina a ejecutar
+
+        Returns:
+            Future con el resultado; future.cancel() cancela la tarea asyncio
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_started())
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Cancela las tareas pendientes y detiene el hilo del bucle.
+
+        Args:
+            timeout: Segundos máximos de espera a que el hilo termine
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+
+        loop.call_soon_threadsafe(self._cancel_all, loop)
+        thread.join(timeout)
+        Logger.debug(t.LOOP_LOG_STOPPED, name=self.name)
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Arranca el hilo del bucle si no está en marcha y devuelve el bucle."""
+        with self._lock:
+            if self._loop is not None and self.is_running:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run, args=(loop, ready), name=self.name, daemon=True
+            )
+            thread.start()
+            ready.wait()
+            self._loop = loop
+            self._thread = thread
+            Logger.debug(t.LOOP_LOG_STARTED, name=self.name)
+            return loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        """Cuerpo del hilo: ejecuta el bucle hasta que se detiene."""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    @staticmethod
+    def _cancel_all(loop: asyncio.AbstractEventLoop) -> None:
+        """Cancela todas las tareas y detiene el bucle cuando terminan."""
+        tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+        for task in tasks:
+            task.cancel()
+
+        async def drain() -> None:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            loop.stop()
+
+        loop.create_task(drain())
@@ -6,9 +6,17 @@ en Windows usando comandos netsh, incluyendo escaneo de redes, gestión de conex
 e interacción con el panel de red.
 """
 
+import asyncio
 import subprocess
-import os
-from typing import List
+import threading
+from typing import List, Optional
+from wifi_connector.core.exceptions import ConnectionCancelledError, NetshSessionError
+from wifi_connector.network.netsh_session import NetshSession, is_query
+from wifi_connector.network.process_runner import (
+    DEFAULT_TIMEOUT,
+    run_process,
+    run_process_async,
+)
 from wifi_connector.utils.logger import Logger
 from wifi_connector.utils import translations as t
 
@@ -21,56 +29,83 @@ class NetworkManager:
     de redes, desconectarse de redes, y abrir el panel de red de Windows.
     """
 
-    def __init__(self) -> None:
-        """Inicializa el NetworkManager."""
+    def __init__(self, netsh_session: Optional[NetshSession] = None) -> None:
+        """
+        Inicializa el NetworkManager.
+
+        Args:
+            netsh_session: Sesión netsh persistente para las consultas. Si es
+                None, cada comando lanza su propio proceso netsh
+        """
+        self.netsh_session = netsh_session
         Logger.debug(t.NET_LOG_INIT)
 
-    def get_available_networks(self) -> List[str]:
+    def get_available_networks(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> List[str]:
         """
         Obtiene lista de redes WiFi disponibles.
 
         Ejecuta comando netsh para escanear redes disponibles y
         parsea la salida para extraer nombres SSID.
 
+        Args:
+            timeout: Segundos máximos de espera del escaneo
+            cancel_event: Si se activa, el escaneo se interrumpe
+
         Returns:
             Lista de nombres SSID de redes disponibles. Devuelve lista vacía
             si el comando falla o no se encuentran redes.
+
+        Raises:
+            ConnectionCancelledError: Si se activa cancel_event
         """
         Logger.info(t.NET_LOG_SCANNING)
 
         try:
             output = self._execute_netsh_command(
-                ["wlan", "show", "networks"]
+                ["wlan", "show", "networks"], timeout, cancel_event
             )
             networks = self._parse_network_list(output)
-            Logger.info(t.NET_LOG_FOUND_NETWORKS.format(count=len(networks)))
-            Logger.debug(t.NET_LOG_NETWORKS_LIST.format(networks=networks))
+            Logger.info(t.NET_LOG_FOUND_NETWORKS, count=len(networks))
+            Logger.debug(t.NET_LOG_NETWORKS_LIST, networks=networks)
             return networks
+        except ConnectionCancelledError:
+            raise
         except Exception as e:
-            Logger.error(
-                t.NET_ERROR_GET_NETWORKS.format(error=e),
-                exc_info=True
-            )
+            Logger.error(t.NET_ERROR_GET_NETWORKS, error=e, exc_info=True)
             return []
 
-    def is_network_available(self, ssid: str) -> bool:
+    def is_network_available(
+        self,
+        ssid: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> bool:
         """
         Verifica si una red específica está disponible.
 
         Args:
             ssid: SSID de la red a verificar
+            timeout: Segundos máximos de espera del escaneo
+            cancel_event: Si se activa, el escaneo se interrumpe
 
         Returns:
             True si la red está disponible, False en caso contrario
+
+        Raises:
+            ConnectionCancelledError: Si se activa cancel_event
         """
-        Logger.debug(t.NET_LOG_CHECKING_NETWORK.format(ssid=ssid))
-        networks = self.get_available_networks()
+        Logger.debug(t.NET_LOG_CHECKING_NETWORK, ssid=ssid)
+        networks = self.get_available_networks(timeout, cancel_event)
         is_available = ssid in networks
 
         if is_available:
-            Logger.info(t.NET_LOG_NETWORK_AVAILABLE.format(ssid=ssid))
+            Logger.info(t.NET_LOG_NETWORK_AVAILABLE, ssid=ssid)
         else:
-            Logger.warning(t.NET_LOG_NETWORK_NOT_AVAILABLE.format(ssid=ssid))
+            Logger.warning(t.NET_LOG_NETWORK_NOT_AVAILABLE, ssid=ssid)
 
         return is_available
 
@@ -88,44 +123,137 @@ class NetworkManager:
             Logger.info(t.NET_LOG_DISCONNECT_SUCCESS)
             return True
         except Exception as e:
-            Logger.error(
-                t.NET_ERROR_DISCONNECT.format(error=e),
-                exc_info=True
+            Logger.error(t.NET_ERROR_DISCONNECT, error=e, exc_info=True)
+            return False
+
+    # ─────────────────────────────────────────────────────────────────────────────
+    # Variantes asíncronas (para el bucle de fondo de la GUI)
+    # ─────────────────────────────────────────────────────────────────────────────
+
+    async def get_available_networks_async(self) -> List[str]:
+        """
+        Variante asíncrona de get_available_networks().
+
+        Returns:
+            Lista de nombres SSID de redes disponibles (vacía si falla)
+        """
+        Logger.info(t.NET_LOG_SCANNING)
+
+        try:
+            output = await self._execute_netsh_command_async(
+                ["wlan", "show", "networks"]
             )
+            networks = self._parse_network_list(output)
+            Logger.info(t.NET_LOG_FOUND_NETWORKS, count=len(networks))
+            Logger.debug(t.NET_LOG_NETWORKS_LIST, networks=networks)
+            return networks
+        except Exception as e:
+            Logger.error(t.NET_ERROR_GET_NETWORKS, error=e, exc_info=True)
+            return []
+
+    async def disconnect_async(self) -> bool:
+        """
+        Variante asíncrona de disconnect().
+
+        Returns:
+            True si la desconexión fue exitosa, False en caso contrario
+        """
+        Logger.info(t.NET_LOG_DISCONNECTING)
+
+        try:
+            await self._execute_netsh_command_async(["wlan", "disconnect"])
+            Logger.info(t.NET_LOG_DISCONNECT_SUCCESS)
+            return True
+        except Exception as e:
+            Logger.error(t.NET_ERROR_DISCONNECT, error=e, exc_info=True)
             return False
 
+    async def _execute_netsh_command_async(self, args: List[str]) -> str:
+        """
+        Variante asíncrona de _execute_netsh_command().
 
+        Las consultas que van por la sesión netsh persistente (síncrona) se
+        ejecutan en un hilo del ejecutor para no bloquear el bucle.
 
-    def _execute_netsh_command(self, args: List[str]) -> str:
+        Raises:
+            subprocess.CalledProcessError: Si la ejecución del comando falla
+            CommandTimeoutError: Si netsh no responde dentro del plazo
+        """
+        command = ["netsh"] + args
+        Logger.debug(t.NET_LOG_EXECUTING_CMD, command=' '.join(command))
+
+        if (
+            self.netsh_session is not None
+            and self.netsh_session.is_available
+            and is_query(args)
+        ):
+            try:
+                output = await asyncio.to_thread(self.netsh_session.run, args)
+                return output.decode('cp850', errors='replace')
+            except NetshSessionError as e:
+                Logger.warning(t.NETSH_SESSION_LOG_FALLBACK, error=e)
+
+        try:
+            result = await run_process_async(command, check=True, encoding='cp850')
+            return result.stdout
+        except subprocess.CalledProcessError as e:
+            Logger.error(t.NET_LOG_CMD_FAILED, code=e.returncode)
+            Logger.debug(t.NET_LOG_CMD_OUTPUT, output=e.output)
+            raise
+
+    def _execute_netsh_command(
+        self,
+        args: List[str],
+        timeout: float = DEFAULT_TIMEOUT,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> str:
         """
         Ejecuta comando netsh y devuelve la salida.
 
         Args:
             args: Lista de argumentos de comando a pasar a netsh
+            timeout: Segundos máximos de ejecución
+            cancel_event: Si se activa, el comando se interrumpe (se mata
+                el proceso o la sesión netsh)
 
         Returns:
             Salida del comando como cadena decodificada con codificación CP850
 
         Raises:
             subprocess.CalledProcessError: Si la ejecución del comando falla
+            CommandTimeoutError: Si netsh no responde dentro del plazo
+            ConnectionCancelledError: Si se activa cancel_event
         """
         command = ["netsh"] + args
-        Logger.debug(t.NET_LOG_EXECUTING_CMD.format(command=' '.join(command)))
+        Logger.debug(t.NET_LOG_EXECUTING_CMD, command=' '.join(command))
+
+        if (
+            self.netsh_session is not None
+            and self.netsh_session.is_available
+            and is_query(args)
+        ):
+            try:
+                output = self.netsh_session.run(
+                    args,
+                    timeout=min(timeout, self.netsh_session.timeout),
+                    cancel_event=cancel_event,
+                )
+                return output.decode('cp850', errors='replace')
+            except NetshSessionError as e:
+                Logger.warning(t.NETSH_SESSION_LOG_FALLBACK, error=e)
 
         try:
-            result = subprocess.run(
+            result = run_process(
                 command,
+                timeout=timeout,
                 check=True,
-                capture_output=True,
                 encoding='cp850',
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+                cancel_event=cancel_event,
             )
             return result.stdout
         except subprocess.CalledProcessError as e:
-            Logger.error(
-                t.NET_LOG_CMD_FAILED.format(code=e.returncode)
-            )
-            Logger.debug(t.NET_LOG_CMD_OUTPUT.format(output=e.output))
+            Logger.error(t.NET_LOG_CMD_FAILED, code=e.returncode)
+            Logger.debug(t.NET_LOG_CMD_OUTPUT, output=e.output)
             raise
 
     def _parse_network_list(self, output: str) -> List[str]:
@@ -154,5 +282,5 @@ class NetworkManager:
                         if ssid and ssid not in networks:
                             networks.append(ssid)
 
-        Logger.debug(t.NET_LOG_PARSED_SSIDS.format(count=len(networks)))
+        Logger.debug(t.NET_LOG_PARSED_SSIDS, count=len(networks))
         return networks
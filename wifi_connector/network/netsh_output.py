@@ -0,0 +1,291 @@
+"""
+Clasificación de la salida de netsh y WLANSetEAPUserData en resultados tipados.
+
+La salida de netsh está en el idioma de Windows y, según la página de códigos
+con que se decodifica, las letras acentuadas pueden llegar cambiadas. Por eso
+el texto se normaliza una sola vez (minúsculas, sin acentos ni caracteres no
+ASCII, espacios simples) y se busca con una única expresión regular
+precompilada que reúne las frases de cada resultado en catalán, castellano,
+inglés y francés. Donde va una letra acentuada los patrones aceptan
+cualquier carácter o ninguno ("ubicaci.?n"), así que la misma tabla sirve
+tanto para el texto bien decodificado como para el mal decodificado.
+
+parse_interfaces() convierte la salida de "netsh wlan show interfaces" en
+un WlanInterface por adaptador, en una sola pasada y con las etiquetas de
+los mismos cuatro idiomas.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+
+class NetshOutcome(Enum):
+    """Resultados reconocibles en la salida de un comando."""
+
+    SUCCESS = "success"
+    ALREADY_EXISTS = "already_exists"
+    NOT_FOUND = "not_found"
+    NOT_AVAILABLE = "not_available"
+    PERMISSION = "permission"
+
+
+# Frases por resultado e idioma, sobre el texto normalizado
+_PHRASES: Dict[NetshOutcome, Dict[str, Tuple[str, ...]]] = {
+    NetshOutcome.PERMISSION: {
+        "ca": (r"ubicaci", r"elevaci", r"acc.?s denegat"),
+        "es": (r"ubicaci", r"elevaci", r"acceso denegado"),
+        "en": (r"\blocation", r"elevation", r"access (?:is )?denied"),
+        "fr": (r"localisation", r".?l.?vation", r"acc.?s refus"),
+        # API WLAN y código de error 5 (ERROR_ACCESS_DENIED), en cualquier idioma
+        "api": (r"wlangetavailablenetworklist", r"\berror:? ?5\b"),
+    },
+    NetshOutcome.ALREADY_EXISTS: {
+        "ca": (r"ja existeix", r"ja est.? (?:afegit|instal)"),
+        "es": (r"ya est.? ", r"ya existe"),
+        "en": (r"already",),
+        "fr": (r"existe d.?j.?", r"d.?j.? pr.?sent"),
+    },
+    NetshOutcome.NOT_FOUND: {
+        "ca": (r"no s.?ha trobat", r"no es troba", r"no existeix", r"no hi ha cap perfil"),
+        "es": (r"no se encontr", r"no se encuentra", r"no existe", r"no hay ning.?n perfil"),
+        "en": (r"not found", r"does ?n.?t exist", r"does not exist", r"there is no profile"),
+        "fr": (r"introuvable", r"n.?existe pas", r"aucun profil"),
+    },
+    NetshOutcome.NOT_AVAILABLE: {
+        "ca": (r"no (?:est.? )?disponible",),
+        "es": (r"no (?:est.? )?disponible",),
+        "en": (r"not available", r"unavailable"),
+        "fr": (r"indisponible", r"non disponible", r"n.?est pas disponible"),
+    },
+    NetshOutcome.SUCCESS: {
+        "ca": (r"correctament",),
+        "es": (r"correctamente",),
+        "en": (r"successfully",),
+        "fr": (r"avec succ",),
+    },
+}
+
+_GROUPS = {outcome.value: outcome for outcome in NetshOutcome}
+_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{outcome.value}>"
+        + "|".join(sorted({p for phrases in by_language.values() for p in phrases}))
+        + ")"
+        for outcome, by_language in _PHRASES.items()
+    )
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """
+    Forma normalizada de una salida: minúsculas, sin acentos ni caracteres
+    no ASCII y con los espacios agrupados.
+
+    Args:
+        text: Salida del comando tal como se ha decodificado
+
+    Returns:
+        Texto normalizado
+    """
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return _WHITESPACE.sub(" ", ascii_text.casefold()).strip()
+
+
+@dataclass(frozen=True)
+class NetshOutput:
+    """Salida clasificada de un comando.
+
+    Atributos:
+        text: Texto normalizado (ver normalize)
+        outcomes: Resultados reconocidos en el texto
+    """
+
+    text: str
+    outcomes: FrozenSet[NetshOutcome]
+
+    def has(self, *outcomes: NetshOutcome) -> bool:
+        """True si la salida contiene alguno de los resultados indicados."""
+        return any(outcome in self.outcomes for outcome in outcomes)
+
+
+def classify(*outputs: str) -> NetshOutput:
+    """
+    Clasifica la salida de un comando (p. ej. stdout y stderr) en una pasada.
+
+    Args:
+        *outputs: Textos de la salida; se analizan juntos
+
+    Returns:
+        NetshOutput con el texto normalizado y los resultados reconocidos
+    """
+    text = normalize(" ".join(outputs))
+    found = set()
+    for match in _PATTERN.finditer(text):
+        found.add(_GROUPS[match.lastgroup])
+    return NetshOutput(text=text, outcomes=frozenset(found))
+
+
+# Etiquetas de "netsh wlan show interfaces" normalizadas, sin la unidad entre
+# paréntesis, y el campo de WlanInterface al que corresponden
+_INTERFACE_LABELS: Dict[str, str] = {
+    "name": "name", "nombre": "name", "nom": "name",
+    "state": "state", "estado": "state", "estat": "state", "etat": "state",
+    "tat": "state",  # "État" con la É perdida por la página de códigos
+    "ssid": "ssid",
+    "bssid": "bssid",
+    "radio type": "radio_type", "tipo de radio": "radio_type",
+    "tipus de radio": "radio_type", "type de radio": "radio_type",
+    "authentication": "authentication", "autenticacion": "authentication",
+    "autenticacio": "authentication", "authentification": "authentication",
+    "channel": "channel", "canal": "channel",
+    "receive rate": "receive_rate", "velocidad de recepcion": "receive_rate",
+    "velocitat de recepcio": "receive_rate", "reception": "receive_rate",
+    "debit de reception": "receive_rate", "vitesse de reception": "receive_rate",
+    "transmit rate": "transmit_rate", "velocidad de transmision": "transmit_rate",
+    "velocitat de transmissio": "transmit_rate", "transmission": "transmit_rate",
+    "debit de transmission": "transmit_rate", "vitesse de transmission": "transmit_rate",
+    "signal": "signal", "senal": "signal", "senyal": "signal",
+    "profile": "profile", "perfil": "profile", "profil": "profile",
+}
+
+# Estados por orden de comprobación: "desconectado" contiene "conectado"
+_INTERFACE_STATES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("disconnected", ("disconnect", "desconect", "desconnect", "deconnect")),
+    ("authenticating", ("authenticat", "autentica", "authentifica")),
+    ("connecting", ("connecting", "conectando", "connectant", "en cours", "associ", "asocia")),
+    ("connected", ("connect", "conect")),
+)
+
+_NUMBER = re.compile(r"-?\d+(?:[.,]\d+)?")
+
+
+@dataclass(frozen=True)
+class WlanInterface:
+    """Un adaptador de "netsh wlan show interfaces".
+
+    Los campos que netsh no muestra (p. ej. SSID o señal sin conexión) son None.
+
+    Atributos:
+        name: Nombre del adaptador ("Wi-Fi")
+        state: Estado normalizado: "connected", "disconnected",
+            "authenticating", "connecting" o None si no se reconoce
+        ssid: Red a la que está asociado
+        bssid: Punto de acceso
+        radio_type: Tipo de radio ("802.11ac")
+        authentication: Autenticación ("WPA2-Enterprise")
+        channel: Canal
+        receive_rate: Velocidad de recepción en Mbps
+        transmit_rate: Velocidad de transmisión en Mbps
+        signal: Calidad de la señal en porcentaje
+        profile: Perfil en uso
+    """
+
+    name: Optional[str] = None
+    state: Optional[str] = None
+    ssid: Optional[str] = None
+    bssid: Optional[str] = None
+    radio_type: Optional[str] = None
+    authentication: Optional[str] = None
+    channel: Optional[int] = None
+    receive_rate: Optional[float] = None
+    transmit_rate: Optional[float] = None
+    signal: Optional[int] = None
+    profile: Optional[str] = None
+
+    def is_network(self, ssid: str) -> bool:
+        """True si el adaptador está en la red indicada (por SSID o perfil)."""
+        target = ssid.casefold()
+        return any(
+            value is not None and value.casefold() == target
+            for value in (self.ssid, self.profile)
+        )
+
+
+@lru_cache(maxsize=256)
+def _interface_field(label: str) -> Optional[str]:
+    """Campo de WlanInterface de una etiqueta tal como sale en netsh."""
+    key = normalize(label.split("(", 1)[0])
+    return _INTERFACE_LABELS.get(key)
+
+
+def _interface_state(value: str) -> Optional[str]:
+    """Estado normalizado de un valor de la línea de estado."""
+    text = normalize(value)
+    for state, prefixes in _INTERFACE_STATES:
+        if any(prefix in text for prefix in prefixes):
+            return state
+    return None
+
+
+def _number(value: str) -> Optional[float]:
+    """Primer número de un valor ("866,7", "92%"), o None si no hay."""
+    match = _NUMBER.search(value)
+    if not match:
+        return None
+    return float(match.group(0).replace(",", "."))
+
+
+def _interface_value(field: str, value: str):
+    """Convierte el texto de un campo a su tipo."""
+    if field == "state":
+        return _interface_state(value)
+    if field in ("channel", "signal"):
+        number = _number(value)
+        return None if number is None else int(number)
+    if field in ("receive_rate", "transmit_rate"):
+        return _number(value)
+    return value or None
+
+
+def parse_interfaces(output: str) -> List[WlanInterface]:
+    """
+    Analiza la salida de "netsh wlan show interfaces" en una sola pasada.
+
+    Cada línea "Nombre : ..." empieza un adaptador nuevo; también un campo
+    que se repite, por si la salida no trae nombres.
+
+    Args:
+        output: Salida del comando (en cualquiera de los idiomas soportados)
+
+    Returns:
+        Un WlanInterface por adaptador, en el orden de la salida
+    """
+    interfaces: List[WlanInterface] = []
+    current: Dict[str, object] = {}
+    for line in output.splitlines():
+        label, separator, value = line.partition(":")
+        if not separator:
+            continue
+        field = _interface_field(label.strip())
+        if field is None:
+            continue
+        if current and (field == "name" or field in current):
+            interfaces.append(WlanInterface(**current))
+            current = {}
+        current[field] = _interface_value(field, value.strip())
+    if current:
+        interfaces.append(WlanInterface(**current))
+    return interfaces
+
+
+def find_interface(
+    interfaces: Sequence[WlanInterface], ssid: str
+) -> Optional[WlanInterface]:
+    """
+    Adaptador que está en la red indicada.
+
+    Si hay varios (p. ej. dos adaptadores WiFi), se prefiere el conectado.
+
+    Returns:
+        El adaptador, o None si ninguno está en esa red
+    """
+    matches = [interface for interface in interfaces if interface.is_network(ssid)]
+    for interface in matches:
+        if interface.state == "connected":
+            return interface
+    return matches[0] if matches else None
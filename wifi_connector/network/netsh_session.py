@@ -0,0 +1,281 @@
+"""
+Sesión interactiva persistente de netsh.
+
+Lanzar netsh cuesta un proceso nuevo por comando, y en los equipos de los
+centros (con antivirus que interceptan cada creación de proceso) ese coste
+domina el tiempo de las consultas. Este módulo mantiene un único netsh en
+modo interactivo, le envía los comandos por stdin y delimita cada respuesta
+con un centinela: tras el comando se envía una palabra desconocida y única,
+que netsh devuelve dentro de su mensaje de "comando no encontrado" en
+cualquier idioma.
+
+La sesión se usa solo para consultas (comandos "show"): en modo interactivo
+netsh no informa del código de retorno, así que los comandos que modifican
+el sistema siguen lanzándose como proceso propio.
+
+Si netsh no responde a tiempo se mata y la siguiente consulta arranca uno
+nuevo. Si vuelve a pasar seguido (p. ej. si retiene la salida cuando no
+escribe en una consola) la sesión se desactiva para el resto de la
+ejecución y las consultas vuelven a lanzar un proceso cada una.
+"""
+
+import os
+import queue
+import subprocess
+import threading
+import time
+import uuid
+from typing import List, Optional, Sequence
+
+from wifi_connector.core.exceptions import ConnectionCancelledError, NetshSessionError
+from wifi_connector.network.process_runner import CANCEL_POLL_INTERVAL, latency_stats
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+DEFAULT_TIMEOUT = 10.0
+CLOSE_TIMEOUT = 2.0
+MAX_TIMEOUTS = 2
+
+
+def is_query(args: Sequence[str]) -> bool:
+    """
+    Indica si unos argumentos de netsh corresponden a una consulta.
+
+    Args:
+        args: Argumentos de netsh sin el ejecutable (p. ej. ["wlan", "show", "interfaces"])
+
+    Returns:
+        True si el comando es de solo lectura ("<contexto> show ...")
+    """
+    return len(args) >= 2 and args[1].lower() == "show"
+
+
+class NetshSession:
+    """
+    Proceso netsh interactivo reutilizable entre comandos.
+
+    El proceso se inicia en la primera llamada a run() y se reinicia de forma
+    transparente si termina inesperadamente o deja de responder. Tras
+    MAX_TIMEOUTS esperas agotadas seguidas la sesión queda desactivada
+    (is_available es False). Las llamadas se serializan, por lo que una
+    sesión puede compartirse entre hilos.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str] = ("netsh",),
+        prompt: bytes = b"netsh>",
+        timeout: float = DEFAULT_TIMEOUT,
+        encoding: str = "cp850",
+    ) -> None:
+        """
+        Inicializa la sesión sin lanzar todavía el proceso.
+
+        Args:
+            command: Comando que arranca el intérprete interactivo
+            prompt: Prompt que el intérprete escribe antes de cada respuesta
+            timeout: Segundos máximos de espera por respuesta
+            encoding: Codificación con la que se escriben los comandos
+        """
+        self.command = list(command)
+        self.prompt = prompt
+        self.timeout = timeout
+        self.encoding = encoding
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: Optional[queue.Queue] = None
+        self._unavailable = False
+        self._timeouts = 0
+
+    @property
+    def is_alive(self) -> bool:
+        """True si el proceso interactivo está en marcha."""
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def is_available(self) -> bool:
+        """False si netsh no se pudo iniciar o dejó de responder varias veces seguidas."""
+        return not self._unavailable
+
+    def run(
+        self,
+        args: Sequence[str],
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> bytes:
+        """
+        Ejecuta un comando en la sesión y devuelve su salida.
+
+        Si el proceso había terminado se reinicia y se reintenta una vez.
+        Si no responde a tiempo se mata y la siguiente llamada arranca uno
+        nuevo; tras MAX_TIMEOUTS esperas agotadas seguidas la sesión queda
+        desactivada y las llamadas fallan enseguida con NetshSessionError.
+
+        Args:
+            args: Argumentos de netsh sin el ejecutable
+            timeout: Segundos máximos de espera. Si es None, usa self.timeout
+            cancel_event: Evento que, al activarse, interrumpe la espera
+
+        Returns:
+            Salida del comando (stdout y stderr combinados) sin prompts
+
+        Raises:
+            NetshSessionError: Si netsh no se puede iniciar, termina dos veces
+                seguidas, no responde a tiempo o la sesión está desactivada
+            ConnectionCancelledError: Si se activa cancel_event (el proceso
+                se mata y la siguiente llamada arranca uno nuevo)
+        """
+        if timeout is None:
+            timeout = self.timeout
+        line = subprocess.list2cmdline(list(args))
+
+        with self._lock:
+            for attempt in (1, 2):
+                self._ensure_started()
+                started = time.monotonic()
+                try:
+                    output = self._exchange(line, timeout, cancel_event)
+                    self._timeouts = 0
+                    latency_stats.record("netsh-session", time.monotonic() - started)
+                    return output
+                except (BrokenPipeError, EOFError):
+                    self._stop()
+                if attempt == 1:
+                    Logger.warning(t.NETSH_SESSION_LOG_RESTARTING, command=line)
+
+            raise NetshSessionError(t.NETSH_SESSION_ERROR_DIED.format(command=line))
+
+    def close(self) -> None:
+        """Termina el proceso interactivo si está en marcha."""
+        with self._lock:
+            if self._process is not None:
+                self._stop()
+                Logger.debug(t.NETSH_SESSION_LOG_CLOSED)
+
+    def _ensure_started(self) -> None:
+        """Lanza el proceso interactivo si no está en marcha."""
+        if self._unavailable:
+            raise NetshSessionError(t.NETSH_SESSION_ERROR_UNAVAILABLE)
+        if self.is_alive:
+            return
+        if self._process is not None:
+            self._stop()
+
+        try:
+            process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+            )
+        except OSError as e:
+            self._unavailable = True
+            raise NetshSessionError(
+                t.NETSH_SESSION_ERROR_START.format(error=e)
+            ) from e
+
+        lines: queue.Queue = queue.Queue()
+        reader = threading.Thread(
+            target=self._read_lines,
+            args=(process.stdout, lines),
+            name="netsh-session-reader",
+            daemon=True,
+        )
+        reader.start()
+        self._process = process
+        self._lines = lines
+        Logger.debug(t.NETSH_SESSION_LOG_STARTED, pid=process.pid)
+
+    def _exchange(
+        self, line: str, timeout: float, cancel_event: Optional[threading.Event]
+    ) -> bytes:
+        """
+        Envía un comando seguido del centinela y lee hasta encontrarlo.
+
+        Raises:
+            BrokenPipeError: Si no se puede escribir en el proceso
+            EOFError: Si el proceso termina antes del centinela
+            NetshSessionError: Si se agota el tiempo de espera
+            ConnectionCancelledError: Si se activa cancel_event
+        """
+        token = f"wc_end_{uuid.uuid4().hex}"
+        payload = f"{line}\n{token}\n".encode(self.encoding, errors="replace")
+        try:
+            self._process.stdin.write(payload)
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            raise BrokenPipeError(str(e)) from e
+
+        marker = token.encode("ascii")
+        output: List[bytes] = []
+        deadline = time.monotonic() + timeout
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                self._stop(kill=True)
+                raise ConnectionCancelledError(
+                    t.PROCESS_ERROR_CANCELLED.format(program="netsh")
+                )
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._stop(kill=True)
+                self._timeouts += 1
+                if self._timeouts >= MAX_TIMEOUTS:
+                    Logger.warning(t.NETSH_SESSION_LOG_DISABLED, command=line)
+                    self._unavailable = True
+                else:
+                    Logger.warning(t.NETSH_SESSION_LOG_TIMEOUT, command=line)
+                raise NetshSessionError(
+                    t.NETSH_SESSION_ERROR_TIMEOUT.format(command=line, timeout=timeout)
+                )
+            try:
+                received = self._lines.get(timeout=min(remaining, CANCEL_POLL_INTERVAL))
+            except queue.Empty:
+                continue
+            if received is None:
+                raise EOFError(line)
+            if marker in received:
+                return b"".join(output)
+            output.append(self._strip_prompt(received))
+
+    def _strip_prompt(self, line: bytes) -> bytes:
+        """Elimina los prompts que el intérprete deja al inicio de la línea."""
+        while self.prompt and line.lstrip().startswith(self.prompt):
+            line = line.lstrip()[len(self.prompt):]
+        return line
+
+    def _stop(self, kill: bool = False) -> None:
+        """
+        Cierra stdin y espera al proceso; lo mata si no termina.
+
+        Args:
+            kill: Matar el proceso directamente (p. ej. si no responde)
+        """
+        process = self._process
+        self._process = None
+        self._lines = None
+        if process is None:
+            return
+        if kill:
+            process.kill()
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=CLOSE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    @staticmethod
+    def _read_lines(stream, lines: queue.Queue) -> None:
+        """Copia las líneas de stdout a la cola; None marca el fin del proceso."""
+        try:
+            for raw in iter(stream.readline, b""):
+                lines.put(raw)
+        except (OSError, ValueError):
+            pass
+        finally:
+            lines.put(None)
@@ -0,0 +1,461 @@
+"""
+Ejecución de comandos externos con plazo, terminación del árbol y vigilancia.
+
+subprocess.run sin timeout deja el hilo que lo llama bloqueado para siempre
+si netsh o WLANSetEAPUserData.exe se cuelgan. run_process() ofrece la misma
+interfaz básica pero con plazo obligatorio: al agotarse mata el proceso y
+todos sus descendientes (taskkill /T en Windows, grupo de procesos en POSIX)
+y lanza CommandTimeoutError.
+
+Cada comando queda registrado en un vigilante (CommandWatchdog) que avisa en
+el log de los que siguen en marcha pasado un umbral, y su duración se
+acumula en LatencyStats para poder registrar medianas y colas (p95).
+
+run_process_async() es la variante para asyncio (create_subprocess_exec),
+con el mismo plazo y además cancelable: cancelar la tarea también termina
+el árbol de procesos.
+
+Además, cada comando se registra como span "process.<programa>" en la traza
+de tiempos del intento de conexión en curso.
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence
+
+from wifi_connector.core.exceptions import CommandTimeoutError, ConnectionCancelledError
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils.timing import span_recorder
+from wifi_connector.utils import translations as t
+
+
+DEFAULT_TIMEOUT = 30.0
+KILL_GRACE = 5.0
+CANCEL_POLL_INTERVAL = 0.1
+SLOW_COMMAND_SECONDS = 2.0
+
+
+def _program_name(command: Sequence[str]) -> str:
+    """Nombre corto del programa (sin ruta ni extensión) para logs y estadísticas."""
+    return os.path.splitext(os.path.basename(command[0]))[0] if command else "?"
+
+
+class LatencyStats:
+    """
+    Duraciones acumuladas de los comandos ejecutados, por programa.
+
+    De cada programa se guardan solo las últimas max_samples duraciones, así
+    que la memoria no crece en una sesión larga y la mediana y el p95 se
+    calculan sobre esa ventana. El número de comandos y el máximo cuentan
+    todos los registrados.
+    """
+
+    DEFAULT_MAX_SAMPLES = 1024
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES) -> None:
+        """
+        Inicializa las estadísticas vacías.
+
+        Args:
+            max_samples: Duraciones que se guardan por programa
+        """
+        self._lock = threading.Lock()
+        self._max_samples = max_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._peaks: Dict[str, float] = {}
+
+    def record(self, program: str, duration: float) -> None:
+        """
+        Añade la duración de un comando.
+
+        Args:
+            program: Nombre del programa ejecutado
+            duration: Duración en segundos
+        """
+        with self._lock:
+            samples = self._samples.get(program)
+            if samples is None:
+                samples = self._samples[program] = deque(maxlen=self._max_samples)
+            samples.append(duration)
+            self._counts[program] = self._counts.get(program, 0) + 1
+            self._peaks[program] = max(self._peaks.get(program, duration), duration)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Calcula mediana y p95 (sobre las últimas duraciones) y máximo por programa.
+
+        Returns:
+            Diccionario {programa: {"count", "p50", "p95", "max"}} en segundos
+        """
+        with self._lock:
+            snapshot = {
+                name: (sorted(values), self._counts[name], self._peaks[name])
+                for name, values in self._samples.items()
+            }
+
+        result = {}
+        for name, (values, count, peak) in snapshot.items():
+            window = len(values)
+            result[name] = {
+                "count": count,
+                "p50": values[(window - 1) // 2],
+                "p95": values[max(0, -(-95 * window // 100) - 1)],
+                "max": peak,
+            }
+        return result
+
+    def log_summary(self) -> None:
+        """Registra en el log la mediana, el p95 y el máximo de cada programa."""
+        for name, stats in sorted(self.summary().items()):
+            Logger.info(
+                t.PROCESS_LOG_LATENCY_SUMMARY,
+                program=name,
+                count=stats["count"],
+                p50=stats["p50"] * 1000,
+                p95=stats["p95"] * 1000,
+                max=stats["max"] * 1000,
+            )
+
+
+@dataclass
+class _WatchedCommand:
+    """Comando en ejecución vigilado por CommandWatchdog."""
+
+    command: str
+    pid: int
+    started: float
+    reported: int = 0
+
+
+class CommandWatchdog:
+    """
+    Hilo de fondo que avisa de comandos que siguen en marcha demasiado tiempo.
+
+    Cada comando se avisa una vez por cada múltiplo de stall_after segundos
+    que lleve en ejecución. El hilo se inicia con el primer comando vigilado.
+    """
+
+    def __init__(self, stall_after: float = 10.0, interval: float = 1.0) -> None:
+        """
+        Inicializa el vigilante.
+
+        Args:
+            stall_after: Segundos en ejecución a partir de los cuales se avisa
+            interval: Cada cuántos segundos se revisan los comandos
+        """
+        self.stall_after = stall_after
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._watched: Dict[int, _WatchedCommand] = {}
+        self._next_id = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, command: Sequence[str], pid: int) -> int:
+        """
+        Empieza a vigilar un comando.
+
+        Args:
+            command: Comando ejecutado
+            pid: PID del proceso
+
+        Returns:
+            Identificador para unregister()
+        """
+        with self._lock:
+            self._next_id += 1
+            watch_id = self._next_id
+            self._watched[watch_id] = _WatchedCommand(
+                command=" ".join(command), pid=pid, started=time.monotonic()
+            )
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._loop, name="command-watchdog", daemon=True
+                )
+                self._thread.start()
+        return watch_id
+
+    def unregister(self, watch_id: int) -> None:
+        """Deja de vigilar un comando."""
+        with self._lock:
+            self._watched.pop(watch_id, None)
+
+    def check(self) -> List[str]:
+        """
+        Revisa los comandos vigilados y avisa de los que se han estancado.
+
+        Returns:
+            Comandos de los que se ha avisado en esta revisión
+        """
+        now = time.monotonic()
+        stalled = []
+        with self._lock:
+            for watched in self._watched.values():
+                elapsed = now - watched.started
+                level = int(elapsed // self.stall_after)
+                if level > watched.reported:
+                    watched.reported = level
+                    stalled.append((watched, elapsed))
+
+        for watched, elapsed in stalled:
+            Logger.warning(
+                t.PROCESS_LOG_STALLED,
+                command=watched.command,
+                pid=watched.pid,
+                elapsed=elapsed,
+            )
+        return [watched.command for watched, _ in stalled]
+
+    def _loop(self) -> None:
+        """Revisa periódicamente mientras queden comandos vigilados."""
+        while True:
+            time.sleep(self.interval)
+            self.check()
+            with self._lock:
+                if not self._watched:
+                    self._thread = None
+                    return
+
+
+watchdog = CommandWatchdog()
+latency_stats = LatencyStats()
+
+
+def _kill_tree(pid: int) -> None:
+    """Mata el proceso pid y todos sus descendientes."""
+    try:
+        if os.name == "nt":
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(pid)],
+                capture_output=True,
+                check=False,
+                timeout=KILL_GRACE,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            )
+        else:
+            os.killpg(pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError) as e:
+        Logger.warning(t.PROCESS_LOG_TREE_KILL_FAILED, pid=pid, error=e)
+
+
+def kill_process_tree(process: subprocess.Popen) -> None:
+    """
+    Mata un proceso y todos sus descendientes.
+
+    En Windows usa taskkill /T; en POSIX el proceso se lanza como líder de su
+    propio grupo, así que basta con enviar SIGKILL al grupo.
+
+    Args:
+        process: Proceso lanzado por run_process
+    """
+    if process.poll() is not None:
+        return
+    _kill_tree(process.pid)
+    if process.poll() is None:
+        process.kill()
+
+
+def _record_aborted(program: str, elapsed: float, status: str) -> None:
+    """Acumula la duración de un comando terminado por plazo o cancelación."""
+    latency_stats.record(program, elapsed)
+    span_recorder.add(f"process.{program}", elapsed, status=status)
+
+
+def _record_finished(program: str, elapsed: float, returncode: int) -> None:
+    """Acumula la duración de un comando terminado y la registra en el log."""
+    latency_stats.record(program, elapsed)
+    span_recorder.add(
+        f"process.{program}",
+        elapsed,
+        status="ok" if returncode == 0 else "error",
+        returncode=returncode,
+    )
+    if elapsed >= SLOW_COMMAND_SECONDS:
+        Logger.warning(
+            t.PROCESS_LOG_SLOW,
+            program=program,
+            duration_ms=elapsed * 1000,
+            returncode=returncode,
+        )
+    else:
+        Logger.debug(
+            t.PROCESS_LOG_FINISHED,
+            program=program,
+            duration_ms=elapsed * 1000,
+            returncode=returncode,
+        )
+
+
+def run_process(
+    command: Sequence[str],
+    timeout: float = DEFAULT_TIMEOUT,
+    check: bool = False,
+    encoding: Optional[str] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Ejecuta un comando capturando su salida, con plazo máximo.
+
+    Args:
+        command: Lista con el comando y sus argumentos
+        timeout: Segundos máximos de ejecución
+        check: Lanzar CalledProcessError si el código de retorno no es 0
+        encoding: Si se indica, stdout y stderr se devuelven decodificados
+        cancel_event: Si se activa mientras el comando está en marcha, se
+            termina el árbol de procesos y se lanza ConnectionCancelledError
+
+    Returns:
+        CompletedProcess con returncode, stdout y stderr
+
+    Raises:
+        CommandTimeoutError: Si el comando supera el plazo (ya terminado)
+        ConnectionCancelledError: Si se activa cancel_event (ya terminado)
+        subprocess.CalledProcessError: Si check es True y el comando falla
+        OSError: Si el programa no se puede ejecutar
+    """
+    command = list(command)
+    program = _program_name(command)
+    started = time.monotonic()
+    if cancel_event is not None and cancel_event.is_set():
+        raise ConnectionCancelledError(t.PROCESS_ERROR_CANCELLED.format(program=program))
+
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        stdin=subprocess.DEVNULL,
+        encoding=encoding,
+        creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+        start_new_session=os.name != "nt",
+    )
+    watch_id = watchdog.register(command, process.pid)
+    deadline = started + timeout
+    try:
+        while True:
+            # Con cancel_event se espera por tramos para poder reaccionar
+            remaining = deadline - time.monotonic()
+            wait = remaining if cancel_event is None else min(
+                remaining, CANCEL_POLL_INTERVAL
+            )
+            try:
+                stdout, stderr = process.communicate(timeout=max(wait, 0))
+                break
+            except subprocess.TimeoutExpired:
+                cancelled = cancel_event is not None and cancel_event.is_set()
+                if not cancelled and time.monotonic() < deadline:
+                    continue
+
+            kill_process_tree(process)
+            try:
+                process.communicate(timeout=KILL_GRACE)
+            except subprocess.TimeoutExpired:
+                # Algún descendiente mantiene las tuberías abiertas; no se espera más
+                Logger.warning(t.PROCESS_LOG_PIPES_HELD, program=program)
+            _record_aborted(
+                program,
+                time.monotonic() - started,
+                "cancelled" if cancelled else "timeout",
+            )
+            if cancelled:
+                Logger.info(t.PROCESS_LOG_CANCELLED, command=" ".join(command))
+                raise ConnectionCancelledError(
+                    t.PROCESS_ERROR_CANCELLED.format(program=program)
+                )
+            Logger.error(
+                t.PROCESS_LOG_TIMEOUT, command=" ".join(command), timeout=timeout
+            )
+            raise CommandTimeoutError(
+                t.PROCESS_ERROR_TIMEOUT.format(program=program, timeout=timeout)
+            )
+    finally:
+        watchdog.unregister(watch_id)
+
+    _record_finished(program, time.monotonic() - started, process.returncode)
+
+    if check and process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, command, output=stdout, stderr=stderr
+        )
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+
+async def run_process_async(
+    command: Sequence[str],
+    timeout: float = DEFAULT_TIMEOUT,
+    check: bool = False,
+    encoding: Optional[str] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Variante asyncio de run_process().
+
+    Si la tarea se cancela mientras el comando está en marcha, se termina el
+    árbol de procesos antes de propagar la cancelación.
+
+    Args:
+        command: Lista con el comando y sus argumentos
+        timeout: Segundos máximos de ejecución
+        check: Lanzar CalledProcessError si el código de retorno no es 0
+        encoding: Si se indica, stdout y stderr se devuelven decodificados
+
+    Returns:
+        CompletedProcess con returncode, stdout y stderr
+
+    Raises:
+        CommandTimeoutError: Si el comando supera el plazo (ya terminado)
+        subprocess.CalledProcessError: Si check es True y el comando falla
+        asyncio.CancelledError: Si la tarea se cancela (proceso ya terminado)
+        OSError: Si el programa no se puede ejecutar
+    """
+    command = list(command)
+    program = _program_name(command)
+    started = time.monotonic()
+
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        stdin=asyncio.subprocess.DEVNULL,
+        creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+        start_new_session=os.name != "nt",
+    )
+    watch_id = watchdog.register(command, process.pid)
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+        if process.returncode is None:
+            _kill_tree(process.pid)
+            try:
+                await asyncio.wait_for(process.wait(), KILL_GRACE)
+            except asyncio.TimeoutError:
+                Logger.warning(t.PROCESS_LOG_PIPES_HELD, program=program)
+        cancelled = isinstance(e, asyncio.CancelledError)
+        _record_aborted(
+            program,
+            time.monotonic() - started,
+            "cancelled" if cancelled else "timeout",
+        )
+        if cancelled:
+            raise
+        Logger.error(t.PROCESS_LOG_TIMEOUT, command=" ".join(command), timeout=timeout)
+        raise CommandTimeoutError(
+            t.PROCESS_ERROR_TIMEOUT.format(program=program, timeout=timeout)
+        ) from None
+    finally:
+        watchdog.unregister(watch_id)
+
+    _record_finished(program, time.monotonic() - started, process.returncode)
+
+    if encoding is not None:
+        stdout = stdout.decode(encoding, errors="replace")
+        stderr = stderr.decode(encoding, errors="replace")
+    if check and process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, command, output=stdout, stderr=stderr
+        )
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
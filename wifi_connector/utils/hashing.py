@@ -0,0 +1,24 @@
+"""Hash de archivos por bloques."""
+
+import hashlib
+import os
+from typing import Union
+
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Union[str, os.PathLike]) -> str:
+    """Calcula el SHA-256 de un archivo leyéndolo por bloques.
+
+    Args:
+        path: Ruta del archivo
+
+    Returns:
+        Hash en hexadecimal
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
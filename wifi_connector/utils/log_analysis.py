@@ -0,0 +1,515 @@
+"""Análisis de los logs diarios de toda la flota de equipos.
+
+Logger.setup escribe un DD-MM-YYYY.log por día en cada equipo y se recogen
+en una carpeta con una subcarpeta por equipo. Este módulo recorre ese árbol,
+analiza los logs en paralelo con un pool de procesos y agrega por equipo y
+día la tasa de éxito de las conexiones, los motivos de fallo (autenticación,
+permisos, red o archivo no encontrado, verificación agotada) y el tiempo de
+cada paso según el resumen de spans de cada intento.
+
+Los mensajes se reconocen con expresiones regulares generadas a partir de las
+plantillas de translations, así que si cambia un texto el análisis lo sigue.
+
+El análisis es incremental: un archivo de cursor guarda, por log, hasta qué
+byte se ha leído, el intento que quedó abierto y los agregados acumulados.
+Al volver a ejecutarlo solo se leen las líneas nuevas; una línea a medio
+escribir se deja para la siguiente ejecución. Los fragmentos que separa la
+rotación (DD-MM-YYYY.N.log.gz) se leen enteros una sola vez; si el log del
+día ha rotado (su primera línea ya no es la misma) se vuelve a leer desde
+el principio, porque lo leído antes está ahora en el fragmento. Las líneas
+en formato JSON (Logger.set_json_format) se analizan por su campo message.
+
+    python -m wifi_connector.utils.log_analysis CARPETA_LOGS [--json]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from string import Formatter
+from typing import BinaryIO, Dict, List, Optional, Pattern, Sequence, Tuple
+
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+CURSOR_VERSION = 1
+CURSOR_FILENAME = ".log_analysis_cursor.json"
+
+_LOG_NAME = re.compile(r"^(\d{2})-(\d{2})-(\d{4})(\.\d+\.log\.gz|\.log)$")
+_HEAD_BYTES = 256
+# Formato de Logger: "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_LINE = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} - \S+ - [A-Z]+ - (.*)$")
+_SUCCESS_MARK = "✓ "
+
+
+def _pattern(template: str) -> Pattern[str]:
+    """Expresión regular que reconoce los mensajes de una plantilla de translations."""
+    parts = []
+    for literal, name, spec, _ in Formatter().parse(template):
+        parts.append(re.escape(literal))
+        if name is None:
+            continue
+        if spec and spec[-1] in "dfg":
+            parts.append(rf"(?P<{name}>-?[\d.]+)")
+        else:
+            parts.append(rf"(?P<{name}>.*?)")
+    return re.compile("".join(parts))
+
+
+_STARTED = _pattern(t.PROFILE_LOG_STARTING)
+_CONNECTED = _pattern(t.PROFILE_SUCCESS_COMPLETE)
+_UNVERIFIED = _pattern(t.PROFILE_LOG_VERIFY_PROBABLY_OK)
+_CANCELLED = _pattern(t.PROFILE_LOG_CANCELLED)
+_FAILED = tuple(
+    _pattern(template)
+    for template in (
+        t.PROFILE_LOG_VERIFY_ERROR,
+        t.PROFILE_LOG_INSTALL_ERROR,
+        t.PROFILE_LOG_UPDATE_ERROR,
+        t.PROFILE_LOG_CONFIG_ERROR,
+        t.PROFILE_LOG_CONNECT_ERROR,
+        t.PROFILE_ERROR_UNEXPECTED,
+    )
+)
+_SUMMARY = _pattern(t.TIMING_LOG_SUMMARY)
+_SUMMARY_ITEM = _pattern(t.TIMING_SUMMARY_ITEM)
+
+# Motivos en orden de prioridad: si un intento acumula varios, cuenta el primero
+_REASONS: Tuple[Tuple[str, Tuple[Pattern[str], ...]], ...] = (
+    ("auth", (_pattern(t.PROFILE_ERROR_AUTH),)),
+    (
+        "not_found",
+        tuple(
+            _pattern(template)
+            for template in (
+                t.PROFILE_WARNING_NOT_VISIBLE,
+                t.PROFILE_ERROR_PROFILE_NOT_FOUND,
+                t.PROFILE_ERROR_CREDS_NOT_FOUND,
+                t.PROFILE_ERROR_EXE_NOT_FOUND,
+            )
+        ),
+    ),
+    ("verify_timeout", (_pattern(t.PROFILE_ERROR_NO_VERIFY),)),
+    (
+        "permissions",
+        (
+            _pattern(t.PROFILE_WARNING_PERMISSIONS_VERIFY),
+            _pattern(t.PROFILE_ERROR_PERMISSIONS_VERIFY),
+        ),
+    ),
+)
+_REASON_PRIORITY = {reason: index for index, (reason, _) in enumerate(_REASONS)}
+
+
+@dataclass
+class DayStats:
+    """Agregados de los intentos de conexión de un equipo en un día.
+
+    reasons cuenta el motivo de los intentos fallidos y de los conectados sin
+    verificar (por permisos). timings guarda, por span, [recuento, ms totales];
+    "attempt" es la duración total de los intentos.
+    """
+
+    connected: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    reasons: Dict[str, int] = field(default_factory=dict)
+    timings: Dict[str, List[float]] = field(default_factory=dict)
+
+    @property
+    def attempts(self) -> int:
+        """Intentos terminados, incluidos los cancelados."""
+        return self.connected + self.failed + self.cancelled
+
+    @property
+    def success_rate(self) -> float:
+        """Fracción de intentos conectados; los cancelados no cuentan."""
+        finished = self.connected + self.failed
+        return self.connected / finished if finished else 0.0
+
+    def add_timing(self, name: str, ms: float, count: int = 1) -> None:
+        """Suma count intervalos de name con ms milisegundos en total."""
+        entry = self.timings.setdefault(name, [0, 0.0])
+        entry[0] += count
+        entry[1] += ms
+
+    def mean_timings(self) -> Dict[str, float]:
+        """Milisegundos medios por span."""
+        return {
+            name: total / count
+            for name, (count, total) in sorted(self.timings.items())
+            if count
+        }
+
+    def merge(self, other: "DayStats") -> None:
+        """Acumula los agregados de other."""
+        self.connected += other.connected
+        self.failed += other.failed
+        self.cancelled += other.cancelled
+        for reason, count in other.reasons.items():
+            self.reasons[reason] = self.reasons.get(reason, 0) + count
+        for name, (count, total) in other.timings.items():
+            self.add_timing(name, total, int(count))
+
+    def report(self) -> Dict[str, object]:
+        """Resumen serializable para la salida JSON."""
+        return {
+            "attempts": self.attempts,
+            "connected": self.connected,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "success_rate": self.success_rate,
+            "reasons": dict(sorted(self.reasons.items())),
+            "mean_ms": self.mean_timings(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DayStats":
+        """Reconstruye los agregados guardados en el cursor."""
+        return cls(
+            connected=data.get("connected", 0),
+            failed=data.get("failed", 0),
+            cancelled=data.get("cancelled", 0),
+            reasons=dict(data.get("reasons", {})),
+            timings={name: list(entry) for name, entry in data.get("timings", {}).items()},
+        )
+
+
+@dataclass
+class FileCursor:
+    """Estado del análisis de un log: posición, intento abierto y agregados.
+
+    open_attempt es None si no hay ningún intento en curso al final de lo
+    leído; si lo hay, es su motivo de fallo provisional ("" si aún ninguno).
+    head es el SHA-1 de la primera línea, para detectar que el log ha rotado.
+    """
+
+    offset: int = 0
+    open_attempt: Optional[str] = None
+    stats: DayStats = field(default_factory=DayStats)
+    head: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FileCursor":
+        """Reconstruye el cursor guardado en JSON."""
+        return cls(
+            offset=data.get("offset", 0),
+            open_attempt=data.get("open_attempt"),
+            stats=DayStats.from_dict(data.get("stats", {})),
+            head=data.get("head", ""),
+        )
+
+    def close_attempt(self, outcome: str, reason: Optional[str] = None) -> None:
+        """Cierra el intento abierto con su resultado y, si lo hay, su motivo."""
+        self.open_attempt = None
+        setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+        if reason:
+            self.stats.reasons[reason] = self.stats.reasons.get(reason, 0) + 1
+
+    def consume(self, message: str) -> None:
+        """Actualiza el estado con el mensaje de una línea del log."""
+        if message.startswith(_SUCCESS_MARK):
+            message = message[len(_SUCCESS_MARK):]
+
+        if _STARTED.fullmatch(message):
+            if self.open_attempt is not None:
+                # El intento anterior no llegó a registrar su resultado
+                self.close_attempt("failed", "interrupted")
+            self.open_attempt = ""
+            return
+
+        summary = _SUMMARY.fullmatch(message)
+        if summary:
+            self._add_summary(summary)
+            if self.open_attempt is not None:
+                self.close_attempt("failed", self.open_attempt or "other")
+            return
+
+        if self.open_attempt is None:
+            return
+
+        for reason, patterns in _REASONS:
+            if any(pattern.search(message) for pattern in patterns):
+                current = _REASON_PRIORITY.get(self.open_attempt, len(_REASONS))
+                if _REASON_PRIORITY[reason] < current:
+                    self.open_attempt = reason
+                break
+
+        if _CONNECTED.fullmatch(message):
+            self.close_attempt("connected")
+        elif _UNVERIFIED.fullmatch(message):
+            self.close_attempt("connected", "permissions")
+        elif _CANCELLED.fullmatch(message):
+            self.close_attempt("cancelled")
+        elif any(pattern.fullmatch(message) for pattern in _FAILED):
+            self.close_attempt("failed", self.open_attempt or "other")
+
+    def _add_summary(self, summary: "re.Match[str]") -> None:
+        """Suma la duración total y el desglose por span de un intento."""
+        self.stats.add_timing("attempt", float(summary.group("duration_ms")))
+        for item in summary.group("breakdown").split(", "):
+            match = _SUMMARY_ITEM.fullmatch(item)
+            if match:
+                self.stats.add_timing(
+                    match.group("name"),
+                    float(match.group("ms")),
+                    int(match.group("count")),
+                )
+
+
+def parse_log(path: str, state: Optional[Dict] = None) -> Dict:
+    """
+    Lee las líneas nuevas de un log y devuelve su cursor actualizado.
+
+    Se ejecuta en los procesos del pool, así que recibe y devuelve el cursor
+    como diccionario. Si el archivo es más corto que la posición guardada o
+    su primera línea ha cambiado (truncado, rotado o sustituido) se vuelve a
+    analizar desde el principio. Los fragmentos .gz se leen siempre enteros.
+
+    Args:
+        path: Ruta del log
+        state: Cursor anterior (to_dict de FileCursor), o None
+
+    Returns:
+        Cursor actualizado como diccionario
+
+    Raises:
+        OSError: Si no se puede leer el archivo
+    """
+    if path.endswith(".gz"):
+        cursor = FileCursor()
+        with gzip.open(path, "rb") as f:
+            _read_lines(f, cursor)
+        return asdict(cursor)
+
+    cursor = FileCursor.from_dict(state or {})
+    with open(path, "rb") as f:
+        first_line = f.readline(_HEAD_BYTES)
+        head = hashlib.sha1(first_line).hexdigest() if first_line.endswith(b"\n") else ""
+        rotated = bool(cursor.head and head and head != cursor.head)
+        if os.fstat(f.fileno()).st_size < cursor.offset or rotated:
+            cursor = FileCursor()
+        cursor.head = cursor.head or head
+        f.seek(cursor.offset)
+        _read_lines(f, cursor)
+    return asdict(cursor)
+
+
+def _read_lines(f: BinaryIO, cursor: FileCursor) -> None:
+    """Consume las líneas completas desde la posición actual de f."""
+    for raw in f:
+        if not raw.endswith(b"\n"):
+            # Línea a medio escribir: se leerá en la próxima ejecución
+            break
+        cursor.offset += len(raw)
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if line.startswith("{"):
+            try:
+                message = json.loads(line).get("message")
+            except (ValueError, AttributeError):
+                message = None
+            if isinstance(message, str):
+                cursor.consume(message)
+            continue
+        match = _LINE.match(line)
+        if match:
+            cursor.consume(match.group(1))
+
+
+def _day_of(log_name: str) -> Optional[str]:
+    """Fecha ISO (AAAA-MM-DD) de un log DD-MM-YYYY[.N].log[.gz], o None si no lo es."""
+    match = _LOG_NAME.match(log_name)
+    if not match:
+        return None
+    day, month, year, _ = match.groups()
+    return f"{year}-{month}-{day}"
+
+
+def _load_cursor(path: Path) -> Dict[str, Dict]:
+    """Cursores por log guardados; vacío si no hay o no se pueden leer."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != CURSOR_VERSION:
+            raise ValueError(data.get("version"))
+        return dict(data["files"])
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        Logger.warning(t.LOG_ANALYSIS_LOG_CURSOR_INVALID, path=path, error=e)
+        return {}
+
+
+def _save_cursor(path: Path, files: Dict[str, Dict]) -> None:
+    """Guarda los cursores de forma atómica (temporal en la misma carpeta)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": CURSOR_VERSION, "files": files}, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        Logger.warning(t.LOG_ANALYSIS_LOG_CURSOR_SAVE_FAILED, path=path, error=e)
+
+
+def analyze(
+    root: Path, cursor_path: Optional[Path] = None, workers: Optional[int] = None
+) -> Dict[Tuple[str, str], DayStats]:
+    """
+    Analiza los logs nuevos del árbol y devuelve los agregados acumulados.
+
+    El equipo es la carpeta del log relativa a root ("." si está en la
+    raíz). Los logs que ya no existen conservan sus agregados en el cursor.
+
+    Args:
+        root: Carpeta con los logs de la flota
+        cursor_path: Archivo de cursor (por defecto, dentro de root)
+        workers: Procesos en paralelo (None: uno por CPU; 1: sin pool)
+
+    Returns:
+        Agregados por (equipo, día ISO)
+    """
+    root = Path(root)
+    cursor_path = Path(cursor_path) if cursor_path else root / CURSOR_FILENAME
+    files = _load_cursor(cursor_path)
+
+    pending: List[Tuple[str, Path]] = []
+    for path in sorted(root.rglob("*.log*")):
+        if _day_of(path.name) is None:
+            continue
+        key = path.relative_to(root).as_posix()
+        try:
+            if path.name.endswith(".gz"):
+                unchanged = key in files
+            else:
+                unchanged = path.stat().st_size == files.get(key, {}).get("offset")
+        except OSError:
+            continue
+        if not unchanged:
+            pending.append((key, path))
+
+    def store(key: str, path: Path, result) -> None:
+        try:
+            files[key] = result()
+        except OSError as e:
+            Logger.warning(t.LOG_ANALYSIS_LOG_READ_FAILED, path=path, error=e)
+
+    if workers == 1 or len(pending) < 2:
+        for key, path in pending:
+            store(key, path, lambda: parse_log(str(path), files.get(key)))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (key, path, executor.submit(parse_log, str(path), files.get(key)))
+                for key, path in pending
+            ]
+            for key, path, future in futures:
+                store(key, path, future.result)
+
+    _save_cursor(cursor_path, files)
+    Logger.info(
+        t.LOG_ANALYSIS_LOG_DONE, files=len(pending), skipped=len(files) - len(pending)
+    )
+
+    results: Dict[Tuple[str, str], DayStats] = {}
+    for key, state in files.items():
+        machine, _, name = key.rpartition("/")
+        day = _day_of(name)
+        if day is None:
+            continue
+        stats = results.setdefault((machine or ".", day), DayStats())
+        stats.merge(FileCursor.from_dict(state).stats)
+    return results
+
+
+def _format_reasons(stats: DayStats) -> str:
+    """Motivos como "auth=2 verify_timeout=1", o "-" si no hay."""
+    return " ".join(f"{k}={v}" for k, v in sorted(stats.reasons.items())) or "-"
+
+
+def _print_row(machine: str, day: str, stats: DayStats) -> None:
+    """Imprime la fila de un equipo y día seguida de los tiempos medios."""
+    print(
+        t.LOG_ANALYSIS_CLI_ROW.format(
+            machine=machine,
+            day=day,
+            count=stats.attempts,
+            success=stats.success_rate * 100,
+            reasons=_format_reasons(stats),
+        )
+    )
+    timings = ", ".join(
+        t.LOG_ANALYSIS_CLI_TIMING_ITEM.format(name=name, ms=ms)
+        for name, ms in stats.mean_timings().items()
+    )
+    if timings:
+        print(t.LOG_ANALYSIS_CLI_TIMINGS.format(timings=timings))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Analiza los logs de la flota e imprime los agregados por equipo y día.
+
+    Args:
+        argv: Argumentos de línea de comandos (por defecto sys.argv[1:])
+
+    Returns:
+        Código de salida
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m wifi_connector.utils.log_analysis",
+        description=t.LOG_ANALYSIS_CLI_DESCRIPTION,
+    )
+    parser.add_argument("root", type=Path, help=t.LOG_ANALYSIS_CLI_HELP_ROOT)
+    parser.add_argument(
+        "--cursor", type=Path, default=None, help=t.LOG_ANALYSIS_CLI_HELP_CURSOR
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help=t.LOG_ANALYSIS_CLI_HELP_WORKERS
+    )
+    parser.add_argument("--json", action="store_true", help=t.LOG_ANALYSIS_CLI_HELP_JSON)
+    args = parser.parse_args(argv)
+
+    results = analyze(args.root, args.cursor, args.workers)
+    machines: Dict[str, Dict[str, DayStats]] = {}
+    for (machine, day), stats in sorted(results.items()):
+        machines.setdefault(machine, {})[day] = stats
+
+    totals: Dict[str, DayStats] = {}
+    for machine, days in machines.items():
+        total = totals[machine] = DayStats()
+        for stats in days.values():
+            total.merge(stats)
+
+    if args.json:
+        report = {
+            machine: {
+                "days": {day: stats.report() for day, stats in days.items()},
+                "total": totals[machine].report(),
+            }
+            for machine, days in machines.items()
+        }
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0
+
+    print(t.LOG_ANALYSIS_CLI_HEADER)
+    for machine, days in machines.items():
+        for day, stats in days.items():
+            _print_row(machine, day, stats)
+        if len(days) > 1:
+            _print_row(machine, t.LOG_ANALYSIS_CLI_ALL_DAYS, totals[machine])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Formato JSON Lines del log, para la ingesta centralizada.
+
+Cada registro es un objeto JSON en una línea con un identificador de
+evento estable (el nombre de la constante de translations, p. ej.
+"PROFILE_LOG_STARTING"), así que el análisis no depende del texto de las
+traducciones. Los campos de la plantilla (Logger.info(t.X, campo=valor)) y
+los del contexto (centro, traza, paso) se conservan como datos.
+
+El formato se hace en el hilo de escritura del logger: el hilo que registra
+solo añade al registro referencias a la plantilla, los campos y el contexto.
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+from wifi_connector.utils import translations as t
+
+
+_events: Optional[Dict[str, str]] = None
+
+
+def event_id(message: str) -> Optional[str]:
+    """
+    Identificador estable de un mensaje de translations.
+
+    Args:
+        message: Plantilla o mensaje sin campos
+
+    Returns:
+        Nombre de la constante (los textos de translations son únicos), o
+        None si el mensaje no es una constante de translations
+    """
+    global _events
+    if _events is None:
+        events: Dict[str, str] = {}
+        for name, value in vars(t).items():
+            if name.isupper() and isinstance(value, str):
+                events[value] = name
+        _events = events
+    return _events.get(message)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatea cada registro como una línea JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Serializa el registro.
+
+        Claves: ts (ISO 8601 con zona), level, logger, thread, event,
+        message, las del contexto (center, trace_id, step...) y, si el
+        mensaje venía de una plantilla, fields con sus campos.
+        """
+        payload = {
+            "ts": datetime.fromtimestamp(record.created)
+            .astimezone()
+            .isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "event": event_id(getattr(record, "event_template", record.msg)),
+            "message": record.getMessage(),
+        }
+        context = getattr(record, "event_context", None)
+        if context:
+            payload.update(context)
+        fields = getattr(record, "event_fields", None)
+        if fields:
+            payload["fields"] = fields
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
@@ -0,0 +1,314 @@
+"""
+Rotación de los logs diarios por tamaño, compresión y retención.
+
+El archivo en uso es siempre Logs/DD-MM-YYYY.log, el del día. Cuando supera
+el tamaño máximo se renombra a DD-MM-YYYY.N.log, con N creciente (los
+fragmentos anteriores nunca se renumeran, así el cursor de log_analysis
+sigue siendo válido), y se vuelve a empezar el archivo del día. Al cambiar
+de día se pasa directamente al archivo del nuevo día.
+
+Un hilo de mantenimiento comprime cada fragmento a DD-MM-YYYY.N.log.gz y
+después aplica la retención: borra los logs más antiguos (nunca el activo)
+hasta no superar el número de archivos, el tamaño total y la antigüedad
+máximos. Así la carpeta Logs no crece sin límite en discos pequeños.
+"""
+
+import gzip
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from wifi_connector.utils import translations as t
+
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DAY_FORMAT = "%d-%m-%Y"
+
+_DAILY_NAME = re.compile(r"^\d{2}-\d{2}-\d{4}\.log$")
+_SEGMENT_NAME = re.compile(r"^(\d{2}-\d{2}-\d{4})\.(\d+)\.log(\.gz)?$")
+_STOP = object()
+
+
+def _warn(message: str) -> None:
+    """Avisa en el log (importación diferida: logger depende de este módulo)."""
+    from wifi_connector.utils.logger import Logger
+
+    Logger.warning(message)
+
+
+def next_segment_path(path: Path) -> Path:
+    """
+    Ruta del siguiente fragmento de un log diario.
+
+    Args:
+        path: Log del día (DD-MM-YYYY.log)
+
+    Returns:
+        DD-MM-YYYY.N.log con N una unidad mayor que el último fragmento
+    """
+    stem = path.name[: -len(".log")]
+    last = 0
+    try:
+        names = os.listdir(path.parent)
+    except OSError:
+        names = []
+    for name in names:
+        match = _SEGMENT_NAME.match(name)
+        if match and match.group(1) == stem:
+            last = max(last, int(match.group(2)))
+    return path.with_name(f"{stem}.{last + 1}.log")
+
+
+@dataclass
+class RetentionPolicy:
+    """Límites de la carpeta de logs; el archivo activo nunca se borra.
+
+    Atributos:
+        max_files: Número máximo de logs (diarios y fragmentos)
+        max_total_bytes: Tamaño máximo de todos los logs juntos
+        max_age_days: Antigüedad máxima según la fecha de modificación
+    """
+
+    max_files: int = 60
+    max_total_bytes: int = 100 * 1024 * 1024
+    max_age_days: float = 90
+
+    def expired(self, folder: Path, active: Optional[Path], now: float) -> List[Path]:
+        """
+        Logs que hay que borrar para cumplir los límites, del más antiguo al más nuevo.
+
+        Los fragmentos aún sin comprimir no se tienen en cuenta.
+
+        Args:
+            folder: Carpeta de logs
+            active: Log en uso, que se conserva siempre
+            now: Hora actual (time.time())
+        """
+        entries = []
+        for path in folder.iterdir():
+            segment = _SEGMENT_NAME.match(path.name)
+            if not (_DAILY_NAME.match(path.name) or (segment and segment.group(3))):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        entries.sort()
+
+        count = len(entries)
+        total = sum(size for _, _, size in entries)
+        oldest_allowed = now - self.max_age_days * 86400
+        expired = []
+        for mtime, path, size in entries:
+            if active is not None and path == active:
+                continue
+            if (
+                count <= self.max_files
+                and total <= self.max_total_bytes
+                and mtime >= oldest_allowed
+            ):
+                break
+            expired.append(path)
+            count -= 1
+            total -= size
+        return expired
+
+
+class LogMaintenance:
+    """Hilo que comprime los fragmentos rotados y aplica la retención."""
+
+    def __init__(self, folder: Path, policy: Optional[RetentionPolicy] = None):
+        """
+        Inicializa el mantenimiento sin arrancarlo.
+
+        Args:
+            folder: Carpeta de logs
+            policy: Límites de retención (por defecto, RetentionPolicy())
+        """
+        self.folder = Path(folder)
+        self.policy = policy or RetentionPolicy()
+        self.active: Optional[Path] = None
+        self._queue: "queue.SimpleQueue[object]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, active: Optional[Path] = None) -> None:
+        """
+        Arranca el hilo y recupera el trabajo pendiente de ejecuciones anteriores.
+
+        Args:
+            active: Log en uso, que la retención conserva
+        """
+        self.active = active
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._loop, name="log-maintenance", daemon=True
+            )
+            self._thread.start()
+        # Fragmentos que quedaron sin comprimir (p. ej. cierre a medias)
+        try:
+            names = sorted(os.listdir(self.folder))
+        except OSError:
+            names = []
+        for name in names:
+            match = _SEGMENT_NAME.match(name)
+            if match and not match.group(3):
+                self.submit(self.folder / name)
+        self.submit(None)
+
+    def submit(self, segment: Optional[Path]) -> None:
+        """
+        Encola un fragmento para comprimirlo y aplicar después la retención.
+
+        Args:
+            segment: Fragmento rotado, o None para aplicar solo la retención
+        """
+        if self._thread is None:
+            return
+        self._queue.put(segment)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Termina el trabajo encolado y detiene el hilo."""
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+    def compress(self, segment: Path) -> Optional[Path]:
+        """
+        Comprime un fragmento a .gz de forma atómica y borra el original.
+
+        Returns:
+            Ruta del .gz, o None si no se pudo comprimir
+        """
+        target = segment.with_name(segment.name + ".gz")
+        partial = segment.with_name(segment.name + ".gz.part")
+        try:
+            with open(segment, "rb") as src, gzip.open(partial, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(partial, target)
+            os.unlink(segment)
+            return target
+        except OSError as e:
+            _warn(t.LOG_ROTATION_LOG_COMPRESS_FAILED.format(path=segment, error=e))
+            try:
+                os.unlink(partial)
+            except OSError:
+                pass
+            return None
+
+    def apply_retention(self) -> List[Path]:
+        """
+        Borra los logs que exceden la política de retención.
+
+        Returns:
+            Logs borrados
+        """
+        removed = []
+        try:
+            expired = self.policy.expired(self.folder, self.active, time.time())
+        except OSError as e:
+            _warn(t.LOG_ROTATION_LOG_RETENTION_FAILED.format(path=self.folder, error=e))
+            return removed
+        for path in expired:
+            try:
+                os.unlink(path)
+                removed.append(path)
+            except OSError as e:
+                _warn(t.LOG_ROTATION_LOG_RETENTION_FAILED.format(path=path, error=e))
+        return removed
+
+    def _loop(self) -> None:
+        """Cuerpo del hilo: atiende la cola hasta que se detiene."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            if item is not None:
+                self.compress(item)
+            self.apply_retention()
+
+
+class RotatingDailyFileHandler(RotatingFileHandler):
+    """
+    Handler del log diario que rota por tamaño y por cambio de día.
+
+    A diferencia de RotatingFileHandler, los fragmentos no se renumeran
+    (DD-MM-YYYY.1.log, .2.log...) y se entregan a LogMaintenance para
+    comprimirlos en otro hilo; la escritura nunca espera a gzip.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        maintenance: Optional[LogMaintenance] = None,
+        clock: Callable[[], date] = date.today,
+    ):
+        """
+        Inicializa el handler y abre el log del día.
+
+        Args:
+            path: Log del día (DD-MM-YYYY.log)
+            max_bytes: Tamaño a partir del cual se rota (0 desactiva la rotación por tamaño)
+            maintenance: Hilo que comprime los fragmentos y aplica la retención
+            clock: Fuente de la fecha actual (inyectable en tests)
+        """
+        super().__init__(str(path), maxBytes=max_bytes, encoding="utf-8")
+        self.maintenance = maintenance
+        self._clock = clock
+        self._day = clock()
+
+    @property
+    def path(self) -> Path:
+        """Log en uso."""
+        return Path(self.baseFilename)
+
+    def shouldRollover(self, record) -> bool:
+        """Rota al cambiar de día o si el registro haría superar max_bytes."""
+        if self._clock() != self._day:
+            return True
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        self.stream.seek(0, os.SEEK_END)
+        position = self.stream.tell()
+        # Un registro más grande que max_bytes no rota un archivo vacío
+        return position > 0 and position + len(self.format(record)) + 1 >= self.maxBytes
+
+    def doRollover(self) -> None:
+        """Cierra el log, separa el fragmento o cambia de día y vuelve a abrir."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        today = self._clock()
+        if today != self._day:
+            self._day = today
+            self.baseFilename = str(
+                self.path.with_name(f"{today.strftime(DAY_FORMAT)}.log")
+            )
+            if self.maintenance is not None:
+                self.maintenance.active = self.path
+                self.maintenance.submit(None)
+        else:
+            segment = next_segment_path(self.path)
+            try:
+                os.replace(self.path, segment)
+            except OSError:
+                # Archivo bloqueado por otro proceso: se sigue escribiendo en él
+                segment = None
+            if segment is not None and self.maintenance is not None:
+                self.maintenance.submit(segment)
+
+        self.stream = self._open()
@@ -4,10 +4,61 @@ Módulo de utilidad de logging para WiFi Connector.
 Este módulo proporciona una interfaz centralizada de logging con soporte para
 logging en consola y archivo, niveles de log configurables, y formato
 consistente en toda la aplicación.
+
+Los registros no se escriben en el hilo que llama (a menudo el bucle de Tk):
+el logger solo los encola y un único hilo (QueueListener) los formatea y los
+escribe en la consola y el archivo. Logger.shutdown() vacía la cola al salir.
+
+Con Logger.set_json_format(True) el archivo pasa a JSON Lines (ver log_json)
+para la ingesta centralizada; la consola sigue en texto.
 """
 
+import atexit
 import logging
-from typing import Optional
+import os
+import queue
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, List, Optional
+
+from wifi_connector.utils.log_json import JsonFormatter
+
+from wifi_connector.utils.log_rotation import (
+    DEFAULT_MAX_BYTES,
+    LogMaintenance,
+    RetentionPolicy,
+    RotatingDailyFileHandler,
+)
+
+# Campos de contexto (centro, traza, paso) de los registros del formato JSON
+_context: ContextVar[Dict[str, Any]] = ContextVar("wifi_connector_log_context", default={})
+_NO_EXTRA: Dict[str, Any] = {}
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler que encola el registro tal cual.
+
+    El QueueHandler estándar formatea el mensaje en el hilo que llama para
+    poder enviarlo a otro proceso. Aquí la cola es del mismo proceso, así que
+    el formato (fecha, traza de la excepción) se deja al hilo de escritura.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _has_console() -> bool:
+    """
+    Indica si hay una consola donde escribir.
+
+    En el ejecutable sin consola sys.stderr es None o main.py lo redirige a
+    os.devnull; en ese caso el handler de consola solo gastaría tiempo.
+    """
+    stream = sys.stderr
+    return stream is not None and getattr(stream, "name", None) != os.devnull
 
 
 class Logger:
@@ -16,24 +67,62 @@ class Logger:
 
     Proporciona métodos estáticos para registrar logs en diferentes niveles con
     formato consistente y soporte para salida en consola y archivo.
+
+    En rutas frecuentes se pasa la plantilla y sus campos por separado,
+    Logger.debug(t.MAIN_LOG_FILTERING, query=query), para no formatear
+    mensajes de niveles desactivados; para preparar datos más caros que
+    un format se comprueba antes Logger.is_enabled(Logger.DEBUG).
     """
 
+    DEBUG = logging.DEBUG
+    INFO = logging.INFO
+    WARNING = logging.WARNING
+    ERROR = logging.ERROR
+    CRITICAL = logging.CRITICAL
+
     _logger: Optional[logging.Logger] = None
     _is_setup: bool = False
+    _listener: Optional[QueueListener] = None
+    _handlers: List[logging.Handler] = []
+    _file_handler: Optional[logging.Handler] = None
+    _text_formatter: Optional[logging.Formatter] = None
+    _json_format: bool = False
+    _maintenance: Optional[LogMaintenance] = None
+    _atexit_registered: bool = False
 
     @classmethod
-    def setup(cls, level: str = "INFO", log_file: Optional[str] = None) -> None:
+    def setup(
+        cls,
+        level: str = "INFO",
+        log_file: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        retention: Optional[RetentionPolicy] = None,
+        json_format: bool = False,
+    ) -> None:
         """
         Configura el sistema de logging.
 
+        Los handlers de consola y archivo quedan detrás de una cola que vacía
+        un único hilo; el handler de consola se omite si no hay consola.
+
+        El log diario de la carpeta Logs rota por tamaño y al cambiar de día;
+        los fragmentos se comprimen y se aplica la retención en segundo plano
+        (ver log_rotation).
+
         Args:
             level: Nivel de logging (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-            log_file: Ruta opcional al archivo de log.
-                     Si es None, crea un archivo con marca de tiempo en la carpeta Logs.
+            log_file: Ruta opcional al archivo de log (sin rotación).
+                     Si es None, usa el log del día (paths.get_current_log_path()).
+            max_bytes: Tamaño del log diario a partir del cual se rota
+            retention: Límites de la carpeta Logs (por defecto, RetentionPolicy())
+            json_format: Escribir el archivo en JSON Lines (ver set_json_format)
         """
         if cls._is_setup:
             return
 
+        cls.shutdown()
+        for handler in cls._handlers:
+            handler.close()
         cls._logger = logging.getLogger("wifi_connector")
         cls._logger.setLevel(getattr(logging, level.upper()))
 
@@ -43,26 +132,30 @@ class Logger:
             fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
+        handlers: List[logging.Handler] = []
 
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(getattr(logging, level.upper()))
-        console_handler.setFormatter(formatter)
-        cls._logger.addHandler(console_handler)
+        if _has_console():
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(getattr(logging, level.upper()))
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
 
-        file_handler = None
+        file_handler: Optional[logging.FileHandler] = None
         if log_file is None:
-            from wifi_connector.utils.paths import get_logs_folder
-            from datetime import datetime
+            from wifi_connector.utils.paths import get_current_log_path
 
-            logs_folder = get_logs_folder()
+            daily_log = get_current_log_path()
             try:
-                logs_folder.mkdir(parents=True, exist_ok=True)
-                timestamp = datetime.now().strftime("%d-%m-%Y")
-                log_file = str(logs_folder / f"{timestamp}.log")
+                daily_log.parent.mkdir(parents=True, exist_ok=True)
+                maintenance = LogMaintenance(daily_log.parent, retention)
+                file_handler = RotatingDailyFileHandler(
+                    daily_log, max_bytes=max_bytes, maintenance=maintenance
+                )
+                maintenance.start(active=daily_log)
+                cls._maintenance = maintenance
             except OSError:
-                log_file = None
-
-        if log_file:
+                file_handler = None
+        else:
             try:
                 file_handler = logging.FileHandler(log_file, encoding="utf-8")
             except OSError:
@@ -71,10 +164,91 @@ class Logger:
         if file_handler:
             file_handler.setLevel(getattr(logging, level.upper()))
             file_handler.setFormatter(formatter)
-            cls._logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        cls._logger.addHandler(_InProcessQueueHandler(log_queue))
+        cls._handlers = handlers
+        cls._file_handler = file_handler
+        cls._text_formatter = formatter
+        cls.set_json_format(json_format)
+        cls._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        cls._listener.start()
+        if not cls._atexit_registered:
+            atexit.register(cls.shutdown)
+            cls._atexit_registered = True
 
         cls._is_setup = True
 
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Vacía la cola de registros y detiene el hilo de escritura.
+
+        Se llama al salir de la aplicación (y desde atexit por si acaso).
+        También espera a que terminen la compresión y la retención en curso.
+        Los mensajes posteriores se escriben directamente en el hilo que llama.
+        """
+        listener, cls._listener = cls._listener, None
+        if listener is None:
+            return
+        listener.stop()
+        maintenance, cls._maintenance = cls._maintenance, None
+        if maintenance is not None:
+            maintenance.stop()
+        if cls._logger:
+            cls._logger.handlers.clear()
+            for handler in cls._handlers:
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    # Flujo ya cerrado (p. ej. la consola al terminar el proceso)
+                    pass
+                cls._logger.addHandler(handler)
+
+    @classmethod
+    def set_json_format(cls, enabled: bool) -> None:
+        """
+        Cambia el formato del archivo de log entre texto y JSON Lines.
+
+        Se puede llamar en cualquier momento (p. ej. al cargar la
+        configuración): los registros encolados hasta ese momento se
+        escriben antes con el formato anterior.
+
+        Args:
+            enabled: True para JSON Lines, False para texto
+        """
+        if cls._file_handler is None:
+            cls._json_format = enabled
+            return
+        listener = cls._listener
+        if listener is not None:
+            listener.stop()
+        cls._json_format = enabled
+        cls._file_handler.setFormatter(
+            JsonFormatter() if enabled else cls._text_formatter
+        )
+        if listener is not None:
+            listener.start()
+
+    @classmethod
+    @contextmanager
+    def context(cls, **fields: Any) -> Iterator[None]:
+        """
+        Añade campos a los registros JSON emitidos dentro del bloque.
+
+        El contexto se hereda en las tareas asyncio y en los hilos que
+        copian el contexto (asyncio.to_thread, StepGraph).
+
+        Args:
+            **fields: Campos (p. ej. center, trace_id, step)
+        """
+        token = _context.set({**_context.get(), **fields})
+        try:
+            yield
+        finally:
+            _context.reset(token)
+
     @classmethod
     def _ensure_setup(cls) -> None:
         """Asegura que el logger está configurado antes de usar."""
@@ -82,73 +256,139 @@ class Logger:
             cls.setup()
 
     @classmethod
-    def info(cls, message: str) -> None:
+    def is_enabled(cls, level: int) -> bool:
+        """
+        Indica si un nivel se registra, para evitar preparar mensajes caros.
+
+        Args:
+            level: Nivel de logging (Logger.DEBUG, Logger.INFO...)
+
+        Returns:
+            True si los mensajes de ese nivel llegan a algún handler
+        """
+        if not cls._is_setup:
+            cls.setup()
+        if cls._logger:
+            return cls._logger.isEnabledFor(level)
+        return logging.getLogger().isEnabledFor(level)
+
+    @classmethod
+    def _render(cls, level: int, message: str, fields: Dict[str, Any]) -> Optional[str]:
+        """
+        Prepara el mensaje de un registro.
+
+        Sin campos, el mensaje se usa tal cual. Con campos, message es una
+        plantilla de translations que solo se formatea si el nivel está
+        activo; si no lo está devuelve None y no se registra nada.
+        """
+        if not cls._is_setup:
+            cls.setup()
+        if not fields:
+            return message
+        if not (cls._logger or logging.getLogger()).isEnabledFor(level):
+            return None
+        return message.format(**fields)
+
+    @classmethod
+    def _extra(cls, level: int, template: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Argumentos adicionales del registro para el formato JSON.
+
+        En formato texto o con el nivel desactivado no crea nada.
+        """
+        if not cls._json_format or not cls._logger.isEnabledFor(level):
+            return _NO_EXTRA
+        return {
+            "extra": {
+                "event_template": template,
+                "event_fields": fields,
+                "event_context": _context.get(),
+            }
+        }
+
+    @classmethod
+    def info(cls, message: str, /, **fields: Any) -> None:
         """
         Registra mensaje de información.
 
         Args:
-            message: Mensaje a registrar
+            message: Mensaje a registrar, o plantilla si se pasan campos
+            **fields: Campos de la plantilla (se formatea solo si el nivel está activo)
         """
-        cls._ensure_setup()
+        text = cls._render(logging.INFO, message, fields)
+        if text is None:
+            return
         if cls._logger:
-            cls._logger.info(message)
+            cls._logger.info(text, **cls._extra(logging.INFO, message, fields))
         else:
-            logging.info(message)
+            logging.info(text)
 
     @classmethod
-    def error(cls, message: str, exc_info: bool = False) -> None:
+    def error(cls, message: str, /, exc_info: bool = False, **fields: Any) -> None:
         """
         Registra mensaje de error.
 
         Args:
-            message: Mensaje de error a registrar
+            message: Mensaje de error a registrar, o plantilla si se pasan campos
             exc_info: Incluir información de excepción si es True
+            **fields: Campos de la plantilla (se formatea solo si el nivel está activo)
         """
-        cls._ensure_setup()
+        text = cls._render(logging.ERROR, message, fields)
+        if text is None:
+            return
         if cls._logger:
-            cls._logger.error(message, exc_info=exc_info)
+            cls._logger.error(text, exc_info=exc_info, **cls._extra(logging.ERROR, message, fields))
         else:
-            logging.error(message, exc_info=exc_info)
+            logging.error(text, exc_info=exc_info)
 
     @classmethod
-    def debug(cls, message: str) -> None:
+    def debug(cls, message: str, /, **fields: Any) -> None:
         """
         Registra mensaje de depuración.
 
         Args:
-            message: Mensaje de depuración a registrar
+            message: Mensaje de depuración a registrar, o plantilla si se pasan campos
+            **fields: Campos de la plantilla (se formatea solo si el nivel está activo)
         """
-        cls._ensure_setup()
+        text = cls._render(logging.DEBUG, message, fields)
+        if text is None:
+            return
         if cls._logger:
-            cls._logger.debug(message)
+            cls._logger.debug(text, **cls._extra(logging.DEBUG, message, fields))
         else:
-            logging.debug(message)
+            logging.debug(text)
 
     @classmethod
-    def warning(cls, message: str) -> None:
+    def warning(cls, message: str, /, **fields: Any) -> None:
         """
         Registra mensaje de advertencia.
 
         Args:
-            message: Mensaje de advertencia a registrar
+            message: Mensaje de advertencia a registrar, o plantilla si se pasan campos
+            **fields: Campos de la plantilla (se formatea solo si el nivel está activo)
         """
-        cls._ensure_setup()
+        text = cls._render(logging.WARNING, message, fields)
+        if text is None:
+            return
         if cls._logger:
-            cls._logger.warning(message)
+            cls._logger.warning(text, **cls._extra(logging.WARNING, message, fields))
         else:
-            logging.warning(message)
+            logging.warning(text)
 
     @classmethod
-    def critical(cls, message: str, exc_info: bool = False) -> None:
+    def critical(cls, message: str, /, exc_info: bool = False, **fields: Any) -> None:
         """
         Registra mensaje crítico.
 
         Args:
-            message: Mensaje crítico a registrar
+            message: Mensaje crítico a registrar, o plantilla si se pasan campos
             exc_info: Incluir información de excepción si es True
+            **fields: Campos de la plantilla (se formatea solo si el nivel está activo)
         """
-        cls._ensure_setup()
+        text = cls._render(logging.CRITICAL, message, fields)
+        if text is None:
+            return
         if cls._logger:
-            cls._logger.critical(message, exc_info=exc_info)
+            cls._logger.critical(text, exc_info=exc_info, **cls._extra(logging.CRITICAL, message, fields))
         else:
-            logging.critical(message, exc_info=exc_info)
+            logging.critical(text, exc_info=exc_info)
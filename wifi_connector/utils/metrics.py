@@ -0,0 +1,384 @@
+"""
+Métricas en formato de texto de Prometheus para el textfile collector.
+
+En los equipos de los centros node_exporter lee los archivos *.prom de una
+carpeta (textfile collector). TextfileExporter reescribe periódicamente uno
+de esos archivos de forma atómica (archivo temporal en la misma carpeta y
+os.replace), así node_exporter nunca lee un archivo a medias.
+
+Las métricas están desactivadas por defecto: mientras no se llame a
+enable(), active() devuelve None y los puntos instrumentados no hacen nada.
+Registrar un valor solo actualiza contadores en memoria bajo un lock; la
+escritura del archivo se hace siempre en el hilo del exportador.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from wifi_connector.network.netsh_output import WlanInterface
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+FAST_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escapa el valor de una etiqueta según el formato de texto de Prometheus."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Formatea {nombre="valor",...}; cadena vacía si no hay etiquetas."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Formatea un número sin decimales innecesarios."""
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base común: nombre, ayuda, etiquetas y lock."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Mapping[str, str]) -> LabelValues:
+        """Valores de las etiquetas en el orden declarado."""
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        """Líneas del formato de texto, con cabeceras HELP y TYPE."""
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}",
+        ] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Contador monótono."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        super().__init__(name, help_text, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Incrementa el contador de las etiquetas indicadas."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Valor actual del contador."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """Valor que puede subir o bajar."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        super().__init__(name, help_text, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Fija el valor de las etiquetas indicadas."""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Histograma con cubetas acumuladas, suma y recuento."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Por etiquetas: [recuento por cubeta..., +Inf], suma
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Añade una observación."""
+        key = self._key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        """Número de observaciones de las etiquetas indicadas."""
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), ()))
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(
+                (key, list(counts), self._sums[key])
+                for key, counts in self._counts.items()
+            )
+
+        lines = []
+        bucket_labels = self.label_names + ("le",)
+        for key, counts, total in items:
+            cumulative = 0
+            bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(bucket_labels, key + (bound,))} "
+                    f"{cumulative}"
+                )
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class AppMetrics:
+    """Métricas de la aplicación y registro para exportarlas."""
+
+    def __init__(self) -> None:
+        """Crea las métricas vacías."""
+        self.attempts = Counter(
+            "wifi_connector_connect_attempts_total",
+            "Connection attempts by final outcome.",
+            ("outcome",),
+        )
+        self.attempt_duration = Histogram(
+            "wifi_connector_connect_duration_seconds",
+            "Total duration of connection attempts.",
+            ("outcome",),
+        )
+        self.step_duration = Histogram(
+            "wifi_connector_step_duration_seconds",
+            "Time spent per connection step, verify poll and command.",
+            ("step",),
+        )
+        self.vault_unlock_duration = Histogram(
+            "wifi_connector_vault_unlock_duration_seconds",
+            "Duration of successful vault unlocks.",
+        )
+        self.search_duration = Histogram(
+            "wifi_connector_search_duration_seconds",
+            "Duration of center searches, including the table refresh.",
+            buckets=FAST_BUCKETS,
+        )
+        self.last_success = Gauge(
+            "wifi_connector_last_success_timestamp_seconds",
+            "Unix time of the last successful connection.",
+        )
+        self.signal = Gauge(
+            "wifi_connector_signal_percent",
+            "Signal quality of the adapter on the network at the last verification.",
+        )
+        self.link_rate = Gauge(
+            "wifi_connector_link_rate_mbps",
+            "Link rate of the adapter on the network at the last verification.",
+            ("direction",),
+        )
+        self._metrics: List[_Metric] = [
+            self.attempts,
+            self.attempt_duration,
+            self.step_duration,
+            self.vault_unlock_duration,
+            self.search_duration,
+            self.last_success,
+            self.signal,
+            self.link_rate,
+        ]
+
+    def attempt_finished(
+        self, outcome: str, duration: float, step_durations: Mapping[str, float]
+    ) -> None:
+        """
+        Registra un intento de conexión terminado.
+
+        Args:
+            outcome: Estado final ("connected", "failed", "cancelled")
+            duration: Duración total en segundos
+            step_durations: Segundos por span del intento
+        """
+        self.attempts.inc(outcome=outcome)
+        self.attempt_duration.observe(duration, outcome=outcome)
+        for step, seconds in step_durations.items():
+            self.step_duration.observe(seconds, step=step)
+        if outcome == "connected":
+            self.last_success.set(time.time())
+
+    def interface_observed(self, interface: WlanInterface) -> None:
+        """
+        Registra la señal y la velocidad del adaptador tras una verificación.
+
+        Args:
+            interface: Adaptador en la red (campos None si netsh no los mostró)
+        """
+        if interface.signal is not None:
+            self.signal.set(interface.signal)
+        if interface.receive_rate is not None:
+            self.link_rate.set(interface.receive_rate, direction="receive")
+        if interface.transmit_rate is not None:
+            self.link_rate.set(interface.transmit_rate, direction="transmit")
+
+    def render(self) -> str:
+        """Todas las métricas en formato de texto de Prometheus."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class TextfileExporter:
+    """Hilo que reescribe el archivo .prom de forma atómica cada cierto tiempo."""
+
+    def __init__(self, metrics: AppMetrics, path: Path, interval: float = 15.0):
+        """
+        Inicializa el exportador sin arrancarlo.
+
+        Args:
+            metrics: Métricas a exportar
+            path: Archivo .prom de destino
+            interval: Segundos entre escrituras
+        """
+        self.metrics = metrics
+        self.path = Path(path)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Arranca el hilo del exportador."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Detiene el hilo tras una última escritura."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def write(self) -> bool:
+        """
+        Escribe el archivo .prom de forma atómica.
+
+        Returns:
+            True si se escribió
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f".{self.path.name}.", dir=self.path.parent
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                    f.write(self.metrics.render())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return True
+        except OSError as e:
+            Logger.warning(t.METRICS_LOG_WRITE_FAILED, path=self.path, error=e)
+            return False
+
+    def _loop(self) -> None:
+        """Cuerpo del hilo: escribe cada interval segundos y al detenerse."""
+        while not self._stop.wait(self.interval):
+            self.write()
+        self.write()
+
+
+_active: Optional[AppMetrics] = None
+_exporter: Optional[TextfileExporter] = None
+
+
+def active() -> Optional[AppMetrics]:
+    """Métricas activas, o None si la exportación está desactivada."""
+    return _active
+
+
+def enable(path: Path, interval: float = 15.0) -> AppMetrics:
+    """
+    Activa las métricas y arranca el exportador del archivo .prom.
+
+    Args:
+        path: Archivo .prom (dentro de la carpeta del textfile collector)
+        interval: Segundos entre escrituras
+
+    Returns:
+        Métricas activas
+    """
+    global _active, _exporter
+    disable()
+    _active = AppMetrics()
+    _exporter = TextfileExporter(_active, path, interval)
+    _exporter.start()
+    Logger.info(t.METRICS_LOG_ENABLED, path=path, interval=interval)
+    return _active
+
+
+def disable() -> None:
+    """Escribe por última vez, detiene el exportador y desactiva las métricas."""
+    global _active, _exporter
+    exporter, _exporter, _active = _exporter, None, None
+    if exporter is not None:
+        exporter.stop()
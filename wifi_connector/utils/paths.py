@@ -5,7 +5,9 @@ al ejecutar como script de Python o como ejecutable de PyInstaller.
 """
 
 import sys
+from datetime import date
 from pathlib import Path
+from typing import List, Optional
 
 
 def get_base_path() -> Path:
@@ -51,6 +53,30 @@ def get_vault_path() -> Path:
     return get_base_path() / "vault"
 
 
+def get_vault_files() -> List[Path]:
+    """Obtiene los archivos de vault disponibles en la carpeta vault.
+
+    El personal que trabaja en varios centros puede recibir más de un vault;
+    todos los archivos *.bin de la carpeta se cargan y combinan. vault.bin,
+    si existe, va siempre primero; el resto se ordena por nombre.
+
+    Returns:
+        Lista de rutas a vaults. Si no hay ninguno, devuelve [vault/vault.bin]
+        para que el error de archivo no encontrado sea el habitual.
+    """
+    vault_dir = get_vault_path()
+    default_vault = vault_dir / "vault.bin"
+    try:
+        found = sorted(vault_dir.glob("*.bin"))
+    except OSError:
+        found = []
+
+    extra = [path for path in found if path.name != default_vault.name]
+    if default_vault.exists() or not extra:
+        return [default_vault] + extra
+    return extra
+
+
 def get_favorites_path() -> Path:
     """Obtiene la ruta al archivo de favoritos.
 
@@ -63,6 +89,40 @@ def get_favorites_path() -> Path:
     return get_vault_path() / "fav.json"
 
 
+def get_profile_state_path() -> Path:
+    """Obtiene la ruta al archivo de estado de perfiles WLAN instalados.
+
+    Returns:
+        Objeto Path apuntando al archivo vault/profile_state.json
+    """
+    return get_vault_path() / "profile_state.json"
+
+
+def get_index_cache_path() -> Path:
+    """Obtiene la carpeta de la caché cifrada del índice de centros.
+
+    Es una subcarpeta de vault/, de modo que get_vault_files() no la recorre.
+
+    Returns:
+        Objeto Path apuntando a vault/cache
+    """
+    return get_vault_path() / "cache"
+
+
+def get_config_path() -> Path:
+    """Obtiene la ruta al archivo de configuración opcional config.json.
+
+    Cuando se ejecuta como ejecutable, se busca junto al .exe.
+    Cuando se ejecuta como script, en la raíz del proyecto.
+
+    Returns:
+        Objeto Path apuntando a config.json
+    """
+    if getattr(sys, "frozen", False):
+        return Path(sys.executable).parent / "config.json"
+    return get_base_path() / "config.json"
+
+
 def get_logs_folder() -> Path:
     """Obtiene la ruta a la carpeta de Logs.
 
@@ -75,3 +135,31 @@ def get_logs_folder() -> Path:
     if getattr(sys, "frozen", False):
         return Path(sys.executable).parent / "Logs"
     return Path.cwd() / "Logs"
+
+
+def get_current_log_path(day: Optional[date] = None) -> Path:
+    """Obtiene la ruta del log del día, donde Logger escribe en cada momento.
+
+    Los fragmentos que la rotación separa por tamaño se guardan al lado como
+    DD-MM-YYYY.N.log.gz; el archivo del día conserva siempre este nombre.
+
+    Args:
+        day: Día del log (por defecto, hoy)
+
+    Returns:
+        Objeto Path apuntando a Logs/DD-MM-YYYY.log
+    """
+    day = day or date.today()
+    return get_logs_folder() / f"{day.strftime('%d-%m-%Y')}.log"
+
+
+def get_history_path() -> Path:
+    """Obtiene la ruta a la base de datos SQLite del historial de conexiones.
+
+    Se guarda al lado de la carpeta Logs (no dentro), para que vaciar los
+    logs no borre el historial.
+
+    Returns:
+        Objeto Path apuntando a history.sqlite3
+    """
+    return get_logs_folder().parent / "history.sqlite3"
@@ -41,8 +41,8 @@ def setup_dark_theme() -> None:
         ctk.set_default_color_theme(COLOR_THEME)
         Logger.info(t.THEME_LOG_CONFIGURED)
     except ImportError as e:
-        Logger.critical(t.THEME_ERROR_NOT_INSTALLED.format(error=e))
+        Logger.critical(t.THEME_ERROR_NOT_INSTALLED, error=e)
         raise
     except (AttributeError, RuntimeError) as e:
-        Logger.error(t.THEME_ERROR_SETUP.format(error=e))
+        Logger.error(t.THEME_ERROR_SETUP, error=e)
         raise
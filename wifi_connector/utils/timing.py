@@ -0,0 +1,230 @@
+"""
+Intervalos de tiempo (spans) estructurados para medir los intentos de conexión.
+
+Cada span registra un nombre, su duración, un estado y atributos libres, y
+pertenece a la traza del intento en curso. La traza se propaga con
+contextvars: las tareas asyncio y asyncio.to_thread la heredan, y StepGraph
+copia el contexto a sus hilos, así que los comandos ejecutados por un paso
+quedan asociados al mismo intento.
+
+Los spans se pueden consultar en memoria (span_recorder.spans()), se
+escriben en el log como registros JSON y se resumen al final de cada intento.
+"""
+
+import json
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from wifi_connector.utils.logger import Logger
+from wifi_connector.utils import translations as t
+
+
+_current_trace: ContextVar[Optional[str]] = ContextVar(
+    "wifi_connector_trace", default=None
+)
+
+
+@dataclass(frozen=True)
+class Span:
+    """Intervalo de tiempo medido.
+
+    Atributos:
+        name: Nombre del intervalo (p. ej. "step.install", "process")
+        trace_id: Intento de conexión al que pertenece, o None
+        start: Inicio en tiempo de reloj (segundos desde epoch)
+        duration: Duración en segundos
+        status: "ok", "error" u otro estado específico ("timeout", ...)
+        attributes: Datos adicionales (programa, intento, código, ...)
+    """
+
+    name: str
+    trace_id: Optional[str]
+    start: float
+    duration: float
+    status: str = "ok"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representación serializable a JSON."""
+        return asdict(self)
+
+
+class SpanRecorder:
+    """Almacén en memoria de los últimos spans, seguro entre hilos."""
+
+    def __init__(self, max_spans: int = 2000) -> None:
+        """
+        Inicializa el almacén.
+
+        Args:
+            max_spans: Número máximo de spans conservados (se descartan los
+                más antiguos)
+        """
+        self._lock = threading.Lock()
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    @staticmethod
+    def current_trace() -> Optional[str]:
+        """Identificador de la traza activa en el contexto actual."""
+        return _current_trace.get()
+
+    @contextmanager
+    def trace(self, trace_id: Optional[str] = None) -> Iterator[str]:
+        """
+        Activa una traza para todo lo que se ejecute dentro del bloque.
+
+        Los registros del log emitidos dentro del bloque llevan el trace_id
+        en el formato JSON (Logger.context).
+
+        Args:
+            trace_id: Identificador; si es None se genera uno
+
+        Yields:
+            Identificador de la traza
+        """
+        trace_id = trace_id or uuid.uuid4().hex[:8]
+        token = _current_trace.set(trace_id)
+        try:
+            with Logger.context(trace_id=trace_id):
+                yield trace_id
+        finally:
+            _current_trace.reset(token)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Mide el bloque y lo registra como span de la traza activa.
+
+        Si el bloque lanza una excepción el estado es "error". El bloque
+        puede añadir atributos o cambiar el estado con la clave "status".
+
+        Args:
+            name: Nombre del span
+            **attributes: Atributos iniciales
+
+        Yields:
+            Diccionario de atributos modificable
+        """
+        start = time.time()
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            yield attributes
+        except BaseException as e:
+            status = "error"
+            attributes["error"] = type(e).__name__
+            raise
+        finally:
+            status = attributes.pop("status", status)
+            self.record(
+                Span(
+                    name=name,
+                    trace_id=_current_trace.get(),
+                    start=start,
+                    duration=time.perf_counter() - started,
+                    status=status,
+                    attributes=attributes,
+                )
+            )
+
+    def add(
+        self, name: str, duration: float, status: str = "ok", **attributes: Any
+    ) -> Span:
+        """
+        Registra un span ya medido que acaba ahora.
+
+        Args:
+            name: Nombre del span
+            duration: Duración en segundos
+            status: Estado del span
+            **attributes: Atributos adicionales
+
+        Returns:
+            Span registrado
+        """
+        span = Span(
+            name=name,
+            trace_id=_current_trace.get(),
+            start=time.time() - duration,
+            duration=duration,
+            status=status,
+            attributes=attributes,
+        )
+        self.record(span)
+        return span
+
+    def record(self, span: Span) -> None:
+        """Guarda un span y lo escribe en el log como registro JSON."""
+        with self._lock:
+            self._spans.append(span)
+        # Serializar a JSON cuesta más que el propio span: solo si DEBUG está activo
+        if Logger.is_enabled(Logger.DEBUG):
+            Logger.debug(
+                t.TIMING_LOG_SPAN,
+                payload=json.dumps(span.to_dict(), ensure_ascii=False, default=str),
+            )
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        """
+        Devuelve los spans guardados, en orden de finalización.
+
+        Args:
+            trace_id: Si se indica, solo los de esa traza
+        """
+        with self._lock:
+            snapshot = list(self._spans)
+        if trace_id is None:
+            return snapshot
+        return [span for span in snapshot if span.trace_id == trace_id]
+
+    def summary(self, trace_id: str) -> Dict[str, Dict[str, float]]:
+        """
+        Agrupa los spans de una traza por nombre.
+
+        Returns:
+            Diccionario {nombre: {"count", "total"}} con total en segundos
+        """
+        result: Dict[str, Dict[str, float]] = {}
+        for span in self.spans(trace_id):
+            entry = result.setdefault(span.name, {"count": 0, "total": 0.0})
+            entry["count"] += 1
+            entry["total"] += span.duration
+        return result
+
+    def log_summary(self, trace_id: str, total: float) -> None:
+        """
+        Registra en el log en qué se ha ido el tiempo de un intento.
+
+        Args:
+            trace_id: Traza del intento
+            total: Duración total del intento en segundos
+        """
+        summary = self.summary(trace_id)
+        breakdown = ", ".join(
+            t.TIMING_SUMMARY_ITEM.format(
+                name=name, ms=entry["total"] * 1000, count=entry["count"]
+            )
+            for name, entry in sorted(
+                summary.items(), key=lambda item: item[1]["total"], reverse=True
+            )
+        )
+        Logger.info(
+            t.TIMING_LOG_SUMMARY,
+            trace_id=trace_id,
+            duration_ms=total * 1000,
+            breakdown=breakdown or "-",
+        )
+
+    def clear(self) -> None:
+        """Descarta todos los spans guardados."""
+        with self._lock:
+            self._spans.clear()
+
+
+span_recorder = SpanRecorder()
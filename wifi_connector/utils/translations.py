@@ -58,14 +58,9 @@ STATUS_LOADED_SEARCH = (
 # Mensajes de conexión
 MSG_CONNECTING_TO = "Connectant a {network}..."
 MSG_CONNECTION_SUCCESS = "Connexió iniciada correctament"
-MSG_CONNECTION_FAILED = "Error en la connexió: {error}"
-MSG_DISCONNECTION_SUCCESS = "Desconnectat correctament"
-MSG_DISCONNECTION_FAILED = "Error en desconnectar"
 
 # Mensajes de error
-ERROR_NO_CENTER_SELECTED = "Si us plau, selecciona un centre primer"
 ERROR_ALREADY_CONNECTING = "Ja hi ha una connexió en curs"
-ERROR_LOAD_CREDENTIALS = "Error en carregar les credencials: {error}"
 
 # Mensajes del conector de perfiles
 PROFILE_STARTING = "Iniciant connexió per perfil..."
@@ -91,6 +86,8 @@ PROFILE_SUCCESS_CONNECTED = "Connectat exitosament a '{ssid}'"
 PROFILE_SUCCESS_COMMAND = "Comanda de connexió executada per '{ssid}'"
 PROFILE_SUCCESS_VERIFIED = "Connexió verificada: Connectat a '{ssid}'"
 PROFILE_SUCCESS_COMPLETE = "Connexió completada i verificada exitosament"
+PROFILE_LOG_STEP_DONE = "✓ {message}"
+PROFILE_LOG_TEMPLATE_ERROR = "Plantilla de credencials no vàlida: {error}"
 
 PROFILE_ERROR_PROFILE_NOT_FOUND = "Arxiu de perfil no trobat: {path}"
 PROFILE_ERROR_NETSH = "Error de xarxa. Revisa els logs per a més detalls."
@@ -124,6 +121,8 @@ PROFILE_ERROR_VERIFY = "Error en verificar connexió: {error}"
 PROFILE_ERROR_NO_VERIFY = "No s'ha pogut verificar la connexió a '{ssid}' després de {attempts} intents. La xarxa pot estar autenticant o les credencials són incorrectes."
 PROFILE_ERROR_AUTH = "Error d'autenticació: Credencials invàlides o xarxa no disponible"
 PROFILE_ERROR_UNEXPECTED = "Error inesperat durant la connexió: {error}"
+PROFILE_CANCELLED = "S'ha cancel·lat la connexió"
+PROFILE_LOG_CANCELLED = "Intent de connexió cancel·lat"
 
 PROFILE_WARNING_NO_CREDS = (
     "No s'han proporcionat credencials, utilitzant les del XML existent"
@@ -149,14 +148,16 @@ PROFILE_ERROR_PERMISSIONS_VERIFY = (
 PROFILE_LOG_INIT = "ProfileConnector inicialitzat per SSID: {ssid}, Usuari: {username}"
 PROFILE_LOG_STARTING = "=== Iniciant Mètode de Connexió per Perfil ==="
 PROFILE_LOG_VERIFYING = "Verificant connexió a '{ssid}' (màxim {attempts} intents)..."
-PROFILE_LOG_ATTEMPT = "Intent {attempt}/{max_attempts}..."
+PROFILE_LOG_VERIFYING_DEADLINE = "Verificant connexió a '{ssid}' (màxim {seconds:g} s)..."
+PROFILE_LOG_ATTEMPT_ELAPSED = "Intent {attempt} ({elapsed:.2f} s)..."
 PROFILE_LOG_STATE_AUTH = "Estat: Autenticant... (intent {attempt})"
 PROFILE_LOG_STATE_CONNECTING = "Estat: Connectant... (intent {attempt})"
 PROFILE_LOG_CMD_EXECUTING = "Executant comanda: {command}"
 PROFILE_LOG_CREDS_UPDATED = "Credencials actualitzades a {path}"
+PROFILE_LOG_CREDS_REMOVED = "Directori temporal de credencials eliminat: {path}"
 PROFILE_LOG_PARSING_XML = "Parsejant XML: {path}"
 PROFILE_LOG_UPDATING_USER = "Actualitzant usuari: {username}"
-PROFILE_LOG_RETURNCODE = "returncode: {code}"
+PROFILE_LOG_RETURNCODE = "returncode: {returncode}"
 PROFILE_LOG_STDOUT = "stdout: {output}"
 PROFILE_LOG_STDERR = "stderr: {output}"
 PROFILE_LOG_INSTALL_ERROR = "Error en instal·lar perfil: {message}"
@@ -167,12 +168,20 @@ PROFILE_LOG_VERIFY_ERROR = "Error de verificació: {message}"
 PROFILE_LOG_VERIFY_FAILED = "No s'ha pogut verificar: {message}"
 PROFILE_LOG_VERIFY_PROBABLY_OK = "La connexió probablement s'ha establert correctament"
 
-# Mensajes de limpieza de credenciales
-PROFILE_CLEAN_TEMPLATE_NOT_FOUND = "Plantilla de credencials no trobada: {path}"
-PROFILE_CLEAN_FILE_NOT_EXISTS = "Arxiu de credencials no existeix: {path}"
-PROFILE_CLEAN_SUCCESS = "Arxiu credentials.xml restaurat a configuració per defecte"
-PROFILE_CLEAN_ERROR = "Error en netejar credentials.xml: {error}"
-PROFILE_CLEAN_ERROR_ON_CLOSE = "Error en netejar credencials al tancar: {error}"
+# Mensajes del grafo de pasos de conexión
+STEP_ERROR_DUPLICATE = "Pas duplicat al graf de connexió: {name}"
+STEP_ERROR_UNKNOWN_DEPENDENCY = "Dependència desconeguda del pas {name}: {dependency}"
+PROFILE_LOG_SCANNING = "Comprovant si la xarxa '{ssid}' és visible"
+PROFILE_WARNING_NOT_VISIBLE = "La xarxa '{ssid}' no apareix a l'escaneig; s'intenta connectar igualment"
+
+# Mensajes del estado de perfiles instalados
+PROFILE_STATE_LOG_LOAD_ERROR = "No s'ha pogut llegir l'estat dels perfils: {error}"
+PROFILE_STATE_LOG_SAVE_ERROR = "No s'ha pogut desar l'estat dels perfils: {error}"
+PROFILE_LOG_PROFILE_UNCHANGED = "Perfil {ssid} ja instal·lat i sense canvis, s'omet la reinstal·lació"
+PROFILE_LOG_PROFILE_MISSING = "Perfil {ssid} registrat però no present al sistema, es reinstal·la"
+PROFILE_LOG_FORCE_REINSTALL = "Reinstal·lació forçada del perfil {ssid}"
+PROFILE_LOG_EAP_UNCHANGED = "Credencials EAP de {ssid} sense canvis, s'omet la configuració"
+PROFILE_SUCCESS_UNCHANGED = "Perfil WiFi ja instal·lat (sense canvis)"
 
 # Mensajes del gestor de credenciales
 CREDS_LOG_INIT = "CredentialsManager inicialitzat amb ruta: {path}"
@@ -190,6 +199,9 @@ CREDS_LOG_SEARCHING = "Cercant centres amb consulta: {query}"
 CREDS_LOG_EMPTY_QUERY = "Consulta buida, retornant tots els centres"
 CREDS_LOG_FOUND_MATCHING = "Trobats {count} centres coincidents"
 CREDS_WARNING_SKIP_ENTRY = "Ometent entrada de centre invàlida: {error}"
+CREDS_LOG_DUPLICATE_CODE = "Codi de centre duplicat {code} a {path}"
+CREDS_LOG_PEEK_FAILED = "No s'han pogut llegir les metadades de {path}: {error}"
+CREDS_LOG_MERGED_VAULTS = "Combinats {vaults} vaults en {count} centres"
 
 CREDS_ERROR_FILE_NOT_FOUND = "Arxiu de credencials no trobat: {path}"
 CREDS_ERROR_INVALID_JSON = "JSON invàlid a {path}: {error}"
@@ -197,6 +209,7 @@ CREDS_ERROR_UNEXPECTED = "Error inesperat carregant credencials: {error}"
 CREDS_ERROR_INVALID_STRUCTURE = (
     "Estructura de credencials invàlida a {path}: s'esperava un array"
 )
+CREDS_ERROR_NO_VAULTS = "No s'ha indicat cap arxiu de vault"
 CREDS_ERROR_NOT_DICT = "L'entrada de centre ha de ser un diccionari"
 CREDS_ERROR_MISSING_FIELD = "Falta el camp requerit: {field}"
 
@@ -227,12 +240,38 @@ VAULT_ERROR_FILE_NOT_FOUND = "Arxiu de vault no trobat: {path}"
 VAULT_ERROR_FILE_READ = "Error en llegir el vault: {path} ({error})"
 VAULT_ERROR_INVALID_FORMAT = "Format de vault invàlid"
 VAULT_ERROR_INVALID_MAGIC = "Magic del vault invàlid"
+VAULT_ERROR_UNSUPPORTED_VERSION = "Versió de vault no suportada: {version}"
 VAULT_ERROR_INVALID_JSON = "JSON invàlid dins el vault: {error}"
 VAULT_ERROR_INVALID_STRUCTURE = "Estructura de vault invàlida"
 VAULT_ERROR_METADATA_INVALID = "Metadades del vault invàlides"
 VAULT_ERROR_MISSING_CENTERS = "El vault no conté la llista de centres"
 VAULT_ERROR_DECRYPT_FAILED = "Error en descifrar el vault: {error}"
 
+# Mensajes del actualizador de vault
+VAULT_UPDATE_LOG_CHECKING = "Comprovant actualitzacions de vault a {mirror}"
+VAULT_UPDATE_LOG_MIRROR_MISSING = "Carpeta mirall de vault no accessible: {mirror}"
+VAULT_UPDATE_LOG_UP_TO_DATE = "Vault {name} ja està actualitzat"
+VAULT_UPDATE_LOG_LOCAL_NEWER = "Vault local {name} és més recent que el del mirall, s'omet"
+VAULT_UPDATE_LOG_COPYING = "Copiant vault {name} des del mirall (des del byte {offset})"
+VAULT_UPDATE_LOG_UPDATED = "Vault {name} actualitzat des del mirall"
+VAULT_UPDATE_LOG_HASH_MISMATCH = "Hash del vault {name} no coincideix després de copiar, es reintenta"
+VAULT_UPDATE_LOG_ERROR = "Error en actualitzar el vault {name}: {error}"
+VAULT_UPDATE_LOG_FINISHED = "Actualització de vaults completada: {updated} actualitzats"
+VAULT_UPDATE_ERROR_VERIFY = "El vault copiat no coincideix amb el del mirall"
+VAULT_UPDATE_STATUS_UPDATED = "Vault actualitzat. Reinicia l'aplicació per aplicar els canvis"
+
+# Mensajes de la caché del índice de centros
+INDEX_CACHE_LOG_HIT = "Índex de centres carregat des de la memòria cau ({count} centres)"
+INDEX_CACHE_LOG_MISS = "Memòria cau de l'índex no disponible, es reconstrueix"
+INDEX_CACHE_LOG_INVALID = "Memòria cau de l'índex invàlida a {path}: {error}"
+INDEX_CACHE_LOG_SAVED = "Índex de centres desat a la memòria cau: {path}"
+INDEX_CACHE_LOG_SAVE_FAILED = "No s'ha pogut desar la memòria cau de l'índex: {error}"
+
+# Mensajes del desbloqueo especulativo
+SPECULATIVE_LOG_STARTED = "Derivació especulativa de la clau iniciada"
+SPECULATIVE_LOG_REUSED = "Reutilitzant la clau derivada especulativament"
+SPECULATIVE_LOG_FAILED = "La derivació especulativa ha fallat: {error}"
+
 # Mensajes del gestor de red
 NET_LOG_INIT = "NetworkManager inicialitzat"
 NET_LOG_SCANNING = "Escanejant xarxes WiFi disponibles"
@@ -243,7 +282,7 @@ NET_LOG_NETWORK_AVAILABLE = "Xarxa '{ssid}' està disponible"
 NET_LOG_NETWORK_NOT_AVAILABLE = "Xarxa '{ssid}' no està disponible"
 NET_LOG_DISCONNECTING = "Intentant desconnectar de la xarxa WiFi"
 NET_LOG_DISCONNECT_SUCCESS = "Desconnectat exitosament de la xarxa WiFi"
-NET_LOG_EXECUTING_CMD = "Executant comanda: {command}"
+NET_LOG_EXECUTING_CMD = "Executant comanda de xarxa: {command}"
 NET_LOG_CMD_FAILED = "Comanda netsh ha fallat amb codi de retorn {code}"
 NET_LOG_CMD_OUTPUT = "Sortida de la comanda: {output}"
 NET_LOG_PARSED_SSIDS = "Parseats {count} SSIDs únics de la sortida"
@@ -251,12 +290,86 @@ NET_LOG_PARSED_SSIDS = "Parseats {count} SSIDs únics de la sortida"
 NET_ERROR_GET_NETWORKS = "Error en obtenir xarxes disponibles: {error}"
 NET_ERROR_DISCONNECT = "Error en desconnectar de la xarxa: {error}"
 
+# Mensajes de la sesión persistente de netsh
+NETSH_SESSION_LOG_STARTED = "Sessió interactiva de netsh iniciada (pid {pid})"
+NETSH_SESSION_LOG_RESTARTING = "La sessió de netsh s'ha aturat, reiniciant per a: {command}"
+NETSH_SESSION_LOG_TIMEOUT = "La sessió de netsh no respon a: {command}; es reiniciarà"
+NETSH_SESSION_LOG_DISABLED = "La sessió de netsh torna a no respondre a: {command}; es desactiva"
+NETSH_SESSION_LOG_CLOSED = "Sessió interactiva de netsh tancada"
+NETSH_SESSION_LOG_FALLBACK = "Sessió de netsh no disponible, s'executa com a procés: {error}"
+NETSH_SESSION_ERROR_START = "No s'ha pogut iniciar netsh: {error}"
+NETSH_SESSION_ERROR_UNAVAILABLE = "La sessió de netsh no està disponible"
+NETSH_SESSION_ERROR_DIED = "La sessió de netsh s'ha aturat en executar: {command}"
+NETSH_SESSION_ERROR_TIMEOUT = "Temps esgotat ({timeout} s) esperant netsh: {command}"
+
+# Mensajes de la ejecución de comandos externos
+PROCESS_LOG_FINISHED = "{program} finalitzat en {duration_ms:.0f} ms (codi {returncode})"
+PROCESS_LOG_SLOW = "{program} ha trigat {duration_ms:.0f} ms (codi {returncode})"
+PROCESS_LOG_TIMEOUT = "Temps esgotat ({timeout} s), s'atura l'arbre de processos: {command}"
+PROCESS_LOG_STALLED = "Comanda encara en execució després de {elapsed:.1f} s (pid {pid}): {command}"
+PROCESS_LOG_TREE_KILL_FAILED = "No s'ha pogut aturar l'arbre del procés {pid}: {error}"
+PROCESS_LOG_PIPES_HELD = "Un subprocés de {program} manté la sortida oberta; no s'espera més"
+PROCESS_LOG_LATENCY_SUMMARY = "Latència de {program}: n={count} p50={p50:.0f} ms p95={p95:.0f} ms màx={max:.0f} ms"
+PROCESS_LOG_CANCELLED = "Comanda cancel·lada, s'atura l'arbre de processos: {command}"
+PROCESS_ERROR_CANCELLED = "{program} cancel·lat"
+PROCESS_ERROR_TIMEOUT = "{program} no ha respost en {timeout} s i s'ha aturat"
+
+# Mensajes de los intervalos de tiempo (spans)
+TIMING_LOG_SPAN = "span {payload}"
+TIMING_LOG_SUMMARY = "Temps de l'intent {trace_id}: {duration_ms:.0f} ms en total; {breakdown}"
+TIMING_SUMMARY_ITEM = "{name} {ms:.0f} ms (x{count})"
+
+# Mensajes del historial de conexiones (SQLite)
+HISTORY_LOG_OPEN_FAILED = "No s'ha pogut obrir l'historial de connexions {path}: {error}"
+HISTORY_LOG_WRITTEN = "{count} intents desats a l'historial de connexions"
+HISTORY_LOG_WRITE_FAILED = "No s'han pogut desar {count} intents a l'historial: {error}"
+HISTORY_CLI_DESCRIPTION = "Latència i taxa d'èxit de les connexions registrades"
+HISTORY_CLI_HELP_DB = "Fitxer SQLite de l'historial (per defecte, al costat de Logs)"
+HISTORY_CLI_HELP_DAYS = "Dies enrere a consultar (per defecte 30)"
+HISTORY_CLI_HELP_WINDOW = "Mida de cada finestra en dies (per defecte, una sola finestra)"
+HISTORY_CLI_HELP_CENTER = "Limita la consulta a un codi de centre"
+HISTORY_CLI_HEADER = "Inici             Intents  Èxit    p50 ms   p95 ms   p99 ms"
+HISTORY_CLI_ROW = "{start}  {count:7d}  {success:5.1f}%  {p50:7.0f}  {p95:7.0f}  {p99:7.0f}"
+
+# Mensajes de la rotación de logs
+LOG_ROTATION_LOG_COMPRESS_FAILED = "No s'ha pogut comprimir el log {path}: {error}"
+LOG_ROTATION_LOG_RETENTION_FAILED = "No s'ha pogut esborrar el log antic {path}: {error}"
+
+# Mensajes del análisis de logs de la flota
+LOG_ANALYSIS_LOG_READ_FAILED = "No s'ha pogut llegir el log {path}: {error}"
+LOG_ANALYSIS_LOG_CURSOR_INVALID = "Cursor d'anàlisi {path} il·legible, es torna a començar: {error}"
+LOG_ANALYSIS_LOG_CURSOR_SAVE_FAILED = "No s'ha pogut desar el cursor d'anàlisi {path}: {error}"
+LOG_ANALYSIS_LOG_DONE = "{files} logs analitzats ({skipped} sense canvis)"
+LOG_ANALYSIS_CLI_DESCRIPTION = "Taxa d'èxit, motius de fallada i temps per pas a partir dels logs de molts equips"
+LOG_ANALYSIS_CLI_HELP_ROOT = "Carpeta amb els logs (una subcarpeta per equip)"
+LOG_ANALYSIS_CLI_HELP_CURSOR = "Fitxer de cursor (per defecte, dins de la carpeta de logs)"
+LOG_ANALYSIS_CLI_HELP_WORKERS = "Processos en paral·lel (per defecte, un per CPU)"
+LOG_ANALYSIS_CLI_HELP_JSON = "Escriu el resultat en JSON"
+LOG_ANALYSIS_CLI_HEADER = "Equip                 Dia         Intents  Èxit    Motius"
+LOG_ANALYSIS_CLI_ROW = "{machine:<20}  {day:<10}  {count:7d}  {success:5.1f}%  {reasons}"
+LOG_ANALYSIS_CLI_TIMINGS = "    {timings}"
+LOG_ANALYSIS_CLI_TIMING_ITEM = "{name} {ms:.0f} ms"
+LOG_ANALYSIS_CLI_ALL_DAYS = "total"
+
+# Mensajes de la exportación de métricas (Prometheus)
+METRICS_LOG_ENABLED = "Exportant mètriques a {path} cada {interval} s"
+METRICS_LOG_WRITE_FAILED = "No s'ha pogut escriure el fitxer de mètriques {path}: {error}"
+
+# Mensajes del bucle asyncio de red
+LOOP_LOG_STARTED = "Bucle de xarxa {name} iniciat"
+LOOP_LOG_STOPPED = "Bucle de xarxa {name} aturat"
+
+# Mensajes de la máquina de estados de conexión
+CONNECT_LOG_TRANSITION = "Intent de connexió: {source} -> {target}"
+CONNECT_LOG_PREEMPTING = "Nova connexió sol·licitada, es cancel·la l'intent en curs"
+CONNECT_ERROR_TRANSITION = "Transició no permesa de {source} a {target}"
+
 # Mensajes de log de MainWindow
 MAIN_LOG_INIT = "Inicialitzant MainWindow"
 MAIN_LOG_ICON_SET = "Icona de finestra establerta des de: {path}"
 MAIN_LOG_ICON_NOT_FOUND = "Arxiu d'icona no trobat: {path}"
 MAIN_LOG_ICON_ERROR = "No s'ha pogut establir la icona de la finestra: {error}"
-MAIN_LOG_LOAD_ERROR = "Error en carregar les credencials: {error}"
+MAIN_LOG_LOAD_ERROR = "No s'han pogut carregar les credencials a la finestra: {error}"
 MAIN_LOG_INIT_SUCCESS = "MainWindow inicialitzat exitosament"
 MAIN_LOG_STARTING_GUI = "Iniciant bucle principal de la GUI"
 MAIN_LOG_STATUS_UPDATE = "Actualitzant estat: {type} - {message}"
@@ -266,7 +379,7 @@ MAIN_LOG_CREATE_SEARCH = "Creant marc de cerca"
 MAIN_LOG_SEARCH_CREATED = "Marc de cerca creat"
 MAIN_LOG_SEARCH_CHANGED = "Consulta de cerca canviada: {query}"
 MAIN_LOG_FILTERING = "Filtrant centres amb consulta: '{query}'"
-MAIN_LOG_FOUND_MATCHING = "Trobats {count} centres coincidents"
+MAIN_LOG_FOUND_MATCHING = "Filtre de cerca: {count} centres coincidents"
 MAIN_LOG_CREATE_TABLE = "Creant taula de centres"
 MAIN_LOG_TABLE_CREATED = "Taula de centres creada"
 MAIN_LOG_POPULATING = "Omplint taula de centres amb {count} centres"
@@ -281,7 +394,7 @@ MAIN_LOG_BUTTONS_CREATED = "Botons d'acció creats"
 MAIN_LOG_CREATE_STATUS = "Creant barra d'estat"
 MAIN_LOG_STATUS_CREATED = "Barra d'estat creada"
 MAIN_LOG_CONNECT_NO_CENTER = "Connectar clicat però no hi ha centre seleccionat"
-MAIN_LOG_CONNECT_IN_PROGRESS = "Connexió ja en curs"
+MAIN_LOG_CONNECT_PREEMPT = "Connexió en curs, es substitueix pel centre: {code}"
 MAIN_LOG_CONNECT_CLICKED = "Botó de connectar clicat per al centre: {code}"
 MAIN_LOG_PROFILE_CLICKED = "Botó de Connectar via Perfil clicat"
 MAIN_LOG_PROFILE_NO_CENTER = (
@@ -304,6 +417,7 @@ APP_STARTING = "Iniciant aplicació WiFi Connector"
 APP_CLOSED = "Aplicació WiFi Connector tancada normalment"
 APP_INTERRUPTED = "Aplicació interrompuda per l'usuari (Ctrl+C)"
 APP_ERROR_START = "Error en iniciar WiFi Connector: {error}"
+APP_ERROR_THEME = "No s'ha pogut configurar el tema fosc: {error}"
 APP_ERROR_MESSAGE = "Error: No s'ha pogut iniciar l'aplicació WiFi Connector"
 APP_ERROR_DETAILS = "Detalls: {error}"
 APP_ERROR_CHECK_LOGS = "Si us plau, revisa els logs per a més informació."
@@ -316,11 +430,17 @@ SEARCH_PROMPT_HINT = "Utilitza la cerca per filtrar els {count} centres disponib
 CONFIG_ERROR_PAUSE_NEGATIVE = (
     "pause_duration ha de ser no negatiu, s'ha obtingut {value}"
 )
+CONFIG_ERROR_DEBOUNCE_NEGATIVE = "speculative_unlock_delay_ms no pot ser negatiu: {value}"
+CONFIG_ERROR_METRICS_INTERVAL = "metrics_interval ha de ser positiu: {value}"
 CONFIG_ERROR_WAIT_NEGATIVE = (
     "credential_dialog_wait_time ha de ser no negatiu, s'ha obtingut {value}"
 )
 CONFIG_ERROR_FILE_NOT_FOUND = "Arxiu de configuració no trobat: {path}"
 CONFIG_ERROR_UNSUPPORTED_FORMAT = "Format d'arxiu no suportat: {suffix}. Utilitza .json"
+CONFIG_LOG_LOADED = "Configuració carregada des de {path}"
+CONFIG_LOG_LOAD_FAILED = (
+    "No s'ha pogut carregar la configuració {path}: {error}. S'usen valors per defecte"
+)
 
 # Mensajes de error de favoritos (favorites_manager.py)
 FAV_ERROR_SAVE_FAILED = "Error en desar els favorits: {error}"
@@ -377,7 +497,7 @@ MAIN_LOG_ERROR_OPENING_ABOUT = "Error en obrir finestra Acerca de: {error}"
 MAIN_LOG_CONNECTION_THREAD_COMPLETED = "Fil de connexió completat"
 MAIN_LOG_CONNECTION_THREAD_STARTED = "Fil de connexió iniciat"
 MAIN_LOG_WINDOW_CLOSE_REQUESTED = "Tancament de finestra sol·licitat"
-MAIN_LOG_CONNECTION_IN_PROGRESS = "Connexió en curs, esperant finalització"
+MAIN_LOG_CONNECTION_IN_PROGRESS = "Connexió en curs, cancel·lant abans de tancar"
 MAIN_LOG_WINDOW_CLOSED = "Finestra tancada"
 
 # Mensajes de theme.py
@@ -402,15 +522,21 @@ STATUS_ERROR_OPEN_LOGS = "Error en obrir logs: {error}"
 STATUS_ERROR_OPEN_ABOUT = "Error en obrir finestra About: {error}"
 STATUS_ERROR_DISCONNECT_IN_PROGRESS = "No es pot desconnectar mentre es fa la connexió"
 STATUS_DISCONNECTING = "Desconnectant..."
+STATUS_CANCELLING = "Cancel·lant la connexió..."
+STATUS_CONNECTION_CANCELLED = "Connexió cancel·lada"
 STATUS_DISCONNECTED_SUCCESS = "Desconnectat correctament"
 STATUS_DISCONNECTED_ERROR = "Error en desconnectar"
 STATUS_ERROR_DISCONNECT = "Error en desconnectar: {error}"
+STATUS_CONNECTED_PROFILE = "Connectat correctament via perfil!"
+STATUS_CONNECTED_PROFILE_DETAILS = "{status} ({details})"
+STATUS_LINK_SIGNAL = "senyal {signal}%"
+STATUS_LINK_CHANNEL = "canal {channel}"
+STATUS_LINK_RATE = "{rate:g} Mbps"
 STATUS_ERROR_CONNECTION_CHECK_LOGS = (
     "Error de connexió. Revisa els Logs per més detalls."
 )
 STATUS_ERROR_CONNECTION_FAILED = "Connection error: {error}"
 # About window
-ABOUT_TITLE = "WiFi de Centres Educatius"
 ABOUT_VERSION = "Versió 2.0.0"
 ABOUT_DEVELOPER = "Desenvolupat per:"
 ABOUT_DEVELOPER_NAME = "Àlex Garcia Vilà"
@@ -418,7 +544,3 @@ ABOUT_LINKEDIN = "Veure Perfil de LinkedIn"
 ABOUT_PORTFOLIO = "Visita el meu portafolis"
 ABOUT_VAULT_INFO = "Vault {version} ({generated_at})"
 ABOUT_VAULT_INFO_VERSION = "Vault {version}"
-
-
-# Mensajes de log para errores de conexión
-MAIN_LOG_CONNECTION_ERROR = "Error en la connexió: {error}"